@@ -0,0 +1,52 @@
+"""
+Rebuild Pulse "following" timelines from user_follows and recent pulses.
+
+Run after upgrading to migration b8e4f1a6d293, or to repair timelines after
+bulk edits to follows or pulses.
+
+Usage:
+    cd backend
+    python scripts/backfill_pulse_timeline.py              # every user
+    python scripts/backfill_pulse_timeline.py --days 7 --user user-1 --user user-2
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from src import db
+from src.config import settings
+from src.models import User
+from src.repositories.pulse_timeline import PulseTimelineRepository
+
+
+async def main(user_external_ids: list[str] | None, days: int) -> None:
+    await db.init_db()
+    if db.SessionLocal is None:
+        print("DATABASE_URL is not configured; nothing to backfill.")
+        return
+    try:
+        async with db.SessionLocal() as session:
+            owner_ids = None
+            if user_external_ids:
+                owner_ids = (
+                    await session.execute(select(User.id).where(User.external_id.in_(user_external_ids)))
+                ).scalars().all()
+            written = await PulseTimelineRepository(session).backfill(owner_ids, days=days)
+        print(f"Wrote {written} timeline entries.")
+    finally:
+        await db.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user", action="append", dest="users", help="external id of a user to rebuild (repeatable)")
+    parser.add_argument("--days", type=int, default=settings.pulse_timeline_backfill_days)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.days))
@@ -0,0 +1,131 @@
+"""
+Benchmark SearchRepository against a large synthetic catalog.
+
+Seeds movies tagged with a "bench-" external_id (100k by default), runs a
+mix of exact, prefix, multi-word and misspelled queries through
+SearchRepository.search and MovieRepository.search, and prints p50/p95
+latency per query kind. Requires Postgres with migration 8d3f0b6c2a41.
+
+Usage:
+    cd backend
+    python scripts/benchmark_search.py                  # seed (if needed) + run
+    python scripts/benchmark_search.py --movies 20000 --rounds 50
+    python scripts/benchmark_search.py --cleanup        # delete seeded rows
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, func, insert, select
+
+from src import db
+from src.models import Movie
+from src.repositories.movies import MovieRepository
+from src.repositories.search import SearchRepository
+
+PREFIX = "bench-"
+BATCH_SIZE = 5000
+
+WORDS = [
+    "shadow", "river", "midnight", "empire", "garden", "silent", "crimson", "frontier",
+    "echo", "harbor", "velvet", "storm", "paper", "winter", "orbit", "legend",
+    "mirror", "desert", "lantern", "thunder", "glass", "hollow", "summer", "kingdom",
+]
+
+QUERIES = {
+    "exact": ["midnight empire", "silent river", "crimson garden"],
+    "prefix": ["midn", "fronti", "lante"],
+    "multi_word": ["storm over the harbor", "legend of winter"],
+    "typo": ["midnigth", "kingdon", "thundr"],
+}
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(2, 4)))
+
+
+async def seed(session, count: int) -> int:
+    existing = (
+        await session.execute(select(func.count(Movie.id)).where(Movie.external_id.like(f"{PREFIX}%")))
+    ).scalar_one()
+    rng = random.Random(42)
+    for start in range(existing, count, BATCH_SIZE):
+        rows = [
+            {
+                "external_id": f"{PREFIX}{i}",
+                "title": _title(rng),
+                "overview": " ".join(rng.choice(WORDS) for _ in range(30)),
+                "year": str(rng.randint(1950, 2025)),
+                "siddu_score": round(rng.uniform(1, 10), 1),
+            }
+            for i in range(start, min(start + BATCH_SIZE, count))
+        ]
+        await session.execute(insert(Movie), rows)
+        await session.commit()
+        print(f"  seeded {start + len(rows)}/{count}")
+    return max(count - existing, 0)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def run(session, rounds: int) -> None:
+    search = SearchRepository(session)
+    movies = MovieRepository(session)
+    print(f"{'kind':<12}{'endpoint':<10}{'p50 ms':>10}{'p95 ms':>10}")
+    for kind, queries in QUERIES.items():
+        for label, call in (
+            ("/search", lambda q: search.search(query=q, limit_per_type=10)),
+            ("/movies", lambda q: movies.search(query=q, limit=10)),
+        ):
+            samples = []
+            for _ in range(rounds):
+                for q in queries:
+                    started = time.perf_counter()
+                    await call(q)
+                    samples.append((time.perf_counter() - started) * 1000)
+            print(f"{kind:<12}{label:<10}{statistics.median(samples):>10.2f}{_percentile(samples, 95):>10.2f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=100_000, help="catalog size to seed")
+    parser.add_argument("--rounds", type=int, default=20, help="repetitions per query")
+    parser.add_argument("--cleanup", action="store_true", help="delete seeded movies and exit")
+    args = parser.parse_args()
+
+    await db.init_db()
+    if db.SessionLocal is None:
+        print("DATABASE_URL is not configured; nothing to benchmark.")
+        return
+    try:
+        async with db.SessionLocal() as session:
+            if session.get_bind().dialect.name != "postgresql":
+                print("The search benchmark needs Postgres.")
+                return
+            if args.cleanup:
+                result = await session.execute(delete(Movie).where(Movie.external_id.like(f"{PREFIX}%")))
+                await session.commit()
+                print(f"Deleted {result.rowcount} seeded movies.")
+                return
+            print(f"Seeding up to {args.movies} movies...")
+            added = await seed(session, args.movies)
+            print(f"Added {added} movies.")
+            await run(session, args.rounds)
+    finally:
+        await db.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
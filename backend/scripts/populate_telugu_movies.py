@@ -5,6 +5,10 @@ Run this script to populate the database with 200+ Telugu movies and complete us
 Usage:
     cd apps/backend
     python scripts/populate_telugu_movies.py
+
+To load the real Telugu catalog from TMDB instead, start one bulk import job:
+    POST /api/v1/admin/tmdb/import/bulk
+    {"category": "discover", "original_language": "te", "end_page": 25}
 """
 
 import asyncio
@@ -0,0 +1,37 @@
+"""
+Rebuild user_review_stats and movie_review_stats from the reviews table.
+
+The counters are maintained incrementally by ReviewRepository; run this after
+bulk imports, seeding, or any direct SQL edit of reviews to repair drift.
+
+Usage:
+    cd backend
+    python scripts/reconcile_review_stats.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import db
+from src.repositories.review_stats import ReviewStatsRepository
+
+
+async def main() -> None:
+    await db.init_db()
+    if db.SessionLocal is None:
+        print("DATABASE_URL is not configured; nothing to reconcile.")
+        return
+    try:
+        async with db.SessionLocal() as session:
+            counts = await ReviewStatsRepository(session).reconcile()
+        print(f"Reconciled review stats for {counts['users']} users and {counts['movies']} movies.")
+    finally:
+        await db.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
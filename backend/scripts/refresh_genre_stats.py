@@ -0,0 +1,42 @@
+"""
+Rebuild genre_stats_snapshots for every genre.
+
+Imports and curation edits refresh the genres they touch; run this after
+bulk SQL loads or seeding to rebuild every snapshot at once.
+
+Usage:
+    cd backend
+    python scripts/refresh_genre_stats.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from src import db
+from src.models import Genre
+from src.repositories.genre_stats import GenreStatsRepository
+
+
+async def main() -> None:
+    await db.init_db()
+    if db.SessionLocal is None:
+        print("DATABASE_URL is not configured; nothing to refresh.")
+        return
+    try:
+        async with db.SessionLocal() as session:
+            genre_ids = (await session.execute(select(Genre.id))).scalars().all()
+            refreshed = await GenreStatsRepository(session).refresh(genre_ids)
+            await session.commit()
+        print(f"Refreshed statistics for {refreshed} genres.")
+    finally:
+        await db.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
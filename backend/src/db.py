@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from typing import AsyncIterator
+import re
+import ssl
+import threading
+import time
+from typing import Any, AsyncIterator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .config import settings
 
@@ -12,38 +18,148 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = None
+engine: AsyncEngine | None = None
 SessionLocal: async_sessionmaker[AsyncSession] | None = None
+# Optional read replica (database_read_url); None routes reads to the primary
+read_engine: AsyncEngine | None = None
+ReadSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+
+class PoolStats:
+    """Checkout wait times and timeouts of one pool, for /health/metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """The default asyncio pool, timing how long each checkout waits for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except Exception:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started, timed_out=False)
+        return conn
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    connect_args: dict[str, Any] = {}
+
+    # Handle SSL for asyncpg if needed (Neon DB support)
+    if "sslmode" in url or "neon.tech" in url:
+        # Create SSL context
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        connect_args["ssl"] = ssl_context
+
+        # asyncpg doesn't support sslmode in URL, so we need to strip it
+        if "sslmode=" in url:
+            url = re.sub(r'[?&]sslmode=[^&]+', '', url)
+            if "?" not in url and "&" in url:
+                url = url.replace("&", "?", 1)
+
+    if url.startswith("sqlite"):
+        # SQLite (local scripts) keeps SQLAlchemy's default pool
+        return create_async_engine(url, echo=False, connect_args=connect_args)
+
+    if "+asyncpg" in url:
+        # Prepared statements per connection; 0 behind a transaction-mode pgbouncer
+        connect_args["statement_cache_size"] = settings.db_statement_cache_size
+        connect_args["server_settings"] = {"application_name": settings.db_application_name}
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        connect_args=connect_args,
+    )
 
 
 async def init_db() -> None:
-    global engine, SessionLocal
+    global engine, SessionLocal, read_engine, ReadSessionLocal
     if settings.database_url:
-        url = settings.database_url
-        connect_args = {}
-        
-        # Handle SSL for asyncpg if needed (Neon DB support)
-        if "sslmode" in url or "neon.tech" in url:
-            import ssl
-            import re
-            
-            # Create SSL context
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            connect_args["ssl"] = ssl_context
-            
-            # asyncpg doesn't support sslmode in URL, so we need to strip it
-            if "sslmode=" in url:
-                url = re.sub(r'[?&]sslmode=[^&]+', '', url)
-                if "?" not in url and "&" in url:
-                    url = url.replace("&", "?", 1)
-        
-        engine = create_async_engine(url, echo=False, pool_pre_ping=True, connect_args=connect_args)
+        engine = _create_engine(settings.database_url)
         SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
     else:
         engine = None
         SessionLocal = None
+    if settings.database_url and settings.database_read_url:
+        read_engine = _create_engine(settings.database_read_url)
+        ReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False)
+    else:
+        read_engine = None
+        ReadSessionLocal = None
+
+
+async def close_db() -> None:
+    """Close every pooled connection, so the server is not left holding them after shutdown."""
+    global engine, SessionLocal, read_engine, ReadSessionLocal
+    for eng in (read_engine, engine):
+        if eng is not None:
+            await eng.dispose()
+    engine = SessionLocal = read_engine = ReadSessionLocal = None
+
+
+def _pool_metrics(eng: AsyncEngine | None) -> dict[str, Any] | None:
+    if eng is None:
+        return None
+    pool = eng.pool
+    metrics: dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, TimedQueuePool):
+        metrics.update(
+            size=pool.size(),
+            in_use=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+            **pool.stats.snapshot(),
+        )
+    return metrics
+
+
+def pool_metrics() -> dict[str, Any]:
+    """Connection pool usage of this worker, per database."""
+    return {"primary": _pool_metrics(engine), "replica": _pool_metrics(read_engine)}
 
 
 async def get_session() -> AsyncIterator[AsyncSession | None]:
@@ -54,3 +170,19 @@ async def get_session() -> AsyncIterator[AsyncSession | None]:
     async with SessionLocal() as session:
         yield session
 
+
+async def get_read_session(
+    primary: AsyncSession | None = Depends(get_session),
+) -> AsyncIterator[AsyncSession | None]:
+    """
+    A session on the read replica for endpoints that only read. Replicas lag,
+    so anything that must see its own writes stays on ``get_session``.
+
+    Without a replica this is the primary session. Sessions only take a
+    connection on first use, so the unused primary session costs nothing.
+    """
+    if ReadSessionLocal is None:
+        yield primary
+        return
+    async with ReadSessionLocal() as session:
+        yield session
@@ -7,7 +7,7 @@ error if they don't.
 
 Usage:
     @router.get("/admin/users")
-    async def list_users(current_user: User = Depends(require_admin)):
+    async def list_users(admin: Principal = Depends(require_admin)):
         # Only admin users can access this endpoint
         ...
 
@@ -18,53 +18,56 @@ Date: 2025-01-30
 from __future__ import annotations
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from ..db import get_session
-from ..models import User, RoleType, UserRoleProfile
-from .auth import get_current_user
+from ..models import User
+from ..security.principal import Principal
+from .auth import get_current_principal, get_current_user
 
 
 async def require_admin(
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
-) -> User:
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
     """
     Dependency that enforces admin role requirement.
     
     This dependency:
-    1. Gets the current authenticated user via get_current_user
-    2. Checks if the user has an ADMIN role profile that is enabled
+    1. Resolves the principal via get_current_principal, from the token's role
+       claims when they are current (no database round trip for the user)
+    2. Checks if the principal has an ADMIN role profile that is enabled
     3. Raises 403 Forbidden if the user is not an admin
     
     Args:
-        current_user: The authenticated user (from get_current_user dependency)
-        session: Database session for querying role profiles
+        principal: The authenticated principal (from get_current_principal dependency)
         
     Returns:
-        User: The authenticated user if they have admin role
+        Principal: The caller's ids and roles. Endpoints that need the User
+        row use require_admin_user instead.
         
     Raises:
         HTTPException: 403 Forbidden if user doesn't have admin role
         
     Example:
         @router.get("/admin/users")
-        async def list_users(admin_user: User = Depends(require_admin)):
-            # admin_user is guaranteed to have ADMIN role
+        async def list_users(admin: Principal = Depends(require_admin)):
+            # admin is guaranteed to have ADMIN role
             return await get_all_users()
     """
     
     # Check if user has an enabled ADMIN role profile
-    has_admin_role = any(
-        role_profile.role_type == RoleType.ADMIN and role_profile.enabled
-        for role_profile in current_user.role_profiles
-    )
-    
-    if not has_admin_role:
+    if not principal.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required. User does not have admin role.",
         )
     
-    return current_user
+    return principal
+
 
+async def require_admin_user(
+    principal: Principal = Depends(require_admin),
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """
+    require_admin for endpoints that need the admin's User row (e.g. their
+    email); the role check still runs first, from the principal.
+    """
+    return current_user
@@ -3,21 +3,16 @@ from __future__ import annotations
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from ..db import get_session
 from ..models import User
 from ..security.jwt import decode_token
+from ..security.principal import Principal, get_token_principal, invalidate_principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
 
-async def get_current_user(
-    token: str | None = Depends(oauth2_scheme),
-    session: AsyncSession = Depends(get_session),
-) -> User:
-    if not token:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+def _access_claims(token: str) -> tuple[int, int | None, dict]:
     try:
         payload = decode_token(token)
     except Exception:
@@ -31,9 +26,35 @@ async def get_current_user(
         user_id = int(sub)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid subject")
-    res = await session.execute(select(User).where(User.id == user_id))
-    user = res.scalar_one_or_none()
+    return user_id, payload.get("iat"), payload
+
+
+async def get_current_principal(
+    token: str | None = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_session),
+) -> Principal:
+    """
+    Resolve the caller to a ``Principal`` without loading the User entity: from
+    the token's role claims when they are current, else from the cache.
+    Prefer this over get_current_user when only ids and roles are needed.
+    """
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    user_id, iat, payload = _access_claims(token)
+    principal = await get_token_principal(session, payload, user_id, iat)
+    if not principal:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_session),
+) -> User:
+    # Relationships on User raise on access; callers that need them query explicitly.
+    user = await session.get(User, principal.id)
     if not user:
+        invalidate_principal(principal.id)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
 
@@ -49,16 +70,10 @@ async def get_current_user_optional(
     if not token:
         return None
     try:
-        payload = decode_token(token)
-        if payload.get("type") != "access":
+        user_id, iat, payload = _access_claims(token)
+        principal = await get_token_principal(session, payload, user_id, iat)
+        if not principal:
             return None
-        sub = payload.get("sub")
-        if not sub:
-            return None
-        user_id = int(sub)
-        res = await session.execute(select(User).where(User.id == user_id))
-        user = res.scalar_one_or_none()
-        return user
+        return await session.get(User, principal.id)
     except Exception:
         return None
-
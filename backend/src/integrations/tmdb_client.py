@@ -3,21 +3,42 @@ TMDB (The Movie Database) API Integration
 
 Provides functions to fetch movie data from TMDB API v3.
 Supports both search-based and direct ID-based movie fetching.
+
+All requests go through one long-lived ``TMDBClient`` per process
+(``tmdb_client``), started and closed by ``main.lifespan``:
+
+- a pooled ``httpx.AsyncClient`` reuses connections instead of paying
+  TCP+TLS setup on every call;
+- a token bucket keeps the request rate under TMDB's quota. The bucket is
+  per process, so the configured rate is the total for the deployment and
+  each of the ``worker_processes`` workers gets an equal share of it;
+- 429 and 5xx responses are retried with jittered exponential backoff,
+  honouring ``Retry-After``;
+- movie details are cached by TMDB id for ``tmdb_cache_ttl_seconds``, in
+  memory and in a SQLite file so the cache survives restarts. Expired rows
+  are deleted when the file is opened and periodically on write.
+
+``tmdb_base_url`` and the ``transport`` argument let tests point the client
+at a local stub server.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
-from typing import Any, Dict, Optional
+import random
+import time
+from typing import Any, Callable, Dict, Optional
 
 import httpx
 
 try:
     from ..config import settings
+    from ..services.sqlite_cache import SQLiteLRUCache
 except ImportError:
     # Fallback for direct script execution
     from config import settings
+    from services.sqlite_cache import SQLiteLRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +50,14 @@ TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
 POSTER_SIZE = "w500"  # 500px width for posters
 BACKDROP_SIZE = "original"  # Original size for backdrops
 
+# Extra sections requested with every movie details call
+APPEND_TO_RESPONSE = "credits,keywords,release_dates,watch/providers,videos,reviews,similar"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 30.0
+# How often cache writes also sweep expired rows out of the SQLite file
+CACHE_PURGE_INTERVAL_SECONDS = 600.0
+
 
 class TMDBError(Exception):
     """Base exception for TMDB API errors"""
@@ -45,6 +74,217 @@ class TMDBRateLimitError(TMDBError):
     pass
 
 
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second on average, with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        # The balance may go negative: each caller waits out the debt ahead of it,
+        # so waiters are released in arrival order without a lock.
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TMDBResponseCache(SQLiteLRUCache):
+    """TTL cache of raw TMDB responses, keyed by request and stamped with the store time."""
+
+    def __init__(self, path: str | None, ttl_seconds: float, max_memory_entries: int = 1000) -> None:
+        super().__init__(
+            path,
+            "tmdb_responses",
+            label="TMDB",
+            max_memory_entries=max_memory_entries,
+            expire_before=lambda: time.time() - self.ttl_seconds,
+            purge_interval=CACHE_PURGE_INTERVAL_SECONDS,
+        )
+        self.ttl_seconds = ttl_seconds
+
+    def _fresh(self, stored_at: float) -> bool:
+        return time.time() - stored_at < self.ttl_seconds
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        _, value = await self.lookup(key, self._fresh)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        await self.store(key, time.time(), value)
+
+
+class TMDBClient:
+    def __init__(
+        self,
+        api_key: str | None,
+        *,
+        base_url: str = TMDB_BASE_URL,
+        timeout: float = 20.0,
+        max_connections: int = 20,
+        rate_limit: TokenBucket | None = None,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        cache: TMDBResponseCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.cache = cache
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+
+    # --------------------------------------------------------------- lifecycle
+
+    async def start(self) -> None:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self.cache is not None:
+            self.cache.close()
+
+    # ---------------------------------------------------------------- requests
+
+    def _backoff(self, attempt: int, response: httpx.Response | None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(MAX_BACKOFF_SECONDS, float(retry_after))
+            except ValueError:
+                pass
+        # Full jitter: concurrent callers that failed together spread out their retries.
+        return random.uniform(0, min(MAX_BACKOFF_SECONDS, self.backoff_seconds * 2 ** attempt))
+
+    async def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GET ``path`` (relative to the API root) and return the decoded body.
+
+        Raises:
+            TMDBNotFoundError: on 404
+            TMDBRateLimitError: when 429 persists after every retry
+            TMDBError: on timeouts, transport errors or other non-200 responses
+        """
+        if self._http is None or self._http.is_closed:
+            # Scripts and tests that never ran the app lifespan.
+            await self.start()
+        query = {"api_key": self.api_key, **(params or {})}
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limit is not None:
+                await self.rate_limit.acquire()
+            response = None
+            try:
+                response = await self._http.get(path, params=query)
+            except httpx.TimeoutException:
+                error: TMDBError = TMDBError("TMDB API request timed out")
+            except httpx.TransportError as e:
+                error = TMDBError(f"TMDB request failed: {e}")
+            else:
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code == 404:
+                    raise TMDBNotFoundError(f"TMDB resource not found: {path}")
+                if response.status_code == 429:
+                    error = TMDBRateLimitError("TMDB API rate limit exceeded")
+                else:
+                    error = TMDBError(f"TMDB request failed: {response.status_code}")
+                if response.status_code not in RETRY_STATUSES:
+                    raise error
+            if attempt == self.max_retries:
+                raise error
+            delay = self._backoff(attempt, response)
+            logger.warning(f"TMDB {path} failed ({error}); retry {attempt + 1} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def movie_details(self, movie_id: int) -> Dict[str, Any]:
+        """Raw movie details with credits, providers etc., served from the cache when fresh."""
+        key = f"movie:{movie_id}"
+        if self.cache is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+        data = await self.get_json(f"/movie/{movie_id}", {"append_to_response": APPEND_TO_RESPONSE})
+        if self.cache is not None:
+            await self.cache.set(key, data)
+        return data
+
+    async def fetch_movie_by_id(self, movie_id: int) -> Optional[Dict[str, Any]]:
+        if not self.api_key:
+            logger.warning("TMDB_API_KEY not configured")
+            return None
+        try:
+            data = await self.movie_details(movie_id)
+        except TMDBNotFoundError:
+            logger.warning(f"TMDB movie not found: {movie_id}")
+            raise TMDBNotFoundError(f"Movie {movie_id} not found on TMDB")
+        logger.debug(f"Successfully fetched TMDB movie: {data.get('title')}")
+        return _transform_tmdb_response(data)
+
+    async def search_movie(self, query: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        if not self.api_key:
+            logger.warning("TMDB_API_KEY not configured")
+            return None
+        params = {"query": query, "include_adult": "false"}
+        if year:
+            params["year"] = str(year)
+        logger.debug(f"Searching TMDB for: {query}")
+        data = await self.get_json("/search/movie", params)
+        results = data.get("results") or []
+        if not results:
+            logger.debug(f"No TMDB results for: {query}")
+            return None
+        # Return the first result
+        movie_id = results[0]["id"]
+        logger.debug(f"Found TMDB movie ID: {movie_id}")
+        return await self.fetch_movie_by_id(movie_id)
+
+
+tmdb_client = TMDBClient(
+    settings.tmdb_api_key,
+    base_url=settings.tmdb_base_url,
+    timeout=settings.tmdb_timeout_seconds,
+    max_connections=settings.tmdb_max_connections,
+    # Each worker process gets an equal share of the deployment-wide budget.
+    rate_limit=TokenBucket(
+        settings.tmdb_rate_limit_per_second / max(1, settings.worker_processes),
+        max(1, settings.tmdb_rate_limit_burst // max(1, settings.worker_processes)),
+    ),
+    max_retries=settings.tmdb_max_retries,
+    backoff_seconds=settings.tmdb_retry_backoff_seconds,
+    cache=TMDBResponseCache(settings.tmdb_cache_path, settings.tmdb_cache_ttl_seconds),
+)
+
+
 async def search_movie(query: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
     Search for a movie on TMDB by title.
@@ -59,51 +299,7 @@ async def search_movie(query: str, year: Optional[int] = None) -> Optional[Dict[
     Raises:
         TMDBError: If API call fails
     """
-    if not TMDB_API_KEY:
-        logger.warning("TMDB_API_KEY not configured")
-        return None
-    
-    try:
-        async with httpx.AsyncClient(timeout=20) as client:
-            params = {
-                "api_key": TMDB_API_KEY,
-                "query": query,
-                "include_adult": "false",
-            }
-            if year:
-                params["year"] = str(year)
-            
-            logger.debug(f"Searching TMDB for: {query}")
-            response = await client.get(
-                f"{TMDB_BASE_URL}/search/movie",
-                params=params,
-            )
-            
-            if response.status_code == 429:
-                raise TMDBRateLimitError("TMDB API rate limit exceeded")
-            
-            if response.status_code != 200:
-                logger.error(f"TMDB search failed: {response.status_code}")
-                return None
-            
-            data = response.json()
-            results = data.get("results") or []
-            
-            if not results:
-                logger.debug(f"No TMDB results for: {query}")
-                return None
-            
-            # Return the first result
-            movie_id = results[0]["id"]
-            logger.debug(f"Found TMDB movie ID: {movie_id}")
-            return await fetch_movie_by_id(movie_id)
-            
-    except httpx.TimeoutException:
-        logger.error("TMDB API request timed out")
-        raise TMDBError("TMDB API request timed out")
-    except Exception as e:
-        logger.error(f"TMDB search error: {str(e)}")
-        raise TMDBError(f"TMDB search failed: {str(e)}")
+    return await tmdb_client.search_movie(query, year)
 
 
 async def fetch_movie_by_id(movie_id: int) -> Optional[Dict[str, Any]]:
@@ -119,47 +315,7 @@ async def fetch_movie_by_id(movie_id: int) -> Optional[Dict[str, Any]]:
     Raises:
         TMDBError: If API call fails
     """
-    if not TMDB_API_KEY:
-        logger.warning("TMDB_API_KEY not configured")
-        return None
-    
-    try:
-        async with httpx.AsyncClient(timeout=20) as client:
-            # Append additional data to the response
-            append_to_response = "credits,keywords,release_dates,watch/providers,videos,reviews,similar"
-            
-            logger.debug(f"Fetching TMDB movie ID: {movie_id}")
-            response = await client.get(
-                f"{TMDB_BASE_URL}/movie/{movie_id}",
-                params={
-                    "api_key": TMDB_API_KEY,
-                    "append_to_response": append_to_response,
-                },
-            )
-            
-            if response.status_code == 429:
-                raise TMDBRateLimitError("TMDB API rate limit exceeded")
-            
-            if response.status_code == 404:
-                logger.warning(f"TMDB movie not found: {movie_id}")
-                raise TMDBNotFoundError(f"Movie {movie_id} not found on TMDB")
-            
-            if response.status_code != 200:
-                logger.error(f"TMDB fetch failed: {response.status_code}")
-                return None
-            
-            data = response.json()
-            logger.debug(f"Successfully fetched TMDB movie: {data.get('title')}")
-            return _transform_tmdb_response(data)
-            
-    except TMDBNotFoundError:
-        raise
-    except httpx.TimeoutException:
-        logger.error("TMDB API request timed out")
-        raise TMDBError("TMDB API request timed out")
-    except Exception as e:
-        logger.error(f"TMDB fetch error: {str(e)}")
-        raise TMDBError(f"TMDB fetch failed: {str(e)}")
+    return await tmdb_client.fetch_movie_by_id(movie_id)
 
 
 def _transform_tmdb_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -33,13 +33,24 @@ from pathlib import Path  # Modern way to handle file paths
 import json  # For exporting OpenAPI schema
 
 # FastAPI core imports
-from fastapi import FastAPI, APIRouter  # Main framework and router for organizing endpoints
+from fastapi import FastAPI, APIRouter, Request  # Main framework and router for organizing endpoints
+from fastapi.responses import JSONResponse  # Plain JSON error bodies from exception handlers
 from fastapi.middleware.cors import CORSMiddleware  # Middleware for handling CORS
+from fastapi.staticfiles import StaticFiles  # Serves locally stored uploads
 
 # Application-specific imports
 from .config import settings  # Application configuration (loaded from .env file)
 from .logging_config import setup_logging, log  # Structured logging setup
-from .db import init_db  # Database initialization function
+from .db import close_db, init_db  # Database initialization and shutdown
+from .services.engagement_buffer import engagement_buffer  # Batched critic review view/like/share counters
+from .services.import_jobs import import_jobs  # Background streaming NDJSON movie imports
+from .services.tmdb_import import tmdb_import_jobs  # Background bulk TMDB imports
+from .integrations.tmdb_client import tmdb_client  # Pooled, rate-limited TMDB API client
+from .security.password import password_hasher  # Worker pool for argon2 hashing
+from .services.media import shutdown_media_pipeline  # Image upload worker pool
+from .services.festival_cache import festival_cache  # Festival program/winners documents
+from .services.media_storage import local_fallback_unintended, media_backend_name  # Which upload storage backend is active
+from .repositories.pagination import InvalidCursor  # Bad keyset cursor tokens -> 400
 
 # Import all API routers (each router handles a specific domain)
 # These are organized by feature/domain for better code organization
@@ -98,11 +109,11 @@ Why use lifespan instead of @app.on_event("startup")?
 
 What happens during startup (before 'yield'):
 1. Set up structured logging
-2. Initialize database connection pool
+2. Initialize database connection pool and the pooled TMDB client
 3. Export OpenAPI schema for frontend type generation
 
 What happens during shutdown (after 'yield'):
-4. Log shutdown event
+4. Log shutdown event, flush buffered engagement counters and cancel running imports
 5. Database connections are automatically closed by SQLAlchemy
 
 For Beginners:
@@ -125,6 +136,24 @@ async def lifespan(app: FastAPI):
     # connections from the pool (fast)
     await init_db()
 
+    # Step 2b: Start the write-behind flusher for critic review engagement counters
+    engagement_buffer.start()
+
+    # Step 2c: Open the pooled TMDB client (connections are reused across requests)
+    await tmdb_client.start()
+
+    # Step 2d: Prepare the local uploads directory served at media_public_path
+    if media_backend_name() == "local":
+        Path(settings.media_local_root).mkdir(parents=True, exist_ok=True)
+        if local_fallback_unintended():
+            # Files on a worker's disk are not shared with other hosts and vanish on redeploy
+            log.warning(
+                "media_storage_local_fallback",
+                env=settings.env,
+                root=settings.media_local_root,
+                hint="set CLOUDINARY_* or MEDIA_STORAGE=local explicitly",
+            )
+
     # Step 3: Export OpenAPI schema (optional, for development)
     # OpenAPI is a standard format for describing REST APIs
     # We export it so the frontend can auto-generate TypeScript types
@@ -167,8 +196,21 @@ async def lifespan(app: FastAPI):
 
     # ========== SHUTDOWN PHASE ==========
     log.info("stopping_app")
-    # Note: Database connections are automatically closed by SQLAlchemy's engine.dispose()
-    # which is called when the engine is garbage collected
+    # Flush buffered engagement counters before the process exits
+    await engagement_buffer.stop()
+    # Stop streaming imports still in progress (their committed batches are kept)
+    await import_jobs.shutdown()
+    await tmdb_import_jobs.shutdown()
+    # Close pooled TMDB connections and the response cache file
+    await tmdb_client.aclose()
+    # Stop the password hashing workers
+    password_hasher.shutdown()
+    # Stop the image processing workers
+    shutdown_media_pipeline()
+    # Close the festival document cache file
+    festival_cache.close()
+    # Close pooled database connections last: the steps above may still write
+    await close_db()
 
 
 """
@@ -256,6 +298,13 @@ app.add_middleware(
 # Log the CORS configuration for debugging
 log.info("cors_config", origins=_allowed_origins, allow_credentials=_allow_credentials)
 
+
+# Keyset-paginated list endpoints raise InvalidCursor for tampered or stale
+# cursor tokens; answer 400 instead of a 500.
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": "invalid_cursor"})
+
 """
 API Router Registration
 
@@ -344,6 +393,15 @@ api.include_router(critic_brand_deals_router.router)  # POST /api/v1/critic-bran
 # Attach the versioned API router to the main app
 app.include_router(api)
 
+# Serve uploads written by the local storage backend (tests, offline development)
+# (the directory itself is created in lifespan, so importing the app touches no disk)
+if media_backend_name() == "local":
+    app.mount(
+        settings.media_public_path,
+        StaticFiles(directory=settings.media_local_root, check_dir=False),
+        name="uploads",
+    )
+
 """
 Application is now ready to handle requests!
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import String, ForeignKey, Integer, Table, Column, Text, Float, Boolean, DateTime, UniqueConstraint, TIMESTAMP, func
+from sqlalchemy import String, ForeignKey, Integer, Table, Column, Text, Float, Boolean, DateTime, UniqueConstraint, TIMESTAMP, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import Base
@@ -41,7 +41,7 @@ movie_genres = Table(
     "movie_genres",
     Base.metadata,
     Column("movie_id", ForeignKey("movies.id"), primary_key=True),
-    Column("genre_id", ForeignKey("genres.id"), primary_key=True),
+    Column("genre_id", ForeignKey("genres.id"), primary_key=True, index=True),
 )
 
 movie_people = Table(
@@ -72,8 +72,9 @@ collection_likes = Table(
 
 
 
-
-
+# Relationships in the core catalog/user graph (Genre, Movie, Person, User, Review,
+# Collection, Watchlist, Favorite) are lazy="raise_on_sql": queries opt into the
+# parts of the graph they need via repositories/loader_profiles.py.
 class Genre(Base):
     __tablename__ = "genres"
 
@@ -84,10 +85,43 @@ class Genre(Base):
     movies: Mapped[List["Movie"]] = relationship(
         back_populates="genres",
         secondary=movie_genres,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
+class GenreStatsSnapshot(Base):
+    """
+    Precomputed statistics block for a genre page, rebuilt by GenreStatsRepository
+    whenever movies in the genre are imported or curated.
+    """
+    __tablename__ = "genre_stats_snapshots"
+
+    genre_id: Mapped[int] = mapped_column(ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True)
+    total_movies: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    statistics: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class BackgroundJob(Base):
+    """
+    Status and progress of a long-running admin job (e.g. a streaming movie
+    import). The worker running the job updates the row as it goes, so any
+    worker can answer a status poll.
+    """
+    __tablename__ = "background_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(40), index=True)
+    status: Mapped[str] = mapped_column(String(20), default="queued")
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    report: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Touched on every progress write; a running job that stops updating was interrupted
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
 class Movie(Base):
     __tablename__ = "movies"
 
@@ -159,21 +193,33 @@ class Movie(Base):
     last_reviewed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    curated_by: Mapped["User | None"] = relationship(lazy="selectin")
+    curated_by: Mapped["User | None"] = relationship(lazy="raise_on_sql")
 
     genres: Mapped[List[Genre]] = relationship(
         back_populates="movies",
         secondary=movie_genres,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     people: Mapped[List["Person"]] = relationship(
         secondary=movie_people,
         back_populates="movies",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
+class MovieDraftAudit(Base):
+    """One draft publish or discard: which movie, which category, by whom."""
+    __tablename__ = "movie_draft_audit"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), index=True)
+    category: Mapped[str] = mapped_column(String(20))  # trivia | timeline | awards | cast_crew | ...
+    action: Mapped[str] = mapped_column(String(20))  # publish | discard
+    user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+
 class Person(Base):
     __tablename__ = "people"
 
@@ -186,7 +232,7 @@ class Person(Base):
     movies: Mapped[List["Movie"]] = relationship(
         secondary=movie_people,
         back_populates="people",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -247,12 +293,14 @@ class User(Base):
     active_role: Mapped[str | None] = mapped_column(String(50), nullable=True, default="lover")  # Current active role for multi-role users
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime | None] = mapped_column(DateTime, onupdate=datetime.utcnow, nullable=True)
+    # Bumped (UTC) whenever roles or the active role change; principals loaded earlier are stale
+    roles_changed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
-    reviews: Mapped[List["Review"]] = relationship(back_populates="author", lazy="selectin")
-    critic_profile: Mapped["CriticProfile | None"] = relationship(back_populates="user", uselist=False, lazy="selectin")
-    role_profiles: Mapped[List["UserRoleProfile"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="selectin")
-    talent_profile: Mapped["TalentProfile | None"] = relationship(back_populates="user", uselist=False, lazy="selectin")
-    industry_profile: Mapped["IndustryProfile | None"] = relationship(back_populates="user", uselist=False, lazy="selectin")
+    reviews: Mapped[List["Review"]] = relationship(back_populates="author", lazy="raise_on_sql")
+    critic_profile: Mapped["CriticProfile | None"] = relationship(back_populates="user", uselist=False, lazy="raise_on_sql")
+    role_profiles: Mapped[List["UserRoleProfile"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    talent_profile: Mapped["TalentProfile | None"] = relationship(back_populates="user", uselist=False, lazy="raise_on_sql")
+    industry_profile: Mapped["IndustryProfile | None"] = relationship(back_populates="user", uselist=False, lazy="raise_on_sql")
 
 
 class UserRoleProfile(Base):
@@ -354,8 +402,59 @@ class Review(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"))
 
-    author: Mapped["User"] = relationship(back_populates="reviews", lazy="selectin")
-    movie: Mapped["Movie"] = relationship(lazy="selectin")
+    author: Mapped["User"] = relationship(back_populates="reviews", lazy="raise_on_sql")
+    movie: Mapped["Movie"] = relationship(lazy="raise_on_sql")
+
+
+class UserReviewStats(Base):
+    """
+    Per-reviewer review aggregates, maintained incrementally by ReviewRepository.
+    rating_sum is stored instead of the average so deltas stay exact.
+    """
+    __tablename__ = "user_review_stats"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    helpful_votes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def avg_rating(self) -> float | None:
+        return self.rating_sum / self.review_count if self.review_count else None
+
+
+class MovieReviewStats(Base):
+    """Per-movie review aggregates, maintained alongside UserReviewStats."""
+    __tablename__ = "movie_review_stats"
+
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    helpful_votes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def avg_rating(self) -> float | None:
+        return self.rating_sum / self.review_count if self.review_count else None
+
+
+class UserStats(Base):
+    """
+    Per-user profile counters, maintained incrementally by the review,
+    watchlist, favorite, collection and follow write paths.
+    """
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    reviews: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    watchlist: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    favorites: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # movie favorites only
+    collections: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Indexed: the Pulse timeline looks up high-follower authors by this count
+    followers: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+    following: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class Collection(Base):
@@ -368,13 +467,17 @@ class Collection(Base):
     is_public: Mapped[bool] = mapped_column(Boolean, default=True)
     followers: Mapped[int] = mapped_column(Integer, default=0)
     tags: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array as text
+    # Card fields kept in step with collection_movies by CollectionRepository,
+    # so listing collections never reads their movies
+    movie_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    preview_posters: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, onupdate=datetime.utcnow)
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
-    creator: Mapped["User"] = relationship(lazy="selectin")
-    movies: Mapped[List["Movie"]] = relationship(secondary=collection_movies, lazy="selectin")
+    creator: Mapped["User"] = relationship(lazy="raise_on_sql")
+    movies: Mapped[List["Movie"]] = relationship(secondary=collection_movies, lazy="raise_on_sql")
 
 
 class Watchlist(Base):
@@ -393,8 +496,8 @@ class Watchlist(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"))
 
-    user: Mapped["User"] = relationship(lazy="selectin")
-    movie: Mapped["Movie"] = relationship(lazy="selectin")
+    user: Mapped["User"] = relationship(lazy="raise_on_sql")
+    movie: Mapped["Movie"] = relationship(lazy="raise_on_sql")
 
 
 class Favorite(Base):
@@ -409,9 +512,9 @@ class Favorite(Base):
     movie_id: Mapped[int | None] = mapped_column(ForeignKey("movies.id"), nullable=True)
     person_id: Mapped[int | None] = mapped_column(ForeignKey("people.id"), nullable=True)
 
-    user: Mapped["User"] = relationship(lazy="selectin")
-    movie: Mapped["Movie | None"] = relationship(lazy="selectin")
-    person: Mapped["Person | None"] = relationship(lazy="selectin")
+    user: Mapped["User"] = relationship(lazy="raise_on_sql")
+    movie: Mapped["Movie | None"] = relationship(lazy="raise_on_sql")
+    person: Mapped["Person | None"] = relationship(lazy="raise_on_sql")
 
 
 
@@ -612,8 +715,19 @@ class Festival(Base):
     image_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     logo_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     founding_year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # The edition festival cards and headers show: the upcoming one, else the
+    # latest year. FestivalsRepository resets it on every edition write.
+    current_edition_id: Mapped[int | None] = mapped_column(
+        ForeignKey("festival_editions.id", use_alter=True, name="fk_festivals_current_edition_id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    # Bumped on every edit of the festival's editions, program or winners;
+    # cached program/winners documents are keyed by it
+    content_version: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
 
-    editions: Mapped[List["FestivalEdition"]] = relationship(back_populates="festival", lazy="selectin")
+    editions: Mapped[List["FestivalEdition"]] = relationship(
+        back_populates="festival", lazy="selectin", foreign_keys="FestivalEdition.festival_id"
+    )
 
 
 class FestivalEdition(Base):
@@ -627,7 +741,7 @@ class FestivalEdition(Base):
     status: Mapped[str | None] = mapped_column(String(20), nullable=True)  # upcoming | live | past
 
     festival_id: Mapped[int] = mapped_column(ForeignKey("festivals.id"))
-    festival: Mapped["Festival"] = relationship(back_populates="editions", lazy="selectin")
+    festival: Mapped["Festival"] = relationship(back_populates="editions", lazy="selectin", foreign_keys=[festival_id])
 
     program_sections: Mapped[List["FestivalProgramSection"]] = relationship(back_populates="edition", lazy="selectin")
     winner_categories: Mapped[List["FestivalWinnerCategory"]] = relationship(back_populates="edition", lazy="selectin")
@@ -750,8 +864,8 @@ class UserFollow(Base):
     __tablename__ = "user_follows"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    follower_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
-    following_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    follower_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    following_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
@@ -765,7 +879,7 @@ class Pulse(Base):
     user: Mapped["User"] = relationship(lazy="selectin")
 
     content_text: Mapped[str] = mapped_column(Text)
-    content_media: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array of {type,url,thumbnailUrl}
+    content_media: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # array of URLs or {type,url,thumbnailUrl}
 
     linked_type: Mapped[str | None] = mapped_column(String(20), nullable=True)  # movie | cricket
     linked_external_id: Mapped[str | None] = mapped_column(String(80), nullable=True)
@@ -774,9 +888,10 @@ class Pulse(Base):
     linked_movie_id: Mapped[int | None] = mapped_column(ForeignKey("movies.id"), nullable=True)
     linked_movie: Mapped["Movie | None"] = relationship(lazy="selectin")
 
-    hashtags: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array of strings
+    hashtags: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # array of strings
 
-    reactions_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON object with reaction counts
+    # {reaction type: count}; changed only by single UPDATE statements (PulseRepository.react)
+    reactions_json: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
     reactions_total: Mapped[int] = mapped_column(Integer, default=0)
     comments_count: Mapped[int] = mapped_column(Integer, default=0)
     shares_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -785,6 +900,44 @@ class Pulse(Base):
     edited_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
 
+class PulseTimelineEntry(Base):
+    """
+    One row per (follower, pulse): the "following" feed inbox, written when a
+    pulse is created. Authors with many followers are not fanned out; their
+    pulses are merged in when the feed is read.
+    """
+    __tablename__ = "pulse_timeline"
+    __table_args__ = (
+        Index("ix_pulse_timeline_owner_keyset", "owner_id", "created_at", "pulse_id"),
+    )
+
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    pulse_id: Mapped[int] = mapped_column(ForeignKey("pulses.id", ondelete="CASCADE"), primary_key=True)
+    author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    # Copy of pulses.created_at so the inbox pages on its own index
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class PulseHashtag(Base):
+    """Hashtags of a pulse, one row each, written with the pulse."""
+    __tablename__ = "pulse_hashtags"
+
+    pulse_id: Mapped[int] = mapped_column(ForeignKey("pulses.id", ondelete="CASCADE"), primary_key=True)
+    tag: Mapped[str] = mapped_column(String(120), primary_key=True, index=True)
+
+
+class PulseHashtagBucket(Base):
+    """
+    Pulses per hashtag per hour. ``hour`` counts hours since the Unix epoch
+    (UTC), so decay weights are plain integer arithmetic on every dialect.
+    """
+    __tablename__ = "pulse_hashtag_buckets"
+
+    tag: Mapped[str] = mapped_column(String(120), primary_key=True)
+    hour: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
 class TrendingTopic(Base):
     __tablename__ = "trending_topics"
 
@@ -1313,6 +1466,7 @@ class CriticVerificationApplication(Base):
 
 class CriticAnalytics(Base):
     __tablename__ = "critic_analytics"
+    __table_args__ = (UniqueConstraint("critic_id", "date", name="uq_critic_analytics_date"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     critic_id: Mapped[int] = mapped_column(ForeignKey("critic_profiles.id", ondelete="CASCADE"), index=True)
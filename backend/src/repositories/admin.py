@@ -14,6 +14,14 @@ from ..models import (
     AdminMetricSnapshot,
     Movie,
 )
+from .loader_profiles import load_profile
+from .pagination import Keyset, SortKey, cursor_page
+
+
+USERS_KEYSET = Keyset("admin:users", SortKey(User.id))
+MODERATION_KEYSET = Keyset(
+    "admin:moderation", SortKey(ModerationItem.created_at, descending=True), SortKey(ModerationItem.id, descending=True)
+)
 
 
 class AdminRepository:
@@ -28,7 +36,8 @@ class AdminRepository:
         status: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
-    ) -> List[Dict[str, Any]]:
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
         q = (
             select(User, AdminUserMeta)
             .outerjoin(AdminUserMeta, AdminUserMeta.user_id == User.id)
@@ -41,9 +50,13 @@ class AdminRepository:
             q = q.where(func.jsonb_contains(AdminUserMeta.roles, func.to_jsonb([role])))  # type: ignore
         if status:
             q = q.where(AdminUserMeta.status == status)
-        q = q.offset((page - 1) * limit).limit(limit)
-        res = await self.session.execute(q)
-        rows = res.all()
+        next_cursor = None
+        if cursor is None:
+            q = q.order_by(*USERS_KEYSET.order_by()).offset((page - 1) * limit).limit(limit)
+            rows = (await self.session.execute(q)).all()
+        else:
+            rows = (await self.session.execute(USERS_KEYSET.apply(q, cursor, limit))).all()
+            rows, next_cursor = USERS_KEYSET.page(rows, limit, entity=lambda row: row[0])
         items: List[Dict[str, Any]] = []
         for u, meta in rows:
             items.append(
@@ -62,7 +75,7 @@ class AdminRepository:
                     "location": (meta.location if meta else None),
                 }
             )
-        return items
+        return items if cursor is None else cursor_page(items, next_cursor)
 
     async def list_moderation_items(
         self,
@@ -72,7 +85,8 @@ class AdminRepository:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
-    ) -> List[Dict[str, Any]]:
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
         q = select(ModerationItem).options(selectinload(ModerationItem.actions))
         if status:
             q = q.where(ModerationItem.status == status)
@@ -81,8 +95,13 @@ class AdminRepository:
         if search:
             s = f"%{search.lower()}%"
             q = q.where(or_(func.lower(ModerationItem.content_title).like(s), func.lower(ModerationItem.report_reason).like(s)))
-        q = q.order_by(ModerationItem.created_at.desc()).offset((page - 1) * limit).limit(limit)
-        rows = (await self.session.execute(q)).scalars().all()
+        next_cursor = None
+        if cursor is None:
+            q = q.order_by(*MODERATION_KEYSET.order_by()).offset((page - 1) * limit).limit(limit)
+            rows = (await self.session.execute(q)).scalars().all()
+        else:
+            rows = (await self.session.execute(MODERATION_KEYSET.apply(q, cursor, limit))).scalars().all()
+            rows, next_cursor = MODERATION_KEYSET.page(rows, limit)
         out: List[Dict[str, Any]] = []
         for m in rows:
             out.append(
@@ -97,7 +116,7 @@ class AdminRepository:
                     "reports": m.reporter_count,
                 }
             )
-        return out
+        return out if cursor is None else cursor_page(out, next_cursor)
 
     async def set_moderation_action(self, *, item_external_id: str, action: str, reason: Optional[str] = None) -> Dict[str, Any]:
         item = (
@@ -177,7 +196,7 @@ class AdminRepository:
             Tuple of (movies_list, total_count)
         """
         # Build base query with eager loading
-        query = select(Movie).options(selectinload(Movie.curated_by))
+        query = select(Movie).options(*load_profile("movie_curation"))
 
         # Apply filters
         if curation_status:
@@ -235,7 +254,7 @@ class AdminRepository:
             HTTPException: If movie not found
         """
         # Fetch movie
-        query = select(Movie).where(Movie.id == movie_id).options(selectinload(Movie.curated_by))
+        query = select(Movie).where(Movie.id == movie_id).options(*load_profile("movie_curation"))
         result = await self.session.execute(query)
         movie = result.scalar_one_or_none()
 
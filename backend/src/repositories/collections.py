@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, List
-from sqlalchemy import select, desc, delete, insert, and_
+from typing import Any, Iterable, List
+from sqlalchemy import select, desc, delete, insert, update, and_, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import uuid
 
 from ..models import Collection, User, Movie, collection_movies, collection_likes
+from .loader_profiles import load_profile
+from .user_stats import UserStatsRepository
+
+PREVIEW_POSTERS = 4
 
 
 class CollectionRepository:
@@ -23,7 +27,7 @@ class CollectionRepository:
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Collection)
+        q = select(Collection).options(*load_profile("collection_card"))
         if user_id:
             q = q.join(Collection.creator).where(User.external_id == user_id)
         if is_public is not None:
@@ -37,9 +41,9 @@ class CollectionRepository:
                 "title": c.title,
                 "description": c.description,
                 "creator": c.creator.name,
-                "movieCount": len(c.movies),
+                "movieCount": c.movie_count,
                 "followers": c.followers,
-                "posterImages": [m.poster_url for m in c.movies[:4] if m.poster_url],
+                "posterImages": list(c.preview_posters or []),
                 "isPublic": c.is_public,
                 "createdAt": c.created_at.isoformat(),
                 "updatedAt": c.updated_at.isoformat() if c.updated_at else None,
@@ -48,10 +52,61 @@ class CollectionRepository:
             for c in collections
         ]
 
+    def _preview_query(self, collection_id: int):
+        return (
+            select(Movie.poster_url)
+            .join(collection_movies, collection_movies.c.movie_id == Movie.id)
+            .where(collection_movies.c.collection_id == collection_id, Movie.poster_url.is_not(None))
+            .order_by(collection_movies.c.movie_id)
+            .limit(PREVIEW_POSTERS)
+        )
+
+    async def _sync_card(self, collection: Collection, delta: int) -> None:
+        """
+        Apply a membership change to the card columns: ``movie_count`` moves by
+        ``delta`` in SQL (safe against concurrent adds) and ``preview_posters``
+        is re-read with a LIMIT query, so the cost does not grow with the collection.
+        """
+        posters = list((await self.session.execute(self._preview_query(collection.id))).scalars().all())
+        await self.session.execute(
+            update(Collection)
+            .where(Collection.id == collection.id)
+            .values(movie_count=Collection.movie_count + delta, preview_posters=posters)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    async def refresh_cards(self, collection_ids: Iterable[int] | None = None) -> int:
+        """
+        Recompute ``movie_count`` and ``preview_posters`` from collection_movies.
+        For seeds and repairs after rows were written around this repository.
+        """
+        if not self.session:
+            return 0
+        q = select(Collection.id)
+        if collection_ids is not None:
+            q = q.where(Collection.id.in_(list(collection_ids)))
+        ids = (await self.session.execute(q)).scalars().all()
+        for cid in ids:
+            count = (
+                select(func.count())
+                .select_from(collection_movies)
+                .where(collection_movies.c.collection_id == cid)
+                .scalar_subquery()
+            )
+            posters = list((await self.session.execute(self._preview_query(cid))).scalars().all())
+            await self.session.execute(
+                update(Collection)
+                .where(Collection.id == cid)
+                .values(movie_count=count, preview_posters=posters)
+                .execution_options(synchronize_session=False)
+            )
+        await self.session.flush()
+        return len(ids)
+
     async def get(self, external_id: str) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Collection).where(Collection.external_id == external_id)
+        q = select(Collection).where(Collection.external_id == external_id).options(*load_profile("collection_detail"))
         res = await self.session.execute(q)
         c = res.scalar_one_or_none()
         if not c:
@@ -99,10 +154,13 @@ class CollectionRepository:
             description=description,
             is_public=is_public,
             followers=0,
+            movie_count=0,
+            preview_posters=[],
             created_at=datetime.utcnow(),
         )
         self.session.add(collection)
         await self.session.flush()
+        await UserStatsRepository(self.session).apply(user_id, collections=1)
         await self.session.refresh(collection, ["creator"])
 
         return {
@@ -151,16 +209,16 @@ class CollectionRepository:
 
         collection.updated_at = datetime.utcnow()
         await self.session.flush()
-        await self.session.refresh(collection, ["creator", "movies"])
+        await self.session.refresh(collection, ["creator"])
 
         return {
             "id": collection.external_id,
             "title": collection.title,
             "description": collection.description,
             "creator": collection.creator.name,
-            "movieCount": len(collection.movies),
+            "movieCount": collection.movie_count,
             "followers": collection.followers,
-            "posterImages": [m.poster_url for m in collection.movies[:4] if m.poster_url],
+            "posterImages": list(collection.preview_posters or []),
             "isPublic": collection.is_public,
             "createdAt": collection.created_at.isoformat(),
             "updatedAt": collection.updated_at.isoformat() if collection.updated_at else None,
@@ -212,6 +270,7 @@ class CollectionRepository:
         )
         collection.updated_at = datetime.utcnow()
         await self.session.flush()
+        await self._sync_card(collection, 1)
         return True
 
     async def remove_movie(
@@ -242,7 +301,7 @@ class CollectionRepository:
             return False
 
         # Delete from collection
-        await self.session.execute(
+        result = await self.session.execute(
             delete(collection_movies).where(
                 collection_movies.c.collection_id == collection.id,
                 collection_movies.c.movie_id == movie.id,
@@ -250,6 +309,8 @@ class CollectionRepository:
         )
         collection.updated_at = datetime.utcnow()
         await self.session.flush()
+        if result.rowcount:
+            await self._sync_card(collection, -result.rowcount)
         return True
 
     async def delete_collection(self, collection_id: str, user_id: int) -> bool:
@@ -277,6 +338,7 @@ class CollectionRepository:
         )
 
         # Delete collection
+        await UserStatsRepository(self.session).apply(collection.user_id, collections=-1)
         await self.session.delete(collection)
         await self.session.flush()
         return True
@@ -338,7 +400,7 @@ class CollectionRepository:
         if not self.session:
             return None
 
-        # Get the source collection
+        # Get the source collection (its movies are copied in SQL, never loaded)
         coll_res = await self.session.execute(
             select(Collection).where(Collection.external_id == collection_id)
         )
@@ -359,30 +421,34 @@ class CollectionRepository:
             is_public=False,  # Imported collections are private by default
             followers=0,
             tags=source_collection.tags,
+            movie_count=0,
+            preview_posters=[],
             created_at=datetime.utcnow(),
         )
         self.session.add(new_collection)
         await self.session.flush()
+        await UserStatsRepository(self.session).apply(user_id, collections=1)
 
-        # Copy all movies from the source collection
-        for movie in source_collection.movies:
-            await self.session.execute(
-                insert(collection_movies).values(
-                    collection_id=new_collection.id,
-                    movie_id=movie.id,
-                )
+        # Copy all movies from the source collection with one INSERT ... SELECT
+        await self.session.execute(
+            insert(collection_movies).from_select(
+                ["collection_id", "movie_id"],
+                select(literal(new_collection.id), collection_movies.c.movie_id).where(
+                    collection_movies.c.collection_id == source_collection.id
+                ),
             )
-        await self.session.flush()
-        await self.session.refresh(new_collection, ["creator", "movies"])
+        )
+        await self.refresh_cards([new_collection.id])
+        await self.session.refresh(new_collection, ["creator", "movie_count", "preview_posters"])
 
         return {
             "id": new_collection.external_id,
             "title": new_collection.title,
             "description": new_collection.description,
             "creator": new_collection.creator.name,
-            "movieCount": len(new_collection.movies),
+            "movieCount": new_collection.movie_count,
             "followers": new_collection.followers,
-            "posterImages": [m.poster_url for m in new_collection.movies[:4] if m.poster_url],
+            "posterImages": list(new_collection.preview_posters or []),
             "isPublic": new_collection.is_public,
             "createdAt": new_collection.created_at.isoformat(),
         }
@@ -1,5 +1,5 @@
 """Critic Hub - Critic Reviews Repository"""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
@@ -7,6 +7,13 @@ import uuid
 import re
 
 from ..models import CriticReview, CriticReviewComment, CriticReviewLike, CriticProfile, Movie, User
+from ..services.engagement_buffer import engagement_buffer
+from .pagination import Keyset, SortKey
+
+
+REVIEWS_KEYSET = Keyset(
+    "critic-reviews:published", SortKey(CriticReview.published_at, descending=True), SortKey(CriticReview.id, descending=True)
+)
 
 
 class CriticReviewRepository:
@@ -147,6 +154,24 @@ class CriticReviewRepository:
         await self.db.commit()
         return result.rowcount > 0
 
+    def _critic_reviews_query(self, critic_id: int, include_drafts: bool, drafts_only: bool = False):
+        query = select(CriticReview).where(CriticReview.critic_id == critic_id)
+        if drafts_only:
+            query = query.where(CriticReview.is_draft == True)
+        elif not include_drafts:
+            query = query.where(CriticReview.is_draft == False)
+        return query
+
+    def _movie_reviews_query(self, movie_id: int):
+        return select(CriticReview).where(
+            (CriticReview.movie_id == movie_id) &
+            (CriticReview.is_draft == False)
+        )
+
+    async def _page(self, query, cursor: str, limit: int) -> Tuple[List[CriticReview], Optional[str]]:
+        result = await self.db.execute(REVIEWS_KEYSET.apply(query, cursor, limit))
+        return REVIEWS_KEYSET.page(result.scalars().all(), limit)
+
     async def list_reviews_by_critic(
         self,
         critic_id: int,
@@ -155,15 +180,22 @@ class CriticReviewRepository:
         offset: int = 0
     ) -> List[CriticReview]:
         """List reviews by critic"""
-        query = select(CriticReview).where(CriticReview.critic_id == critic_id)
-        
-        if not include_drafts:
-            query = query.where(CriticReview.is_draft == False)
-        
-        query = query.order_by(CriticReview.published_at.desc()).limit(limit).offset(offset)
+        query = self._critic_reviews_query(critic_id, include_drafts)
+        query = query.order_by(*REVIEWS_KEYSET.order_by()).limit(limit).offset(offset)
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def page_reviews_by_critic(
+        self,
+        critic_id: int,
+        cursor: str,
+        include_drafts: bool = False,
+        drafts_only: bool = False,
+        limit: int = 20
+    ) -> Tuple[List[CriticReview], Optional[str]]:
+        """Keyset page of a critic's reviews; returns (reviews, next_cursor)"""
+        return await self._page(self._critic_reviews_query(critic_id, include_drafts, drafts_only), cursor, limit)
+
     async def list_reviews_by_movie(
         self,
         movie_id: int,
@@ -171,22 +203,27 @@ class CriticReviewRepository:
         offset: int = 0
     ) -> List[CriticReview]:
         """List reviews for a movie"""
-        query = select(CriticReview).where(
-            (CriticReview.movie_id == movie_id) &
-            (CriticReview.is_draft == False)
-        ).order_by(CriticReview.published_at.desc()).limit(limit).offset(offset)
-        
+        query = self._movie_reviews_query(movie_id).order_by(*REVIEWS_KEYSET.order_by()).limit(limit).offset(offset)
+
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def page_reviews_by_movie(
+        self,
+        movie_id: int,
+        cursor: str,
+        limit: int = 20
+    ) -> Tuple[List[CriticReview], Optional[str]]:
+        """Keyset page of a movie's published critic reviews; returns (reviews, next_cursor)"""
+        return await self._page(self._movie_reviews_query(movie_id), cursor, limit)
+
     async def increment_view_count(self, review_id: int) -> None:
-        """Increment view count for a review"""
-        await self.db.execute(
-            update(CriticReview)
-            .where(CriticReview.id == review_id)
-            .values(view_count=CriticReview.view_count + 1)
-        )
-        await self.db.commit()
+        """Record a view; persisted by the engagement buffer's next batched flush"""
+        engagement_buffer.record(review_id, views=1)
+
+    async def record_share(self, review_id: int) -> None:
+        """Record a share; persisted by the engagement buffer's next batched flush"""
+        engagement_buffer.record(review_id, shares=1)
 
     async def like_review(self, review_id: int, user_id: int) -> CriticReviewLike:
         """Like a review"""
@@ -195,16 +232,11 @@ class CriticReviewRepository:
             user_id=user_id
         )
         self.db.add(like)
-        
-        # Increment like count
-        await self.db.execute(
-            update(CriticReview)
-            .where(CriticReview.id == review_id)
-            .values(like_count=CriticReview.like_count + 1)
-        )
-        
         await self.db.commit()
         await self.db.refresh(like)
+
+        # like_count is a buffered counter; the like row above is the source of truth
+        engagement_buffer.record(review_id, likes=1)
         return like
 
     async def unlike_review(self, review_id: int, user_id: int) -> bool:
@@ -217,13 +249,8 @@ class CriticReviewRepository:
         )
         
         if result.rowcount > 0:
-            # Decrement like count
-            await self.db.execute(
-                update(CriticReview)
-                .where(CriticReview.id == review_id)
-                .values(like_count=CriticReview.like_count - 1)
-            )
             await self.db.commit()
+            engagement_buffer.record(review_id, likes=-1)
             return True
         
         return False
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import uuid
 
-from ..models import CriticProfile, CriticSocialLink, CriticFollower, User
+from ..models import CriticAnalytics, CriticProfile, CriticSocialLink, CriticFollower, User
 
 
 class CriticRepository:
@@ -74,6 +74,16 @@ class CriticRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_views_since(self, critic_id: int, since: datetime) -> int:
+        """Sum of daily analytics views for a critic since ``since``"""
+        result = await self.db.execute(
+            select(func.coalesce(func.sum(CriticAnalytics.total_views), 0)).where(
+                CriticAnalytics.critic_id == critic_id,
+                CriticAnalytics.date >= since,
+            )
+        )
+        return int(result.scalar_one())
+
     async def update_critic_profile(
         self,
         critic_id: int,
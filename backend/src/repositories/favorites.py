@@ -7,6 +7,8 @@ from datetime import datetime
 import uuid
 
 from ..models import Favorite, User, Movie, Person
+from .loader_profiles import load_profile
+from .user_stats import UserStatsRepository
 
 
 class FavoriteRepository:
@@ -23,7 +25,7 @@ class FavoriteRepository:
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Favorite)
+        q = select(Favorite).options(*load_profile("favorite_item"))
         if user_id:
             q = q.join(Favorite.user).where(User.external_id == user_id)
         if type_filter and type_filter != "all":
@@ -55,7 +57,7 @@ class FavoriteRepository:
     async def get(self, external_id: str) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Favorite).where(Favorite.external_id == external_id)
+        q = select(Favorite).where(Favorite.external_id == external_id).options(*load_profile("favorite_item"))
         res = await self.session.execute(q)
         f = res.scalar_one_or_none()
         if not f:
@@ -140,6 +142,8 @@ class FavoriteRepository:
         )
         self.session.add(favorite)
         await self.session.flush()
+        if fav_type == "movie":
+            await UserStatsRepository(self.session).apply(user_id, favorites=1)
 
         return {
             "id": favorite.external_id,
@@ -163,6 +167,8 @@ class FavoriteRepository:
         if favorite.user_id != user_id:
             raise ValueError("User does not own this favorite")
 
+        if favorite.type == "movie":
+            await UserStatsRepository(self.session).apply(favorite.user_id, favorites=-1)
         await self.session.delete(favorite)
         await self.session.flush()
         return True
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select as _select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import case, delete, func, update, select as _select
 
 from ..models import (
     Festival,
@@ -13,6 +12,14 @@ from ..models import (
     FestivalWinnerCategory,
     FestivalWinner,
 )
+from ..services.festival_cache import festival_cache
+
+# Which edition is a festival's current one: the upcoming edition, else the latest year
+CURRENT_EDITION_ORDER = (
+    case((func.lower(FestivalEdition.status) == "upcoming", 0), else_=1),
+    FestivalEdition.year.desc(),
+    FestivalEdition.id.desc(),
+)
 
 
 class FestivalsRepository:
@@ -20,26 +27,24 @@ class FestivalsRepository:
         self.session = session
 
     async def list_festivals(self) -> List[dict[str, Any]]:
+        # Plain columns: loading Festival rows would pull in every edition,
+        # section and entry through the selectin relationships
         q = (
-            _select(Festival)
-            .options(selectinload(Festival.editions))
+            _select(
+                Festival.external_id, Festival.name, Festival.location, Festival.image_url,
+                Festival.description, FestivalEdition.dates, FestivalEdition.status,
+            )
+            .outerjoin(FestivalEdition, FestivalEdition.id == Festival.current_edition_id)
             .order_by(Festival.name)
         )
-        festivals = (await self.session.execute(q)).scalars().all()
         items: List[dict[str, Any]] = []
-        for f in festivals:
-            # Derive a current/upcoming edition if present
-            edition = None
-            if f.editions:
-                # Prefer upcoming, else latest year
-                upcoming = [e for e in f.editions if (e.status or "").lower() == "upcoming"]
-                edition = (upcoming[0] if upcoming else sorted(f.editions, key=lambda e: e.year, reverse=True)[0])
+        for f in (await self.session.execute(q)).all():
             items.append(
                 {
                     "id": f.external_id,
                     "name": f.name,
                     "location": f.location,
-                    "dates": edition.dates if edition else None,
+                    "dates": f.dates,
                     "image": f.image_url,
                     "description": f.description,
                     "categories": [
@@ -47,7 +52,7 @@ class FestivalsRepository:
                         "Un Certain Regard",
                         "Directors' Fortnight",
                     ],
-                    "status": edition.status if edition else None,
+                    "status": f.status,
                 }
             )
         return items
@@ -55,50 +60,82 @@ class FestivalsRepository:
     async def get_festival_header(self, festival_id: str) -> dict[str, Any] | None:
         f = (
             await self.session.execute(
-                _select(Festival)
+                _select(
+                    Festival.external_id, Festival.name, Festival.location, Festival.website,
+                    Festival.image_url, Festival.logo_url, Festival.description,
+                    FestivalEdition.edition_label, FestivalEdition.dates, FestivalEdition.status,
+                )
+                .outerjoin(FestivalEdition, FestivalEdition.id == Festival.current_edition_id)
                 .where(Festival.external_id == festival_id)
-                .options(selectinload(Festival.editions))
             )
-        ).scalars().first()
+        ).first()
         if not f:
             return None
-        # Choose latest edition
-        ed = None
-        if f.editions:
-            ed = sorted(f.editions, key=lambda e: e.year, reverse=True)[0]
         return {
             "id": f.external_id,
             "name": f.name,
-            "edition": ed.edition_label if ed else None,
-            "dates": ed.dates if ed else None,
+            "edition": f.edition_label,
+            "dates": f.dates,
             "location": f.location,
             "website": f.website,
             "image": f.image_url,
             "logo": f.logo_url,
-            "status": ed.status if ed else None,
+            "status": f.status,
             "description": f.description,
         }
 
+    async def _cached(
+        self,
+        festival_id: str,
+        year: int,
+        kind: str,
+        build: Callable[[int, int], Awaitable[Any]],
+    ) -> Any:
+        """
+        The ``kind`` document of one edition: from ``festival_cache`` while the
+        festival's content_version is unchanged, else built by ``build(festival pk,
+        year)`` and cached. None when the festival or edition does not exist.
+        """
+        festival = (
+            await self.session.execute(
+                _select(Festival.id, Festival.content_version).where(Festival.external_id == festival_id)
+            )
+        ).first()
+        if not festival:
+            return None
+        found, document = await festival_cache.get(festival_id, year, kind, festival.content_version)
+        if not found:
+            document = await build(festival.id, year)
+            await festival_cache.set(festival_id, year, kind, festival.content_version, document)
+        return document
+
     async def get_program(self, festival_id: str, year: int) -> dict[str, List[dict[str, Any]]] | None:
-        ed = (
+        return await self._cached(festival_id, year, "program", self._build_program)
+
+    async def _build_program(self, festival_pk: int, year: int) -> dict[str, List[dict[str, Any]]] | None:
+        rows = (
             await self.session.execute(
-                _select(FestivalEdition)
-                .join(Festival)
-                .where(Festival.external_id == festival_id, FestivalEdition.year == year)
-                .options(
-                    selectinload(FestivalEdition.program_sections).selectinload(FestivalProgramSection.entries)
+                _select(
+                    FestivalEdition.id, FestivalProgramSection.name, FestivalProgramEntry.id.label("entry_id"),
+                    FestivalProgramEntry.title, FestivalProgramEntry.director, FestivalProgramEntry.country,
+                    FestivalProgramEntry.premiere, FestivalProgramEntry.image_url,
                 )
+                .outerjoin(FestivalProgramSection, FestivalProgramSection.edition_id == FestivalEdition.id)
+                .outerjoin(FestivalProgramEntry, FestivalProgramEntry.section_id == FestivalProgramSection.id)
+                .where(FestivalEdition.festival_id == festival_pk, FestivalEdition.year == year)
+                .order_by(FestivalEdition.id, FestivalProgramSection.id, FestivalProgramEntry.id)
             )
-        ).scalars().first()
-        if not ed:
+        ).all()
+        if not rows:
             return None
         out: Dict[str, List[Dict[str, Any]]] = {"competition": [], "outOfCompetition": [], "specialScreenings": []}
-        for sec in ed.program_sections:
-            key = sec.name
-            if key not in out:
-                out[key] = []
-            for e in sec.entries:
-                out[key].append(
+        for e in rows:
+            # Same-year duplicates: the first edition wins, as with .first() before
+            if e.id != rows[0].id or e.name is None:
+                continue
+            entries = out.setdefault(e.name, [])
+            if e.entry_id is not None:
+                entries.append(
                     {
                         "title": e.title,
                         "director": e.director,
@@ -110,38 +147,176 @@ class FestivalsRepository:
         return out
 
     async def get_winners(self, festival_id: str, year: int) -> List[dict[str, Any]] | None:
-        ed = (
+        return await self._cached(festival_id, year, "winners", self._build_winners)
+
+    async def _build_winners(self, festival_pk: int, year: int) -> List[dict[str, Any]] | None:
+        rows = (
             await self.session.execute(
-                _select(FestivalEdition)
-                .join(Festival)
-                .where(Festival.external_id == festival_id, FestivalEdition.year == year)
-                .options(
-                    selectinload(FestivalEdition.winner_categories).selectinload(FestivalWinnerCategory.winners)
+                _select(
+                    FestivalEdition.id, FestivalWinnerCategory.id.label("category_pk"),
+                    FestivalWinnerCategory.external_id, FestivalWinnerCategory.name,
+                    FestivalWinner.id.label("winner_id"), FestivalWinner.movie_title, FestivalWinner.movie_poster_url,
+                    FestivalWinner.recipient, FestivalWinner.director, FestivalWinner.citation, FestivalWinner.rating,
                 )
+                .outerjoin(FestivalWinnerCategory, FestivalWinnerCategory.edition_id == FestivalEdition.id)
+                .outerjoin(FestivalWinner, FestivalWinner.category_id == FestivalWinnerCategory.id)
+                .where(FestivalEdition.festival_id == festival_pk, FestivalEdition.year == year)
+                .order_by(FestivalEdition.id, FestivalWinnerCategory.id, FestivalWinner.id)
             )
-        ).scalars().first()
-        if not ed:
+        ).all()
+        if not rows:
             return None
         results: List[dict[str, Any]] = []
-        for cat in ed.winner_categories:
-            results.append(
-                {
-                    "id": cat.external_id,
-                    "categoryName": cat.name,
-                    "winners": [
-                        {
-                            "id": str(w.id),
-                            "movieId": None,
-                            "movieTitle": w.movie_title,
-                            "moviePoster": w.movie_poster_url,
-                            "recipient": w.recipient,
-                            "director": w.director,
-                            "citation": w.citation,
-                            "rating": w.rating,
-                        }
-                        for w in cat.winners
-                    ],
-                }
-            )
+        categories: Dict[int, dict[str, Any]] = {}
+        for w in rows:
+            if w.id != rows[0].id or w.category_pk is None:
+                continue
+            cat = categories.get(w.category_pk)
+            if cat is None:
+                cat = categories[w.category_pk] = {"id": w.external_id, "categoryName": w.name, "winners": []}
+                results.append(cat)
+            if w.winner_id is not None:
+                cat["winners"].append(
+                    {
+                        "id": str(w.winner_id),
+                        "movieId": None,
+                        "movieTitle": w.movie_title,
+                        "moviePoster": w.movie_poster_url,
+                        "recipient": w.recipient,
+                        "director": w.director,
+                        "citation": w.citation,
+                        "rating": w.rating,
+                    }
+                )
         return results
 
+    # ------------------------------------------------------------------
+    # Writes: every one resets current_edition_id and bumps content_version
+    # ------------------------------------------------------------------
+
+    async def refresh_current_editions(self, festival_pks: Sequence[int] | None = None) -> None:
+        """Point current_edition_id of the given festivals (default: all) at their current edition."""
+        current = (
+            _select(FestivalEdition.id)
+            .where(FestivalEdition.festival_id == Festival.id)
+            .order_by(*CURRENT_EDITION_ORDER)
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = update(Festival).values(current_edition_id=current)
+        if festival_pks is not None:
+            stmt = stmt.where(Festival.id.in_(list(festival_pks)))
+        await self.session.execute(stmt.execution_options(synchronize_session=False))
+
+    async def _festival_pk(self, festival_id: str) -> int | None:
+        return (
+            await self.session.execute(_select(Festival.id).where(Festival.external_id == festival_id))
+        ).scalar_one_or_none()
+
+    async def _edition_pk(self, festival_pk: int, year: int) -> int | None:
+        return (
+            await self.session.execute(
+                _select(FestivalEdition.id)
+                .where(FestivalEdition.festival_id == festival_pk, FestivalEdition.year == year)
+                .order_by(FestivalEdition.id)
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+
+    async def touch(self, festival_pks: Sequence[int] | None = None) -> None:
+        """
+        After editing festivals (default: all) outside the methods below, e.g.
+        when seeding: reset their current edition and retire cached documents.
+        """
+        await self.refresh_current_editions(festival_pks)
+        stmt = update(Festival).values(content_version=Festival.content_version + 1)
+        if festival_pks is not None:
+            stmt = stmt.where(Festival.id.in_(list(festival_pks)))
+        await self.session.execute(stmt.execution_options(synchronize_session=False))
+
+    async def _commit_edit(self, festival_id: str, festival_pk: int) -> None:
+        await self.touch([festival_pk])
+        await self.session.commit()
+        festival_cache.invalidate(festival_id)
+
+    async def upsert_edition(self, festival_id: str, year: int, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Create or update the ``year`` edition (edition_label, dates, status); returns the header."""
+        festival_pk = await self._festival_pk(festival_id)
+        if festival_pk is None:
+            return None
+        edition_pk = await self._edition_pk(festival_pk, year)
+        if edition_pk is None:
+            self.session.add(
+                FestivalEdition(external_id=f"{festival_id}-{year}", year=year, festival_id=festival_pk, **data)
+            )
+            await self.session.flush()
+        elif data:
+            await self.session.execute(
+                update(FestivalEdition)
+                .where(FestivalEdition.id == edition_pk)
+                .values(**data)
+                .execution_options(synchronize_session=False)
+            )
+        await self._commit_edit(festival_id, festival_pk)
+        return await self.get_festival_header(festival_id)
+
+    async def replace_program(
+        self, festival_id: str, year: int, program: dict[str, List[dict[str, Any]]]
+    ) -> dict[str, List[dict[str, Any]]] | None:
+        """Replace the edition's sections and entries; ``program`` has the shape get_program returns."""
+        festival_pk = await self._festival_pk(festival_id)
+        edition_pk = await self._edition_pk(festival_pk, year) if festival_pk is not None else None
+        if edition_pk is None:
+            return None
+        sections = _select(FestivalProgramSection.id).where(FestivalProgramSection.edition_id == edition_pk)
+        await self.session.execute(delete(FestivalProgramEntry).where(FestivalProgramEntry.section_id.in_(sections)))
+        await self.session.execute(delete(FestivalProgramSection).where(FestivalProgramSection.edition_id == edition_pk))
+        for name, entries in program.items():
+            section = FestivalProgramSection(name=name, edition_id=edition_pk)
+            self.session.add(section)
+            await self.session.flush()
+            self.session.add_all([
+                FestivalProgramEntry(
+                    section_id=section.id,
+                    title=e["title"],
+                    director=e.get("director"),
+                    country=e.get("country"),
+                    premiere=e.get("premiere"),
+                    image_url=e.get("image"),
+                )
+                for e in entries
+            ])
+        await self.session.flush()
+        await self._commit_edit(festival_id, festival_pk)
+        return await self.get_program(festival_id, year)
+
+    async def replace_winners(
+        self, festival_id: str, year: int, categories: List[dict[str, Any]]
+    ) -> List[dict[str, Any]] | None:
+        """Replace the edition's winner categories and winners; ``categories`` has the shape get_winners returns."""
+        festival_pk = await self._festival_pk(festival_id)
+        edition_pk = await self._edition_pk(festival_pk, year) if festival_pk is not None else None
+        if edition_pk is None:
+            return None
+        existing = _select(FestivalWinnerCategory.id).where(FestivalWinnerCategory.edition_id == edition_pk)
+        await self.session.execute(delete(FestivalWinner).where(FestivalWinner.category_id.in_(existing)))
+        await self.session.execute(delete(FestivalWinnerCategory).where(FestivalWinnerCategory.edition_id == edition_pk))
+        for c in categories:
+            category = FestivalWinnerCategory(external_id=c["id"], name=c["categoryName"], edition_id=edition_pk)
+            self.session.add(category)
+            await self.session.flush()
+            self.session.add_all([
+                FestivalWinner(
+                    category_id=category.id,
+                    movie_title=w.get("movieTitle"),
+                    movie_poster_url=w.get("moviePoster"),
+                    recipient=w.get("recipient"),
+                    director=w.get("director"),
+                    citation=w.get("citation"),
+                    rating=w.get("rating"),
+                )
+                for w in c.get("winners") or []
+            ])
+        await self.session.flush()
+        await self._commit_edit(festival_id, festival_pk)
+        return await self.get_winners(festival_id, year)
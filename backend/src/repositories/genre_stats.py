@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from sqlalchemy import case, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models import GenreStatsSnapshot, Movie, Person, movie_genres, movie_people
+from .upsert import dialect_insert
+
+
+TOP_DIRECTORS = 5
+TOP_ACTORS = 10
+TOP_MOVIES = 3
+
+# Movie fields the statistics block is computed from; changing any of them
+# on a movie means its genres' snapshots must be refreshed.
+AGGREGATED_FIELDS = frozenset({"title", "poster_url", "year", "language", "country", "siddu_score", "genres"})
+
+# siddu_score buckets: "0-1", "1-2", ..., "9-10"
+_RATING_BUCKETS = [(f"{i}-{i + 1}", i + 1) for i in range(10)]
+
+
+def empty_statistics() -> dict[str, Any]:
+    return {
+        "totalMovies": 0,
+        "averageRating": 0,
+        "topDirectors": [],
+        "peakDecade": "",
+        "top3MoviesBySidduScoreInGenre": [],
+        "availableCountries": [],
+        "availableLanguages": [],
+        "popularityTrend": [],
+        "ratingDistribution": [],
+        "subgenreBreakdown": [],
+        "topActorsInGenre": [],
+        "releaseFrequencyByYear": [],
+    }
+
+
+class GenreStatsRepository:
+    """
+    Computes the genre-page statistics block with grouped SQL aggregates and
+    stores it in genre_stats_snapshots, so reads are a single PK lookup.
+
+    Call ``refresh_for_movies`` after importing or curating movies; it only
+    recomputes the genres those movies belong to. Snapshots older than
+    ``genre_stats_max_age_seconds`` are also rebuilt on read (``is_stale``),
+    which covers writers that do not call it.
+    """
+
+    def __init__(self, session: AsyncSession | None) -> None:
+        self.session = session
+
+    def _in_genre(self, genre_id: int):
+        return select(movie_genres.c.movie_id).where(movie_genres.c.genre_id == genre_id).scalar_subquery()
+
+    async def compute(self, genre_id: int) -> dict[str, Any]:
+        assert self.session is not None
+        in_genre = Movie.id.in_(self._in_genre(genre_id))
+        stats = empty_statistics()
+
+        total, avg_rating = (
+            await self.session.execute(select(func.count(Movie.id), func.avg(Movie.siddu_score)).where(in_genre))
+        ).one()
+        stats["totalMovies"] = total
+        stats["averageRating"] = round(float(avg_rating), 2) if avg_rating is not None else 0
+        if not total:
+            return stats
+
+        for key, role, limit in (("topDirectors", "director", TOP_DIRECTORS), ("topActorsInGenre", "actor", TOP_ACTORS)):
+            movie_count = func.count(movie_people.c.movie_id).label("movie_count")
+            rows = await self.session.execute(
+                select(Person.external_id, Person.name, Person.image_url, movie_count)
+                .join(movie_people, movie_people.c.person_id == Person.id)
+                .where(movie_people.c.role == role, movie_people.c.movie_id.in_(self._in_genre(genre_id)))
+                .group_by(Person.id, Person.external_id, Person.name, Person.image_url)
+                .order_by(desc(movie_count), Person.name)
+                .limit(limit)
+            )
+            stats[key] = [
+                {"id": r.external_id, "name": r.name, "imageUrl": r.image_url, "movieCount": r.movie_count}
+                for r in rows
+            ]
+
+        top_movies = await self.session.execute(
+            select(Movie.external_id, Movie.title, Movie.poster_url, Movie.siddu_score)
+            .where(in_genre, Movie.siddu_score.is_not(None))
+            .order_by(desc(Movie.siddu_score), Movie.title)
+            .limit(TOP_MOVIES)
+        )
+        stats["top3MoviesBySidduScoreInGenre"] = [
+            {"id": r.external_id, "title": r.title, "posterUrl": r.poster_url, "sidduScore": r.siddu_score}
+            for r in top_movies
+        ]
+
+        for key, column in (("availableCountries", Movie.country), ("availableLanguages", Movie.language)):
+            n = func.count(Movie.id).label("n")
+            rows = await self.session.execute(
+                select(column, n).where(in_genre, column.is_not(None)).group_by(column).order_by(desc(n), column)
+            )
+            stats[key] = [value for value, _ in rows]
+
+        bucket = case(
+            *[(Movie.siddu_score < upper, label) for label, upper in _RATING_BUCKETS[:-1]],
+            else_=_RATING_BUCKETS[-1][0],
+        ).label("bucket")
+        rows = await self.session.execute(
+            select(bucket, func.count(Movie.id))
+            .where(in_genre, Movie.siddu_score.is_not(None))
+            .group_by(bucket)
+        )
+        by_bucket = dict(rows.all())
+        stats["ratingDistribution"] = [
+            {"range": label, "count": by_bucket.get(label, 0)} for label, _ in _RATING_BUCKETS
+        ]
+
+        # One row per distinct year; the decade roll-up below is bounded by that, not by movie count.
+        rows = await self.session.execute(
+            select(Movie.year, func.count(Movie.id))
+            .where(in_genre, Movie.year.is_not(None))
+            .group_by(Movie.year)
+            .order_by(Movie.year)
+        )
+        by_year = [(year, count) for year, count in rows if year and year.isdigit()]
+        stats["releaseFrequencyByYear"] = [{"year": int(year), "count": count} for year, count in by_year]
+        decades: dict[int, int] = {}
+        for year, count in by_year:
+            decade = int(year) // 10 * 10
+            decades[decade] = decades.get(decade, 0) + count
+        if decades:
+            peak = max(decades.items(), key=lambda item: (item[1], item[0]))[0]
+            stats["peakDecade"] = f"{peak}s"
+
+        return stats
+
+    async def refresh(self, genre_ids: Iterable[int]) -> int:
+        """Recompute and upsert snapshots for ``genre_ids``. Caller commits."""
+        if not self.session:
+            return 0
+        insert = dialect_insert(self.session)
+        refreshed = 0
+        for genre_id in sorted(set(genre_ids)):
+            stats = await self.compute(genre_id)
+            stmt = insert(GenreStatsSnapshot.__table__).values(
+                genre_id=genre_id,
+                total_movies=stats["totalMovies"],
+                statistics=stats,
+                refreshed_at=datetime.utcnow(),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["genre_id"],
+                set_={
+                    "total_movies": stmt.excluded.total_movies,
+                    "statistics": stmt.excluded.statistics,
+                    "refreshed_at": stmt.excluded.refreshed_at,
+                },
+            )
+            await self.session.execute(stmt)
+            refreshed += 1
+        return refreshed
+
+    async def genre_ids_for_movies(self, movie_ids: Iterable[int]) -> set[int]:
+        movie_ids = list(set(movie_ids))
+        if not self.session or not movie_ids:
+            return set()
+        rows = await self.session.execute(
+            select(movie_genres.c.genre_id).where(movie_genres.c.movie_id.in_(movie_ids)).distinct()
+        )
+        return set(rows.scalars().all())
+
+    async def refresh_for_movies(self, movie_ids: Iterable[int], also_genre_ids: Iterable[int] = ()) -> int:
+        """
+        Refresh the snapshots of every genre linked to ``movie_ids``, plus
+        ``also_genre_ids`` (genres a movie was just unlinked from). Caller commits.
+        """
+        genre_ids = await self.genre_ids_for_movies(movie_ids) | set(also_genre_ids)
+        return await self.refresh(genre_ids)
+
+    @staticmethod
+    def is_stale(snapshot: GenreStatsSnapshot) -> bool:
+        max_age = settings.genre_stats_max_age_seconds
+        if max_age <= 0 or snapshot.refreshed_at is None:
+            return False
+        return datetime.utcnow() - snapshot.refreshed_at > timedelta(seconds=max_age)
+
+    async def get(self, genre_id: int) -> GenreStatsSnapshot | None:
+        if not self.session:
+            return None
+        return await self.session.get(GenreStatsSnapshot, genre_id, populate_existing=True)
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Genre, Movie
+from .genre_stats import GenreStatsRepository, empty_statistics
 
 
 class GenreRepository:
@@ -12,60 +13,33 @@ class GenreRepository:
         self.session = session
 
     async def get_details(self, genre_slug: str) -> dict[str, Any] | None:
-        # Minimal placeholder; expand with real aggregates later
         if not self.session:
             # Return stub to enable vertical slice
-            return {
-                "id": genre_slug,
-                "name": genre_slug.title(),
-                "description": "",
-                "backgroundImage": "",
-                "subgenres": [],
-                "statistics": {
-                    "totalMovies": 0,
-                    "averageRating": 0,
-                    "topDirectors": [],
-                    "peakDecade": "",
-                    "top3MoviesBySidduScoreInGenre": [],
-                    "availableCountries": [],
-                    "availableLanguages": [],
-                    "popularityTrend": [],
-                    "ratingDistribution": [],
-                    "subgenreBreakdown": [],
-                    "topActorsInGenre": [],
-                    "releaseFrequencyByYear": [],
-                },
-                "relatedGenres": [],
-                "curatedCollections": [],
-                "notableFigures": [],
-                "evolutionTimeline": [],
-            }
-        # DB-backed (simplified)
+            return self._details(genre_slug, genre_slug.title(), empty_statistics())
         q = select(Genre).where(Genre.slug == genre_slug)
         res = await self.session.execute(q)
         g = res.scalar_one_or_none()
         if not g:
             return None
+        stats_repo = GenreStatsRepository(self.session)
+        snapshot = await stats_repo.get(g.id)
+        if snapshot is None or stats_repo.is_stale(snapshot):
+            # First view of a genre that has never been refreshed, or an expired snapshot
+            await stats_repo.refresh([g.id])
+            await self.session.commit()
+            snapshot = await stats_repo.get(g.id)
+        statistics = {**empty_statistics(), **(snapshot.statistics if snapshot else {})}
+        return self._details(g.slug, g.name, statistics)
+
+    @staticmethod
+    def _details(slug: str, name: str, statistics: dict[str, Any]) -> dict[str, Any]:
         return {
-            "id": g.slug,
-            "name": g.name,
+            "id": slug,
+            "name": name,
             "description": "",
             "backgroundImage": "",
             "subgenres": [],
-            "statistics": {
-                "totalMovies": len(g.movies),
-                "averageRating": 0,
-                "topDirectors": [],
-                "peakDecade": "",
-                "top3MoviesBySidduScoreInGenre": [],
-                "availableCountries": [],
-                "availableLanguages": [],
-                "popularityTrend": [],
-                "ratingDistribution": [],
-                "subgenreBreakdown": [],
-                "topActorsInGenre": [],
-                "releaseFrequencyByYear": [],
-            },
+            "statistics": statistics,
             "relatedGenres": [],
             "curatedCollections": [],
             "notableFigures": [],
@@ -0,0 +1,105 @@
+"""
+Loader profiles for the core catalog and user graph.
+
+Relationships between Movie, Genre, Person, User, Review, Collection,
+Watchlist and Favorite are declared ``lazy="raise_on_sql"`` in models.py, so a
+plain ``select(Movie)`` loads exactly one row set. Each repository states the
+part of the graph it renders by opting into a named profile:
+
+    q = select(Movie).options(*load_profile("movie_card"))
+
+Touching a relationship that the profile did not load raises
+``InvalidRequestError`` instead of silently walking the object graph.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from ..models import Collection, Favorite, Movie, Person, Review, User, Watchlist
+
+
+# Movie listings and search results: scalar columns plus genre names.
+MOVIE_CARD: Tuple[LoaderOption, ...] = (
+    selectinload(Movie.genres),
+)
+
+# Movie detail page. People, reviews, scenes and streaming options are read
+# with dedicated column queries, so only genres come through the ORM graph.
+MOVIE_DETAIL: Tuple[LoaderOption, ...] = (
+    selectinload(Movie.genres),
+)
+
+# Authenticated principal: the user row and its role toggles.
+USER_AUTH: Tuple[LoaderOption, ...] = (
+    selectinload(User.role_profiles),
+)
+
+# Review cards: author, reviewed movie and that movie's genres.
+REVIEW_LIST: Tuple[LoaderOption, ...] = (
+    selectinload(Review.author),
+    selectinload(Review.movie).selectinload(Movie.genres),
+)
+
+# Reviews embedded in the movie detail page only need their author.
+REVIEW_AUTHOR: Tuple[LoaderOption, ...] = (
+    selectinload(Review.author),
+)
+
+# Collection cards: creator name only. The movie count and first posters are
+# the denormalized Collection.movie_count / preview_posters columns.
+COLLECTION_CARD: Tuple[LoaderOption, ...] = (
+    selectinload(Collection.creator),
+)
+
+# Collection detail: every movie with its genres.
+COLLECTION_DETAIL: Tuple[LoaderOption, ...] = (
+    selectinload(Collection.creator),
+    selectinload(Collection.movies).selectinload(Movie.genres),
+)
+
+# Watchlist and favorites entries render a movie card (or a person).
+WATCHLIST_ITEM: Tuple[LoaderOption, ...] = (
+    selectinload(Watchlist.movie).selectinload(Movie.genres),
+)
+
+FAVORITE_ITEM: Tuple[LoaderOption, ...] = (
+    selectinload(Favorite.movie).selectinload(Movie.genres),
+    selectinload(Favorite.person),
+)
+
+# Person page filmography.
+PERSON_DETAIL: Tuple[LoaderOption, ...] = (
+    selectinload(Person.movies),
+)
+
+# Admin curation screens show who curated each movie.
+MOVIE_CURATION: Tuple[LoaderOption, ...] = (
+    selectinload(Movie.curated_by),
+)
+
+
+PROFILES: dict[str, Tuple[LoaderOption, ...]] = {
+    "movie_card": MOVIE_CARD,
+    "movie_detail": MOVIE_DETAIL,
+    "user_auth": USER_AUTH,
+    "review_list": REVIEW_LIST,
+    "review_author": REVIEW_AUTHOR,
+    "collection_card": COLLECTION_CARD,
+    "collection_detail": COLLECTION_DETAIL,
+    "watchlist_item": WATCHLIST_ITEM,
+    "favorite_item": FAVORITE_ITEM,
+    "person_detail": PERSON_DETAIL,
+    "movie_curation": MOVIE_CURATION,
+}
+
+
+def load_profile(name: str) -> Tuple[LoaderOption, ...]:
+    """Return the loader options registered under ``name``."""
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise KeyError(f"Unknown loader profile '{name}'. Known profiles: {', '.join(sorted(PROFILES))}") from None
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
 from typing import Any, List, Optional
-from sqlalchemy import select, desc, asc, or_, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Movie, Genre, Review, Scene, MovieStreamingOption, StreamingPlatform
+from .loader_profiles import load_profile
+from .pagination import Keyset, SortKey, cursor_page
+from .search import movie_search
+
+
+_BY_SCORE = Keyset("movies:score", SortKey(Movie.siddu_score, descending=True), SortKey(Movie.id, descending=True))
+
+# sortBy -> order; each ends in id so keyset cursors are unambiguous.
+MOVIE_KEYSETS: dict[str, Keyset] = {
+    "": Keyset("movies:id", SortKey(Movie.id)),
+    "latest": Keyset("movies:latest", SortKey(Movie.year, descending=True), SortKey(Movie.id, descending=True)),
+    "score": _BY_SCORE,
+    "rating": _BY_SCORE,
+    "popular": _BY_SCORE,
+    "alphabetical": Keyset("movies:title", SortKey(Movie.title), SortKey(Movie.id)),
+    "alphabetical-desc": Keyset("movies:title-desc", SortKey(Movie.title, descending=True), SortKey(Movie.id, descending=True)),
+}
 
 
 class MovieRepository:
@@ -24,10 +41,16 @@ class MovieRepository:
         rating_min: Optional[float] = None,
         rating_max: Optional[float] = None,
         sort_by: Optional[str] = None,
-    ) -> List[dict[str, Any]]:
+        cursor: Optional[str] = None,
+    ) -> List[dict[str, Any]] | dict[str, Any]:
+        """
+        List movies with filters. Offset paging via ``page`` by default; pass
+        ``cursor`` ("" for the first page) for keyset paging, which returns
+        ``{"items": [...], "next_cursor": ...}`` instead of a bare list.
+        """
         if not self.session:
-            return []
-        q = select(Movie)
+            return [] if cursor is None else cursor_page([], None)
+        q = select(Movie).options(*load_profile("movie_card"))
         if genre_slug:
             q = q.join(Movie.genres).where(Genre.slug == genre_slug)
         if year_min is not None:
@@ -42,21 +65,17 @@ class MovieRepository:
             q = q.where(Movie.siddu_score >= rating_min)
         if rating_max is not None:
             q = q.where(Movie.siddu_score <= rating_max)
-        # sorting
-        if sort_by == "latest":
-            q = q.order_by(desc(Movie.year))
-        elif sort_by in ("score", "rating"):
-            q = q.order_by(desc(Movie.siddu_score))
-        elif sort_by == "popular":
-            q = q.order_by(desc(Movie.siddu_score))
-        elif sort_by == "alphabetical":
-            q = q.order_by(asc(Movie.title))
-        elif sort_by == "alphabetical-desc":
-            q = q.order_by(desc(Movie.title))
-        q = q.limit(limit).offset((page - 1) * limit)
+        keyset = MOVIE_KEYSETS.get(sort_by or "", MOVIE_KEYSETS[""])
+        if cursor is None:
+            q = q.order_by(*keyset.order_by()).limit(limit).offset((page - 1) * limit)
+        else:
+            q = keyset.apply(q, cursor, limit)
         res = await self.session.execute(q)
         movies = res.scalars().all()
-        return [
+        next_cursor = None
+        if cursor is not None:
+            movies, next_cursor = keyset.page(movies, limit)
+        items = [
             {
                 "id": m.external_id,
                 "title": m.title,
@@ -71,11 +90,12 @@ class MovieRepository:
             }
             for m in movies
         ]
+        return items if cursor is None else cursor_page(items, next_cursor)
 
     async def get(self, external_id: str) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Movie).where(Movie.external_id == external_id)
+        q = select(Movie).where(Movie.external_id == external_id).options(*load_profile("movie_detail"))
         res = await self.session.execute(q)
         m = res.scalar_one_or_none()
         if not m:
@@ -115,7 +135,12 @@ class MovieRepository:
                 cast.append(person_dict)
 
         # Get reviews
-        reviews_query = select(Review).where(Review.movie_id == m.id).limit(10)
+        reviews_query = (
+            select(Review)
+            .where(Review.movie_id == m.id)
+            .options(*load_profile("review_author"))
+            .limit(10)
+        )
         reviews_result = await self.session.execute(reviews_query)
         reviews_list = []
         for review in reviews_result.scalars():
@@ -209,35 +234,19 @@ class MovieRepository:
         limit: int = 10,
     ) -> List[dict[str, Any]]:
         """
-        Search movies by title or description.
-        Returns results ordered by relevance (exact title match first, then partial matches).
+        Search movies by title, tagline or description.
+        Returns results ordered by relevance (full-text rank plus title
+        similarity on Postgres; exact, then prefix title matches elsewhere).
         """
         if not self.session or not query:
             return []
 
-        # Normalize query for case-insensitive search
-        search_term = f"%{query}%"
-
-        # Build search query - search in title and overview only
-        # This avoids the DISTINCT issue with genre joins
+        where, order_by = movie_search(self.session, query.strip())
         q = (
             select(Movie)
-            .where(
-                or_(
-                    func.lower(Movie.title).like(func.lower(search_term)),
-                    func.lower(Movie.overview).like(func.lower(search_term)),
-                )
-            )
-            .order_by(
-                # Exact match (case-insensitive)
-                desc(func.lower(Movie.title) == func.lower(query)),
-                # Starts with query
-                desc(func.lower(Movie.title).like(func.lower(f"{query}%"))),
-                # Then by popularity (siddu_score)
-                desc(Movie.siddu_score),
-                # Then by year (newest first)
-                desc(Movie.year),
-            )
+            .options(*load_profile("movie_card"))
+            .where(where)
+            .order_by(*order_by)
             .limit(limit)
         )
 
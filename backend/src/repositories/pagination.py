@@ -0,0 +1,140 @@
+"""
+Keyset ("cursor") pagination for list endpoints.
+
+A ``Keyset`` names the ORDER BY of a listing, always ending in a unique
+column (normally ``id``). Instead of ``OFFSET n`` the next page is requested
+with an opaque token holding the sort-key values of the last row returned,
+and the query resumes with a ``WHERE (key1, key2, ...) > (v1, v2, ...)``
+predicate that a composite index on the same columns can seek into:
+
+    KEYSET = Keyset("movies:score", SortKey(Movie.siddu_score, descending=True),
+                    SortKey(Movie.id, descending=True))
+
+    q = KEYSET.apply(q, cursor, limit)          # ORDER BY + seek + LIMIT limit+1
+    rows = (await session.execute(q)).scalars().all()
+    rows, next_cursor = KEYSET.page(rows, limit)
+
+Nullable sort columns sort NULLS LAST on every dialect. Offset paging keeps
+working: call ``order_by()`` and apply ``offset``/``limit`` as before.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import and_, false, literal, or_, tuple_
+
+
+class InvalidCursor(ValueError):
+    """Raised for a malformed cursor, or one issued for a different sort order."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    expr: Any
+    descending: bool = False
+    # How to read this key's value from a result row; defaults to the mapped attribute.
+    value: Callable[[Any], Any] | None = None
+
+    @property
+    def nullable(self) -> bool:
+        column = getattr(self.expr, "expression", self.expr)
+        return bool(getattr(column, "nullable", True))
+
+    def order_by(self):
+        clause = self.expr.desc() if self.descending else self.expr.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def extract(self, row: Any) -> Any:
+        if self.value is not None:
+            return self.value(row)
+        return getattr(row, self.expr.key)
+
+    def equals(self, value: Any):
+        return self.expr.is_(None) if value is None else self.expr == value
+
+    def beyond(self, value: Any):
+        if value is None:
+            # NULLs sort last, so nothing follows them within this key.
+            return None
+        clause = self.expr < value if self.descending else self.expr > value
+        return or_(clause, self.expr.is_(None)) if self.nullable else clause
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+class Keyset:
+    def __init__(self, name: str, *keys: SortKey) -> None:
+        self.name = name
+        self.keys = keys
+
+    def order_by(self) -> list:
+        return [key.order_by() for key in self.keys]
+
+    def encode(self, row: Any) -> str:
+        payload = {"s": self.name, "k": [_encode_value(key.extract(row)) for key in self.keys]}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = [_decode_value(v) for v in payload["k"]]
+            name = payload["s"]
+        except (binascii.Error, ValueError, KeyError, TypeError) as e:
+            raise InvalidCursor("malformed cursor") from e
+        if name != self.name or len(values) != len(self.keys):
+            raise InvalidCursor("cursor does not match this listing's sort order")
+        return values
+
+    def after(self, values: Sequence[Any]):
+        """Predicate selecting rows strictly after ``values`` in this sort order."""
+        directions = {key.descending for key in self.keys}
+        if len(directions) == 1 and not any(key.nullable for key in self.keys):
+            # Uniform direction, no NULLs: a row-value comparison the index can seek on.
+            row = tuple_(*(key.expr for key in self.keys))
+            bound = tuple_(*(literal(v, key.expr.type) for key, v in zip(self.keys, values)))
+            return row < bound if self.keys[0].descending else row > bound
+        branches = []
+        for i, key in enumerate(self.keys):
+            step = key.beyond(values[i])
+            if step is None:
+                continue
+            equal_prefix = [k.equals(v) for k, v in zip(self.keys[:i], values[:i])]
+            branches.append(and_(*equal_prefix, step))
+        return or_(*branches) if branches else false()
+
+    def apply(self, q, cursor: str | None, limit: int):
+        """Order ``q``, seek past ``cursor`` and fetch one extra row to detect more pages."""
+        q = q.order_by(*self.order_by())
+        if cursor:
+            q = q.where(self.after(self.decode(cursor)))
+        return q.limit(limit + 1)
+
+    def page(self, rows: Sequence[Any], limit: int, entity: Callable[[Any], Any] | None = None) -> tuple[list, str | None]:
+        """Trim the look-ahead row; return the page and the cursor for the next one."""
+        items = list(rows[:limit])
+        if len(rows) <= limit or not items:
+            return items, None
+        last = items[-1] if entity is None else entity(items[-1])
+        return items, self.encode(last)
+
+
+def cursor_page(items: list, next_cursor: str | None) -> dict[str, Any]:
+    return {"items": items, "next_cursor": next_cursor}
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Person, Movie, movie_people
+from .loader_profiles import load_profile
 
 
 class PeopleRepository:
@@ -29,7 +30,7 @@ class PeopleRepository:
     async def get(self, external_id: str) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Person).where(Person.external_id == external_id)
+        q = select(Person).where(Person.external_id == external_id).options(*load_profile("person_detail"))
         res = await self.session.execute(q)
         p = res.scalar_one_or_none()
         if not p:
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
-import json
 import uuid
 
-from sqlalchemy import select, desc
+from sqlalchemy import Text, case, cast, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import Pulse, User, UserFollow, Movie
+from ..models import Pulse, User, Movie
+from .pagination import Keyset, SortKey, cursor_page
+from .pulse_hashtags import PulseHashtagRepository, normalize_hashtags, trending_cache
+from .pulse_timeline import PulseTimelineRepository
 
 
 def _slugify_username(name: str | None) -> str:
@@ -18,30 +21,38 @@ def _slugify_username(name: str | None) -> str:
     return "".join(ch.lower() if ch.isalnum() else "" for ch in name) or "user"
 
 
-def _parse_json_array(text: Optional[str]) -> List[Any]:
-    if not text:
-        return []
-    try:
-        return json.loads(text)
-    except Exception:
-        return []
+REACTION_TYPES = ("love", "fire", "mindblown", "laugh", "sad", "angry")
 
 
-def _parse_json_obj(text: Optional[str]) -> Dict[str, int]:
-    if not text:
-        return {}
-    try:
-        data = json.loads(text)
-        if isinstance(data, dict):
-            return {k: int(v) for k, v in data.items() if isinstance(v, (int, float))}
-        return {}
-    except Exception:
-        return {}
+# Backed by the ix_pulses_popular_keyset / ix_pulses_trending_keyset expression
+# indexes; keep the expression and its direction in sync with that migration.
+_ENGAGEMENT = SortKey(
+    Pulse.reactions_total + Pulse.comments_count + Pulse.shares_count,
+    descending=True,
+    value=lambda p: (p.reactions_total or 0) + (p.comments_count or 0) + (p.shares_count or 0),
+)
+FEED_LATEST = Keyset("pulse:latest", SortKey(Pulse.created_at, descending=True), SortKey(Pulse.id, descending=True))
+FEED_POPULAR = Keyset(
+    "pulse:popular", _ENGAGEMENT, SortKey(Pulse.created_at, descending=True), SortKey(Pulse.id, descending=True)
+)
+FEED_TRENDING = Keyset("pulse:trending", _ENGAGEMENT, SortKey(Pulse.id, descending=True))
+
+
+def _infer_category(tag: str) -> Optional[str]:
+    """Naive category inference based on tags."""
+    lower = tag.lower()
+    if "ipl" in lower or "cricket" in lower or "indv" in lower:
+        return "cricket"
+    if any(k in lower for k in ["oscar", "cannes", "festival"]):
+        return "event"
+    return "movie" if lower.startswith("#") else "general"
 
 
 class PulseRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.timeline = PulseTimelineRepository(session)
+        self.hashtags = PulseHashtagRepository(session)
 
     def _base_query(self):
         return (
@@ -56,7 +67,13 @@ class PulseRepository:
         page: int = 1,
         limit: int = 20,
         viewer_external_id: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
+        """
+        Feed listing. ``page`` pages by offset; ``cursor`` ("" for the first
+        page) pages by keyset and returns ``{"items", "next_cursor"}``.
+        """
+        empty: List[Dict[str, Any]] | Dict[str, Any] = [] if cursor is None else cursor_page([], None)
         q = self._base_query()
 
         # Window handling
@@ -67,74 +84,59 @@ class PulseRepository:
         elif window == "30d":
             delta = timedelta(days=30)
 
-        if filter_type == "latest":
-            q = q.order_by(desc(Pulse.created_at))
-        elif filter_type == "popular":
-            q = q.order_by(desc(Pulse.reactions_total + Pulse.comments_count + Pulse.shares_count), desc(Pulse.created_at))
+        keyset = FEED_LATEST
+        if filter_type == "popular":
+            keyset = FEED_POPULAR
         elif filter_type == "trending":
-            q = q.where(Pulse.created_at >= (now - delta)).order_by(desc(Pulse.reactions_total + Pulse.comments_count + Pulse.shares_count))
+            q = q.where(Pulse.created_at >= (now - delta))
+            keyset = FEED_TRENDING
         elif filter_type == "following":
-            if viewer_external_id:
-                viewer = (await self.session.execute(select(User).where(User.external_id == viewer_external_id))).scalar_one_or_none()
-                if viewer:
-                    following_rows = (
-                        await self.session.execute(select(UserFollow.following_id).where(UserFollow.follower_id == viewer.id))
-                    ).scalars().all()
-                    if following_rows:
-                        q = q.where(Pulse.user_id.in_(following_rows)).order_by(desc(Pulse.created_at))
-                    else:
-                        return []
-                else:
-                    return []
-            else:
-                return []
-        else:
-            q = q.order_by(desc(Pulse.created_at))
+            if not viewer_external_id:
+                return empty
+            viewer_id = (
+                await self.session.execute(select(User.id).where(User.external_id == viewer_external_id))
+            ).scalar_one_or_none()
+            if viewer_id is None:
+                return empty
 
         if limit is None or limit <= 0:
             limit = 20
         if page is None or page <= 0:
             page = 1
 
-        q = q.limit(limit).offset((page - 1) * limit)
-        rows = (await self.session.execute(q)).scalars().all()
-
-        return [self._to_dto(p) for p in rows]
-
-    async def trending_topics(self, window: str = "7d", limit: int = 10) -> List[Dict[str, Any]]:
-        now = datetime.utcnow()
-        delta = timedelta(days=7)
-        if window == "24h":
-            delta = timedelta(hours=24)
-        elif window == "30d":
-            delta = timedelta(days=30)
-
-        q = self._base_query().where(Pulse.created_at >= (now - delta))
-        rows = (await self.session.execute(q)).scalars().all()
-
-        counts: Dict[str, int] = {}
-        for p in rows:
-            tags = _parse_json_array(p.hashtags)
-            for tag in tags:
-                if not isinstance(tag, str):
-                    continue
-                counts[tag] = counts.get(tag, 0) + 1
-
-        items = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-        # Add naive category inference based on tags
-        def infer_category(tag: str) -> Optional[str]:
-            lower = tag.lower()
-            if "ipl" in lower or "cricket" in lower or "indv" in lower:
-                return "cricket"
-            if any(k in lower for k in ["oscar", "cannes", "festival"]):
-                return "event"
-            return "movie" if lower.startswith("#") else "general"
-
-        out = [
-            {"id": i + 1, "tag": tag, "count": cnt, "category": infer_category(tag)}
-            for i, (tag, cnt) in enumerate(items)
+        if filter_type == "following":
+            # Inbox rows plus pulses of followed high-follower authors, each
+            # side cut to the rows this page can use (see PulseTimelineRepository)
+            if cursor is None:
+                candidates = self.timeline.candidate_ids(viewer_id, keyset, None, page * limit)
+            else:
+                after = keyset.decode(cursor) if cursor else None
+                candidates = self.timeline.candidate_ids(viewer_id, keyset, after, limit + 1)
+            q = q.where(Pulse.id.in_(select(candidates.subquery().c.id)))
+
+        if cursor is None:
+            q = q.order_by(*keyset.order_by()).limit(limit).offset((page - 1) * limit)
+            rows = (await self.session.execute(q)).scalars().all()
+            return [self._to_dto(p) for p in rows]
+
+        rows = (await self.session.execute(keyset.apply(q, cursor, limit))).scalars().all()
+        rows, next_cursor = keyset.page(rows, limit)
+        return cursor_page([self._to_dto(p) for p in rows], next_cursor)
+
+    async def trending_topics(self, window: str = "7d", limit: int = 10, decay: bool = False) -> List[Dict[str, Any]]:
+        """
+        Top hashtags from the hourly counters (never the pulses themselves),
+        ranked per window for ``pulse_trending_cache_seconds``.
+        """
+        key = (window, decay)
+        ranked = trending_cache.get(key)
+        if ranked is None:
+            ranked = await self.hashtags.trending(window, decay=decay)
+            trending_cache.put(key, ranked)
+        return [
+            {"id": i + 1, "tag": t["tag"], "count": t["count"], "category": _infer_category(t["tag"])}
+            for i, t in enumerate(ranked[:limit])
         ]
-        return out
 
     def _to_dto(self, p: Pulse) -> Dict[str, Any]:
         user = p.user
@@ -142,8 +144,8 @@ class PulseRepository:
         display_name = getattr(user, "name", "User")
         avatar_url = getattr(user, "avatar_url", None) or "/user-avatar.png"
 
-        media = _parse_json_array(p.content_media)
-        reactions = _parse_json_obj(p.reactions_json)
+        media = p.content_media or []
+        reactions = p.reactions_json or {}
         total = p.reactions_total or sum(reactions.values())
 
         linked: Optional[Dict[str, Any]] = None
@@ -175,11 +177,11 @@ class PulseRepository:
                 "text": p.content_text,
                 "media": media if media else None,
                 "linkedContent": linked,
-                "hashtags": _parse_json_array(p.hashtags),
+                "hashtags": p.hashtags or [],
             },
             "engagement": {
                 "reactions": {
-                    **{"love": 0, "fire": 0, "mindblown": 0, "laugh": 0, "sad": 0, "angry": 0},
+                    **dict.fromkeys(REACTION_TYPES, 0),
                     **reactions,
                     "total": total,
                 },
@@ -216,15 +218,17 @@ class PulseRepository:
             if movie:
                 movie_id_db = movie.id
 
+        hashtags = normalize_hashtags(hashtags)
+
         # Create pulse
         pulse = Pulse(
             external_id=str(uuid.uuid4()),
             user_id=user_id,
             content_text=content_text,
-            content_media=json.dumps(content_media) if content_media else None,
+            content_media=content_media or None,
             linked_movie_id=movie_id_db,
-            hashtags=json.dumps(hashtags) if hashtags else None,
-            reactions_json="{}",
+            hashtags=hashtags or None,
+            reactions_json={},
             reactions_total=0,
             comments_count=0,
             shares_count=0,
@@ -232,6 +236,8 @@ class PulseRepository:
         )
         self.session.add(pulse)
         await self.session.flush()
+        await self.timeline.fan_out(pulse)
+        await self.hashtags.record(pulse, hashtags)
         await self.session.refresh(pulse, ["user", "linked_movie"])
 
         return self._to_dto(pulse)
@@ -249,7 +255,41 @@ class PulseRepository:
         if pulse.user_id != user_id:
             raise ValueError("User does not own this pulse")
 
+        await self.timeline.remove(pulse.id)
+        await self.hashtags.forget(pulse)
         await self.session.delete(pulse)
         await self.session.flush()
         return True
 
+    def _with_reaction(self, reaction: str, value):
+        """``reactions_json`` with ``reaction`` set to the SQL expression ``value``."""
+        if self.session.get_bind().dialect.name == "sqlite":
+            return func.json_set(Pulse.reactions_json, f"$.{reaction}", value)
+        return func.jsonb_set(Pulse.reactions_json, cast([reaction], ARRAY(Text)), func.to_jsonb(value))
+
+    async def react(self, pulse_id: str, reaction: str, delta: int) -> Dict[str, int] | None:
+        """
+        Add ``delta`` to one reaction count (never below zero) and return the
+        new counts, or None for an unknown pulse. A single UPDATE computes the
+        new values from the row it locks, so concurrent taps are never lost.
+        """
+        if reaction not in REACTION_TYPES:
+            raise ValueError(f"Unknown reaction: {reaction}")
+        current = func.coalesce(Pulse.reactions_json[reaction].as_integer(), 0)
+        updated = case((current + delta < 0, 0), else_=current + delta)
+        row = (
+            await self.session.execute(
+                update(Pulse)
+                .where(Pulse.external_id == pulse_id)
+                .values(
+                    reactions_json=self._with_reaction(reaction, updated),
+                    reactions_total=func.coalesce(Pulse.reactions_total, 0) + (updated - current),
+                )
+                .returning(Pulse.reactions_json, Pulse.reactions_total)
+                .execution_options(synchronize_session=False)
+            )
+        ).one_or_none()
+        if row is None:
+            return None
+        reactions, total = row
+        return {**dict.fromkeys(REACTION_TYPES, 0), **(reactions or {}), "total": total}
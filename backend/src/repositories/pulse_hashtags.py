@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models import Pulse, PulseHashtag, PulseHashtagBucket
+from .upsert import dialect_insert
+
+MAX_TAG_LENGTH = 120
+# Rankings are cached this deep and sliced to the requested limit
+CACHED_TOP = 50
+WINDOWS = {"24h": timedelta(hours=24), "7d": timedelta(days=7), "30d": timedelta(days=30)}
+
+
+def normalize_hashtags(tags: Iterable[Any] | None) -> List[str]:
+    """Trimmed, non-empty, at most 120 characters, first occurrence kept (case-insensitive)."""
+    out: List[str] = []
+    seen: set[str] = set()
+    for tag in tags or []:
+        if not isinstance(tag, str):
+            continue
+        tag = tag.strip()[:MAX_TAG_LENGTH]
+        if tag and tag.lower() not in seen:
+            seen.add(tag.lower())
+            out.append(tag)
+    return out
+
+
+def hour_bucket(at: datetime) -> int:
+    """Hours since the epoch for a naive UTC datetime."""
+    return int(at.replace(tzinfo=timezone.utc).timestamp() // 3600)
+
+
+class TrendingCache:
+    """Per-(window, decay) rankings, each reused for ``ttl_seconds``."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, bool], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, bool]) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, key: Tuple[str, bool], items: List[Dict[str, Any]]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+trending_cache = TrendingCache(settings.pulse_trending_cache_seconds)
+
+
+class PulseHashtagRepository:
+    """
+    ``pulse_hashtags`` rows and hourly ``pulse_hashtag_buckets`` counters,
+    kept in step with pulse create/delete, so trending hashtags are a GROUP BY
+    over at most (tags x hours in the window) bucket rows.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _bump(self, counts: Dict[Tuple[str, int], int]) -> None:
+        if not counts:
+            return
+        table = PulseHashtagBucket.__table__
+        stmt = dialect_insert(self.session)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tag", "hour"],
+            set_={"count": table.c["count"] + stmt.excluded["count"]},
+        )
+        await self.session.execute(
+            stmt, [{"tag": tag, "hour": hour, "count": n} for (tag, hour), n in counts.items()]
+        )
+
+    async def record(self, pulse: Pulse, tags: List[str]) -> None:
+        """Store a new pulse's (already normalized) hashtags and count them in its hour."""
+        if not tags:
+            return
+        await self.session.execute(
+            PulseHashtag.__table__.insert(), [{"pulse_id": pulse.id, "tag": tag} for tag in tags]
+        )
+        hour = hour_bucket(pulse.created_at)
+        await self._bump({(tag, hour): 1 for tag in tags})
+
+    async def forget(self, pulse: Pulse) -> None:
+        """Uncount a pulse that is about to be deleted."""
+        tags = (
+            await self.session.execute(select(PulseHashtag.tag).where(PulseHashtag.pulse_id == pulse.id))
+        ).scalars().all()
+        if not tags:
+            return
+        hour = hour_bucket(pulse.created_at)
+        await self._bump({(tag, hour): -1 for tag in tags})
+        await self.session.execute(delete(PulseHashtag).where(PulseHashtag.pulse_id == pulse.id))
+
+    async def trending(self, window: str, decay: bool = False) -> List[Dict[str, Any]]:
+        """
+        Top hashtags in ``window`` as ``{"tag", "count", "score"}``. With
+        ``decay`` each hour's count is weighted by
+        ``0.5 ** (age_hours / pulse_trending_half_life_hours)``.
+        """
+        now_hour = hour_bucket(datetime.utcnow())
+        since = hour_bucket(datetime.utcnow() - WINDOWS.get(window, WINDOWS["7d"]))
+        B = PulseHashtagBucket
+        total = func.sum(B.count)
+        score = total
+        if decay and settings.pulse_trending_half_life_hours > 0:
+            weight = func.power(0.5, (now_hour - B.hour) / float(settings.pulse_trending_half_life_hours))
+            score = func.sum(B.count * weight)
+        rows = await self.session.execute(
+            select(B.tag, total.label("count"), score.label("score"))
+            .where(B.hour >= since)
+            .group_by(B.tag)
+            .having(total > 0)
+            .order_by(score.desc(), B.tag)
+            .limit(CACHED_TOP)
+        )
+        return [{"tag": tag, "count": int(count), "score": float(s)} for tag, count, s in rows]
+
+    async def rebuild(self) -> int:
+        """Recreate both tables from ``pulses.hashtags`` (seeds, repairs). Returns hashtag rows written."""
+        await self.session.execute(delete(PulseHashtagBucket))
+        await self.session.execute(delete(PulseHashtag))
+        rows: List[Dict[str, Any]] = []
+        counts: Counter[Tuple[str, int]] = Counter()
+        result = await self.session.execute(select(Pulse.id, Pulse.hashtags, Pulse.created_at))
+        for pulse_id, raw, created_at in result:
+            tags = normalize_hashtags(raw if isinstance(raw, list) else [])
+            hour = hour_bucket(created_at)
+            for tag in tags:
+                rows.append({"pulse_id": pulse_id, "tag": tag})
+                counts[(tag, hour)] += 1
+        if rows:
+            await self.session.execute(PulseHashtag.__table__.insert(), rows)
+        await self._bump(dict(counts))
+        await self.session.commit()
+        return len(rows)
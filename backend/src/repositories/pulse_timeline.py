@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import DateTime, Select, delete, exists, insert, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models import Pulse, PulseTimelineEntry, UserFollow, UserStats
+from .pagination import Keyset, SortKey
+
+# Shares its name and key order with PulseRepository's FEED_LATEST, so one
+# cursor seeks both the inbox and the pulses merged in at read time.
+INBOX_LATEST = Keyset(
+    "pulse:latest",
+    SortKey(PulseTimelineEntry.created_at, descending=True),
+    SortKey(PulseTimelineEntry.pulse_id, descending=True),
+)
+
+
+def _high_follower(author_id: Any):
+    """True for authors whose pulses are read from ``pulses`` rather than fanned out."""
+    return exists().where(
+        UserStats.user_id == author_id,
+        UserStats.followers >= settings.pulse_fanout_max_followers,
+    )
+
+
+class PulseTimelineRepository:
+    """
+    Fan-out-on-write inbox behind the Pulse "following" feed.
+
+    ``fan_out`` copies a new pulse into each follower's ``pulse_timeline`` in
+    one INSERT ... SELECT. Authors at or above ``pulse_fanout_max_followers``
+    are skipped; ``candidate_ids`` pulls their pulses straight from ``pulses``
+    and unions them with the viewer's inbox, each side limited to one page,
+    so a read costs the same however many accounts the viewer follows.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def fan_out(self, pulse: Pulse) -> int:
+        high = (await self.session.execute(select(_high_follower(pulse.user_id)))).scalar()
+        if high:
+            return 0
+        result = await self.session.execute(
+            insert(PulseTimelineEntry).from_select(
+                ["owner_id", "pulse_id", "author_id", "created_at"],
+                select(
+                    UserFollow.follower_id,
+                    literal(pulse.id),
+                    literal(pulse.user_id),
+                    literal(pulse.created_at, DateTime),
+                )
+                .where(UserFollow.following_id == pulse.user_id)
+                .distinct(),
+            )
+        )
+        return result.rowcount or 0
+
+    async def remove(self, pulse_id: int) -> None:
+        await self.session.execute(delete(PulseTimelineEntry).where(PulseTimelineEntry.pulse_id == pulse_id))
+
+    def candidate_ids(
+        self,
+        viewer_id: int,
+        pulse_keyset: Keyset,
+        after: Sequence[Any] | None,
+        n: int,
+    ) -> Select[Any]:
+        """
+        Ids of at most ``2 * n`` pulses containing the next ``n`` of the
+        viewer's "following" feed, in ``pulse_keyset`` order past ``after``.
+        """
+        inbox = select(PulseTimelineEntry.pulse_id.label("id")).where(PulseTimelineEntry.owner_id == viewer_id)
+        if after:
+            inbox = inbox.where(INBOX_LATEST.after(after))
+        inbox = inbox.order_by(*INBOX_LATEST.order_by()).limit(n).subquery()
+
+        followed_high = select(UserFollow.following_id).where(
+            UserFollow.follower_id == viewer_id,
+            _high_follower(UserFollow.following_id),
+        )
+        pulled = select(Pulse.id.label("id")).where(Pulse.user_id.in_(followed_high))
+        if after:
+            pulled = pulled.where(pulse_keyset.after(after))
+        pulled = pulled.order_by(*pulse_keyset.order_by()).limit(n).subquery()
+
+        return union_all(select(inbox.c.id), select(pulled.c.id))
+
+    async def backfill(self, owner_ids: Iterable[int] | None = None, days: int | None = None) -> int:
+        """
+        Rebuild inboxes from ``user_follows`` and recent pulses (default
+        ``pulse_timeline_backfill_days``). Run after importing follows, or
+        after an author drops below the fan-out threshold.
+        """
+        since = datetime.utcnow() - timedelta(days=settings.pulse_timeline_backfill_days if days is None else days)
+        owners = list(owner_ids) if owner_ids is not None else None
+        clear = delete(PulseTimelineEntry)
+        source = (
+            select(UserFollow.follower_id, Pulse.id, Pulse.user_id, Pulse.created_at)
+            .join(Pulse, Pulse.user_id == UserFollow.following_id)
+            .where(Pulse.created_at >= since, ~_high_follower(Pulse.user_id))
+            .distinct()
+        )
+        if owners is not None:
+            clear = clear.where(PulseTimelineEntry.owner_id.in_(owners))
+            source = source.where(UserFollow.follower_id.in_(owners))
+        await self.session.execute(clear)
+        result = await self.session.execute(
+            insert(PulseTimelineEntry).from_select(["owner_id", "pulse_id", "author_id", "created_at"], source)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
@@ -18,6 +18,12 @@ from ..models import (
     QuizQuestionOption,
     User,
 )
+from .pagination import Keyset, SortKey, cursor_page
+
+
+ATTEMPTS_KEYSET = Keyset(
+    "quiz:attempts", SortKey(QuizAttempt.started_at, descending=True), SortKey(QuizAttempt.id, descending=True)
+)
 
 
 class QuizRepository:
@@ -305,18 +311,28 @@ class QuizRepository:
         return out
 
     async def user_attempt_history(
-        self, user_external_id: str, quiz_external_id: Optional[str] = None, page: int = 1, limit: int = 20
-    ) -> List[Dict[str, Any]]:
+        self,
+        user_external_id: str,
+        quiz_external_id: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
         user_id = (
             await self.session.execute(select(User.id).where(User.external_id == user_external_id))
         ).scalar_one_or_none()
         if not user_id:
-            return []
+            return [] if cursor is None else cursor_page([], None)
         q = select(QuizAttempt, Quiz).join(Quiz, Quiz.id == QuizAttempt.quiz_id).where(QuizAttempt.user_id == user_id)
         if quiz_external_id:
             q = q.where(Quiz.external_id == quiz_external_id)
-        q = q.order_by(desc(QuizAttempt.started_at)).limit(limit).offset((page - 1) * limit)
-        rows = (await self.session.execute(q)).all()
+        next_cursor = None
+        if cursor is None:
+            q = q.order_by(*ATTEMPTS_KEYSET.order_by()).limit(limit).offset((page - 1) * limit)
+            rows = (await self.session.execute(q)).all()
+        else:
+            rows = (await self.session.execute(ATTEMPTS_KEYSET.apply(q, cursor, limit))).all()
+            rows, next_cursor = ATTEMPTS_KEYSET.page(rows, limit, entity=lambda row: row[0])
         out: List[Dict[str, Any]] = []
         for att, quiz in rows:
             out.append(
@@ -332,5 +348,5 @@ class QuizRepository:
                     "answers": [],  # not loading per-history row for brevity
                 }
             )
-        return out
+        return out if cursor is None else cursor_page(out, next_cursor)
 
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, delete, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import MovieReviewStats, Review, UserReviewStats
+from .upsert import dialect_insert
+
+
+class ReviewStatsRepository:
+    """
+    Incrementally maintained review aggregates per user and per movie.
+
+    Write paths call ``apply`` with signed deltas inside their own transaction,
+    so the counters commit or roll back together with the review row.
+    ``reconcile`` rebuilds both tables from ``reviews`` to repair any drift.
+    """
+
+    def __init__(self, session: AsyncSession | None) -> None:
+        self.session = session
+
+    async def apply(
+        self,
+        *,
+        user_id: int,
+        movie_id: int,
+        count: int = 0,
+        rating: float = 0.0,
+        helpful: int = 0,
+    ) -> None:
+        if not self.session or not (count or rating or helpful):
+            return
+        insert = dialect_insert(self.session)
+        now = datetime.utcnow()
+        for model, key, value in (
+            (UserReviewStats, "user_id", user_id),
+            (MovieReviewStats, "movie_id", movie_id),
+        ):
+            table = model.__table__
+            stmt = insert(table).values(
+                **{key: value},
+                review_count=count,
+                rating_sum=rating,
+                helpful_votes=helpful,
+                updated_at=now,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[key],
+                set_={
+                    "review_count": table.c.review_count + stmt.excluded.review_count,
+                    "rating_sum": table.c.rating_sum + stmt.excluded.rating_sum,
+                    "helpful_votes": table.c.helpful_votes + stmt.excluded.helpful_votes,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            await self.session.execute(stmt)
+
+    async def get_user_stats(self, user_id: int) -> dict[str, Any]:
+        row = await self.session.get(UserReviewStats, user_id, populate_existing=True) if self.session else None
+        return self._to_dict(row)
+
+    async def get_movie_stats(self, movie_id: int) -> dict[str, Any]:
+        row = await self.session.get(MovieReviewStats, movie_id, populate_existing=True) if self.session else None
+        return self._to_dict(row)
+
+    @staticmethod
+    def _to_dict(row: UserReviewStats | MovieReviewStats | None) -> dict[str, Any]:
+        if row is None:
+            return {"reviewCount": 0, "avgRating": None, "helpfulVotes": 0}
+        avg = row.avg_rating
+        return {
+            "reviewCount": row.review_count,
+            "avgRating": round(avg, 2) if avg is not None else None,
+            "helpfulVotes": row.helpful_votes,
+        }
+
+    async def reconcile(self) -> dict[str, int]:
+        """Rebuild both stats tables from the reviews table in one transaction."""
+        if not self.session:
+            return {"users": 0, "movies": 0}
+        now = datetime.utcnow()
+        counts: dict[str, int] = {}
+        for label, model, key in (
+            ("users", UserReviewStats, Review.user_id),
+            ("movies", MovieReviewStats, Review.movie_id),
+        ):
+            table = model.__table__
+            await self.session.execute(delete(table))
+            source = select(
+                key,
+                func.count(Review.id),
+                func.coalesce(func.sum(Review.rating), 0),
+                func.coalesce(func.sum(Review.helpful_votes), 0),
+                literal(now, DateTime),
+            ).group_by(key)
+            result = await self.session.execute(
+                table.insert().from_select(
+                    [key.key, "review_count", "rating_sum", "helpful_votes", "updated_at"],
+                    source,
+                )
+            )
+            counts[label] = result.rowcount or 0
+        await self.session.commit()
+        return counts
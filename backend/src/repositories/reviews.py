@@ -7,11 +7,16 @@ from datetime import datetime
 import uuid
 
 from ..models import Review, User, Movie
+from .loader_profiles import load_profile
+from .review_stats import ReviewStatsRepository
+from .user_stats import UserStatsRepository
 
 
 class ReviewRepository:
     def __init__(self, session: AsyncSession | None) -> None:
         self.session = session
+        self.stats = ReviewStatsRepository(session)
+        self.user_stats = UserStatsRepository(session)
 
     async def list(
         self,
@@ -24,7 +29,7 @@ class ReviewRepository:
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Review)
+        q = select(Review).options(*load_profile("review_list"))
         if movie_id:
             q = q.join(Review.movie).where(Movie.external_id == movie_id)
         if user_id:
@@ -79,17 +84,14 @@ class ReviewRepository:
     async def get(self, external_id: str) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Review).where(Review.external_id == external_id)
+        q = select(Review).where(Review.external_id == external_id).options(*load_profile("review_list"))
         res = await self.session.execute(q)
         r = res.scalar_one_or_none()
         if not r:
             return None
 
         # Get reviewer stats
-        reviewer_reviews_count = await self.session.execute(
-            select(Review).where(Review.user_id == r.user_id)
-        )
-        total_reviews = len(reviewer_reviews_count.scalars().all())
+        reviewer_stats = await self.stats.get_user_stats(r.user_id)
 
         return {
             "id": r.external_id,
@@ -109,7 +111,8 @@ class ReviewRepository:
                 "username": r.author.name,
                 "avatarUrl": r.author.avatar_url,
                 "isVerifiedReviewer": r.is_verified,
-                "totalReviews": total_reviews,
+                "totalReviews": reviewer_stats["reviewCount"],
+                "averageRating": reviewer_stats["avgRating"],
                 "followerCount": 0,  # TODO: Implement followers system
             },
             "movie": {
@@ -177,6 +180,8 @@ class ReviewRepository:
         )
         self.session.add(review)
         await self.session.flush()
+        await self.stats.apply(user_id=user.id, movie_id=movie.id, count=1, rating=rating)
+        await self.user_stats.apply(user.id, reviews=1)
 
         return {
             "id": review.external_id,
@@ -228,7 +233,9 @@ class ReviewRepository:
         if rating is not None:
             if not (0 <= rating <= 10):
                 raise ValueError("Rating must be between 0 and 10")
+            rating_delta = rating - review.rating
             review.rating = rating
+            await self.stats.apply(user_id=review.user_id, movie_id=review.movie_id, rating=rating_delta)
         if has_spoilers is not None:
             review.has_spoilers = has_spoilers
 
@@ -259,6 +266,14 @@ class ReviewRepository:
         if review.user_id != user_id:
             raise ValueError("User does not own this review")
 
+        await self.stats.apply(
+            user_id=review.user_id,
+            movie_id=review.movie_id,
+            count=-1,
+            rating=-review.rating,
+            helpful=-(review.helpful_votes or 0),
+        )
+        await self.user_stats.apply(review.user_id, reviews=-1)
         await self.session.delete(review)
         await self.session.flush()
         return True
@@ -10,6 +10,7 @@ from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import UserRoleProfile, TalentProfile, IndustryProfile, CriticProfile, AdminUserMeta
+from ..security.principal import roles_changed
 
 
 class RoleManagementRepository:
@@ -100,6 +101,7 @@ class RoleManagementRepository:
                     setattr(role_profile, key, value)
 
             await self.session.commit()
+            await roles_changed(self.session, role_profile.user_id)
             await self.session.refresh(role_profile)
             return role_profile
         except Exception:
@@ -172,6 +174,7 @@ class RoleManagementRepository:
                     profile_type = "industry"
 
             await self.session.commit()
+            await roles_changed(self.session, user_id)
             await self.session.refresh(role_profile)
             return role_profile, profile_created, profile_type
         except Exception:
@@ -235,6 +238,7 @@ class RoleManagementRepository:
                         break
 
             await self.session.commit()
+            await roles_changed(self.session, role_profile.user_id)
             await self.session.refresh(role_profile)
             return role_profile
         except Exception:
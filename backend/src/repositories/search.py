@@ -1,13 +1,70 @@
 from __future__ import annotations
 
-from typing import Any, List
-from sqlalchemy import select, or_
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy import desc, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Movie, Person, Genre
+from .loader_profiles import load_profile
+
+
+# Generated, GIN-indexed columns created by migration 8d3f0b6c2a41. They are not
+# mapped on the models so create_all() keeps working on SQLite test databases.
+# Queries must use the text search config the column was built with:
+# 'english' for movies (migration a7e2d5c8b913), 'simple' for people.
+MOVIE_TS_CONFIG = "english"
+PERSON_TS_CONFIG = "simple"
+MOVIE_VECTOR = literal_column("movies.search_vector", type_=TSVECTOR)
+PERSON_VECTOR = literal_column("people.search_vector", type_=TSVECTOR)
+
+
+def is_postgres(session: AsyncSession) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def _trigram_match(col, query: str):
+    # `%` is pg_trgm's similarity operator (typo tolerant); ILIKE covers substrings.
+    # Both are served by the gin_trgm_ops index on the column.
+    return or_(col.bool_op("%")(query), col.ilike(f"%{query}%"))
+
+
+def movie_search(session: AsyncSession, query: str) -> tuple[Any, list[Any]]:
+    """
+    WHERE clause and ORDER BY for a ranked movie search.
+
+    On Postgres this matches the weighted title/tagline/overview tsvector or
+    a trigram match on the title, ranked by ts_rank + title similarity. Other
+    dialects fall back to case-insensitive LIKE with exact/prefix ordering.
+    """
+    if is_postgres(session):
+        tsquery = func.websearch_to_tsquery(MOVIE_TS_CONFIG, query)
+        rank = func.ts_rank(MOVIE_VECTOR, tsquery) + func.similarity(Movie.title, query)
+        where = or_(MOVIE_VECTOR.bool_op("@@")(tsquery), _trigram_match(Movie.title, query))
+        return where, [desc(rank), desc(Movie.siddu_score), Movie.id]
+
+    lowered = func.lower(query)
+    where = or_(
+        func.lower(Movie.title).like(func.lower(f"%{query}%")),
+        func.lower(Movie.overview).like(func.lower(f"%{query}%")),
+    )
+    return where, [
+        desc(func.lower(Movie.title) == lowered),
+        desc(func.lower(Movie.title).like(func.lower(f"{query}%"))),
+        desc(Movie.siddu_score),
+        desc(Movie.year),
+    ]
 
 
 class SearchRepository:
+    """
+    Cross-entity search backed by Postgres full-text and pg_trgm indexes.
+
+    Each requested type is one indexed query. They run one after another on
+    the request's session, so a search holds a single pooled connection.
+    """
+
     def __init__(self, session: AsyncSession | None) -> None:
         self.session = session
 
@@ -18,53 +75,56 @@ class SearchRepository:
         types: List[str] | None = None,
         limit_per_type: int = 10,
     ) -> dict[str, Any]:
-        if not self.session:
-            return {"movies": [], "people": [], "genres": []}
+        result: dict[str, Any] = {"movies": [], "people": [], "genres": []}
+        query = query.strip()
+        if not self.session or not query:
+            return result
 
         types = types or ["movies", "people", "genres"]
-        result: dict[str, Any] = {"movies": [], "people": [], "genres": []}
+        runners: dict[str, Callable[[AsyncSession, str, int], Awaitable[list[dict[str, Any]]]]] = {
+            "movies": self._movies,
+            "people": self._people,
+            "genres": self._genres,
+        }
+        for name, run in runners.items():
+            if name in types:
+                result[name] = await run(self.session, query, limit_per_type)
+        return result
 
-        if "movies" in types:
-            q = select(Movie).where(Movie.title.ilike(f"%{query}%")).limit(limit_per_type)
-            res = await self.session.execute(q)
-            movies = res.scalars().all()
-            result["movies"] = [
-                {
-                    "id": m.external_id,
-                    "title": m.title,
-                    "year": m.year,
-                    "posterUrl": m.poster_url,
-                    "genres": [g.name for g in m.genres],
-                }
-                for m in movies
-            ]
-
-        if "people" in types:
-            q = select(Person).where(Person.name.ilike(f"%{query}%")).limit(limit_per_type)
-            res = await self.session.execute(q)
-            people = res.scalars().all()
-            result["people"] = [
-                {
-                    "id": p.external_id,
-                    "name": p.name,
-                    "imageUrl": p.image_url,
-                }
-                for p in people
-            ]
-
-        if "genres" in types:
-            q = select(Genre).where(
-                or_(Genre.name.ilike(f"%{query}%"), Genre.slug.ilike(f"%{query}%"))
-            ).limit(limit_per_type)
-            res = await self.session.execute(q)
-            genres = res.scalars().all()
-            result["genres"] = [
-                {
-                    "id": g.slug,
-                    "name": g.name,
-                }
-                for g in genres
-            ]
+    async def _movies(self, session: AsyncSession, query: str, limit: int) -> list[dict[str, Any]]:
+        where, order_by = movie_search(session, query)
+        res = await session.execute(
+            select(Movie).options(*load_profile("movie_card")).where(where).order_by(*order_by).limit(limit)
+        )
+        return [
+            {
+                "id": m.external_id,
+                "title": m.title,
+                "year": m.year,
+                "posterUrl": m.poster_url,
+                "genres": [g.name for g in m.genres],
+            }
+            for m in res.scalars().all()
+        ]
 
-        return result
+    async def _people(self, session: AsyncSession, query: str, limit: int) -> list[dict[str, Any]]:
+        q = select(Person.external_id, Person.name, Person.image_url)
+        if is_postgres(session):
+            tsquery = func.websearch_to_tsquery(PERSON_TS_CONFIG, query)
+            rank = func.ts_rank(PERSON_VECTOR, tsquery) + func.similarity(Person.name, query)
+            q = q.where(or_(PERSON_VECTOR.bool_op("@@")(tsquery), _trigram_match(Person.name, query)))
+            q = q.order_by(desc(rank), Person.id)
+        else:
+            q = q.where(Person.name.ilike(f"%{query}%")).order_by(Person.name)
+        res = await session.execute(q.limit(limit))
+        return [{"id": r.external_id, "name": r.name, "imageUrl": r.image_url} for r in res]
 
+    async def _genres(self, session: AsyncSession, query: str, limit: int) -> list[dict[str, Any]]:
+        q = select(Genre.slug, Genre.name)
+        if is_postgres(session):
+            q = q.where(or_(_trigram_match(Genre.name, query), Genre.slug.ilike(f"%{query}%")))
+            q = q.order_by(desc(func.similarity(Genre.name, query)), Genre.name)
+        else:
+            q = q.where(or_(Genre.name.ilike(f"%{query}%"), Genre.slug.ilike(f"%{query}%"))).order_by(Genre.name)
+        res = await session.execute(q.limit(limit))
+        return [{"id": r.slug, "name": r.name} for r in res]
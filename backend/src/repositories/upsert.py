@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(session: AsyncSession):
+    """
+    Return the dialect ``insert`` that supports ``on_conflict_do_*``.
+
+    Production runs on Postgres; the SQLite branch keeps repositories usable
+    against the in-memory databases the test-suite builds.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, delete, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Collection, Favorite, Review, User, UserFollow, UserStats, Watchlist
+from .upsert import dialect_insert
+
+COUNTERS = ("reviews", "watchlist", "favorites", "collections", "followers", "following")
+
+
+class UserStatsRepository:
+    """
+    Profile counters per user in ``user_stats``.
+
+    Write paths call ``apply`` with signed deltas in the same transaction as
+    the row they add or remove; ``reconcile`` recounts everything from the
+    source tables to repair drift.
+    """
+
+    def __init__(self, session: AsyncSession | None) -> None:
+        self.session = session
+
+    async def apply(self, user_id: int, **deltas: int) -> None:
+        deltas = {k: v for k, v in deltas.items() if v}
+        if not self.session or not deltas:
+            return
+        unknown = set(deltas) - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"unknown user stats counters: {sorted(unknown)}")
+        table = UserStats.__table__
+        stmt = dialect_insert(self.session)(table).values(
+            user_id=user_id,
+            **{name: deltas.get(name, 0) for name in COUNTERS},
+            updated_at=datetime.utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                **{name: table.c[name] + stmt.excluded[name] for name in deltas},
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get(self, user_id: int) -> dict[str, int]:
+        """One primary-key read; users without activity have no row yet."""
+        row = await self.session.get(UserStats, user_id, populate_existing=True) if self.session else None
+        return self.to_dict(row)
+
+    @staticmethod
+    def to_dict(row: UserStats | None) -> dict[str, int]:
+        return {name: getattr(row, name) if row is not None else 0 for name in COUNTERS}
+
+    async def reconcile(self) -> int:
+        """Rebuild ``user_stats`` from the source tables in one transaction."""
+        if not self.session:
+            return 0
+
+        def count(column: Any, *where: Any):
+            return select(func.count()).where(column == User.id, *where).correlate(User).scalar_subquery()
+
+        source = select(
+            User.id,
+            count(Review.user_id),
+            count(Watchlist.user_id),
+            count(Favorite.user_id, Favorite.type == "movie"),
+            count(Collection.user_id),
+            count(UserFollow.following_id),
+            count(UserFollow.follower_id),
+            literal(datetime.utcnow(), DateTime),
+        )
+        table = UserStats.__table__
+        await self.session.execute(delete(table))
+        result = await self.session.execute(
+            table.insert().from_select(["user_id", *COUNTERS, "updated_at"], source)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
@@ -2,28 +2,47 @@ from __future__ import annotations
 
 from typing import Any, Iterable, List, Sequence
 import json
+import re
 
-from sqlalchemy import Select, select, desc, asc
+from sqlalchemy import Select, String, asc, case, desc, exists, false, func, literal, or_, select, union_all
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import VisualTreat, VisualTreatTagLookup, Movie, Scene
+from ..models import VisualTreat, VisualTreatTagLookup, Movie, Scene, visual_treat_tags
+
+DECADE_RE = re.compile(r"^(\d{3}0)s$")
+
+FACETS = ("categories", "tags", "directors", "cinematographers", "decades")
+
+# Treats without a movie have no year or film title. NULLs go last in both
+# directions; Postgres would otherwise put them first under DESC.
+SORTS = {
+    "popular": desc(VisualTreat.likes).nulls_last(),
+    "recent": desc(Movie.year).nulls_last(),
+    "oldest": asc(Movie.year).nulls_last(),
+    "title_asc": asc(VisualTreat.title).nulls_last(),
+    "title_desc": desc(VisualTreat.title).nulls_last(),
+    "director_asc": asc(VisualTreat.director).nulls_last(),
+    "director_desc": desc(VisualTreat.director).nulls_last(),
+    "film_asc": asc(Movie.title).nulls_last(),
+    "film_desc": desc(Movie.title).nulls_last(),
+    "views_desc": desc(VisualTreat.views).nulls_last(),
+    "views_asc": asc(VisualTreat.views).nulls_last(),
+}
+
+
+def _has_tag(condition):
+    return exists().where(
+        visual_treat_tags.c.treat_id == VisualTreat.id,
+        visual_treat_tags.c.tag_id == VisualTreatTagLookup.id,
+        condition,
+    )
 
 
 class VisualTreatsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    def _base_query(self) -> Select[Any]:
-        return (
-            select(VisualTreat)
-            .options(
-                selectinload(VisualTreat.movie),
-                selectinload(VisualTreat.scene),
-                selectinload(VisualTreat.tags),
-            )
-        )
-
     @staticmethod
     def _parse_palette(s: str | None) -> List[str] | None:
         if not s:
@@ -68,7 +87,18 @@ class VisualTreatsRepository:
             )
         return out
 
-    async def list_treats(
+    @staticmethod
+    def _decade_ranges(decades: Iterable[str]) -> List[tuple[str, str]]:
+        """"1990s" -> ("1990", "1999"). Movie.year is a 4-char string, so ranges compare lexically."""
+        ranges = []
+        for d in decades:
+            m = DECADE_RE.match(d.strip())
+            if m:
+                start = int(m.group(1))
+                ranges.append((f"{start:04d}", f"{start + 9:04d}"))
+        return ranges
+
+    def _filtered(
         self,
         *,
         categories: Iterable[str] | None = None,
@@ -79,17 +109,19 @@ class VisualTreatsRepository:
         search: str | None = None,
         movie_external_id: str | None = None,
         scene_external_id: str | None = None,
-        sort_by: str | None = None,
-        page: int | None = None,
-        page_size: int | None = None,
-    ) -> List[dict[str, Any]]:
-        q = self._base_query()
+    ) -> Select[Any]:
+        """
+        ``SELECT visual_treats ... LEFT JOIN movies`` with every filter as a
+        WHERE clause, so LIMIT/OFFSET and the facet counts see the same rows.
+        """
+        q = select(VisualTreat).outerjoin(Movie, VisualTreat.movie_id == Movie.id)
 
         if movie_external_id:
-            q = q.join(VisualTreat.movie).where(Movie.external_id == movie_external_id)
+            q = q.where(Movie.external_id == movie_external_id)
         if scene_external_id:
-            q = q.join(VisualTreat.scene).where(Scene.external_id == scene_external_id)
-
+            q = q.where(
+                VisualTreat.scene_id.in_(select(Scene.id).where(Scene.external_id == scene_external_id))
+            )
         if categories:
             q = q.where(VisualTreat.category.in_(list(categories)))
         if directors:
@@ -97,62 +129,105 @@ class VisualTreatsRepository:
         if cinematographers:
             q = q.where(VisualTreat.cinematographer.in_(list(cinematographers)))
         if tags:
-            q = q.join(VisualTreat.tags).where(VisualTreatTagLookup.name.in_(list(tags)))
-
-        # Sorting
-        if sort_by in {"popular", None}:
-            q = q.order_by(desc(VisualTreat.likes))
-        elif sort_by == "recent":
-            q = q.join(VisualTreat.movie).order_by(desc(Movie.year))
-        elif sort_by == "oldest":
-            q = q.join(VisualTreat.movie).order_by(asc(Movie.year))
-        elif sort_by == "title_asc":
-            q = q.order_by(asc(VisualTreat.title))
-        elif sort_by == "title_desc":
-            q = q.order_by(desc(VisualTreat.title))
-        elif sort_by == "director_asc":
-            q = q.order_by(asc(VisualTreat.director))
-        elif sort_by == "director_desc":
-            q = q.order_by(desc(VisualTreat.director))
-        elif sort_by == "film_asc":
-            q = q.join(VisualTreat.movie).order_by(asc(Movie.title))
-        elif sort_by == "film_desc":
-            q = q.join(VisualTreat.movie).order_by(desc(Movie.title))
-        elif sort_by == "views_desc":
-            q = q.order_by(desc(VisualTreat.views))
-        elif sort_by == "views_asc":
-            q = q.order_by(asc(VisualTreat.views))
-        else:
-            q = q.order_by(desc(VisualTreat.likes))
-
-        # Simple page
+            # EXISTS instead of a join: a treat matching several tags stays one row
+            q = q.where(_has_tag(VisualTreatTagLookup.name.in_(list(tags))))
+        if decades:
+            ranges = self._decade_ranges(decades)
+            # Unparseable decades match nothing, as they did when filtered in Python
+            q = q.where(or_(*(Movie.year.between(lo, hi) for lo, hi in ranges)) if ranges else false())
+        if search and search.strip():
+            pattern = f"%{search.strip()}%"
+            q = q.where(
+                or_(
+                    VisualTreat.title.ilike(pattern),
+                    VisualTreat.description.ilike(pattern),
+                    VisualTreat.director.ilike(pattern),
+                    Movie.title.ilike(pattern),
+                    _has_tag(VisualTreatTagLookup.name.ilike(pattern)),
+                )
+            )
+        return q
+
+    async def list_treats(
+        self,
+        *,
+        sort_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        **filters: Any,
+    ) -> List[dict[str, Any]]:
+        """
+        Filters: categories, tags, directors, cinematographers, decades,
+        search, movie_external_id, scene_external_id. All are evaluated in SQL.
+        """
+        q = self._filtered(**filters).options(
+            selectinload(VisualTreat.movie),
+            selectinload(VisualTreat.scene),
+            selectinload(VisualTreat.tags),
+        )
+        order = SORTS.get(sort_by or "popular", SORTS["popular"])
+        # id breaks ties so offset pages neither repeat nor skip rows
+        q = q.order_by(order, desc(VisualTreat.id))
+
         if page and page_size:
             q = q.limit(page_size).offset((page - 1) * page_size)
 
-        rows = (await self.session.execute(q)).scalars().unique().all()
-        items = self._to_dto(rows)
-
-        # Post-filter: search and decades
-        if search:
-            s = search.lower()
-            items = [
-                it
-                for it in items
-                if (s in it["title"].lower())
-                or (s in it["description"].lower())
-                or (s in it["film"].lower())
-                or (s in it["director"].lower())
-                or any(s in tag.lower() for tag in it["tags"])
-            ]
+        rows = (await self.session.execute(q)).scalars().all()
+        return self._to_dto(rows)
+
+    async def facets(self, **filters: Any) -> dict[str, List[dict[str, Any]]]:
+        """
+        Counts per category, tag, director, cinematographer and decade over the
+        rows matching ``filters``, in one aggregate query (UNION ALL of GROUP BYs
+        over a CTE of the filtered rows).
+        """
+        decade = case(
+            (func.length(Movie.year) == 4, func.substr(Movie.year, 1, 3, type_=String).concat("0s")),
+            else_=None,
+        )
+        matched = (
+            self._filtered(**filters)
+            .with_only_columns(
+                VisualTreat.id.label("id"),
+                VisualTreat.category.label("category"),
+                VisualTreat.director.label("director"),
+                VisualTreat.cinematographer.label("cinematographer"),
+                decade.label("decade"),
+            )
+            .cte("matched")
+        )
 
-        if decades:
-            wanted: set[str] = set(decades)
-            def as_decade(y: int) -> str:
-                d = (y // 10) * 10
-                return f"{d}s"
-            items = [it for it in items if it["year"] and as_decade(it["year"]) in wanted]
+        def grouped(facet: str, column):
+            return (
+                select(literal(facet).label("facet"), column.label("value"), func.count().label("n"))
+                .where(column.is_not(None))
+                .group_by(column)
+            )
 
-        return items
+        tag_counts = (
+            select(literal("tags").label("facet"), VisualTreatTagLookup.name.label("value"), func.count().label("n"))
+            .select_from(matched)
+            .join(visual_treat_tags, visual_treat_tags.c.treat_id == matched.c.id)
+            .join(VisualTreatTagLookup, VisualTreatTagLookup.id == visual_treat_tags.c.tag_id)
+            .group_by(VisualTreatTagLookup.name)
+        )
+        stmt = union_all(
+            grouped("categories", matched.c.category),
+            grouped("directors", matched.c.director),
+            grouped("cinematographers", matched.c.cinematographer),
+            grouped("decades", matched.c.decade),
+            tag_counts,
+        )
+        out: dict[str, List[dict[str, Any]]] = {name: [] for name in FACETS}
+        for facet, value, count in (await self.session.execute(stmt)).all():
+            if value != "":
+                out[facet].append({"value": value, "count": count})
+        for name, values in out.items():
+            if name == "decades":
+                values.sort(key=lambda v: v["value"])
+            else:
+                values.sort(key=lambda v: (-v["count"], v["value"]))
+        return out
 
     async def list_by_movie(self, *, movie_external_id: str, **kwargs: Any) -> List[dict[str, Any]]:
         return await self.list_treats(movie_external_id=movie_external_id, **kwargs)
@@ -7,6 +7,8 @@ from datetime import datetime
 import uuid
 
 from ..models import Watchlist, User, Movie
+from .loader_profiles import load_profile
+from .user_stats import UserStatsRepository
 
 
 class WatchlistRepository:
@@ -24,7 +26,7 @@ class WatchlistRepository:
         if not self.session:
             return []
         # Prefer DISTINCT ON (movie_id) to avoid duplicates per movie for a user (PostgreSQL)
-        q = select(Watchlist)
+        q = select(Watchlist).options(*load_profile("watchlist_item"))
         if user_id:
             q = q.join(Watchlist.user).where(User.external_id == user_id)
         if status:
@@ -64,7 +66,7 @@ class WatchlistRepository:
     async def get(self, external_id: str) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Watchlist).where(Watchlist.external_id == external_id)
+        q = select(Watchlist).where(Watchlist.external_id == external_id).options(*load_profile("watchlist_item"))
         res = await self.session.execute(q)
         w = res.scalar_one_or_none()
         if not w:
@@ -176,6 +178,7 @@ class WatchlistRepository:
             except Exception:
                 pass
             raise
+        await UserStatsRepository(self.session).apply(user.id, watchlist=1)
 
         return {
             "id": watchlist_item.external_id,
@@ -230,6 +233,7 @@ class WatchlistRepository:
         if not w:
             return False
 
+        await UserStatsRepository(self.session).apply(w.user_id, watchlist=-1)
         await self.session.delete(w)
         await self.session.flush()
         return True
@@ -7,10 +7,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from ..db import get_session
-from ..models import User
-from ..security.password import hash_password, verify_password
+from ..models import RoleType, User
+from ..security.password import hash_password_async, needs_rehash, verify_password_async
 from ..security.jwt import create_access_token, create_refresh_token, decode_token
-from ..dependencies.auth import get_current_user
+from ..dependencies.auth import get_current_principal, get_current_user
+from ..security.principal import Principal, load_principal, token_claims
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -82,7 +83,7 @@ async def signup(body: SignupBody, session: AsyncSession = Depends(get_session))
         external_id=body.email,  # use email as external_id for now
         email=body.email,
         name=body.name,
-        hashed_password=hash_password(body.password),
+        hashed_password=await hash_password_async(body.password),
     )
     session.add(user)
     await session.flush()
@@ -139,7 +140,12 @@ async def signup(body: SignupBody, session: AsyncSession = Depends(get_session))
     ]
 
     return TokenResponse(
-        access_token=create_access_token(sub, role_profiles=role_profiles),
+        access_token=create_access_token(
+            sub,
+            role_profiles=role_profiles,
+            external_id=user.external_id,
+            active_role=user.active_role or RoleType.LOVER.value,
+        ),
         refresh_token=create_refresh_token(sub)
     )
 
@@ -148,8 +154,12 @@ async def signup(body: SignupBody, session: AsyncSession = Depends(get_session))
 async def login(body: LoginBody, session: AsyncSession = Depends(get_session)) -> Any:
     res = await session.execute(select(User).where(User.email == body.email))
     user = res.scalar_one_or_none()
-    if not user or not verify_password(body.password, user.hashed_password):
+    if not user or not await verify_password_async(body.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if needs_rehash(user.hashed_password):
+        # Argon2 parameters changed since this hash was made: upgrade it now that we have the password
+        user.hashed_password = await hash_password_async(body.password)
+        await session.commit()
     sub = str(user.id)
 
     # Include role_profiles in the access token for middleware admin role checking
@@ -169,7 +179,12 @@ async def login(body: LoginBody, session: AsyncSession = Depends(get_session)) -
     ]
 
     return TokenResponse(
-        access_token=create_access_token(sub, role_profiles=role_profiles),
+        access_token=create_access_token(
+            sub,
+            role_profiles=role_profiles,
+            external_id=user.external_id,
+            active_role=user.active_role or RoleType.LOVER.value,
+        ),
         refresh_token=create_refresh_token(sub)
     )
 
@@ -179,7 +194,7 @@ class RefreshBody(BaseModel):
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(body: RefreshBody) -> Any:
+async def refresh_token(body: RefreshBody, session: AsyncSession = Depends(get_session)) -> Any:
     try:
         payload = decode_token(body.refresh_token)
     except Exception:
@@ -189,7 +204,19 @@ async def refresh_token(body: RefreshBody) -> Any:
     sub = payload.get("sub")
     if not sub:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-    return TokenResponse(access_token=create_access_token(sub), refresh_token=create_refresh_token(sub))
+    try:
+        user_id = int(sub)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid subject")
+    # Fresh role claims (two column-only queries), so the new token can be
+    # authorized without touching the database
+    principal = await load_principal(session, user_id)
+    if principal is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return TokenResponse(
+        access_token=create_access_token(sub, **token_claims(principal)),
+        refresh_token=create_refresh_token(sub),
+    )
 
 
 @router.post("/logout")
@@ -199,12 +226,12 @@ async def logout() -> Any:
 
 
 @router.get("/me", response_model=MeResponse)
-async def me(user: User = Depends(get_current_user)) -> Any:
+async def me(
+    user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+) -> Any:
     # Check if user has admin role
-    is_admin = any(
-        role_profile.role_type == "admin" and role_profile.enabled
-        for role_profile in user.role_profiles
-    )
+    is_admin = principal.is_admin
     # Extract username from email
     username = user.email.split('@')[0] if '@' in user.email else user.email
 
@@ -332,11 +359,11 @@ async def change_password(
 ) -> dict:
     """Change user password"""
     # Verify current password
-    if not verify_password(body.current_password, user.hashed_password):
+    if not await verify_password_async(body.current_password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Current password is incorrect")
 
     # Update password
-    user.hashed_password = hash_password(body.new_password)
+    user.hashed_password = await hash_password_async(body.new_password)
     await session.commit()
 
     return {"ok": True, "message": "Password changed successfully"}
@@ -29,7 +29,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..db import get_session
 from ..repositories.award_ceremonies import AwardCeremoniesRepository
 from ..dependencies.admin import require_admin
-from ..models import User
+from ..security.principal import Principal
 
 
 # Pydantic Models for Request/Response
@@ -237,7 +237,7 @@ admin_router = APIRouter(prefix="/admin", tags=["award-ceremonies-admin"])
 async def create_award_ceremony(
     ceremony_data: AwardCeremonyCreate,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Create a new award ceremony.
@@ -279,7 +279,7 @@ async def update_award_ceremony(
     external_id: str,
     ceremony_data: AwardCeremonyUpdate,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Update an existing award ceremony.
@@ -332,7 +332,7 @@ async def update_award_ceremony(
 async def delete_award_ceremony(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Delete an award ceremony.
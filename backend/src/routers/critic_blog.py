@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from ..db import get_session
-from ..dependencies.auth import get_current_user
+from ..dependencies.auth import get_current_user, get_current_principal
+from ..security.principal import Principal
 from ..models import User, CriticProfile
 from ..repositories.critic_blog import CriticBlogRepository
 from ..repositories.critics import CriticRepository
@@ -20,12 +21,12 @@ router = APIRouter(prefix="/api/v1/critic-blog", tags=["Critic Blog"])
 
 
 async def get_critic_profile(
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_session)
 ) -> CriticProfile:
     """Dependency to get current user's critic profile"""
     critic_repo = CriticRepository(db)
-    critic_profile = await critic_repo.get_critic_by_user_id(current_user.id)
+    critic_profile = await critic_repo.get_critic_by_user_id(principal.id)
     
     if not critic_profile:
         raise HTTPException(
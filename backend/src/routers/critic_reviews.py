@@ -1,14 +1,17 @@
 """Critic Hub - Critic Reviews API Router"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from ..db import get_session
 from ..repositories.critic_reviews import CriticReviewRepository
 from ..repositories.critics import CriticRepository
+from ..repositories.pagination import cursor_page
+from ..schemas.pagination import CursorPage
 from ..dependencies.auth import get_current_user
 from ..models import User
+from ..services.engagement_buffer import engagement_buffer
 
 
 router = APIRouter(prefix="/critic-reviews", tags=["critic-reviews"])
@@ -117,6 +120,8 @@ class CommentResponse(BaseModel):
 # --- Helper Functions ---
 def _review_to_response(review) -> CriticReviewResponse:
     """Convert a CriticReview model to CriticReviewResponse"""
+    # Counters include increments this worker has not flushed yet
+    views, likes, shares = engagement_buffer.pending(review.id)
     return CriticReviewResponse(
         id=review.id,
         external_id=review.external_id,
@@ -131,10 +136,10 @@ def _review_to_response(review) -> CriticReviewResponse:
         published_at=review.published_at.isoformat() if review.published_at else None,
         updated_at=review.updated_at.isoformat() if review.updated_at else None,
         is_draft=review.is_draft,
-        view_count=review.view_count,
-        like_count=review.like_count,
+        view_count=review.view_count + views,
+        like_count=review.like_count + likes,
         comment_count=review.comment_count,
-        share_count=review.share_count,
+        share_count=review.share_count + shares,
         slug=review.slug,
         meta_description=review.meta_description,
         critic=CriticInfoResponse.from_orm(review.critic),
@@ -283,12 +288,13 @@ async def delete_critic_review(
     return None
 
 
-@router.get("/critic/{username}", response_model=List[CriticReviewResponse])
+@router.get("/critic/{username}", response_model=Union[List[CriticReviewResponse], CursorPage[CriticReviewResponse]])
 async def list_reviews_by_critic(
     username: str,
     include_drafts: bool = False,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
     db: AsyncSession = Depends(get_session)
 ):
     """List all reviews by a critic"""
@@ -302,6 +308,12 @@ async def list_reviews_by_critic(
         )
 
     review_repo = CriticReviewRepository(db)
+    if cursor is not None:
+        reviews, next_cursor = await review_repo.page_reviews_by_critic(
+            critic.id, cursor, include_drafts=include_drafts, limit=limit
+        )
+        return cursor_page([_review_to_response(review) for review in reviews], next_cursor)
+
     reviews = await review_repo.list_reviews_by_critic(
         critic.id,
         include_drafts=include_drafts,
@@ -312,11 +324,12 @@ async def list_reviews_by_critic(
     return [_review_to_response(review) for review in reviews]
 
 
-@router.get("/me", response_model=List[CriticReviewResponse])
+@router.get("/me", response_model=Union[List[CriticReviewResponse], CursorPage[CriticReviewResponse]])
 async def list_my_reviews(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_session)
 ):
@@ -333,6 +346,16 @@ async def list_my_reviews(
 
     review_repo = CriticReviewRepository(db)
 
+    if cursor is not None:
+        reviews, next_cursor = await review_repo.page_reviews_by_critic(
+            critic.id,
+            cursor,
+            include_drafts=status != "published",
+            drafts_only=status == "draft",
+            limit=limit
+        )
+        return cursor_page([_review_to_response(review) for review in reviews], next_cursor)
+
     # Determine include_drafts based on status parameter
     if status == "draft":
         # Only drafts
@@ -363,11 +386,12 @@ async def list_my_reviews(
     return [_review_to_response(review) for review in reviews]
 
 
-@router.get("/movie/{movie_id}", response_model=List[CriticReviewResponse])
+@router.get("/movie/{movie_id}", response_model=Union[List[CriticReviewResponse], CursorPage[CriticReviewResponse]])
 async def list_reviews_by_movie(
     movie_id: str,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
     db: AsyncSession = Depends(get_session)
 ):
     """List all critic reviews for a movie (by internal ID or external_id)"""
@@ -379,7 +403,6 @@ async def list_reviews_by_movie(
     # Try to parse as int first (internal ID)
     try:
         movie_id_int = int(movie_id)
-        reviews = await review_repo.list_reviews_by_movie(movie_id_int, limit=limit, offset=offset)
     except ValueError:
         # Try to lookup by external_id
         movie = await movie_repo.get_movie_by_external_id(movie_id)
@@ -388,8 +411,13 @@ async def list_reviews_by_movie(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Movie not found: {movie_id}"
             )
-        reviews = await review_repo.list_reviews_by_movie(movie.id, limit=limit, offset=offset)
+        movie_id_int = movie.id
+
+    if cursor is not None:
+        reviews, next_cursor = await review_repo.page_reviews_by_movie(movie_id_int, cursor, limit=limit)
+        return cursor_page([_review_to_response(review) for review in reviews], next_cursor)
 
+    reviews = await review_repo.list_reviews_by_movie(movie_id_int, limit=limit, offset=offset)
     return [_review_to_response(review) for review in reviews]
 
 
@@ -449,6 +477,27 @@ async def unlike_review(
     return {"message": "Review unliked successfully"}
 
 
+@router.post("/{review_id}/share")
+async def share_review(
+    review_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session)
+):
+    """Record a share of a critic review"""
+    review_repo = CriticReviewRepository(db)
+    review = await review_repo.get_review_by_external_id(review_id)
+
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+
+    await review_repo.record_share(review.id)
+
+    return {"message": "Share recorded"}
+
+
 @router.post("/{review_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def add_comment(
     review_id: str,
@@ -3,11 +3,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 from typing import List, Optional
+from datetime import datetime
 
 from ..db import get_session
 from ..repositories.critics import CriticRepository
 from ..dependencies.auth import get_current_user
 from ..dependencies.admin import require_admin
+from ..security.principal import Principal
 from ..models import User
 
 
@@ -121,6 +123,8 @@ async def get_my_critic_stats(
             detail="User does not have a critic profile"
         )
 
+    month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
     # Return dashboard stats
     return {
         "total_reviews": critic.total_reviews or 0,
@@ -129,7 +133,7 @@ async def get_my_critic_stats(
         "follower_count": critic.follower_count or 0,
         "avg_engagement": critic.avg_engagement or 0.0,
         "reviews_this_month": 0,  # TODO: Calculate from reviews
-        "views_this_month": 0,  # TODO: Calculate from analytics
+        "views_this_month": await repo.get_views_since(critic.id, month_start),
         "growth_rate": 0.0,  # TODO: Calculate from historical data
     }
 
@@ -329,7 +333,7 @@ async def get_critic_followers(
 async def suspend_critic(
     critic_id: int,
     reason: Optional[str] = None,
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session)
 ):
     """Suspend a critic (admin only)"""
@@ -351,7 +355,7 @@ async def suspend_critic(
 @router.post("/{critic_id}/activate")
 async def activate_critic(
     critic_id: int,
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_session)
 ):
     """Activate a suspended critic (admin only)"""
@@ -5,7 +5,7 @@ from sqlalchemy import select, update
 from typing import Optional
 
 from ..db import get_session
-from ..models import FeatureFlag, User
+from ..models import FeatureFlag
 from ..schemas.feature_flag import (
     FeatureFlagsResponse,
     FeatureFlagsAdminResponse,
@@ -15,6 +15,7 @@ from ..schemas.feature_flag import (
 )
 from ..dependencies.auth import get_current_user
 from ..dependencies.admin import require_admin
+from ..security.principal import Principal
 
 router = APIRouter(tags=["feature-flags"])
 
@@ -43,7 +44,7 @@ async def get_feature_flags(
 async def get_admin_feature_flags(
     category: Optional[str] = None,
     db: AsyncSession = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Get all feature flags with full details (admin only).
@@ -67,7 +68,7 @@ async def get_admin_feature_flags(
 async def bulk_update_feature_flags(
     bulk_update: FeatureFlagBulkUpdate,
     db: AsyncSession = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Bulk update multiple feature flags (admin only).
@@ -109,7 +110,7 @@ async def update_feature_flag(
     feature_key: str,
     flag_update: FeatureFlagUpdate,
     db: AsyncSession = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Update a single feature flag (admin only).
@@ -145,7 +146,7 @@ async def update_feature_flag(
 @router.get("/admin/feature-flags/categories", response_model=list[str])
 async def get_feature_categories(
     db: AsyncSession = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """
     Get all unique feature categories (admin only).
@@ -1,23 +1,55 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_session
+from ..db import get_read_session, get_session
+from ..dependencies.admin import require_admin
 from ..repositories.festivals import FestivalsRepository
+from ..security.principal import Principal
 
 router = APIRouter(prefix="/festivals", tags=["festivals"])
 
 
+class FestivalEditionIn(BaseModel):
+    edition_label: Optional[str] = None
+    dates: Optional[str] = None
+    status: Optional[str] = None  # upcoming | live | past
+
+
+class ProgramEntryIn(BaseModel):
+    title: str
+    director: Optional[str] = None
+    country: Optional[str] = None
+    premiere: Optional[str] = None
+    image: Optional[str] = None
+
+
+class WinnerIn(BaseModel):
+    movieTitle: Optional[str] = None
+    moviePoster: Optional[str] = None
+    recipient: Optional[str] = None
+    director: Optional[str] = None
+    citation: Optional[str] = None
+    rating: Optional[float] = None
+
+
+class WinnerCategoryIn(BaseModel):
+    id: str
+    categoryName: str
+    winners: List[WinnerIn] = []
+
+
 @router.get("")
-async def list_festivals(session: AsyncSession = Depends(get_session)) -> Any:
+async def list_festivals(session: AsyncSession = Depends(get_read_session)) -> Any:
     repo = FestivalsRepository(session)
     return await repo.list_festivals()
 
 
 @router.get("/{festival_id}")
-async def get_festival_header(festival_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_festival_header(festival_id: str, session: AsyncSession = Depends(get_read_session)) -> Any:
     repo = FestivalsRepository(session)
     data = await repo.get_festival_header(festival_id)
     if not data:
@@ -26,7 +58,7 @@ async def get_festival_header(festival_id: str, session: AsyncSession = Depends(
 
 
 @router.get("/{festival_id}/{year}/program")
-async def get_program(festival_id: str, year: int, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_program(festival_id: str, year: int, session: AsyncSession = Depends(get_read_session)) -> Any:
     repo = FestivalsRepository(session)
     data = await repo.get_program(festival_id, year)
     if data is None:
@@ -35,10 +67,60 @@ async def get_program(festival_id: str, year: int, session: AsyncSession = Depen
 
 
 @router.get("/{festival_id}/{year}/winners")
-async def get_winners(festival_id: str, year: int, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_winners(festival_id: str, year: int, session: AsyncSession = Depends(get_read_session)) -> Any:
     repo = FestivalsRepository(session)
     data = await repo.get_winners(festival_id, year)
     if data is None:
         raise HTTPException(status_code=404, detail="Winners not found")
     return data
 
+
+
+# Admin edits. Each resets the festival's current edition and retires its
+# cached program/winners documents.
+
+@router.put("/{festival_id}/editions/{year}")
+async def upsert_edition(
+    festival_id: str,
+    year: int,
+    edition: FestivalEditionIn,
+    session: AsyncSession = Depends(get_session),
+    admin_user: Principal = Depends(require_admin),
+) -> Any:
+    repo = FestivalsRepository(session)
+    data = await repo.upsert_edition(festival_id, year, edition.model_dump(exclude_unset=True))
+    if data is None:
+        raise HTTPException(status_code=404, detail="Festival not found")
+    return data
+
+
+@router.put("/{festival_id}/{year}/program")
+async def replace_program(
+    festival_id: str,
+    year: int,
+    program: Dict[str, List[ProgramEntryIn]],
+    session: AsyncSession = Depends(get_session),
+    admin_user: Principal = Depends(require_admin),
+) -> Any:
+    repo = FestivalsRepository(session)
+    data = await repo.replace_program(
+        festival_id, year, {name: [e.model_dump() for e in entries] for name, entries in program.items()}
+    )
+    if data is None:
+        raise HTTPException(status_code=404, detail="Edition not found")
+    return data
+
+
+@router.put("/{festival_id}/{year}/winners")
+async def replace_winners(
+    festival_id: str,
+    year: int,
+    categories: List[WinnerCategoryIn],
+    session: AsyncSession = Depends(get_session),
+    admin_user: Principal = Depends(require_admin),
+) -> Any:
+    repo = FestivalsRepository(session)
+    data = await repo.replace_winners(festival_id, year, [c.model_dump() for c in categories])
+    if data is None:
+        raise HTTPException(status_code=404, detail="Edition not found")
+    return data
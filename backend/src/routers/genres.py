@@ -5,7 +5,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_session
+from ..db import get_read_session, get_session
 from ..repositories.genres import GenreRepository
 
 router = APIRouter(prefix="/genres", tags=["genres"])
@@ -24,6 +24,7 @@ class GenreDetailsDTO(BaseModel):
     evolutionTimeline: list[dict[str, Any]] = []
 
 
+# Stays on the primary: an expired statistics snapshot is rebuilt on read
 @router.get("/{genre_id}", response_model=GenreDetailsDTO)
 async def get_genre_details(genre_id: str, session: AsyncSession = Depends(get_session)) -> Any:
     repo = GenreRepository(session)
@@ -34,7 +35,7 @@ async def get_genre_details(genre_id: str, session: AsyncSession = Depends(get_s
 
 
 @router.get("/{genre_id}/movies")
-async def get_movies_by_genre(genre_id: str, page: int = 1, limit: int = 20, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_movies_by_genre(genre_id: str, page: int = 1, limit: int = 20, session: AsyncSession = Depends(get_read_session)) -> Any:
     repo = GenreRepository(session)
     offset = (page - 1) * limit
     return await repo.get_movies(genre_id, limit=limit, offset=offset)
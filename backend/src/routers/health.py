@@ -1,4 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from ..db import pool_metrics
+from ..dependencies.admin import require_admin
+from ..security.principal import Principal
+from ..security.password import password_hasher
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -7,3 +12,8 @@ router = APIRouter(prefix="/health", tags=["health"])
 async def health():
     return {"ok": True}
 
+
+@router.get("/metrics")
+async def metrics(admin_user: Principal = Depends(require_admin)):
+    """In-process counters for this worker's background and connection pools."""
+    return {"password_hashing": password_hasher.stats(), "db_pool": pool_metrics()}
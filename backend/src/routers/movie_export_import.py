@@ -23,18 +23,36 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
-from io import BytesIO
-import zipfile
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_session
-from ..models import Movie, Genre, Person, StreamingPlatform, MovieStreamingOption, AwardNomination, movie_people, movie_genres, User
-from ..dependencies.admin import require_admin
+from ..config import settings
+from ..db import get_read_session, get_session
+from ..models import Movie, MovieDraftAudit, Genre, movie_genres, User
+from ..dependencies.admin import require_admin, require_admin_user
+from ..security.principal import Principal
+from ..repositories.genre_stats import AGGREGATED_FIELDS, GenreStatsRepository
+from ..schemas.movie_export import (
+    ExportMetadata,
+    ExportResponse,
+    MovieBulkExportRequest,
+    MovieDraftBulkRequest,
+    MovieDraftBulkResponse,
+)
+from ..services.movie_drafts import DRAFT_CATEGORIES, apply_drafts
+from ..services.movie_export import (
+    export_category,
+    export_session,
+    iter_snapshots,
+    load_snapshots,
+    movies_query,
+    stream_ndjson,
+    stream_zip,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,23 +63,6 @@ router = APIRouter(prefix="/admin/movies", tags=["Movie Export/Import"])
 # Pydantic Models for Export/Import
 # ============================================================================
 
-class ExportMetadata(BaseModel):
-    """Metadata for exported data"""
-    source: str = Field(..., description="Data source: tmdb, manual, or llm-generated")
-    last_updated: str = Field(..., description="ISO timestamp of last update")
-    updated_by: Optional[str] = Field(None, description="Email of user who last updated")
-
-
-class ExportResponse(BaseModel):
-    """Standard export response format"""
-    category: str = Field(..., description="Category name")
-    movie_id: str = Field(..., description="Movie external ID")
-    version: str = Field(default="1.0", description="Schema version")
-    exported_at: str = Field(..., description="ISO timestamp of export")
-    data: Dict[str, Any] = Field(..., description="Category-specific data")
-    metadata: ExportMetadata = Field(..., description="Export metadata")
-
-
 class ImportRequest(BaseModel):
     """Standard import request format"""
     category: str = Field(..., description="Category name")
@@ -83,11 +84,6 @@ class ImportResponse(BaseModel):
 # Helper Functions
 # ============================================================================
 
-def get_current_timestamp() -> str:
-    """Get current UTC timestamp in ISO format"""
-    return datetime.now(timezone.utc).isoformat()
-
-
 async def get_movie_by_external_id(session: AsyncSession, external_id: str) -> Movie:
     """Get movie by external ID or raise 404"""
     result = await session.execute(
@@ -102,33 +98,66 @@ async def get_movie_by_external_id(session: AsyncSession, external_id: str) -> M
     return movie
 
 
-def determine_data_source(movie: Movie, field_name: str) -> str:
-    """Determine the source of data for a field"""
-    # Check if field has data
-    field_value = getattr(movie, field_name, None)
-    if field_value is None or (isinstance(field_value, (list, dict)) and not field_value):
-        return "manual"
-    
-    # If movie has tmdb_id, assume TMDB source for basic fields
-    if movie.tmdb_id and field_name in ["title", "year", "runtime", "overview", "poster_url", "backdrop_url", "budget", "revenue"]:
-        return "tmdb"
-    
-    # Timeline and trivia are always manual
-    if field_name in ["timeline", "trivia"]:
-        return "manual"
-    
-    return "manual"
+async def _export(session: AsyncSession, external_id: str, category: str, admin_user: User) -> ExportResponse:
+    """Load the movie with just the rows ``category`` needs and serialize it"""
+    movie = await get_movie_by_external_id(session, external_id)
+    [snapshot] = await load_snapshots(session, [movie], categories=[category])
+    return export_category(snapshot, category, updated_by=admin_user.email)
+
+
+def _timestamp_slug() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
 
 
 # ============================================================================
 # Export Endpoints
 # ============================================================================
 
+@router.post("/export")
+async def export_movies(
+    request: MovieBulkExportRequest,
+    session: AsyncSession = Depends(get_read_session),
+    admin_user: User = Depends(require_admin_user),
+):
+    """
+    Export many movies at once, as a ZIP of category files or as NDJSON.
+
+    Takes explicit movie IDs, or filters (curation_status, status, language,
+    genre slug) that select e.g. the whole curated catalog. The response is
+    streamed: movies are loaded ``movie_export_batch_size`` at a time and
+    each one is written out before the next batch is read. The ZIP has the
+    same ``{movie_id}/{category}.json`` files as /export/all; every NDJSON
+    line holds one movie's category documents.
+    """
+    if request.movie_ids and len(request.movie_ids) > settings.movie_export_max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.movie_export_max_ids} movie IDs per export",
+        )
+    query = movies_query(**request.filters())
+    # The request's session is closed by the time the body streams
+    updated_by = admin_user.email
+
+    async def body():
+        async with export_session(session) as export_db:
+            snapshots = iter_snapshots(export_db, query, batch_size=settings.movie_export_batch_size)
+            write = stream_zip if request.format == "zip" else stream_ndjson
+            async for chunk in write(snapshots, updated_by=updated_by):
+                yield chunk
+
+    filename = f"movies-export-{_timestamp_slug()}.{request.format}"
+    return StreamingResponse(
+        body(),
+        media_type="application/zip" if request.format == "zip" else "application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.get("/{external_id}/export/basic-info", response_model=ExportResponse)
 async def export_basic_info(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export basic movie information.
@@ -136,331 +165,113 @@ async def export_basic_info(
     Includes: title, tagline, year, release_date, runtime, rating, language,
     country, overview, budget, revenue, status, genres, scores
     """
-    movie = await get_movie_by_external_id(session, external_id)
-    
-    # Get genres
-    genres = [genre.name for genre in movie.genres]
-    
-    data = {
-        "title": movie.title,
-        "tagline": movie.tagline,
-        "year": movie.year,
-        "release_date": movie.release_date.isoformat() if movie.release_date else None,
-        "runtime": movie.runtime,
-        "rating": movie.rating,
-        "language": movie.language,
-        "country": movie.country,
-        "overview": movie.overview,
-        "budget": movie.budget,
-        "revenue": movie.revenue,
-        "status": movie.status,
-        "genres": genres,
-        "siddu_score": movie.siddu_score,
-        "critics_score": movie.critics_score,
-        "imdb_rating": movie.imdb_rating,
-        "rotten_tomatoes_score": movie.rotten_tomatoes_score,
-    }
-    
-    return ExportResponse(
-        category="basic_info",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source=determine_data_source(movie, "title"),
-            last_updated=movie.updated_at.isoformat() if hasattr(movie, 'updated_at') and movie.updated_at else get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "basic-info", admin_user)
 
 
 @router.get("/{external_id}/export/cast-crew", response_model=ExportResponse)
 async def export_cast_crew(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export cast and crew information.
     
     Includes: directors, writers, producers, actors with character names
     """
-    movie = await get_movie_by_external_id(session, external_id)
-    
-    # Query movie_people association table
-    people_query = select(Person, movie_people.c.role, movie_people.c.character_name).join(
-        movie_people, Person.id == movie_people.c.person_id
-    ).where(movie_people.c.movie_id == movie.id)
-    
-    people_result = await session.execute(people_query)
-    
-    directors = []
-    writers = []
-    producers = []
-    cast = []
-    
-    for person, role, character_name in people_result:
-        person_dict = {
-            "id": person.external_id,
-            "name": person.name,
-            "image": person.image_url,
-        }
-        
-        if role == "director":
-            directors.append(person_dict)
-        elif role == "writer":
-            writers.append(person_dict)
-        elif role == "producer":
-            producers.append(person_dict)
-        elif role == "actor":
-            person_dict["character"] = character_name
-            cast.append(person_dict)
-    
-    data = {
-        "directors": directors,
-        "writers": writers,
-        "producers": producers,
-        "cast": cast,
-    }
-    
-    return ExportResponse(
-        category="cast_crew",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source=determine_data_source(movie, "people"),
-            last_updated=get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "cast-crew", admin_user)
 
 
 @router.get("/{external_id}/export/timeline", response_model=ExportResponse)
 async def export_timeline(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export production timeline events.
     
     Timeline is stored as JSONB array in the database.
     """
-    movie = await get_movie_by_external_id(session, external_id)
-    
-    data = {
-        "events": movie.timeline or []
-    }
-    
-    return ExportResponse(
-        category="timeline",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source="manual",
-            last_updated=get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "timeline", admin_user)
 
 
 @router.get("/{external_id}/export/trivia", response_model=ExportResponse)
 async def export_trivia(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export trivia items.
 
     Trivia is stored as JSONB array in the database.
     """
-    movie = await get_movie_by_external_id(session, external_id)
-
-    data = {
-        "items": movie.trivia or []
-    }
-
-    return ExportResponse(
-        category="trivia",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source="manual",
-            last_updated=get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "trivia", admin_user)
 
 
 @router.get("/{external_id}/export/awards", response_model=ExportResponse)
 async def export_awards(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export award nominations and wins.
 
-    Fetches from award_nominations table.
+    Fetches from award_nominations, with the ceremony, year and category names.
     """
-    movie = await get_movie_by_external_id(session, external_id)
-
-    # Query award nominations
-    awards_query = select(AwardNomination).where(AwardNomination.movie_id == movie.id)
-    awards_result = await session.execute(awards_query)
-    awards = awards_result.scalars().all()
-
-    awards_list = [
-        {
-            "id": award.external_id,
-            "ceremony": award.ceremony,
-            "year": award.year,
-            "category": award.category,
-            "nominee": award.nominee,
-            "result": award.result,
-            "notes": award.notes,
-        }
-        for award in awards
-    ]
-
-    data = {
-        "awards": awards_list
-    }
-
-    return ExportResponse(
-        category="awards",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source="manual",
-            last_updated=get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "awards", admin_user)
 
 
 @router.get("/{external_id}/export/media", response_model=ExportResponse)
 async def export_media(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export media assets.
 
     Includes: poster, backdrop, trailer URL, gallery images
     """
-    movie = await get_movie_by_external_id(session, external_id)
-
-    data = {
-        "poster_url": movie.poster_url,
-        "backdrop_url": movie.backdrop_url,
-        "trailer_url": None,  # TODO: Add trailer_url field to Movie model
-        "gallery_images": [],  # TODO: Add gallery_images field to Movie model
-    }
-
-    return ExportResponse(
-        category="media",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source=determine_data_source(movie, "poster_url"),
-            last_updated=get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "media", admin_user)
 
 
 @router.get("/{external_id}/export/streaming", response_model=ExportResponse)
 async def export_streaming(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ) -> ExportResponse:
     """
     Export streaming platform links.
 
     Fetches from movie_streaming_options table.
     """
-    movie = await get_movie_by_external_id(session, external_id)
-
-    # Query streaming options
-    streaming_query = select(MovieStreamingOption, StreamingPlatform).join(
-        StreamingPlatform, MovieStreamingOption.platform_id == StreamingPlatform.id
-    ).where(MovieStreamingOption.movie_id == movie.id)
-
-    streaming_result = await session.execute(streaming_query)
-
-    streaming_list = [
-        {
-            "platform": platform.name,
-            "region": option.region,
-            "type": option.type,
-            "price": option.price,
-            "quality": option.quality,
-            "url": option.url,
-        }
-        for option, platform in streaming_result
-    ]
-
-    data = {
-        "streaming_options": streaming_list
-    }
-
-    return ExportResponse(
-        category="streaming",
-        movie_id=external_id,
-        exported_at=get_current_timestamp(),
-        data=data,
-        metadata=ExportMetadata(
-            source=determine_data_source(movie, "streaming"),
-            last_updated=get_current_timestamp(),
-            updated_by=admin_user.email,
-        )
-    )
+    return await _export(session, external_id, "streaming", admin_user)
 
 
 @router.get("/{external_id}/export/all")
 async def export_all_categories(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: User = Depends(require_admin_user),
 ):
     """
     Export all categories as a ZIP file.
 
-    Creates a ZIP file containing 7 JSON files (one per category).
+    Creates a ZIP file containing 7 JSON files (one per category). The movie
+    is loaded once, before the response starts, and the archive is streamed.
     """
-    # Fetch all category data
-    basic_info = await export_basic_info(external_id, session, admin_user)
-    cast_crew = await export_cast_crew(external_id, session, admin_user)
-    timeline = await export_timeline(external_id, session, admin_user)
-    trivia = await export_trivia(external_id, session, admin_user)
-    awards = await export_awards(external_id, session, admin_user)
-    media = await export_media(external_id, session, admin_user)
-    streaming = await export_streaming(external_id, session, admin_user)
-
-    # Create ZIP file in memory
-    zip_buffer = BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        zip_file.writestr(f"{external_id}/basic-info.json", basic_info.model_dump_json(indent=2))
-        zip_file.writestr(f"{external_id}/cast-crew.json", cast_crew.model_dump_json(indent=2))
-        zip_file.writestr(f"{external_id}/timeline.json", timeline.model_dump_json(indent=2))
-        zip_file.writestr(f"{external_id}/trivia.json", trivia.model_dump_json(indent=2))
-        zip_file.writestr(f"{external_id}/awards.json", awards.model_dump_json(indent=2))
-        zip_file.writestr(f"{external_id}/media.json", media.model_dump_json(indent=2))
-        zip_file.writestr(f"{external_id}/streaming.json", streaming.model_dump_json(indent=2))
-
-    zip_buffer.seek(0)
+    movie = await get_movie_by_external_id(session, external_id)
+    [snapshot] = await load_snapshots(session, [movie])
+
+    async def snapshots():
+        yield snapshot
 
     return StreamingResponse(
-        zip_buffer,
+        stream_zip(snapshots(), updated_by=admin_user.email),
         media_type="application/zip",
         headers={
             "Content-Disposition": f"attachment; filename={external_id}-export.zip"
@@ -477,7 +288,7 @@ async def import_basic_info(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import basic movie information.
@@ -571,23 +382,32 @@ async def import_basic_info(
         updated_fields.append("rotten_tomatoes_score")
 
     # Update genres
+    stats_repo = GenreStatsRepository(session)
+    previous_genre_ids: set[int] = set()
     if "genres" in data and isinstance(data["genres"], list):
+        previous_genre_ids = await stats_repo.genre_ids_for_movies([movie.id])
+
         # Clear existing genres
         await session.execute(
             movie_genres.delete().where(movie_genres.c.movie_id == movie.id)
         )
 
         # Add new genres
-        for genre_name in data["genres"]:
+        for genre_name in dict.fromkeys(data["genres"]):
             genre_result = await session.execute(
                 select(Genre).where(Genre.name == genre_name)
             )
             genre = genre_result.scalar_one_or_none()
             if genre:
-                movie.genres.append(genre)
+                await session.execute(
+                    movie_genres.insert().values(movie_id=movie.id, genre_id=genre.id)
+                )
 
         updated_fields.append("genres")
 
+    if AGGREGATED_FIELDS.intersection(updated_fields):
+        await stats_repo.refresh_for_movies([movie.id], also_genre_ids=previous_genre_ids)
+
     # Save basic_info as DRAFT
     movie.basic_info_draft = data
     movie.basic_info_status = "draft"
@@ -606,7 +426,7 @@ async def import_timeline(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import production timeline events as DRAFT.
@@ -653,7 +473,7 @@ async def import_trivia(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import trivia items as DRAFT.
@@ -700,7 +520,7 @@ async def import_media(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import media assets.
@@ -741,7 +561,7 @@ async def import_awards(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import award nominations and wins.
@@ -792,7 +612,7 @@ async def import_streaming(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import streaming platform links.
@@ -843,7 +663,7 @@ async def import_cast_crew(
     external_id: str,
     import_data: ImportRequest,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Import cast and crew information.
@@ -896,12 +716,65 @@ async def import_cast_crew(
 # Draft/Publish Workflow Endpoints
 # ============================================================================
 
+@router.post("/drafts/{action}", response_model=MovieDraftBulkResponse)
+async def bulk_drafts(
+    action: str,
+    request: MovieDraftBulkRequest,
+    session: AsyncSession = Depends(get_session),
+    admin_user: Principal = Depends(require_admin),
+) -> MovieDraftBulkResponse:
+    """
+    Publish or discard the drafts of several categories for many movies.
+
+    ``action`` is ``publish`` or ``discard``. Movies are selected by ID or by
+    filters, as for the bulk export. Each category is one UPDATE over every
+    selected movie that has a draft for it, all in one transaction; every
+    change gets an audit row. Movies without a draft in a category are left
+    alone and reported as ``no_draft``.
+    """
+    if action not in ("publish", "discard"):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown draft action '{action}'")
+    invalid = [c for c in request.categories if c not in DRAFT_CATEGORIES]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid categories {', '.join(invalid)}. Must be among: {', '.join(DRAFT_CATEGORIES)}"
+        )
+    filters = request.filters()
+    if not any(filters.values()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Select movies by movie_ids or at least one filter"
+        )
+    if request.movie_ids and len(request.movie_ids) > settings.movie_export_max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.movie_export_max_ids} movie IDs per request",
+        )
+
+    query = movies_query(**filters).with_only_columns(Movie.id, Movie.external_id)
+    movies = [(movie_id, external_id) for movie_id, external_id in await session.execute(query)]
+    result = await apply_drafts(
+        session, action, movies, list(dict.fromkeys(request.categories)), user_id=admin_user.id
+    )
+    await session.commit()
+
+    found = {external_id for _, external_id in movies}
+    return MovieDraftBulkResponse(
+        action=action,
+        updated=len(result.audit),
+        outcomes=result.outcomes,
+        not_found=[i for i in dict.fromkeys(request.movie_ids or []) if i not in found],
+        audit=result.audit,
+    )
+
+
 @router.post("/{external_id}/publish/{category}", response_model=ImportResponse)
 async def publish_draft(
     external_id: str,
     category: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Publish draft data to make it live on the public website.
@@ -909,11 +782,10 @@ async def publish_draft(
     Copies data from {category}_draft to {category} field.
     """
     # Validate category
-    valid_categories = ["trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info"]
-    if category not in valid_categories:
+    if category not in DRAFT_CATEGORIES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+            detail=f"Invalid category. Must be one of: {', '.join(DRAFT_CATEGORIES)}"
         )
 
     movie = await get_movie_by_external_id(session, external_id)
@@ -934,8 +806,9 @@ async def publish_draft(
     # Copy draft to published
     setattr(movie, published_field, draft_data)
     setattr(movie, status_field, "published")
-    movie.curated_at = datetime.now(timezone.utc)
+    movie.curated_at = datetime.now(timezone.utc).replace(tzinfo=None)
     movie.curated_by_id = admin_user.id
+    session.add(MovieDraftAudit(movie_id=movie.id, category=category, action="publish", user_id=admin_user.id))
 
     await session.commit()
 
@@ -951,7 +824,7 @@ async def discard_draft(
     external_id: str,
     category: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ) -> ImportResponse:
     """
     Discard draft data without publishing.
@@ -959,11 +832,10 @@ async def discard_draft(
     Deletes the {category}_draft field.
     """
     # Validate category
-    valid_categories = ["trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info"]
-    if category not in valid_categories:
+    if category not in DRAFT_CATEGORIES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+            detail=f"Invalid category. Must be one of: {', '.join(DRAFT_CATEGORIES)}"
         )
 
     movie = await get_movie_by_external_id(session, external_id)
@@ -983,6 +855,7 @@ async def discard_draft(
     # Clear draft
     setattr(movie, draft_field, None)
     setattr(movie, status_field, "draft")
+    session.add(MovieDraftAudit(movie_id=movie.id, category=category, action="discard", user_id=admin_user.id))
 
     await session.commit()
 
@@ -997,7 +870,7 @@ async def discard_draft(
 async def get_draft_status(
     external_id: str,
     session: AsyncSession = Depends(get_session),
-    admin_user: User = Depends(require_admin),
+    admin_user: Principal = Depends(require_admin),
 ):
     """
     Get draft status for all categories.
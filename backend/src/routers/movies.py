@@ -4,7 +4,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_session
+from ..db import get_read_session
 from ..repositories.movies import MovieRepository
 
 router = APIRouter(prefix="/movies", tags=["movies"])
@@ -22,7 +22,8 @@ async def list_movies(
     ratingMax: float | None = None,
     status: str | None = None,  # accepted but not used currently
     sortBy: str | None = None,
-    session: AsyncSession = Depends(get_session),
+    cursor: str | None = Query(None, description="Keyset cursor; pass an empty value for the first page"),
+    session: AsyncSession = Depends(get_read_session),
 ) -> Any:
     repo = MovieRepository(session)
     country_list = [c.strip() for c in countries.split(",")] if countries else None
@@ -38,6 +39,7 @@ async def list_movies(
         rating_min=ratingMin,
         rating_max=ratingMax,
         sort_by=sortBy,
+        cursor=cursor,
     )
 
 
@@ -45,7 +47,7 @@ async def list_movies(
 async def search_movies(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> Any:
     """
     Search movies by title, description, or genre name.
@@ -57,7 +59,7 @@ async def search_movies(
 
 
 @router.get("/{movie_id}")
-async def get_movie(movie_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_movie(movie_id: str, session: AsyncSession = Depends(get_read_session)) -> Any:
     repo = MovieRepository(session)
     data = await repo.get(movie_id)
     if not data:
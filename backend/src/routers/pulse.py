@@ -28,20 +28,24 @@ async def get_feed(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     viewerId: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
     session: AsyncSession = Depends(get_session),
 ):
     repo = PulseRepository(session)
-    return await repo.list_feed(filter_type=filter, window=window, page=page, limit=limit, viewer_external_id=viewerId)
+    return await repo.list_feed(
+        filter_type=filter, window=window, page=page, limit=limit, viewer_external_id=viewerId, cursor=cursor
+    )
 
 
 @router.get("/trending-topics")
 async def get_trending_topics(
     window: str = Query("7d", pattern="^(24h|7d|30d)$"),
     limit: int = Query(10, ge=1, le=50),
+    decay: bool = Query(False, description="Weight recent hours more (pulse_trending_half_life_hours)"),
     session: AsyncSession = Depends(get_session),
 ):
     repo = PulseRepository(session)
-    return await repo.trending_topics(window=window, limit=limit)
+    return await repo.trending_topics(window=window, limit=limit, decay=decay)
 
 
 @router.post("")
@@ -93,3 +97,36 @@ async def delete_pulse(
         await session.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete pulse")
 
+
+async def _react(pulse_id: str, reaction: str, delta: int, session: AsyncSession) -> Any:
+    repo = PulseRepository(session)
+    try:
+        reactions = await repo.react(pulse_id=pulse_id, reaction=reaction, delta=delta)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if reactions is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pulse not found")
+    await session.commit()
+    return {"reactions": reactions}
+
+
+@router.post("/{pulse_id}/reactions/{reaction}")
+async def add_reaction(
+    pulse_id: str,
+    reaction: str,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """Increment one reaction count atomically."""
+    return await _react(pulse_id, reaction, 1, session)
+
+
+@router.delete("/{pulse_id}/reactions/{reaction}")
+async def remove_reaction(
+    pulse_id: str,
+    reaction: str,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """Decrement one reaction count atomically (not below zero)."""
+    return await _react(pulse_id, reaction, -1, session)
@@ -47,10 +47,13 @@ async def user_attempt_history(
     quizId: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
     session: AsyncSession = Depends(get_session),
 ):
     repo = QuizRepository(session)
-    return await repo.user_attempt_history(user_external_id=userId, quiz_external_id=quizId, page=page, limit=limit)
+    return await repo.user_attempt_history(
+        user_external_id=userId, quiz_external_id=quizId, page=page, limit=limit, cursor=cursor
+    )
 
 
 @router.get("/{quizId}")
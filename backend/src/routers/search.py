@@ -4,7 +4,7 @@ from typing import Any
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_session
+from ..db import get_read_session
 from ..repositories.search import SearchRepository
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -15,7 +15,7 @@ async def search(
     q: str,
     types: str | None = None,
     limit: int = 10,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> Any:
     """
     Search across movies, people, and genres.
@@ -7,19 +7,27 @@ Provides admin endpoints for browsing, searching, and importing movies from TMDB
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import Integer, any_, bindparam, select, insert
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 
+from ..config import settings
 from ..db import get_session
-from ..models import Movie, Genre, Person, StreamingPlatform, MovieStreamingOption, movie_genres, movie_people, User
+from ..models import Movie, Genre, Person, StreamingPlatform, MovieStreamingOption, movie_genres, movie_people
 from ..dependencies.admin import require_admin
-from ..integrations.tmdb_client import search_movie, fetch_movie_by_id, TMDBError, TMDBNotFoundError
+from ..security.principal import Principal
+from ..repositories.genre_stats import GenreStatsRepository
+from ..integrations.tmdb_client import search_movie, fetch_movie_by_id, tmdb_client, TMDBError, TMDBNotFoundError
+from ..schemas.movie_import import ImportJobOut
+from ..services.tmdb_import import LIST_CATEGORIES, MAX_LIST_PAGE, tmdb_import_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +68,28 @@ class TMDBImportResponse(BaseModel):
     message: str
 
 
+class TMDBBulkImportRequest(BaseModel):
+    """Movies for a bulk import job: explicit TMDB ids, or a TMDB list and page range"""
+    tmdb_ids: Optional[List[int]] = None
+    category: Optional[str] = Field(None, pattern=f"^({'|'.join(LIST_CATEGORIES)})$")
+    start_page: int = Field(1, ge=1, le=MAX_LIST_PAGE)
+    end_page: int = Field(1, ge=1, le=MAX_LIST_PAGE)
+    original_language: Optional[str] = Field(None, description="ISO 639-1 code, e.g. 'te' (discover only)")
+    region: Optional[str] = Field(None, description="ISO 3166-1 code, e.g. 'IN'")
+    year: Optional[int] = Field(None, description="Primary release year (discover only)")
+    batch_size: Optional[int] = Field(None, ge=1, le=5000)
+
+
+class TMDBImportJobResponse(ImportJobOut):
+    """Progress of a bulk TMDB import job"""
+    total: int = Field(0, description="Distinct TMDB ids in the job")
+    skipped: int = Field(0, description="Ids already imported before the job started")
+    not_found: int = Field(0, description="Ids TMDB does not know")
+    items: Dict[int, str] = Field(
+        default_factory=dict, description="Outcome per TMDB id: imported, updated, skipped, not_found or failed"
+    )
+
+
 class TMDBExistsResponse(BaseModel):
     """Response for checking if a movie exists"""
     exists: bool
@@ -79,10 +109,103 @@ async def check_movie_exists_by_tmdb_id(session: AsyncSession, tmdb_id: int) ->
     return result.scalar_one_or_none()
 
 
+async def imported_movie_ids(session: AsyncSession, tmdb_ids: Iterable[Optional[int]]) -> Dict[int, int]:
+    """
+    ``{tmdb_id: movie_id}`` for the given TMDB ids that are already imported.
+
+    One column-only query per page of results. On Postgres the ids go in as a
+    single array parameter (``tmdb_id = ANY(:ids)``), so every page size
+    shares one statement.
+    """
+    ids = sorted({i for i in tmdb_ids if i is not None})
+    if not ids:
+        return {}
+    if session.get_bind().dialect.name == "postgresql":
+        condition = Movie.tmdb_id == any_(bindparam("tmdb_ids", ids, type_=ARRAY(Integer)))
+    else:
+        condition = Movie.tmdb_id.in_(ids)
+    rows = await session.execute(select(Movie.tmdb_id, Movie.id).where(condition))
+    return {tmdb_id: movie_id for tmdb_id, movie_id in rows.all()}
+
+
+def _to_preview(movie_data: Dict[str, Any], imported: Dict[int, int]) -> TMDBMoviePreview:
+    tmdb_id = movie_data.get("id")
+    our_movie_id = imported.get(tmdb_id)
+    return TMDBMoviePreview(
+        tmdb_id=tmdb_id,
+        title=movie_data.get("title"),
+        release_date=movie_data.get("release_date"),
+        poster_url=(
+            f"https://image.tmdb.org/t/p/w500{movie_data.get('poster_path')}"
+            if movie_data.get("poster_path")
+            else None
+        ),
+        backdrop_url=(
+            f"https://image.tmdb.org/t/p/original{movie_data.get('backdrop_path')}"
+            if movie_data.get("backdrop_path")
+            else None
+        ),
+        overview=movie_data.get("overview"),
+        vote_average=movie_data.get("vote_average"),
+        already_imported=our_movie_id is not None,
+        our_movie_id=our_movie_id,
+    )
+
+
+async def _browse_response(session: AsyncSession, data: Dict[str, Any], page: int) -> TMDBSearchResponse:
+    results = data.get("results", [])
+    imported = await imported_movie_ids(session, (m.get("id") for m in results))
+    return TMDBSearchResponse(
+        movies=[_to_preview(m, imported) for m in results],
+        total_results=data.get("total_results", 0),
+        total_pages=data.get("total_pages", 0),
+        current_page=page,
+    )
+
+
+class BrowseCache:
+    """
+    Browse and search pages, each reused for ``ttl_seconds``, so paging back
+    and forth calls neither TMDB nor the database. LRU-bounded because search
+    keys are open-ended. Cleared on import so the importing worker shows the
+    new "already imported" flag at once; other workers catch up within the TTL.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple[float, TMDBSearchResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[TMDBSearchResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, response: TMDBSearchResponse) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+browse_cache = BrowseCache(settings.tmdb_browse_cache_seconds)
+
+
 async def create_movie_from_tmdb_data(
     session: AsyncSession,
     tmdb_data: Dict[str, Any],
-    current_user: User,
+    current_user: Principal,
 ) -> Movie:
     """
     Create a movie record from TMDB data.
@@ -191,7 +314,7 @@ async def _get_or_create_person(session: AsyncSession, person_data: Dict[str, An
 async def get_new_releases(
     category: str = Query("now_playing", regex="^(now_playing|upcoming|popular|top_rated)$"),
     page: int = Query(1, ge=1),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TMDBSearchResponse:
     """
@@ -204,64 +327,20 @@ async def get_new_releases(
     - top_rated: Highest rated movies
     """
     try:
-        import httpx
-        from ..config import settings
-        
         if not settings.tmdb_api_key:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="TMDB API key not configured",
             )
         
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(
-                f"https://api.themoviedb.org/3/movie/{category}",
-                params={
-                    "api_key": settings.tmdb_api_key,
-                    "page": page,
-                    "language": "en-US",
-                },
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to fetch from TMDB API",
-                )
-            
-            data = response.json()
-            movies = []
-            
-            for movie_data in data.get("results", []):
-                tmdb_id = movie_data.get("id")
-                existing = await check_movie_exists_by_tmdb_id(session, tmdb_id)
-                
-                movies.append(TMDBMoviePreview(
-                    tmdb_id=tmdb_id,
-                    title=movie_data.get("title"),
-                    release_date=movie_data.get("release_date"),
-                    poster_url=(
-                        f"https://image.tmdb.org/t/p/w500{movie_data.get('poster_path')}"
-                        if movie_data.get("poster_path")
-                        else None
-                    ),
-                    backdrop_url=(
-                        f"https://image.tmdb.org/t/p/original{movie_data.get('backdrop_path')}"
-                        if movie_data.get("backdrop_path")
-                        else None
-                    ),
-                    overview=movie_data.get("overview"),
-                    vote_average=movie_data.get("vote_average"),
-                    already_imported=existing is not None,
-                    our_movie_id=existing.id if existing else None,
-                ))
-            
-            return TMDBSearchResponse(
-                movies=movies,
-                total_results=data.get("total_results", 0),
-                total_pages=data.get("total_pages", 0),
-                current_page=page,
-            )
+        key = ("new_releases", category, page)
+        cached = browse_cache.get(key)
+        if cached is not None:
+            return cached
+        data = await tmdb_client.get_json(f"/movie/{category}", {"page": page, "language": "en-US"})
+        response = await _browse_response(session, data, page)
+        browse_cache.put(key, response)
+        return response
     
     except Exception as e:
         logger.error(f"Error fetching new releases: {str(e)}")
@@ -276,74 +355,28 @@ async def search_tmdb_movies(
     query: str = Query(..., min_length=1),
     year: Optional[int] = Query(None),
     page: int = Query(1, ge=1),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TMDBSearchResponse:
     """Search for movies on TMDB by title"""
     try:
-        import httpx
-        from ..config import settings
-        
         if not settings.tmdb_api_key:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="TMDB API key not configured",
             )
         
-        async with httpx.AsyncClient(timeout=20) as client:
-            params = {
-                "api_key": settings.tmdb_api_key,
-                "query": query,
-                "page": page,
-                "language": "en-US",
-            }
-            if year:
-                params["year"] = year
-            
-            response = await client.get(
-                "https://api.themoviedb.org/3/search/movie",
-                params=params,
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to search TMDB API",
-                )
-            
-            data = response.json()
-            movies = []
-            
-            for movie_data in data.get("results", []):
-                tmdb_id = movie_data.get("id")
-                existing = await check_movie_exists_by_tmdb_id(session, tmdb_id)
-                
-                movies.append(TMDBMoviePreview(
-                    tmdb_id=tmdb_id,
-                    title=movie_data.get("title"),
-                    release_date=movie_data.get("release_date"),
-                    poster_url=(
-                        f"https://image.tmdb.org/t/p/w500{movie_data.get('poster_path')}"
-                        if movie_data.get("poster_path")
-                        else None
-                    ),
-                    backdrop_url=(
-                        f"https://image.tmdb.org/t/p/original{movie_data.get('backdrop_path')}"
-                        if movie_data.get("backdrop_path")
-                        else None
-                    ),
-                    overview=movie_data.get("overview"),
-                    vote_average=movie_data.get("vote_average"),
-                    already_imported=existing is not None,
-                    our_movie_id=existing.id if existing else None,
-                ))
-            
-            return TMDBSearchResponse(
-                movies=movies,
-                total_results=data.get("total_results", 0),
-                total_pages=data.get("total_pages", 0),
-                current_page=page,
-            )
+        key = ("search", query.strip().lower(), year, page)
+        cached = browse_cache.get(key)
+        if cached is not None:
+            return cached
+        params = {"query": query, "page": page, "language": "en-US"}
+        if year:
+            params["year"] = year
+        data = await tmdb_client.get_json("/search/movie", params)
+        response = await _browse_response(session, data, page)
+        browse_cache.put(key, response)
+        return response
     
     except Exception as e:
         logger.error(f"Error searching TMDB: {str(e)}")
@@ -353,10 +386,68 @@ async def search_tmdb_movies(
         )
 
 
+@router.post("/import/bulk", response_model=TMDBImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_bulk_import(
+    body: TMDBBulkImportRequest,
+    current_user: Principal = Depends(require_admin),
+) -> TMDBImportJobResponse:
+    """
+    Start a background import of many TMDB movies.
+
+    Either ``tmdb_ids``, or a ``category`` with ``start_page``/``end_page``.
+    ``discover`` takes ``original_language``, ``region`` and ``year``, so a
+    regional catalog is one call, e.g.
+    ``{"category": "discover", "original_language": "te", "end_page": 25}``.
+    Movies already imported are skipped. Poll GET /admin/tmdb/import/jobs/{job_id}
+    for progress.
+    """
+    if not settings.tmdb_api_key:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="TMDB API key not configured",
+        )
+    if not body.tmdb_ids and not body.category:
+        raise HTTPException(status_code=400, detail="Provide tmdb_ids or a category")
+    if body.tmdb_ids and len(body.tmdb_ids) > settings.tmdb_import_max_ids:
+        raise HTTPException(status_code=400, detail=f"At most {settings.tmdb_import_max_ids} ids per job")
+    if body.end_page < body.start_page:
+        raise HTTPException(status_code=400, detail="end_page is before start_page")
+
+    list_params: Dict[str, Any] = {}
+    if body.region:
+        list_params["region"] = body.region
+    if body.category == "discover":
+        list_params["sort_by"] = "popularity.desc"
+        if body.original_language:
+            list_params["with_original_language"] = body.original_language
+        if body.year:
+            list_params["primary_release_year"] = body.year
+    job = await tmdb_import_jobs.submit(
+        tmdb_ids=body.tmdb_ids,
+        category=body.category,
+        start_page=body.start_page,
+        end_page=body.end_page,
+        list_params=list_params,
+        batch_size=body.batch_size,
+    )
+    return TMDBImportJobResponse(**job.report())
+
+
+@router.get("/import/jobs/{job_id}", response_model=TMDBImportJobResponse)
+async def get_bulk_import_job(
+    job_id: str,
+    current_user: Principal = Depends(require_admin),
+) -> TMDBImportJobResponse:
+    report = await tmdb_import_jobs.status(job_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return TMDBImportJobResponse(**report)
+
+
 @router.post("/import/{tmdb_id}", response_model=TMDBImportResponse, status_code=status.HTTP_201_CREATED)
 async def import_tmdb_movie(
     tmdb_id: int,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TMDBImportResponse:
     """Import a movie from TMDB by its TMDB ID"""
@@ -379,6 +470,9 @@ async def import_tmdb_movie(
         
         # Create movie
         movie = await create_movie_from_tmdb_data(session, tmdb_data, current_user)
+        await GenreStatsRepository(session).refresh_for_movies([movie.id])
+        await session.commit()
+        browse_cache.clear()
         
         logger.info(f"Imported movie from TMDB: {movie.title} (ID: {movie.id})")
         
@@ -414,7 +508,7 @@ async def import_tmdb_movie(
 @router.get("/check-exists/{tmdb_id}", response_model=TMDBExistsResponse)
 async def check_movie_exists(
     tmdb_id: int,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TMDBExistsResponse:
     """Check if a movie with given TMDB ID already exists in our database"""
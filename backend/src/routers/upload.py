@@ -1,28 +1,29 @@
 """
 File Upload Router
 Handles file uploads for user avatars, banners, and other media assets.
+
+Uploads go through services/media.py: the file is spooled and hashed,
+decoded and resized to WebP variants on a worker pool, and stored on the
+configured backend (Cloudinary or local disk). Re-uploading an image that is
+already stored returns the existing URLs without reprocessing.
 """
 
 from __future__ import annotations
 
-import os
-import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
 
-import cloudinary
-import cloudinary.uploader
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from pydantic import BaseModel
 
 from ..dependencies.auth import get_current_user
+from ..logging_config import log
 from ..models import User
-from ..config import settings
+from ..services.media import InvalidImage, MediaPipeline, get_media_pipeline
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
 # Configuration
-MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
 ALLOWED_CONTENT_TYPES = {
     "image/jpeg",
@@ -31,19 +32,15 @@ ALLOWED_CONTENT_TYPES = {
     "image/gif",
 }
 
-# Configure Cloudinary
-cloudinary.config(
-    cloud_name=settings.cloudinary_cloud_name,
-    api_key=settings.cloudinary_api_key,
-    api_secret=settings.cloudinary_api_secret,
-)
-
 
 class UploadResponse(BaseModel):
     """Response model for file upload"""
     url: str
     filename: str
     size: int
+    variants: Dict[str, str] = {}
+    content_hash: str | None = None
+    deduplicated: bool = False
 
 
 def validate_image_file(file: UploadFile) -> None:
@@ -65,114 +62,65 @@ def validate_image_file(file: UploadFile) -> None:
             )
 
 
+async def _store_image(file: UploadFile, kind: str, pipeline: MediaPipeline) -> UploadResponse:
+    validate_image_file(file)
+    try:
+        stored = await pipeline.store(file, kind)
+    except InvalidImage as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        log.error("media_upload_failed", kind=kind, backend=pipeline.storage.name, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to store upload: {str(e)}",
+        )
+    return UploadResponse(
+        url=stored.url,
+        filename=stored.key,
+        size=stored.size,
+        variants=stored.variants,
+        content_hash=stored.content_hash,
+        deduplicated=stored.deduplicated,
+    )
+
+
 @router.post("/avatar", response_model=UploadResponse)
 async def upload_avatar(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
+    pipeline: MediaPipeline = Depends(get_media_pipeline),
 ) -> Any:
     """
-    Upload user avatar image to Cloudinary.
-    
+    Upload user avatar image.
+
     Requirements:
     - Must be authenticated
     - Image file (JPEG, PNG, WebP, GIF)
-    - Max file size: 5MB
-    
+    - Max file size: media_max_upload_bytes (5MB by default)
+
     Returns:
-    - Cloudinary URL to access the uploaded avatar
-    - Public ID (filename)
-    - File size in bytes
+    - URL of the 400x400 WebP avatar, plus all variant URLs (lg, sm)
+    - Storage key and original file size in bytes
     """
-    # Validate file
-    validate_image_file(file)
-
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
-
-    # Check file size
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024 * 1024):.1f}MB",
-        )
-
-    try:
-        # Upload to Cloudinary
-        # We reset the file cursor to 0 before uploading because we read it above
-        await file.seek(0)
-        
-        result = cloudinary.uploader.upload(
-            file.file,
-            folder="avatars",
-            public_id=f"avatar_{current_user.id}_{uuid.uuid4()}",
-            overwrite=True,
-            resource_type="image"
-        )
-        
-        return UploadResponse(
-            url=result.get("secure_url"),
-            filename=result.get("public_id"),
-            size=file_size,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload to Cloudinary: {str(e)}",
-        )
+    return await _store_image(file, "avatar", pipeline)
 
 
 @router.post("/banner", response_model=UploadResponse)
 async def upload_banner(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
+    pipeline: MediaPipeline = Depends(get_media_pipeline),
 ) -> Any:
     """
-    Upload user banner/cover image to Cloudinary.
-    
+    Upload user banner/cover image.
+
     Requirements:
     - Must be authenticated
     - Image file (JPEG, PNG, WebP, GIF)
-    - Max file size: 5MB
-    
+    - Max file size: media_max_upload_bytes (5MB by default)
+
     Returns:
-    - Cloudinary URL to access the uploaded banner
-    - Public ID (filename)
-    - File size in bytes
+    - URL of the 1500x500 WebP banner, plus all variant URLs (lg, sm)
+    - Storage key and original file size in bytes
     """
-    # Validate file
-    validate_image_file(file)
-
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
-
-    # Check file size
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024 * 1024):.1f}MB",
-        )
-
-    try:
-        # Upload to Cloudinary
-        await file.seek(0)
-        
-        result = cloudinary.uploader.upload(
-            file.file,
-            folder="banners",
-            public_id=f"banner_{current_user.id}_{uuid.uuid4()}",
-            overwrite=True,
-            resource_type="image"
-        )
-        
-        return UploadResponse(
-            url=result.get("secure_url"),
-            filename=result.get("public_id"),
-            size=file_size,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload to Cloudinary: {str(e)}",
-        )
+    return await _store_image(file, "banner", pipeline)
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..db import get_session
 from ..models import User, AdminUserMeta, UserRoleProfile
 from ..dependencies.auth import get_current_user
+from ..security.principal import roles_changed
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -216,6 +217,7 @@ async def set_active_role(
     current_user.active_role = body.role
     session.add(current_user)
     await session.commit()
+    await roles_changed(session, current_user.id)
     
     metadata = ROLE_METADATA.get(body.role, {})
     
@@ -4,11 +4,12 @@ from typing import Any, Optional
 from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from ..db import get_session
-from ..models import User, Review, Watchlist, Favorite, Collection, UserSettings
+from ..models import User, UserSettings, UserStats
 from ..dependencies.auth import get_current_user_optional
+from ..repositories.user_stats import UserStatsRepository
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -127,52 +128,26 @@ async def get_user_stats(
     username: str,
     session: AsyncSession = Depends(get_session),
 ) -> Any:
-    """Get user statistics (counts for reviews, watchlist, favorites, collections)"""
-    # Find user by username
-    query = select(User).where(User.email.like(f"{username}%"))
+    """Get user statistics (reviews, watchlist, favorites, collections, following, followers)"""
+    # Find user by username together with their counters row, in one query
+    query = (
+        select(User.id, UserStats)
+        .outerjoin(UserStats, UserStats.user_id == User.id)
+        .where(User.email.like(f"{username}%"))
+    )
     result = await session.execute(query)
-    user = result.scalar_one_or_none()
+    row = result.one_or_none()
     
-    if not user:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    return await get_user_stats_internal(user.id, session)
+    return UserStatsResponse(**UserStatsRepository.to_dict(row.UserStats))
 
 
 async def get_user_stats_internal(user_id: int, session: AsyncSession) -> UserStatsResponse:
-    """Internal function to get user stats by user ID"""
-    # Count reviews
-    reviews_query = select(func.count(Review.id)).where(Review.user_id == user_id)
-    reviews_result = await session.execute(reviews_query)
-    reviews_count = reviews_result.scalar() or 0
-    
-    # Count watchlist items
-    watchlist_query = select(func.count(Watchlist.id)).where(Watchlist.user_id == user_id)
-    watchlist_result = await session.execute(watchlist_query)
-    watchlist_count = watchlist_result.scalar() or 0
-    
-    # Count favorites
-    favorites_query = select(func.count(Favorite.id)).where(
-        Favorite.user_id == user_id,
-        Favorite.type == "movie"
-    )
-    favorites_result = await session.execute(favorites_query)
-    favorites_count = favorites_result.scalar() or 0
-    
-    # Count collections
-    collections_query = select(func.count(Collection.id)).where(Collection.user_id == user_id)
-    collections_result = await session.execute(collections_query)
-    collections_count = collections_result.scalar() or 0
-    
-    return UserStatsResponse(
-        reviews=reviews_count,
-        watchlist=watchlist_count,
-        favorites=favorites_count,
-        collections=collections_count,
-        following=0,  # TODO: Implement following/followers
-        followers=0,
-    )
+    """Internal function to get user stats by user ID (one read of the user_stats counters row)"""
+    return UserStatsResponse(**await UserStatsRepository(session).get(user_id))
 
@@ -23,10 +23,11 @@ async def list_visual_treats(
     sortBy: Optional[str] = Query("popular"),
     page: Optional[int] = Query(None, ge=1),
     pageSize: Optional[int] = Query(None, ge=1, le=200),
+    facets: bool = Query(False, description="Return {items, facets} with counts per filter value"),
     session: AsyncSession = Depends(get_session),
 ) -> Any:
     repo = VisualTreatsRepository(session)
-    return await repo.list_treats(
+    filters = dict(
         categories=categories,
         tags=tags,
         directors=directors,
@@ -35,10 +36,11 @@ async def list_visual_treats(
         search=search,
         movie_external_id=movieId,
         scene_external_id=sceneId,
-        sort_by=sortBy,
-        page=page,
-        page_size=pageSize,
     )
+    items = await repo.list_treats(sort_by=sortBy, page=page, page_size=pageSize, **filters)
+    if not facets:
+        return items
+    return {"items": items, "facets": await repo.facets(**filters)}
 
 
 @router.get("/by-movie/{movie_id}")
@@ -10,6 +10,7 @@ from sqlalchemy import select
 from ..db import get_session
 from ..dependencies.auth import get_current_user
 from ..models import User, Watchlist, Movie
+from ..repositories.loader_profiles import load_profile
 from ..repositories.watchlist import WatchlistRepository
 
 router = APIRouter(prefix="/watchlist", tags=["watchlist"])
@@ -86,6 +87,7 @@ async def add_to_watchlist(
             .join(Watchlist.user)
             .join(Watchlist.movie)
             .where(User.id == current_user.id, Movie.external_id == body.movieId)
+            .options(*load_profile("watchlist_item"))
             .limit(1)
         )
         w = res.scalar_one_or_none()
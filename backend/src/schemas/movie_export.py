@@ -0,0 +1,70 @@
+"""
+Pydantic schemas for the admin movie category export and drafts
+
+The per-category export document (also the body POSTed back to
+/admin/movies/{id}/import/{category}), and the bulk export and bulk draft
+publish/discard requests, which select movies the same way.
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class ExportMetadata(BaseModel):
+    """Metadata for exported data"""
+    source: str = Field(..., description="Data source: tmdb, manual, or llm-generated")
+    last_updated: str = Field(..., description="ISO timestamp of last update")
+    updated_by: Optional[str] = Field(None, description="Email of user who last updated")
+
+
+class ExportResponse(BaseModel):
+    """Standard export response format"""
+    category: str = Field(..., description="Category name")
+    movie_id: str = Field(..., description="Movie external ID")
+    version: str = Field(default="1.0", description="Schema version")
+    exported_at: str = Field(..., description="ISO timestamp of export")
+    data: Dict[str, Any] = Field(..., description="Category-specific data")
+    metadata: ExportMetadata = Field(..., description="Export metadata")
+
+
+class MovieSelection(BaseModel):
+    """Movies to act on: explicit ids, or every movie matching the filters"""
+    movie_ids: Optional[List[str]] = Field(None, description="Movie external IDs; filters are ignored when given")
+    curation_status: Optional[str] = Field(None, description="e.g. approved")
+    status: Optional[str] = Field(None, description="Movie release status")
+    language: Optional[str] = None
+    genre: Optional[str] = Field(None, description="Genre slug")
+
+    def filters(self) -> Dict[str, Any]:
+        return self.model_dump(include={"movie_ids", "curation_status", "status", "language", "genre"})
+
+
+class MovieBulkExportRequest(MovieSelection):
+    format: Literal["zip", "ndjson"] = Field("zip", description="One ZIP of category files, or one JSON line per movie")
+
+
+class MovieDraftBulkRequest(MovieSelection):
+    categories: List[str] = Field(..., min_length=1, description="e.g. trivia, timeline, awards")
+
+
+class DraftAuditOut(BaseModel):
+    id: int
+    movie_id: str
+    category: str
+    action: str
+    user_id: Optional[int] = None
+    created_at: datetime
+
+
+class MovieDraftBulkResponse(BaseModel):
+    action: str
+    updated: int = Field(..., description="Movie categories published or discarded")
+    outcomes: Dict[str, Dict[str, str]] = Field(
+        ..., description="Movie ID -> category -> published, discarded or no_draft"
+    )
+    not_found: List[str] = Field(default_factory=list, description="Requested movie IDs that do not exist")
+    audit: List[DraftAuditOut]
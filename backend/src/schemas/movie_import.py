@@ -0,0 +1,99 @@
+"""
+Pydantic schemas for the admin JSON movie import
+
+Request rows for POST /admin/movies/import and the report it returns, plus
+the job status returned by the streaming NDJSON import. Shared by the admin
+router, services/movie_import.py and services/import_jobs.py.
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class PersonIn(BaseModel):
+    name: str
+    role: Optional[str] = None  # director | writer | producer | actor
+    character: Optional[str] = None
+    image: Optional[str] = None
+
+class StreamingIn(BaseModel):
+    platform: str  # e.g., "netflix" or platform external_id/name
+    region: str    # e.g., "US"
+    type: str      # subscription | rent | buy | free
+    price: Optional[float] = None
+    quality: Optional[str] = None
+    url: Optional[str] = None
+
+class AwardSimpleIn(BaseModel):
+    name: str
+    year: int
+    category: str
+    status: str  # Winner | Nominee
+
+class TriviaIn(BaseModel):
+    question: str
+    category: str
+    answer: str
+    explanation: Optional[str] = None
+
+class TimelineIn(BaseModel):
+    date: str  # YYYY-MM-DD
+    title: str
+    description: str
+    type: str
+
+class MovieImportIn(BaseModel):
+    external_id: str
+    tmdb_id: Optional[int] = None
+    title: str
+    tagline: Optional[str] = None
+    year: Optional[str] = None
+    release_date: Optional[str] = None
+    runtime: Optional[int] = None
+    rating: Optional[str] = None
+    siddu_score: Optional[float] = None
+    critics_score: Optional[float] = None
+    imdb_rating: Optional[float] = None
+    rotten_tomatoes_score: Optional[float] = None
+    language: Optional[str] = None
+    country: Optional[str] = None
+    overview: Optional[str] = None
+    poster_url: Optional[str] = None
+    backdrop_url: Optional[str] = None
+    budget: Optional[int] = None
+    revenue: Optional[int] = None
+    status: Optional[str] = None
+    genres: Optional[List[str]] = None
+    directors: Optional[List[PersonIn]] = None
+    writers: Optional[List[PersonIn]] = None
+    producers: Optional[List[PersonIn]] = None
+    cast: Optional[List[PersonIn]] = None
+    streaming: Optional[List[StreamingIn]] = None
+    awards: Optional[List[AwardSimpleIn]] = None
+    trivia: Optional[List[TriviaIn]] = None
+    timeline: Optional[List[TimelineIn]] = None
+
+
+class ImportReportOut(BaseModel):
+    imported: int
+    updated: int
+    failed: int
+    errors: List[str]
+    batches: int = Field(0, description="Number of committed batches")
+    elapsed_seconds: float = Field(0.0, description="Wall-clock time spent importing")
+    movies_per_second: float = Field(0.0, description="Imported + updated movies per second")
+
+
+class ImportJobOut(ImportReportOut):
+    id: str
+    status: str = Field(..., description="queued, running, completed or failed")
+    filename: Optional[str] = None
+    processed: int = Field(0, description="Records handled so far, including failures")
+    records_per_second: float = Field(0.0, description="Processed records per second")
+    error: Optional[str] = Field(None, description="Why the job stopped, when it failed")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
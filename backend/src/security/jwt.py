@@ -11,7 +11,13 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def create_access_token(sub: str, role_profiles: list[dict] | None = None) -> str:
+def create_access_token(
+    sub: str,
+    role_profiles: list[dict] | None = None,
+    *,
+    external_id: str | None = None,
+    active_role: str | None = None,
+) -> str:
     payload = {
         "sub": sub,
         "type": "access",
@@ -21,6 +27,12 @@ def create_access_token(sub: str, role_profiles: list[dict] | None = None) -> st
     # Include role_profiles if provided (for admin role checking in middleware)
     if role_profiles:
         payload["role_profiles"] = role_profiles
+    # With role_profiles, these let the API authorize from the token alone
+    # (security/principal.py: principal_from_claims)
+    if external_id:
+        payload["ext"] = external_id
+    if active_role:
+        payload["active_role"] = active_role
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
@@ -1,15 +1,167 @@
+"""
+Argon2 password hashing.
+
+Hashing and verifying cost tens of milliseconds of CPU each, so request
+handlers use ``hash_password_async`` / ``verify_password_async``. These run
+the work on a dedicated thread or process pool (``password_hash_executor``,
+``password_hash_workers``) behind a semaphore of
+``password_hash_max_concurrency``. A login storm therefore queues on the
+semaphore instead of blocking the event loop or the default executor used
+by the rest of the app. ``password_hasher.stats()`` reports queue depth and
+wait times.
+
+Argon2 parameters come from ``Settings``. ``needs_rehash`` tells the login
+handler when a stored hash was made with different parameters so it can be
+upgraded transparently.
+
+The synchronous ``hash_password`` / ``verify_password`` remain for seed
+scripts and other code that runs outside the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable
+
 from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from ..config import settings
+
+Argon2Params = tuple[int, int, int, int, int]
 
-_ph = PasswordHasher()
+
+def _settings_params() -> Argon2Params:
+    return (
+        settings.argon2_time_cost,
+        settings.argon2_memory_cost_kib,
+        settings.argon2_parallelism,
+        settings.argon2_hash_len,
+        settings.argon2_salt_len,
+    )
+
+
+@lru_cache(maxsize=4)
+def _hasher(params: Argon2Params) -> PasswordHasher:
+    time_cost, memory_cost, parallelism, hash_len, salt_len = params
+    return PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=hash_len,
+        salt_len=salt_len,
+    )
+
+
+# Module-level so they can be pickled into a process pool.
+def _hash(params: Argon2Params, password: str) -> str:
+    return _hasher(params).hash(password)
+
+
+def _verify(params: Argon2Params, password: str, hashed: str) -> bool:
+    try:
+        return _hasher(params).verify(hashed, password)
+    except (VerificationError, InvalidHashError, TypeError, ValueError):
+        return False
 
 
 def hash_password(password: str) -> str:
-    return _ph.hash(password)
+    return _hash(_settings_params(), password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _verify(_settings_params(), plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True when ``hashed_password`` was made with other parameters than the configured ones."""
     try:
-        return _ph.verify(hashed_password, plain_password)
-    except Exception:
-        return False
+        return _hasher(_settings_params()).check_needs_rehash(hashed_password)
+    except (InvalidHashError, ValueError):
+        return True
+
+
+class PasswordHashPool:
+    def __init__(self, *, executor: str, workers: int, max_concurrency: int) -> None:
+        self.executor_kind = executor
+        self.workers = max(1, workers)
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.waiting = 0
+        self.in_flight = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.admitted = 0
+        self.total_wait_seconds = 0.0
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _gate(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            # asyncio primitives belong to one loop (tests start one per app)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        gate = self._gate()
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        try:
+            await gate.acquire()
+        finally:
+            self.waiting -= 1
+        self.total_wait_seconds += time.perf_counter() - queued_at
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            gate.release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "completed": self.completed,
+            "avg_wait_ms": round(1000 * self.total_wait_seconds / self.admitted, 2) if self.admitted else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHashPool(
+    executor=settings.password_hash_executor,
+    workers=settings.password_hash_workers,
+    max_concurrency=settings.password_hash_max_concurrency,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.run(_hash, _settings_params(), password)
+
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run(_verify, _settings_params(), plain_password, hashed_password)
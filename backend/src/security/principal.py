@@ -0,0 +1,296 @@
+"""
+Authenticated principal and its in-process cache.
+
+A ``Principal`` is the minimum the auth layer needs to know about a caller:
+ids, the active role and which role profiles are enabled. It is loaded with
+two column-only queries (no ORM entities, no relationship loading) and cached
+per ``(user_id, token iat)`` so repeated requests with the same access token
+skip the database entirely until the entry expires.
+
+The cache is per worker process. Cross-worker invalidation goes through
+``users.roles_changed_at``: a cached principal loaded before that watermark is
+reloaded. Each worker re-reads a user's watermark (one primary-key column) at
+most every ``principal_watermark_ttl_seconds``, which bounds how long another
+worker can keep serving revoked roles.
+
+Anything that changes a user's roles must call ``roles_changed`` after
+committing; it bumps the watermark and drops this worker's entries at once.
+
+Access tokens issued at login, signup and refresh also carry the role
+claims. ``get_token_principal`` trusts those claims, without loading
+anything, as long as the token was issued at or after the user's watermark.
+A token from before the last role change falls back to ``get_principal``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Hashable
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models import RoleType, User, UserRoleProfile
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: int
+    external_id: str
+    active_role: str
+    enabled_roles: frozenset[str]
+
+    def has_role(self, role: str) -> bool:
+        return role in self.enabled_roles
+
+    @property
+    def is_admin(self) -> bool:
+        return RoleType.ADMIN.value in self.enabled_roles
+
+    @property
+    def is_critic(self) -> bool:
+        return RoleType.CRITIC.value in self.enabled_roles
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache with a per-entry TTL, keyed by ``(user_id, iat)``.
+    Entries remember when (wall clock) the principal was read from the database.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_entry(self, user_id: int, iat: int | None) -> tuple[Principal, float] | None:
+        """``(principal, loaded_at)`` for a live entry, else None."""
+        key = (user_id, iat)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2], entry[1]
+
+    def get(self, user_id: int, iat: int | None) -> Principal | None:
+        entry = self.get_entry(user_id, iat)
+        return entry[0] if entry else None
+
+    def put(self, iat: int | None, principal: Principal, loaded_at: float | None = None) -> None:
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        key = (principal.id, iat)
+        loaded_at = time.time() if loaded_at is None else loaded_at
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, loaded_at, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop every cached token of ``user_id``."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RoleWatermarks:
+    """
+    Per-user ``roles_changed_at`` (epoch seconds, 0 when never changed), each
+    value trusted for ``ttl_seconds`` before it is read again.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> float | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now:
+                return None
+            return entry[1]
+
+    def put(self, user_id: int, changed_at: float) -> None:
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, changed_at)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries,
+)
+role_watermarks = RoleWatermarks(
+    ttl_seconds=settings.principal_watermark_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries,
+)
+
+
+def _epoch(value: datetime | None) -> float:
+    """Naive UTC column value -> epoch seconds (0 for never)."""
+    if value is None:
+        return 0.0
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+async def roles_changed_at(session: AsyncSession, user_id: int) -> float | None:
+    """The user's role-change watermark, from the short-lived cache or one PK lookup."""
+    cached = role_watermarks.get(user_id)
+    if cached is not None:
+        return cached
+    row = (
+        await session.execute(select(User.roles_changed_at).where(User.id == user_id))
+    ).one_or_none()
+    if row is None:
+        return None
+    changed_at = _epoch(row.roles_changed_at)
+    role_watermarks.put(user_id, changed_at)
+    return changed_at
+
+
+async def load_principal(session: AsyncSession, user_id: int) -> Principal | None:
+    """Build a ``Principal`` from the users and user_role_profiles columns."""
+    row = (
+        await session.execute(
+            select(User.id, User.external_id, User.active_role, User.roles_changed_at).where(User.id == user_id)
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    role_watermarks.put(user_id, _epoch(row.roles_changed_at))
+    roles = (
+        await session.execute(
+            select(UserRoleProfile.role_type).where(
+                UserRoleProfile.user_id == user_id,
+                UserRoleProfile.enabled.is_(True),
+            )
+        )
+    ).scalars().all()
+    return Principal(
+        id=row.id,
+        external_id=row.external_id,
+        active_role=row.active_role or RoleType.LOVER.value,
+        enabled_roles=frozenset(roles),
+    )
+
+
+async def get_principal(session: AsyncSession, user_id: int, iat: int | None) -> Principal | None:
+    """
+    Return the cached principal for this token, loading it on a miss or when
+    the user's roles changed (on any worker) after it was cached.
+    """
+    entry = principal_cache.get_entry(user_id, iat)
+    if entry is not None:
+        principal, loaded_at = entry
+        changed_at = await roles_changed_at(session, user_id)
+        if changed_at is not None and changed_at < loaded_at:
+            return principal
+        principal_cache.invalidate(user_id)
+    loaded_at = time.time()
+    principal = await load_principal(session, user_id)
+    if principal is not None:
+        principal_cache.put(iat, principal, loaded_at)
+    return principal
+
+
+def principal_from_claims(payload: dict[str, Any]) -> Principal | None:
+    """The principal described by an access token's role claims; None when it has none."""
+    external_id = payload.get("ext")
+    active_role = payload.get("active_role")
+    profiles = payload.get("role_profiles")
+    if not isinstance(external_id, str) or not isinstance(active_role, str) or not isinstance(profiles, list):
+        return None
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return Principal(
+        id=user_id,
+        external_id=external_id,
+        active_role=active_role,
+        enabled_roles=frozenset(
+            p["role_type"] for p in profiles
+            if isinstance(p, dict) and p.get("enabled") and isinstance(p.get("role_type"), str)
+        ),
+    )
+
+
+def token_claims(principal: Principal) -> dict[str, Any]:
+    """``create_access_token`` keyword arguments that let ``principal_from_claims`` rebuild ``principal``."""
+    return {
+        "role_profiles": [{"role_type": role, "enabled": True} for role in sorted(principal.enabled_roles)],
+        "external_id": principal.external_id,
+        "active_role": principal.active_role,
+    }
+
+
+async def get_token_principal(
+    session: AsyncSession, payload: dict[str, Any], user_id: int, iat: int | None
+) -> Principal | None:
+    """
+    The caller of a verified access token. Role claims issued at or after the
+    user's ``roles_changed_at`` are used as is, costing at most the cached
+    watermark lookup; older or claim-less tokens go through ``get_principal``.
+    """
+    claimed = principal_from_claims(payload)
+    if claimed is not None and claimed.id == user_id and iat is not None:
+        changed_at = await roles_changed_at(session, user_id)
+        if changed_at is None:
+            return None
+        if changed_at <= iat:
+            return claimed
+    return await get_principal(session, user_id, iat)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop this worker's cached principals of ``user_id``."""
+    principal_cache.invalidate(user_id)
+
+
+async def roles_changed(session: AsyncSession, user_id: int) -> None:
+    """
+    Record a committed role change: bump ``users.roles_changed_at`` so every
+    worker reloads the principal, and drop this worker's entries immediately.
+    Call it after the role change itself is committed, so a principal loaded
+    in between is always older than the watermark.
+    """
+    now = datetime.now(timezone.utc)
+    await session.execute(
+        update(User).where(User.id == user_id).values(roles_changed_at=now.replace(tzinfo=None))
+    )
+    await session.commit()
+    role_watermarks.put(user_id, now.timestamp())
+    invalidate_principal(user_id)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 try:
     from . import db as dbmod
@@ -39,6 +40,12 @@ try:
     )
     from .config import settings
     from .security.password import hash_password
+    from .repositories.review_stats import ReviewStatsRepository
+    from .repositories.collections import CollectionRepository
+    from .repositories.user_stats import UserStatsRepository
+    from .repositories.pulse_timeline import PulseTimelineRepository
+    from .repositories.pulse_hashtags import PulseHashtagRepository
+    from .repositories.festivals import FestivalsRepository
 except ImportError:
     import db as dbmod  # type: ignore
     from models import Genre, Movie  # type: ignore
@@ -76,7 +83,7 @@ async def seed() -> None:
             {"external_id": "tt1375666", "title": "Inception", "year": "2010"},
             {"external_id": "tt0133093", "title": "The Matrix", "year": "1999"},
         ]
-        existing_movies = (await session.execute(select(Movie))).scalars().all()
+        existing_movies = (await session.execute(select(Movie).options(selectinload(Movie.genres)))).scalars().all()
         by_ext = {m.external_id: m for m in existing_movies}
 
         for spec in movie_specs:
@@ -100,8 +107,8 @@ async def seed() -> None:
                 session.add(Person(**spec))
         await session.flush()
         # Link Keanu to The Matrix; Nolan to Inception
-        m_matrix = (await session.execute(_select(Movie).where(Movie.external_id=="tt0133093"))).scalar_one_or_none()
-        m_inception = (await session.execute(_select(Movie).where(Movie.external_id=="tt1375666"))).scalar_one_or_none()
+        m_matrix = (await session.execute(_select(Movie).where(Movie.external_id=="tt0133093").options(selectinload(Movie.people)))).scalar_one_or_none()
+        m_inception = (await session.execute(_select(Movie).where(Movie.external_id=="tt1375666").options(selectinload(Movie.people)))).scalar_one_or_none()
         p_keanu = (await session.execute(_select(Person).where(Person.external_id=="nm0000206"))).scalar_one_or_none()
         p_nolan = (await session.execute(_select(Person).where(Person.external_id=="nm0634240"))).scalar_one_or_none()
         if m_matrix and p_keanu and p_keanu not in m_matrix.people:
@@ -171,6 +178,7 @@ async def seed() -> None:
                 movie_id=m_inception.id,
             ))
         await session.commit()
+        await ReviewStatsRepository(session).reconcile()
 
         # Upsert collections
         existing_collections = (await session.execute(_select(Collection))).scalars().all()
@@ -193,6 +201,8 @@ async def seed() -> None:
                 col1.movies.append(m_inception)
             if m_matrix and m_matrix not in col1.movies:
                 col1.movies.append(m_matrix)
+        await session.flush()
+        await CollectionRepository(session).refresh_cards()
         await session.commit()
 
         # Upsert watchlist and favorites
@@ -544,6 +554,8 @@ async def seed() -> None:
                 FestivalWinner(category_id=cat_palme.id, movie_title="Anatomy of a Fall", movie_poster_url="/placeholder.svg?height=400&width=300", recipient="Justine Triet", director="Justine Triet", citation="For its masterful exploration of truth and perception in relationships", rating=8.2),
                 FestivalWinner(category_id=cat_gp.id, movie_title="The Zone of Interest", movie_poster_url="/placeholder.svg?height=400&width=300", recipient="Jonathan Glazer", director="Jonathan Glazer", citation="For its haunting portrayal of the banality of evil", rating=8.1),
             ])
+        # Point festivals at their current edition and retire cached programs
+        await FestivalsRepository(session).touch()
         await session.commit()
 
         # Scenes seed (Scene Explorer)
@@ -713,7 +725,6 @@ async def seed() -> None:
 
         # --- Pulse domain seed ---
         from sqlalchemy import select as _select
-        import json as _json
         from .models import Pulse, UserFollow
 
         # Ensure a few users exist for pulse posts
@@ -769,8 +780,8 @@ async def seed() -> None:
                 linked_title=inception.title,
                 linked_poster_url=inception.poster_url,
                 linked_movie_id=inception.id,
-                hashtags=_json.dumps(["#Oppenheimer", "#FilmAnnouncement"]),
-                reactions_json=_json.dumps({"love": 8542, "fire": 3201, "mindblown": 4562, "laugh": 1203, "sad": 89, "angry": 12}),
+                hashtags=["#Oppenheimer", "#FilmAnnouncement"],
+                reactions_json={"love": 8542, "fire": 3201, "mindblown": 4562, "laugh": 1203, "sad": 89, "angry": 12},
                 reactions_total=17609,
                 comments_count=2453,
                 shares_count=1876,
@@ -784,17 +795,17 @@ async def seed() -> None:
                 content_text=(
                     "Studying the cinematography techniques in 'Dune: Part Two'. The use of scale and perspective is impressive."
                 ),
-                content_media=_json.dumps([
+                content_media=[
                     {"type": "image", "url": "/dune-part-two-poster.png"},
                     {"type": "image", "url": "/cinematic-scene.png"},
-                ]),
+                ],
                 linked_type=None,
                 linked_external_id=None,
                 linked_title=None,
                 linked_poster_url=None,
                 linked_movie_id=None,
-                hashtags=_json.dumps(["#Dune2", "#Cinematography", "#FilmStudy"]),
-                reactions_json=_json.dumps({"love": 543, "fire": 321, "mindblown": 432, "laugh": 87, "sad": 12, "angry": 3}),
+                hashtags=["#Dune2", "#Cinematography", "#FilmStudy"],
+                reactions_json={"love": 543, "fire": 321, "mindblown": 432, "laugh": 87, "sad": 12, "angry": 3},
                 reactions_total=1398,
                 comments_count=98,
                 shares_count=54,
@@ -1306,6 +1317,9 @@ async def seed() -> None:
                 )
 
         await session.commit()
+        await UserStatsRepository(session).reconcile()
+        await PulseTimelineRepository(session).backfill()
+        await PulseHashtagRepository(session).rebuild()
 
         print("Seed complete.")
 
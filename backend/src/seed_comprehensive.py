@@ -656,7 +656,6 @@ async def seed_comprehensive():
                         hashtag2="Cinema"
                     )
 
-                    import json
                     hashtags_list = [movie.title.replace(" ", ""), "Cinema", "Movies"]
 
                     pulse = Pulse(
@@ -668,7 +667,7 @@ async def seed_comprehensive():
                         linked_external_id=movie.external_id,
                         linked_title=movie.title,
                         linked_poster_url=movie.poster_url,
-                        hashtags=json.dumps(hashtags_list),
+                        hashtags=hashtags_list,
                         reactions_total=random.randint(10, 500),
                         comments_count=random.randint(2, 50),
                         shares_count=random.randint(0, 20)
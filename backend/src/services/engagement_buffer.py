@@ -0,0 +1,234 @@
+"""
+Write-behind buffer for critic review engagement counters.
+
+Views, likes and shares are recorded in memory and coalesced per review id.
+A background task flushes them every ``engagement_flush_interval_seconds``
+(or sooner once ``engagement_flush_max_pending`` reviews are dirty) with one
+batched UPDATE, then rolls the same deltas into the critic's daily
+``critic_analytics`` row and ``critic_profiles.total_views``.
+
+Counts are eventually consistent: a crash loses at most one interval of
+increments. ``main.lifespan`` calls ``stop()`` so a clean shutdown flushes
+everything still pending.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Integer, bindparam, column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import db as dbmod
+from ..config import settings
+from ..logging_config import log
+from ..models import CriticAnalytics, CriticProfile, CriticReview
+from ..repositories.upsert import dialect_insert
+
+# Index of each counter in a pending delta triple
+VIEWS, LIKES, SHARES = 0, 1, 2
+
+
+class EngagementBuffer:
+    def __init__(
+        self,
+        *,
+        flush_interval: float,
+        max_pending: int,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._session_factory = session_factory
+        self._pending: dict[int, list[int]] = {}
+        self._task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+
+    # ------------------------------------------------------------------ record
+
+    def record(self, review_id: int, *, views: int = 0, likes: int = 0, shares: int = 0) -> None:
+        deltas = self._pending.get(review_id)
+        if deltas is None:
+            deltas = self._pending[review_id] = [0, 0, 0]
+        deltas[VIEWS] += views
+        deltas[LIKES] += likes
+        deltas[SHARES] += shares
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    def pending(self, review_id: int) -> tuple[int, int, int]:
+        """Unflushed (views, likes, shares) for a review; review responses add them to the stored counts."""
+        deltas = self._pending.get(review_id)
+        return tuple(deltas) if deltas else (0, 0, 0)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------- flush
+
+    async def flush(self) -> int:
+        """Write all pending deltas. Returns the number of reviews updated."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            factory = self._session_factory or dbmod.SessionLocal
+            if factory is None:
+                # No database configured (stub mode); nothing to persist to.
+                self._pending.clear()
+                return 0
+            batch, self._pending = self._pending, {}
+            try:
+                async with factory() as session:
+                    written = await self._write(session, batch)
+                    await session.commit()
+                return written
+            except Exception as e:
+                # Put the deltas back so the next flush retries them.
+                for review_id, deltas in batch.items():
+                    self.record(review_id, views=deltas[VIEWS], likes=deltas[LIKES], shares=deltas[SHARES])
+                log.error("engagement_flush_failed", error=str(e), reviews=len(batch))
+                raise
+
+    async def _write(self, session: AsyncSession, batch: dict[int, list[int]]) -> int:
+        rows = [(rid, d[VIEWS], d[LIKES], d[SHARES]) for rid, d in batch.items() if any(d)]
+        if not rows:
+            return 0
+
+        if session.get_bind().dialect.name == "postgresql":
+            v = values(
+                column("id", Integer),
+                column("views", Integer),
+                column("likes", Integer),
+                column("shares", Integer),
+                name="v",
+            ).data(rows)
+            result = await session.execute(
+                update(CriticReview)
+                .where(CriticReview.id == v.c.id)
+                .values(
+                    view_count=CriticReview.view_count + v.c.views,
+                    like_count=CriticReview.like_count + v.c.likes,
+                    share_count=CriticReview.share_count + v.c.shares,
+                    # engagement is not an edit; keep updated_at's onupdate from firing
+                    updated_at=CriticReview.updated_at,
+                )
+                .returning(CriticReview.id, CriticReview.critic_id)
+            )
+            critic_of = dict(result.all())
+        else:
+            # Dialects without UPDATE ... FROM (VALUES ...) column aliases: one executemany.
+            table = CriticReview.__table__
+            await session.execute(
+                table.update()
+                .where(table.c.id == bindparam("rid"))
+                .values(
+                    view_count=table.c.view_count + bindparam("views"),
+                    like_count=table.c.like_count + bindparam("likes"),
+                    share_count=table.c.share_count + bindparam("shares"),
+                    updated_at=table.c.updated_at,
+                ),
+                [{"rid": rid, "views": vw, "likes": lk, "shares": sh} for rid, vw, lk, sh in rows],
+            )
+            ids = [r[0] for r in rows]
+            result = await session.execute(
+                select(CriticReview.id, CriticReview.critic_id).where(CriticReview.id.in_(ids))
+            )
+            critic_of = dict(result.all())
+
+        per_critic: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for rid, views, likes, shares in rows:
+            critic_id = critic_of.get(rid)
+            if critic_id is None:
+                continue  # review deleted since it was viewed
+            totals = per_critic[critic_id]
+            totals[VIEWS] += views
+            totals[LIKES] += likes
+            totals[SHARES] += shares
+        if per_critic:
+            await self._roll_into_analytics(session, per_critic)
+        return len(critic_of)
+
+    async def _roll_into_analytics(self, session: AsyncSession, per_critic: dict[int, list[int]]) -> None:
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        insert = dialect_insert(session)
+        stmt = insert(CriticAnalytics.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["critic_id", "date"],
+            set_={
+                "total_views": CriticAnalytics.__table__.c.total_views + stmt.excluded.total_views,
+                "total_likes": CriticAnalytics.__table__.c.total_likes + stmt.excluded.total_likes,
+                "total_shares": CriticAnalytics.__table__.c.total_shares + stmt.excluded.total_shares,
+            },
+        )
+        await session.execute(
+            stmt,
+            [
+                {
+                    "critic_id": critic_id,
+                    "date": today,
+                    "total_views": t[VIEWS],
+                    "total_likes": t[LIKES],
+                    "total_shares": t[SHARES],
+                    "total_comments": 0,
+                    "new_followers": 0,
+                    "engagement_rate": 0.0,
+                }
+                for critic_id, t in per_critic.items()
+            ],
+        )
+        viewed = [{"cid": cid, "views": t[VIEWS]} for cid, t in per_critic.items() if t[VIEWS]]
+        if viewed:
+            profiles = CriticProfile.__table__
+            await session.execute(
+                profiles.update()
+                .where(profiles.c.id == bindparam("cid"))
+                .values(total_views=profiles.c.total_views + bindparam("views")),
+                viewed,
+            )
+
+    # --------------------------------------------------------------- lifecycle
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            # Fresh primitives bound to the running loop (tests spin up one loop per app)
+            self._flush_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="engagement-buffer")
+
+    async def stop(self) -> None:
+        """Cancel the flush loop and write whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            # Logged by flush(); shutdown must not fail because the database is gone.
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Already logged; deltas were re-queued for the next tick.
+                pass
+
+
+engagement_buffer = EngagementBuffer(
+    flush_interval=settings.engagement_flush_interval_seconds,
+    max_pending=settings.engagement_flush_max_pending,
+)
@@ -0,0 +1,44 @@
+"""
+Cache of festival program and winners documents.
+
+Programs and winners change a few times a year but are read all festival
+season. ``FestivalsRepository`` stores the finished JSON document per
+(festival, year, kind) together with the festival's ``content_version``,
+and serves it while that version is still current. Every festival edit bumps
+the version in the database, so an edit made through any worker invalidates
+the documents of every worker; the editing worker also drops its own copies
+at once.
+
+Documents live in an LRU dict per worker and, when ``festival_cache_path``
+is set, in a SQLite file that workers on the same host share and that
+survives restarts (see ``SQLiteLRUCache``). Only the latest version of a
+document is kept on disk.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..config import settings
+from .sqlite_cache import SQLiteLRUCache
+
+
+class FestivalDocumentCache(SQLiteLRUCache):
+    """Documents keyed by ``festival:year:kind`` and stamped with the festival's content version."""
+
+    def __init__(self, path: str | None, max_memory_entries: int = 512) -> None:
+        super().__init__(path, "festival_documents", label="Festival", max_memory_entries=max_memory_entries)
+
+    async def get(self, festival_id: str, year: int, kind: str, version: int) -> tuple[bool, Any]:
+        """``(True, document)`` when a document of ``version`` is cached, else ``(False, None)``."""
+        return await self.lookup(f"{festival_id}:{year}:{kind}", lambda stamp: stamp == version)
+
+    async def set(self, festival_id: str, year: int, kind: str, version: int, document: Any) -> None:
+        await self.store(f"{festival_id}:{year}:{kind}", version, document)
+
+    def invalidate(self, festival_id: str) -> None:
+        """Drop this worker's documents of one festival (others see the new version)."""
+        self.forget(lambda key: key.startswith(f"{festival_id}:"))
+
+
+festival_cache = FestivalDocumentCache(settings.festival_cache_path, settings.festival_cache_max_entries)
@@ -0,0 +1,369 @@
+"""
+Background jobs for streaming NDJSON movie imports.
+
+POST /admin/movies/import/stream spools the uploaded file to a temporary file
+and returns a job id at once. The job then runs in two stages joined by a
+bounded queue:
+
+- a reader that opens the file (plain or gzip-compressed NDJSON, one
+  ``MovieImportIn`` object per line), then parses and validates it one batch
+  at a time in a worker thread;
+- a writer that hands each batch to ``MovieBulkImporter.import_batch``.
+
+The queue holds at most ``import_stream_queue_batches`` parsed batches. The
+reader waits whenever the writer falls behind, so memory use depends on the
+batch size, not on the size of the file. Invalid lines are counted as
+failures and reported with their line number; the rest of the file still
+imports.
+
+The job runs in the worker process that accepted the upload. That worker
+writes its status and progress to the ``background_jobs`` table on submit,
+after every batch, periodically during the final genre statistics refresh
+and when it finishes, so GET /admin/movies/import/jobs/{id} can be answered
+by any worker and survives restarts. A job still marked
+running whose row has not been updated for ``import_job_stale_seconds`` is
+reported as failed (its worker stopped). The most recent
+``import_job_history`` finished jobs are kept.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, Any, Awaitable, Callable
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import db as dbmod
+from ..config import settings
+from ..logging_config import log
+from ..models import BackgroundJob
+from ..schemas.movie_import import MovieImportIn
+from .movie_import import ImportResult, MovieBulkImporter
+
+GZIP_MAGIC = b"\x1f\x8b"
+SPOOL_CHUNK = 1024 * 1024
+JOB_KIND = "movie_import"
+
+
+@dataclass
+class ImportJob:
+    id: str
+    path: Path | None
+    filename: str | None
+    batch_size: int | None
+    status: str = "queued"  # queued | running | completed | failed
+    result: ImportResult = field(default_factory=ImportResult)
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def report(self) -> dict[str, Any]:
+        report = self.result.report()
+        processed = self.result.imported + self.result.updated + self.result.failed
+        elapsed = report["elapsed_seconds"] if self.status != "queued" else 0.0
+        return {
+            **report,
+            "elapsed_seconds": elapsed,
+            "id": self.id,
+            "status": self.status,
+            "filename": self.filename,
+            "processed": processed,
+            "records_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+async def spool_upload(upload: UploadFile) -> Path:
+    """Copy an upload to a temporary file in fixed-size chunks and return its path."""
+    fd, name = tempfile.mkstemp(prefix="movie-import-", suffix=".ndjson")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await upload.read(SPOOL_CHUNK):
+                await asyncio.to_thread(out.write, chunk)
+    except BaseException:
+        os.unlink(name)
+        raise
+    return Path(name)
+
+
+def _open_ndjson(path: Path) -> IO[str]:
+    with path.open("rb") as probe:
+        compressed = probe.read(2) == GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _describe(error: ValidationError) -> str:
+    parts = []
+    for detail in error.errors()[:3]:
+        where = ".".join(str(p) for p in detail["loc"])
+        parts.append(f"{where}: {detail['msg']}" if where else detail["msg"])
+    return "; ".join(parts)
+
+
+def _read_batch(fh: IO[str], size: int, line_no: int) -> tuple[list[MovieImportIn], list[str], int, bool]:
+    """
+    Parse lines until ``size`` valid records (or as many invalid lines) are
+    collected. Returns (records, errors, last line number, reached end of file).
+    """
+    records: list[MovieImportIn] = []
+    errors: list[str] = []
+    while len(records) < size and len(errors) < size:
+        line = fh.readline()
+        if not line:
+            return records, errors, line_no, True
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            records.append(MovieImportIn.model_validate_json(line))
+        except ValidationError as e:
+            errors.append(f"line {line_no}: {_describe(e)}")
+    return records, errors, line_no, False
+
+
+class ImportJobRegistry:
+    # background_jobs.kind of the jobs this registry runs and reports on
+    kind = JOB_KIND
+
+    def __init__(
+        self,
+        *,
+        queue_batches: int,
+        max_errors: int,
+        history: int,
+        stale_after: float,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        self.queue_batches = max(1, queue_batches)
+        self.max_errors = max_errors
+        self.history = history
+        self.stale_after = stale_after
+        self._session_factory = session_factory
+        # Jobs running (or recently finished) in this worker process
+        self._jobs: OrderedDict[str, ImportJob] = OrderedDict()
+
+    def _factory(self) -> Callable[[], AsyncSession] | None:
+        return self._session_factory or dbmod.SessionLocal
+
+    async def submit(self, path: Path, *, filename: str | None = None, batch_size: int | None = None) -> ImportJob:
+        """
+        Register a job for a spooled file and start it. The job deletes the
+        file when done. Its status row is written before this returns, so a
+        poll on any worker finds it.
+        """
+        job = ImportJob(
+            id=uuid.uuid4().hex,
+            path=path,
+            filename=filename,
+            batch_size=batch_size,
+            result=ImportResult(max_errors=self.max_errors),
+        )
+        try:
+            await self._save(job)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return self._start(job)
+
+    def _start(self, job: ImportJob) -> ImportJob:
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job), name=f"movie-import-{job.id}")
+        self._prune()
+        log.info("movie_import_job_submitted", job_id=job.id, kind=self.kind, filename=job.filename)
+        return job
+
+    def get(self, job_id: str) -> ImportJob | None:
+        """The job object, when it runs in this worker process."""
+        return self._jobs.get(job_id)
+
+    async def status(self, job_id: str) -> dict[str, Any] | None:
+        """The job report from the shared status table (any worker's jobs)."""
+        factory = self._factory()
+        if factory is None:
+            job = self._jobs.get(job_id)
+            return job.report() if job else None
+        async with factory() as session:
+            row = await session.get(BackgroundJob, job_id)
+        if row is None or row.kind != self.kind:
+            return None
+        status, error = row.status, row.error
+        if status in ("queued", "running") and datetime.utcnow() - row.updated_at > timedelta(seconds=self.stale_after):
+            status, error = "failed", "interrupted: the worker running this job stopped"
+        return {
+            **row.report,
+            "id": row.id,
+            "status": status,
+            "filename": row.filename,
+            "error": error,
+            "created_at": row.created_at,
+            "finished_at": row.finished_at,
+        }
+
+    async def _save(self, job: ImportJob) -> None:
+        """Upsert the job's status row."""
+        factory = self._factory()
+        if factory is None:
+            return
+        report = job.report()
+        for key in ("id", "status", "filename", "error", "created_at", "finished_at"):
+            report.pop(key)
+        async with factory() as session:
+            await session.merge(
+                BackgroundJob(
+                    id=job.id,
+                    kind=self.kind,
+                    status=job.status,
+                    filename=job.filename,
+                    report=report,
+                    error=job.error,
+                    created_at=job.created_at,
+                    updated_at=datetime.utcnow(),
+                    finished_at=job.finished_at,
+                )
+            )
+            if job.finished:
+                # Keep only the most recent finished jobs
+                keep = (
+                    select(BackgroundJob.id)
+                    .where(BackgroundJob.kind == self.kind, BackgroundJob.finished_at.is_not(None))
+                    .order_by(BackgroundJob.finished_at.desc())
+                    .limit(self.history)
+                )
+                await session.execute(
+                    delete(BackgroundJob).where(
+                        BackgroundJob.kind == self.kind,
+                        BackgroundJob.finished_at.is_not(None),
+                        BackgroundJob.id.not_in(keep),
+                    )
+                )
+            await session.commit()
+
+    async def _save_quietly(self, job: ImportJob) -> None:
+        # A failed progress write must not abort an import whose batches are committed
+        try:
+            await self._save(job)
+        except Exception as e:
+            log.warning("movie_import_job_status_write_failed", job_id=job.id, error=str(e))
+
+    async def _keep_alive(self, job: ImportJob, step: Awaitable[Any]) -> Any:
+        """
+        Await a long step that writes no progress of its own (such as the
+        genre statistics refresh after the last batch), saving the status row
+        before it and every third of ``stale_after`` while it runs, so other
+        workers don't report the job as interrupted.
+        """
+        await self._save_quietly(job)
+
+        async def heartbeat() -> None:
+            while True:
+                await asyncio.sleep(max(0.1, self.stale_after / 3))
+                await self._save_quietly(job)
+
+        beat = asyncio.create_task(heartbeat())
+        try:
+            return await step
+        finally:
+            beat.cancel()
+            await asyncio.gather(beat, return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Cancel jobs that are still running; batches already committed stay committed."""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    async def _run(self, job: ImportJob) -> None:
+        job.status = "running"
+        job.result.started = time.perf_counter()
+        try:
+            factory = self._factory()
+            if factory is None:
+                raise RuntimeError("database is not configured")
+            await self._save_quietly(job)
+            async with factory() as session:
+                await self._execute(job, session)
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status, job.error = "failed", "cancelled"
+            raise
+        except Exception as e:
+            job.status, job.error = "failed", str(e) or type(e).__name__
+            log.error("movie_import_job_failed", job_id=job.id, error=job.error)
+        finally:
+            job.result.finished = time.perf_counter()
+            job.finished_at = datetime.utcnow()
+            if job.path is not None:
+                job.path.unlink(missing_ok=True)
+            await self._save_quietly(job)
+            self._prune()
+        log.info("movie_import_job_finished", job_id=job.id, status=job.status, processed=job.report()["processed"])
+
+    async def _execute(self, job: ImportJob, session: AsyncSession) -> None:
+        """Import the job's spooled file: a reader feeding the writer through a bounded queue."""
+        importer = MovieBulkImporter(session, batch_size=job.batch_size, result=job.result)
+        queue: asyncio.Queue[list[MovieImportIn] | None] = asyncio.Queue(maxsize=self.queue_batches)
+        reader = asyncio.create_task(self._read(job, importer.batch_size, queue))
+        try:
+            while (batch := await queue.get()) is not None:
+                await importer.import_batch(batch)
+                await importer.fold_movie_ids()
+                await self._save_quietly(job)
+        finally:
+            if not reader.done():
+                reader.cancel()
+        await reader
+        await self._keep_alive(job, importer.refresh_genre_stats())
+
+    async def _read(self, job: ImportJob, batch_size: int, queue: asyncio.Queue) -> None:
+        try:
+            fh = await asyncio.to_thread(_open_ndjson, job.path)
+            try:
+                line_no, done = 0, False
+                while not done:
+                    records, errors, line_no, done = await asyncio.to_thread(_read_batch, fh, batch_size, line_no)
+                    for message in errors:
+                        job.result.add_error(message)
+                    if records:
+                        await queue.put(records)
+            finally:
+                fh.close()
+        except Exception as e:
+            # Undecodable or truncated input: stop the writer after what it already has.
+            await queue.put(None)
+            raise RuntimeError(f"could not read import file: {e}") from e
+        await queue.put(None)
+
+
+import_jobs = ImportJobRegistry(
+    queue_batches=settings.import_stream_queue_batches,
+    max_errors=settings.import_job_max_errors,
+    history=settings.import_job_history,
+    stale_after=settings.import_job_stale_seconds,
+)
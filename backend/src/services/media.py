@@ -0,0 +1,193 @@
+"""
+Image upload pipeline for avatars and banners.
+
+1. ``spool_upload`` copies the request file into a ``SpooledTemporaryFile``
+   in chunks, enforcing ``media_max_upload_bytes`` and computing a SHA-256 of
+   the content as it goes. The whole upload is never held as one bytes object.
+2. If every variant for that hash is already stored, their URLs are returned
+   straight away: re-uploading an image costs no decoding and no transfer.
+3. Otherwise ``process_image`` runs on a worker pool. It validates the file
+   with Pillow, applies the EXIF orientation, drops all metadata (EXIF, GPS,
+   ICC), crops to the standard sizes in ``VARIANTS`` and encodes WebP.
+4. The variants are written to the configured ``MediaStorage`` concurrently.
+
+Keys are ``<folder>/<hash prefix>/<variant>.webp``, so identical uploads from
+different users share their stored files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import IO
+
+from fastapi import UploadFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ..config import settings
+from ..logging_config import log
+from .media_storage import MediaStorage, build_media_storage
+
+CHUNK_SIZE = 256 * 1024
+# Spooled uploads stay in memory up to this size, then move to a temp file.
+SPOOL_MEMORY_BYTES = 1024 * 1024
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+# Output sizes per upload kind (width, height); images are center-cropped to fit.
+VARIANTS: dict[str, dict[str, tuple[int, int]]] = {
+    "avatar": {"lg": (400, 400), "sm": (96, 96)},
+    "banner": {"lg": (1500, 500), "sm": (750, 250)},
+}
+FOLDERS = {"avatar": "avatars", "banner": "banners"}
+
+
+class InvalidImage(ValueError):
+    """The upload is not an acceptable image (bad format, too large, undecodable)."""
+
+
+@dataclass
+class SpooledUpload:
+    file: IO[bytes]
+    size: int
+    sha256: str
+
+    def close(self) -> None:
+        self.file.close()
+
+
+@dataclass
+class StoredImage:
+    url: str
+    key: str
+    size: int
+    content_hash: str
+    variants: dict[str, str]
+    deduplicated: bool
+
+
+async def spool_upload(upload: UploadFile, max_bytes: int) -> SpooledUpload:
+    """Copy ``upload`` into a spooled temp file, hashing it and enforcing ``max_bytes``."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while chunk := await upload.read(CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise InvalidImage(f"File too large. Maximum size is {max_bytes / (1024 * 1024):.1f}MB")
+            digest.update(chunk)
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    if size == 0:
+        spool.close()
+        raise InvalidImage("Empty file")
+    spool.seek(0)
+    return SpooledUpload(file=spool, size=size, sha256=digest.hexdigest())
+
+
+def process_image(source: IO[bytes], sizes: dict[str, tuple[int, int]], quality: int, max_pixels: int) -> dict[str, bytes]:
+    """
+    Decode ``source`` and return {variant name: WebP bytes}. CPU-bound; run
+    it on a worker pool. Raises InvalidImage for anything Pillow rejects.
+    """
+    try:
+        with Image.open(source) as probe:
+            if probe.format not in ALLOWED_FORMATS:
+                raise InvalidImage(f"Unsupported image format: {probe.format}")
+            if probe.width * probe.height > max_pixels:
+                raise InvalidImage("Image dimensions are too large")
+            probe.verify()
+        source.seek(0)
+        with Image.open(source) as img:
+            img.seek(0)  # first frame of animated GIF/WebP
+            img = ImageOps.exif_transpose(img)
+            has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+            # Rebuilding from pixels drops EXIF/XMP/ICC metadata along with the orientation tag.
+            pixels = img.convert("RGBA" if has_alpha else "RGB")
+    except InvalidImage:
+        raise
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError, Image.DecompressionBombError) as e:
+        raise InvalidImage(f"Invalid image file: {e}") from e
+
+    variants: dict[str, bytes] = {}
+    for name, size in sizes.items():
+        fitted = ImageOps.fit(pixels, size, method=Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        fitted.save(out, "WEBP", quality=quality, method=4)
+        variants[name] = out.getvalue()
+    return variants
+
+
+class MediaPipeline:
+    def __init__(self, storage: MediaStorage, *, workers: int, quality: int, max_pixels: int) -> None:
+        self.storage = storage
+        self.quality = quality
+        self.max_pixels = max_pixels
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="media")
+
+    @staticmethod
+    def _keys(kind: str, content_hash: str) -> dict[str, str]:
+        folder = FOLDERS[kind]
+        return {name: f"{folder}/{content_hash[:32]}/{name}.webp" for name in VARIANTS[kind]}
+
+    async def store(self, upload: UploadFile, kind: str) -> StoredImage:
+        spooled = await spool_upload(upload, settings.media_max_upload_bytes)
+        try:
+            keys = self._keys(kind, spooled.sha256)
+            existing = await asyncio.gather(*(self.storage.url_if_exists(key) for key in keys.values()))
+            if all(existing):
+                urls = dict(zip(keys, existing))
+                deduplicated = True
+            else:
+                loop = asyncio.get_running_loop()
+                encoded = await loop.run_in_executor(
+                    self._executor, process_image, spooled.file, VARIANTS[kind], self.quality, self.max_pixels
+                )
+                saved = await asyncio.gather(
+                    *(self.storage.save(keys[name], data, "image/webp") for name, data in encoded.items())
+                )
+                urls = dict(zip(encoded, saved))
+                deduplicated = False
+        finally:
+            spooled.close()
+        log.info("media_stored", kind=kind, hash=spooled.sha256[:12], deduplicated=deduplicated, backend=self.storage.name)
+        return StoredImage(
+            url=urls["lg"],
+            key=keys["lg"],
+            size=spooled.size,
+            content_hash=spooled.sha256,
+            variants=urls,
+            deduplicated=deduplicated,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pipeline: MediaPipeline | None = None
+
+
+def get_media_pipeline() -> MediaPipeline:
+    """FastAPI dependency; the pipeline and its storage backend are built on first use."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = MediaPipeline(
+            build_media_storage(),
+            workers=settings.media_workers,
+            quality=settings.media_webp_quality,
+            max_pixels=settings.media_max_pixels,
+        )
+    return _pipeline
+
+
+def shutdown_media_pipeline() -> None:
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.shutdown()
+        _pipeline = None
@@ -0,0 +1,141 @@
+"""
+Storage backends for processed image uploads.
+
+Objects are addressed by a key such as ``avatars/<content hash>/lg.webp``.
+Because keys are derived from the content, ``url_if_exists`` lets the upload
+pipeline skip both processing and transfer when the same image arrives again.
+
+- ``LocalMediaStorage`` writes under ``media_local_root``; main.py serves the
+  directory at ``media_public_path``. Used in tests and offline development.
+- ``CloudinaryMediaStorage`` uploads to Cloudinary. Its blocking SDK runs in
+  worker threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+from pathlib import Path
+from typing import Protocol
+
+import cloudinary
+import cloudinary.api
+import cloudinary.uploader
+from cloudinary.exceptions import NotFound
+
+from ..config import settings
+
+
+class MediaStorage(Protocol):
+    name: str
+
+    async def url_if_exists(self, key: str) -> str | None:
+        """Public URL of ``key`` when it is already stored, else None."""
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        """Store ``data`` under ``key`` and return its public URL."""
+
+
+class LocalMediaStorage:
+    name = "local"
+
+    def __init__(self, root: str | Path, public_path: str) -> None:
+        self.root = Path(root)
+        self.public_path = public_path.rstrip("/")
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"invalid media key: {key}")
+        return path
+
+    def url(self, key: str) -> str:
+        return f"{self.public_path}/{key}"
+
+    async def url_if_exists(self, key: str) -> str | None:
+        exists = await asyncio.to_thread(self._path(key).is_file)
+        return self.url(key) if exists else None
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        await asyncio.to_thread(self._write, self._path(key), data)
+        return self.url(key)
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file.
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+
+class CloudinaryMediaStorage:
+    name = "cloudinary"
+
+    def __init__(self) -> None:
+        cloudinary.config(
+            cloud_name=settings.cloudinary_cloud_name,
+            api_key=settings.cloudinary_api_key,
+            api_secret=settings.cloudinary_api_secret,
+            secure=True,
+        )
+        # Keys known to exist, so repeat uploads in this process skip the API lookup.
+        self._known: dict[str, str] = {}
+
+    @staticmethod
+    def _public_id(key: str) -> str:
+        return key.rsplit(".", 1)[0]
+
+    async def url_if_exists(self, key: str) -> str | None:
+        if key in self._known:
+            return self._known[key]
+        try:
+            resource = await asyncio.to_thread(cloudinary.api.resource, self._public_id(key))
+        except NotFound:
+            return None
+        url = resource.get("secure_url")
+        if url:
+            self._known[key] = url
+        return url
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        result = await asyncio.to_thread(
+            cloudinary.uploader.upload,
+            io.BytesIO(data),
+            public_id=self._public_id(key),
+            overwrite=False,
+            resource_type="image",
+        )
+        url = result["secure_url"]
+        self._known[key] = url
+        return url
+
+
+# Environments where "auto" may quietly fall back to local storage
+LOCAL_FALLBACK_ENVS = ("development", "test")
+
+
+def media_backend_name() -> str:
+    """The configured backend, with "auto" resolved."""
+    if settings.media_storage == "auto":
+        return "cloudinary" if settings.cloudinary_cloud_name else "local"
+    return settings.media_storage
+
+
+def local_fallback_unintended() -> bool:
+    """True when "auto" resolved to local disk outside development/test."""
+    return (
+        settings.media_storage == "auto"
+        and media_backend_name() == "local"
+        and settings.env not in LOCAL_FALLBACK_ENVS
+    )
+
+
+def build_media_storage() -> MediaStorage:
+    backend = media_backend_name()
+    if backend == "cloudinary":
+        return CloudinaryMediaStorage()
+    if backend == "local":
+        return LocalMediaStorage(settings.media_local_root, settings.media_public_path)
+    raise ValueError(f"unknown media_storage backend: {settings.media_storage}")
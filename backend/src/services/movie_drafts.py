@@ -0,0 +1,103 @@
+"""
+Set-based publish and discard of movie category drafts.
+
+Imports save each category as ``{category}_draft``; publishing copies it to
+the live column and marks ``{category}_status`` published, discarding clears
+it. POST /admin/movies/drafts/{publish,discard} do this for many movies and
+categories at once: one ``UPDATE movies ... WHERE id IN (...) AND draft IS
+NOT NULL RETURNING id`` per category (and chunk of ids), one INSERT of the
+audit rows and one commit, however many movies are selected.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Movie, MovieDraftAudit
+from .movie_import import IN_CHUNK, _chunks
+
+DRAFT_CATEGORIES = ("trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info")
+# Categories with a live column of their own; publishing the others only
+# changes their status, as the single-movie publish does
+PUBLISHED_COLUMNS = ("trivia", "timeline", "awards")
+ACTIONS = {"publish": "published", "discard": "discarded"}
+
+
+@dataclass
+class DraftBulkResult:
+    # movie external id -> category -> published | discarded | no_draft
+    outcomes: dict[str, dict[str, str]] = field(default_factory=dict)
+    audit: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _has_draft(draft):
+    # Empty lists count as no draft, as in the single-movie endpoints
+    return draft.is_not(None) & (draft != [])
+
+
+def _values(category: str, action: str, user_id: int | None, now: datetime) -> dict[str, Any]:
+    if action == "discard":
+        return {f"{category}_draft": None, f"{category}_status": "draft"}
+    values: dict[str, Any] = {
+        f"{category}_status": "published",
+        "curated_at": now,
+        "curated_by_id": user_id,
+    }
+    if category in PUBLISHED_COLUMNS:
+        values[category] = getattr(Movie, f"{category}_draft")
+    return values
+
+
+async def apply_drafts(
+    session: AsyncSession,
+    action: str,
+    movies: Sequence[tuple[int, str]],
+    categories: Sequence[str],
+    *,
+    user_id: int | None,
+) -> DraftBulkResult:
+    """
+    Publish or discard ``categories`` for ``movies`` ((id, external id) pairs)
+    and write one audit row per changed movie and category. The caller commits.
+    """
+    external_ids = dict(movies)
+    result = DraftBulkResult(
+        outcomes={external_id: {category: "no_draft" for category in categories} for external_id in external_ids.values()}
+    )
+    # movies.curated_at is a naive UTC timestamp
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    changed: list[dict[str, Any]] = []
+    for category in categories:
+        draft = getattr(Movie, f"{category}_draft")
+        for chunk in _chunks(list(external_ids), IN_CHUNK):
+            rows = await session.execute(
+                update(Movie)
+                .where(Movie.id.in_(chunk), _has_draft(draft))
+                .values(_values(category, action, user_id, now))
+                .returning(Movie.id)
+                .execution_options(synchronize_session=False)
+            )
+            for movie_id in rows.scalars():
+                result.outcomes[external_ids[movie_id]][category] = ACTIONS[action]
+                changed.append({
+                    "movie_id": movie_id, "category": category, "action": action,
+                    "user_id": user_id, "created_at": now,
+                })
+
+    if changed:
+        rows = await session.execute(
+            insert(MovieDraftAudit).returning(
+                MovieDraftAudit.id, MovieDraftAudit.movie_id, MovieDraftAudit.category,
+                MovieDraftAudit.action, MovieDraftAudit.user_id, MovieDraftAudit.created_at,
+            ),
+            changed,
+        )
+        result.audit = [
+            {**row._asdict(), "movie_id": external_ids[row.movie_id]} for row in rows
+        ]
+    return result
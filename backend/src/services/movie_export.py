@@ -0,0 +1,375 @@
+"""
+Movie snapshots behind the admin category export.
+
+GET /admin/movies/{id}/export/{category} returns one category of one movie,
+GET /admin/movies/{id}/export/all zips all seven, and POST
+/admin/movies/export writes any number of movies as one ZIP or NDJSON stream.
+All of them serialize a ``MovieSnapshot``: the movie row plus its genres,
+people, award nominations and streaming options, loaded for a whole batch of
+movies with one query per table. The category serializers only read the
+snapshot, so a movie's graph is loaded once however many categories are
+written.
+
+ZIP archives are written through ``zipfile`` into an unseekable sink and sent
+entry by entry (sizes go into data descriptors), so neither the archive nor
+the catalog is ever held in memory as a whole.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import db as dbmod
+from ..models import (
+    AwardCategory,
+    AwardCeremony,
+    AwardCeremonyYear,
+    AwardNomination,
+    Genre,
+    Movie,
+    MovieStreamingOption,
+    Person,
+    StreamingPlatform,
+    movie_genres,
+    movie_people,
+)
+from ..schemas.movie_export import ExportMetadata, ExportResponse
+from .movie_import import IN_CHUNK, _chunks
+
+# URL / file name of each category -> its name inside the export document
+CATEGORIES: dict[str, str] = {
+    "basic-info": "basic_info",
+    "cast-crew": "cast_crew",
+    "timeline": "timeline",
+    "trivia": "trivia",
+    "awards": "awards",
+    "media": "media",
+    "streaming": "streaming",
+}
+# Related rows each category reads; the rest only need the movie row
+_RELATED = {"basic-info": "genres", "cast-crew": "people", "awards": "awards", "streaming": "streaming"}
+PEOPLE_ROLES = {"director": "directors", "writer": "writers", "producer": "producers", "actor": "cast"}
+
+
+@dataclass
+class MovieSnapshot:
+    movie: Movie
+    genres: list[str] = field(default_factory=list)
+    # (role, person) in movie_people order; actors carry their character
+    people: list[tuple[str | None, dict[str, Any]]] = field(default_factory=list)
+    awards: list[dict[str, Any]] = field(default_factory=list)
+    streaming: list[dict[str, Any]] = field(default_factory=list)
+
+
+def get_current_timestamp() -> str:
+    """Get current UTC timestamp in ISO format"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def determine_data_source(movie: Movie, field_name: str) -> str:
+    """Determine the source of data for a field"""
+    # Check if field has data
+    field_value = getattr(movie, field_name, None)
+    if field_value is None or (isinstance(field_value, (list, dict)) and not field_value):
+        return "manual"
+
+    # If movie has tmdb_id, assume TMDB source for basic fields
+    if movie.tmdb_id and field_name in ["title", "year", "runtime", "overview", "poster_url", "backdrop_url", "budget", "revenue"]:
+        return "tmdb"
+
+    return "manual"
+
+
+async def load_snapshots(
+    session: AsyncSession,
+    movies: Sequence[Movie],
+    categories: Iterable[str] = CATEGORIES,
+) -> list[MovieSnapshot]:
+    """Snapshots of ``movies``, with the related rows ``categories`` need."""
+    snapshots = {movie.id: MovieSnapshot(movie) for movie in movies}
+    related = {_RELATED[c] for c in categories if c in _RELATED}
+    for chunk in _chunks(list(snapshots), IN_CHUNK):
+        if "genres" in related:
+            rows = await session.execute(
+                select(movie_genres.c.movie_id, Genre.name)
+                .join(Genre, Genre.id == movie_genres.c.genre_id)
+                .where(movie_genres.c.movie_id.in_(chunk))
+            )
+            for movie_id, name in rows:
+                snapshots[movie_id].genres.append(name)
+
+        if "people" in related:
+            rows = await session.execute(
+                select(movie_people.c.movie_id, movie_people.c.role, movie_people.c.character_name,
+                       Person.external_id, Person.name, Person.image_url)
+                .join(Person, Person.id == movie_people.c.person_id)
+                .where(movie_people.c.movie_id.in_(chunk))
+            )
+            for movie_id, role, character, external_id, name, image in rows:
+                person = {"id": external_id, "name": name, "image": image}
+                if role == "actor":
+                    person["character"] = character
+                snapshots[movie_id].people.append((role, person))
+
+        if "awards" in related:
+            # Plain columns throughout: the nomination and streaming models load
+            # their relationships eagerly, the ceremony's other nominations included
+            rows = await session.execute(
+                select(AwardNomination.movie_id, AwardNomination.external_id, AwardCeremony.name,
+                       AwardCeremonyYear.year, AwardCategory.name, AwardNomination.nominee_name,
+                       AwardNomination.is_winner, AwardNomination.details)
+                .join(AwardCategory, AwardCategory.id == AwardNomination.category_id)
+                .join(AwardCeremonyYear, AwardCeremonyYear.id == AwardCategory.ceremony_year_id)
+                .join(AwardCeremony, AwardCeremony.id == AwardCeremonyYear.ceremony_id)
+                .where(AwardNomination.movie_id.in_(chunk))
+                .order_by(AwardCeremonyYear.year, AwardNomination.id)
+            )
+            for movie_id, external_id, ceremony, year, category, nominee, is_winner, details in rows:
+                snapshots[movie_id].awards.append({
+                    "id": external_id,
+                    "ceremony": ceremony,
+                    "year": year,
+                    "category": category,
+                    "nominee": nominee,
+                    "result": "Winner" if is_winner else "Nominee",
+                    "notes": details,
+                })
+
+        if "streaming" in related:
+            rows = await session.execute(
+                select(MovieStreamingOption.movie_id, StreamingPlatform.name, MovieStreamingOption.region,
+                       MovieStreamingOption.type, MovieStreamingOption.price, MovieStreamingOption.quality,
+                       MovieStreamingOption.url)
+                .join(StreamingPlatform, MovieStreamingOption.platform_id == StreamingPlatform.id)
+                .where(MovieStreamingOption.movie_id.in_(chunk))
+            )
+            for movie_id, platform, region, type_, price, quality, url in rows:
+                snapshots[movie_id].streaming.append({
+                    "platform": platform,
+                    "region": region,
+                    "type": type_,
+                    "price": price,
+                    "quality": quality,
+                    "url": url,
+                })
+    return list(snapshots.values())
+
+
+# ----------------------------------------------------------------------------
+# Category serializers: (data, metadata source)
+# ----------------------------------------------------------------------------
+
+def _basic_info(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    movie = s.movie
+    return {
+        "title": movie.title,
+        "tagline": movie.tagline,
+        "year": movie.year,
+        "release_date": movie.release_date.isoformat() if movie.release_date else None,
+        "runtime": movie.runtime,
+        "rating": movie.rating,
+        "language": movie.language,
+        "country": movie.country,
+        "overview": movie.overview,
+        "budget": movie.budget,
+        "revenue": movie.revenue,
+        "status": movie.status,
+        "genres": list(s.genres),
+        "siddu_score": movie.siddu_score,
+        "critics_score": movie.critics_score,
+        "imdb_rating": movie.imdb_rating,
+        "rotten_tomatoes_score": movie.rotten_tomatoes_score,
+    }, determine_data_source(movie, "title")
+
+
+def _cast_crew(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    data: dict[str, list[dict[str, Any]]] = {key: [] for key in PEOPLE_ROLES.values()}
+    for role, person in s.people:
+        if role in PEOPLE_ROLES:
+            data[PEOPLE_ROLES[role]].append(dict(person))
+    # Credits are curated by hand even for TMDB movies
+    return data, "manual"
+
+
+def _timeline(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    return {"events": s.movie.timeline or []}, "manual"
+
+
+def _trivia(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    return {"items": s.movie.trivia or []}, "manual"
+
+
+def _awards(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    return {"awards": [dict(award) for award in s.awards]}, "manual"
+
+
+def _media(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    return {
+        "poster_url": s.movie.poster_url,
+        "backdrop_url": s.movie.backdrop_url,
+        "trailer_url": None,  # TODO: Add trailer_url field to Movie model
+        "gallery_images": [],  # TODO: Add gallery_images field to Movie model
+    }, determine_data_source(s.movie, "poster_url")
+
+
+def _streaming(s: MovieSnapshot) -> tuple[dict[str, Any], str]:
+    return {"streaming_options": [dict(option) for option in s.streaming]}, "manual"
+
+
+SERIALIZERS: dict[str, Callable[[MovieSnapshot], tuple[dict[str, Any], str]]] = {
+    "basic-info": _basic_info,
+    "cast-crew": _cast_crew,
+    "timeline": _timeline,
+    "trivia": _trivia,
+    "awards": _awards,
+    "media": _media,
+    "streaming": _streaming,
+}
+
+
+def export_category(snapshot: MovieSnapshot, category: str, *, updated_by: str | None) -> ExportResponse:
+    """The export document of one category (``basic-info``, ``cast-crew``, ...)."""
+    data, source = SERIALIZERS[category](snapshot)
+    exported_at = get_current_timestamp()
+    updated_at = getattr(snapshot.movie, "updated_at", None)
+    return ExportResponse(
+        category=CATEGORIES[category],
+        movie_id=snapshot.movie.external_id,
+        exported_at=exported_at,
+        data=data,
+        metadata=ExportMetadata(
+            source=source,
+            last_updated=updated_at.isoformat() if updated_at else exported_at,
+            updated_by=updated_by,
+        ),
+    )
+
+
+# ----------------------------------------------------------------------------
+# Multi-movie export
+# ----------------------------------------------------------------------------
+
+@asynccontextmanager
+async def export_session(fallback: AsyncSession | None) -> AsyncIterator[AsyncSession | None]:
+    """
+    A session that stays open while a response streams. Request dependencies
+    close theirs when the endpoint returns, before the body is sent, so this
+    opens one of its own (on the replica when there is one) and only falls
+    back to ``fallback`` when no database was initialised.
+    """
+    factory = dbmod.ReadSessionLocal or dbmod.SessionLocal
+    if factory is None:
+        yield fallback
+        return
+    async with factory() as session:
+        yield session
+
+
+def movies_query(
+    *,
+    movie_ids: Sequence[str] | None = None,
+    curation_status: str | None = None,
+    status: str | None = None,
+    language: str | None = None,
+    genre: str | None = None,
+):
+    """``SELECT movies`` for explicit external ids, or else for the filters."""
+    q = select(Movie)
+    if movie_ids:
+        return q.where(Movie.external_id.in_(list(movie_ids)))
+    if curation_status:
+        q = q.where(Movie.curation_status == curation_status)
+    if status:
+        q = q.where(Movie.status == status)
+    if language:
+        q = q.where(Movie.language == language)
+    if genre:
+        q = q.where(
+            Movie.id.in_(
+                select(movie_genres.c.movie_id)
+                .join(Genre, Genre.id == movie_genres.c.genre_id)
+                .where(Genre.slug == genre)
+            )
+        )
+    return q
+
+
+async def iter_snapshots(session: AsyncSession, query, *, batch_size: int) -> AsyncIterator[MovieSnapshot]:
+    """Snapshots of every movie ``query`` selects, ``batch_size`` movies per round of queries."""
+    last_id = 0
+    while True:
+        # Keyset pagination on the primary key: each batch is an index range scan
+        movies = (
+            await session.execute(query.where(Movie.id > last_id).order_by(Movie.id).limit(batch_size))
+        ).scalars().all()
+        if not movies:
+            return
+        for snapshot in await load_snapshots(session, movies):
+            yield snapshot
+        last_id = movies[-1].id
+        # Exported movies are not needed again; keep the identity map one batch large
+        session.expunge_all()
+        if len(movies) < batch_size:
+            return
+
+
+def _category_files(snapshot: MovieSnapshot, updated_by: str | None) -> Iterable[tuple[str, str]]:
+    external_id = snapshot.movie.external_id
+    for category in CATEGORIES:
+        doc = export_category(snapshot, category, updated_by=updated_by)
+        yield f"{external_id}/{category}.json", doc.model_dump_json(indent=2)
+
+
+class _ZipSink(io.RawIOBase):
+    """Write-only, unseekable buffer that ``stream_zip`` empties after every entry."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(snapshots: AsyncIterable[MovieSnapshot], *, updated_by: str | None) -> AsyncIterator[bytes]:
+    """A ZIP of every category file of every snapshot, one chunk per movie."""
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        async for snapshot in snapshots:
+            for name, content in _category_files(snapshot, updated_by):
+                archive.writestr(name, content)
+            yield sink.drain()
+    # Central directory
+    yield sink.drain()
+
+
+async def stream_ndjson(snapshots: AsyncIterable[MovieSnapshot], *, updated_by: str | None) -> AsyncIterator[bytes]:
+    """
+    One JSON object per movie: ``{"movie_id": ..., "categories": {...}}``, each
+    category being the same document the single-category export returns.
+    """
+    async for snapshot in snapshots:
+        categories = {
+            category: export_category(snapshot, category, updated_by=updated_by).model_dump()
+            for category in CATEGORIES
+        }
+        line = {"movie_id": snapshot.movie.external_id, "categories": categories}
+        yield (json.dumps(line, default=str) + "\n").encode()
@@ -0,0 +1,452 @@
+"""
+Set-based bulk importer behind POST /admin/movies/import.
+
+Movies are processed in batches of ``import_batch_size`` rows. For each batch
+every distinct genre, person, streaming platform and award ceremony is
+resolved in one pass: a case-insensitive name lookup for rows that already
+exist, then a single ``INSERT ... ON CONFLICT ... RETURNING`` for the rest.
+Movies are upserted on ``external_id`` the same way, and the movie_genres,
+movie_people and streaming-option rows are replaced with executemany
+statements. Each batch commits once.
+
+A batch runs inside a SAVEPOINT. If any statement fails, the batch is
+replayed one movie at a time, each in its own savepoint, so one bad row is
+reported without losing the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Table, bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..logging_config import log
+from ..models import (
+    AwardCategory,
+    AwardCeremony,
+    AwardCeremonyYear,
+    AwardNomination,
+    Genre,
+    Movie,
+    MovieStreamingOption,
+    Person,
+    StreamingPlatform,
+    movie_genres,
+    movie_people,
+)
+from ..repositories.genre_stats import GenreStatsRepository
+from ..repositories.upsert import dialect_insert
+from ..schemas.movie_import import MovieImportIn
+
+# Keep IN (...) lists well under asyncpg's 32767 bind-parameter limit.
+IN_CHUNK = 5000
+
+# Movie columns overwritten on every import (None clears the value, as before).
+MOVIE_FIELDS = (
+    "title", "tagline", "year", "runtime", "rating", "siddu_score", "critics_score",
+    "imdb_rating", "rotten_tomatoes_score", "language", "country", "overview",
+    "poster_url", "backdrop_url", "budget", "revenue", "status",
+)
+
+PEOPLE_ROLES = (("directors", "director"), ("writers", "writer"), ("producers", "producer"), ("cast", "actor"))
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _slug(s: str) -> str:
+    return re.sub(r"[^a-z0-9-]", "", re.sub(r"\s+", "-", s.strip().lower()))
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    updated: int = 0
+    batches: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+    # Keep at most this many error messages; ``failed`` still counts every one.
+    max_errors: int | None = None
+    movie_ids: set[int] = field(default_factory=set)
+    # "imported" / "updated" per external_id, when the caller wants per-row outcomes
+    outcomes: dict[str, str] | None = None
+    unlinked_genre_ids: set[int] = field(default_factory=set)
+    started: float = field(default_factory=time.perf_counter)
+    finished: float | None = None
+
+    def add_error(self, message: str) -> None:
+        self.failed += 1
+        if self.max_errors is None or len(self.errors) < self.max_errors:
+            self.errors.append(message)
+
+    def report(self) -> dict[str, Any]:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        done = self.imported + self.updated
+        return {
+            "imported": self.imported,
+            "updated": self.updated,
+            "failed": self.failed,
+            "errors": self.errors,
+            "batches": self.batches,
+            "elapsed_seconds": round(elapsed, 3),
+            "movies_per_second": round(done / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+class MovieBulkImporter:
+    def __init__(
+        self, session: AsyncSession, *, batch_size: int | None = None, result: ImportResult | None = None
+    ) -> None:
+        self.session = session
+        self.batch_size = max(1, batch_size or settings.import_batch_size)
+        self.result = result or ImportResult()
+        self._insert = dialect_insert(session)
+
+    async def run(self, movies: Sequence[MovieImportIn]) -> ImportResult:
+        for batch in _chunks(movies, self.batch_size):
+            await self.import_batch(batch)
+        await self.refresh_genre_stats()
+        log.info("movie_import_finished", **{k: v for k, v in self.result.report().items() if k != "errors"})
+        return self.result
+
+    async def import_batch(self, movies: Sequence[MovieImportIn]) -> None:
+        """Write one batch and commit it, isolating failing rows."""
+        known = await self._existing_external_ids([m.external_id for m in movies])
+        try:
+            async with self.session.begin_nested():
+                written, unlinked = await self._write(movies)
+            self._count(movies, known, written, unlinked)
+        except Exception as e:
+            log.warning("movie_import_batch_failed", rows=len(movies), error=str(e))
+            for m in movies:
+                try:
+                    async with self.session.begin_nested():
+                        written, unlinked = await self._write([m])
+                except Exception as row_error:
+                    self.result.add_error(f"{m.external_id}: {row_error}")
+                    continue
+                self._count([m], known, written, unlinked)
+                known.add(m.external_id)
+        await self.session.commit()
+        self.result.batches += 1
+
+    async def fold_movie_ids(self) -> None:
+        """
+        Swap the ids of movies written so far for the genres they link to, so
+        a long-running import keeps state bounded by the number of genres.
+        """
+        if not self.result.movie_ids:
+            return
+        genre_ids = await GenreStatsRepository(self.session).genre_ids_for_movies(self.result.movie_ids)
+        self.result.unlinked_genre_ids.update(genre_ids)
+        self.result.movie_ids.clear()
+
+    async def refresh_genre_stats(self) -> None:
+        """Rebuild genre statistics once for every genre the import touched."""
+        if not self.result.movie_ids and not self.result.unlinked_genre_ids:
+            return
+        try:
+            await GenreStatsRepository(self.session).refresh_for_movies(
+                self.result.movie_ids, also_genre_ids=self.result.unlinked_genre_ids
+            )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            self.result.add_error(f"genre statistics refresh: {e}")
+
+    def _count(self, movies: Sequence[MovieImportIn], known: set[str], written: dict[str, int], unlinked: set[int]) -> None:
+        for m in movies:
+            outcome = "updated" if m.external_id in known else "imported"
+            if outcome == "updated":
+                self.result.updated += 1
+            else:
+                self.result.imported += 1
+            if self.result.outcomes is not None:
+                self.result.outcomes[m.external_id] = outcome
+        self.result.movie_ids.update(written.values())
+        self.result.unlinked_genre_ids.update(unlinked)
+
+    async def _existing_external_ids(self, external_ids: list[str]) -> set[str]:
+        found: set[str] = set()
+        for chunk in _chunks(list(set(external_ids)), IN_CHUNK):
+            res = await self.session.execute(select(Movie.external_id).where(Movie.external_id.in_(chunk)))
+            found.update(res.scalars().all())
+        return found
+
+    # ------------------------------------------------------------ resolution
+
+    async def _upsert_returning(self, table: Table, conflict: str, rows: list[dict[str, Any]]) -> dict[Any, int]:
+        """INSERT rows, no-op on ``conflict``, and return {conflict value: id} for all of them."""
+        if not rows:
+            return {}
+        rows = list({row[conflict]: row for row in rows}.values())
+        stmt = self._insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[conflict], set_={conflict: stmt.excluded[conflict]}
+        ).returning(table.c.id, table.c[conflict])
+        ids: dict[Any, int] = {}
+        for chunk in _chunks(rows, IN_CHUNK):
+            res = await self.session.execute(stmt, list(chunk))
+            ids.update((key, id_) for id_, key in res.all())
+        return ids
+
+    async def _resolve_named(
+        self, table: Table, conflict: str, rows_by_name: dict[str, dict[str, Any]]
+    ) -> dict[str, int]:
+        """
+        Map lower-cased names to ids: existing rows matched by name (one query
+        per chunk), the rest inserted with ON CONFLICT on ``conflict``.
+        """
+        ids: dict[str, int] = {}
+        names = list(rows_by_name)
+        for chunk in _chunks(names, IN_CHUNK):
+            res = await self.session.execute(
+                select(table.c.id, func.lower(table.c.name)).where(func.lower(table.c.name).in_(chunk))
+            )
+            for id_, name in res.all():
+                ids.setdefault(name, id_)
+        missing = [name for name in names if name not in ids]
+        created = await self._upsert_returning(table, conflict, [rows_by_name[n] for n in missing])
+        for name in missing:
+            ids[name] = created[rows_by_name[name][conflict]]
+        return ids
+
+    # ---------------------------------------------------------------- writes
+
+    async def _write(self, movies: Sequence[MovieImportIn]) -> tuple[dict[str, int], set[int]]:
+        movie_ids = await self._upsert_movies(movies)
+        unlinked = await self._link_genres(movies, movie_ids)
+        await self._link_people(movies, movie_ids)
+        await self._link_streaming(movies, movie_ids)
+        await self._link_awards(movies, movie_ids)
+        return movie_ids, unlinked
+
+    async def _upsert_movies(self, movies: Sequence[MovieImportIn]) -> dict[str, int]:
+        table = Movie.__table__
+        rows = []
+        for m in movies:
+            row = {name: getattr(m, name) for name in MOVIE_FIELDS}
+            if row["rotten_tomatoes_score"] is not None:
+                row["rotten_tomatoes_score"] = int(round(row["rotten_tomatoes_score"]))
+            row["external_id"] = m.external_id
+            row["tmdb_id"] = m.tmdb_id
+            row["release_date"] = _parse_date(m.release_date)
+            rows.append(row)
+        stmt = self._insert(table)
+        set_ = {name: stmt.excluded[name] for name in MOVIE_FIELDS}
+        # Rows without a release date or TMDB id keep the stored one.
+        for name in ("release_date", "tmdb_id"):
+            set_[name] = func.coalesce(stmt.excluded[name], table.c[name])
+        stmt = stmt.on_conflict_do_update(index_elements=["external_id"], set_=set_).returning(
+            table.c.id, table.c.external_id
+        )
+        res = await self.session.execute(stmt, rows)
+        movie_ids = {external_id: id_ for id_, external_id in res.all()}
+
+        # Trivia/timeline are only replaced when the row provides them.
+        for name in ("trivia", "timeline"):
+            values = [
+                {"mid": movie_ids[m.external_id], "doc": [item.model_dump() for item in getattr(m, name)]}
+                for m in movies
+                if getattr(m, name) is not None
+            ]
+            if values:
+                await self.session.execute(
+                    update(table).where(table.c.id == bindparam("mid")).values({name: bindparam("doc")}),
+                    values,
+                )
+        return movie_ids
+
+    async def _link_genres(self, movies: Sequence[MovieImportIn], movie_ids: dict[str, int]) -> set[int]:
+        targets = [m for m in movies if m.genres is not None]
+        if not targets:
+            return set()
+        ids = [movie_ids[m.external_id] for m in targets]
+        previous = await self.session.execute(
+            select(movie_genres.c.genre_id).where(movie_genres.c.movie_id.in_(ids)).distinct()
+        )
+        unlinked = set(previous.scalars().all())
+        await self.session.execute(movie_genres.delete().where(movie_genres.c.movie_id.in_(ids)))
+
+        rows_by_name = {
+            name.lower(): {"name": name, "slug": name.lower().replace(" ", "-")}
+            for m in targets
+            for name in m.genres
+        }
+        genre_ids = await self._resolve_named(Genre.__table__, "slug", rows_by_name)
+        links = {
+            (movie_ids[m.external_id], genre_ids[name.lower()]) for m in targets for name in m.genres
+        }
+        if links:
+            await self.session.execute(
+                movie_genres.insert(), [{"movie_id": mid, "genre_id": gid} for mid, gid in links]
+            )
+        return unlinked
+
+    async def _link_people(self, movies: Sequence[MovieImportIn], movie_ids: dict[str, int]) -> None:
+        targets = [m for m in movies if any(getattr(m, attr) for attr, _ in PEOPLE_ROLES)]
+        if not targets:
+            return
+        ids = [movie_ids[m.external_id] for m in targets]
+        await self.session.execute(movie_people.delete().where(movie_people.c.movie_id.in_(ids)))
+
+        rows_by_name: dict[str, dict[str, Any]] = {}
+        images: dict[str, str] = {}
+        for m in targets:
+            for attr, _ in PEOPLE_ROLES:
+                for per in getattr(m, attr) or []:
+                    key = per.name.lower()
+                    rows_by_name.setdefault(
+                        key,
+                        {"external_id": f"person-{per.name.lower().replace(' ', '-')}", "name": per.name, "image_url": per.image},
+                    )
+                    if per.image:
+                        images.setdefault(key, per.image)
+        person_ids = await self._resolve_named(Person.__table__, "external_id", rows_by_name)
+
+        # Fill in portraits for existing people that have none.
+        if images:
+            await self.session.execute(
+                update(Person.__table__)
+                .where(Person.__table__.c.id == bindparam("pid"), Person.__table__.c.image_url.is_(None))
+                .values(image_url=bindparam("img")),
+                [{"pid": person_ids[key], "img": url} for key, url in images.items()],
+            )
+
+        links = []
+        for m in targets:
+            movie_id = movie_ids[m.external_id]
+            linked: set[int] = set()  # first role wins, as movie_people is keyed on (movie, person)
+            for attr, role in PEOPLE_ROLES:
+                for per in getattr(m, attr) or []:
+                    pid = person_ids[per.name.lower()]
+                    if pid in linked:
+                        continue
+                    linked.add(pid)
+                    links.append({
+                        "movie_id": movie_id,
+                        "person_id": pid,
+                        "role": role,
+                        "character_name": per.character if role == "actor" else None,
+                    })
+        if links:
+            await self.session.execute(movie_people.insert(), links)
+
+    async def _link_streaming(self, movies: Sequence[MovieImportIn], movie_ids: dict[str, int]) -> None:
+        targets = [m for m in movies if m.streaming is not None]
+        if not targets:
+            return
+        options = MovieStreamingOption.__table__
+        ids = [movie_ids[m.external_id] for m in targets]
+        await self.session.execute(options.delete().where(options.c.movie_id.in_(ids)))
+
+        rows_by_name = {
+            s.platform.lower(): {"external_id": s.platform.lower(), "name": s.platform}
+            for m in targets
+            for s in m.streaming
+        }
+        platform_ids = await self._resolve_named(StreamingPlatform.__table__, "external_id", rows_by_name)
+        platform_keys = dict(
+            (await self.session.execute(
+                select(StreamingPlatform.id, StreamingPlatform.external_id).where(
+                    StreamingPlatform.id.in_(set(platform_ids.values()))
+                )
+            )).all()
+        ) if platform_ids else {}
+
+        rows = []
+        for m in targets:
+            for i, s in enumerate(m.streaming):
+                pid = platform_ids[s.platform.lower()]
+                rows.append({
+                    "external_id": f"{m.external_id}-{platform_keys[pid]}-{s.region}-{i}",
+                    "movie_id": movie_ids[m.external_id],
+                    "platform_id": pid,
+                    "region": s.region,
+                    "type": s.type,
+                    "price": str(s.price) if s.price is not None else None,
+                    "quality": s.quality,
+                    "url": s.url,
+                    "verified": True,
+                })
+        if rows:
+            await self.session.execute(options.insert(), rows)
+
+    async def _link_awards(self, movies: Sequence[MovieImportIn], movie_ids: dict[str, int]) -> None:
+        targets = [m for m in movies if m.awards]
+        if not targets:
+            return
+        ceremony_ids = await self._resolve_named(
+            AwardCeremony.__table__,
+            "external_id",
+            {
+                a.name.lower(): {"external_id": _slug(a.name), "name": a.name, "short_name": a.name}
+                for m in targets
+                for a in m.awards
+            },
+        )
+        ceremony_keys = dict(
+            (await self.session.execute(
+                select(AwardCeremony.id, AwardCeremony.external_id).where(AwardCeremony.id.in_(set(ceremony_ids.values())))
+            )).all()
+        )
+
+        def year_key(a) -> str:
+            return f"{ceremony_keys[ceremony_ids[a.name.lower()]]}-{int(a.year)}"
+
+        year_ids = await self._upsert_returning(
+            AwardCeremonyYear.__table__,
+            "external_id",
+            [
+                {"external_id": year_key(a), "year": int(a.year), "ceremony_id": ceremony_ids[a.name.lower()]}
+                for m in targets
+                for a in m.awards
+            ],
+        )
+        category_ids = await self._upsert_returning(
+            AwardCategory.__table__,
+            "external_id",
+            [
+                {"external_id": f"{year_key(a)}-{_slug(a.category)}", "name": a.category, "ceremony_year_id": year_ids[year_key(a)]}
+                for m in targets
+                for a in m.awards
+            ],
+        )
+
+        nominations = AwardNomination.__table__
+        rows = {}
+        for m in targets:
+            for a in m.awards:
+                category_key = f"{year_key(a)}-{_slug(a.category)}"
+                external_id = f"{category_key}-{m.external_id}"
+                rows[external_id] = {
+                    "external_id": external_id,
+                    "nominee_type": "movie",
+                    "nominee_name": m.title,
+                    "is_winner": str(a.status).lower().startswith("win"),
+                    "category_id": category_ids[category_key],
+                    "movie_id": movie_ids[m.external_id],
+                }
+        stmt = self._insert(nominations)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["external_id"],
+            set_={"nominee_name": stmt.excluded.nominee_name, "is_winner": stmt.excluded.is_winner},
+        )
+        await self.session.execute(stmt, list(rows.values()))
@@ -0,0 +1,141 @@
+"""
+In-memory LRU cache in front of an optional SQLite file.
+
+Shared by the TMDB response cache (integrations/tmdb_client.py) and the
+festival document cache (services/festival_cache.py). Every entry is a JSON
+value stored with a numeric ``stamp``: the store time for TTL caches, the
+content version for versioned ones. Callers pass ``lookup`` a predicate that
+says whether a stamp may still be served.
+
+The memory layer is per worker. The SQLite file, when a path is configured,
+is shared by the workers on the same host and survives restarts; its calls
+run in a worker thread behind one lock. SQLite errors are logged and treated
+as misses, so a broken cache file never fails a request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteLRUCache:
+    def __init__(
+        self,
+        path: str | None,
+        table: str,
+        *,
+        label: str,
+        max_memory_entries: int = 1000,
+        expire_before: Callable[[], float] | None = None,
+        purge_interval: float = 600.0,
+    ) -> None:
+        """
+        ``table`` is the SQLite table of this cache and ``label`` names it in
+        log messages. With ``expire_before``, rows whose stamp is at or below
+        its result are deleted when the file is opened and, at most every
+        ``purge_interval`` seconds, on write.
+        """
+        self.path = path or None
+        self.table = table
+        self.label = label
+        self.max_memory_entries = max_memory_entries
+        self.expire_before = expire_before
+        self.purge_interval = purge_interval
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._last_purge = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, stamp REAL NOT NULL, body TEXT NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+            if self.expire_before is not None:
+                self._purge_expired(conn)
+        return self._conn
+
+    def _purge_expired(self, conn: sqlite3.Connection) -> int:
+        """Delete expired rows. Caller holds ``_db_lock``."""
+        self._last_purge = time.time()
+        deleted = conn.execute(f"DELETE FROM {self.table} WHERE stamp <= ?", (self.expire_before(),)).rowcount
+        conn.commit()
+        return deleted
+
+    def _db_get(self, key: str) -> tuple[float, Any] | None:
+        with self._db_lock:
+            row = self._connection().execute(f"SELECT stamp, body FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def _db_set(self, key: str, stamp: float, value: Any) -> None:
+        with self._db_lock:
+            conn = self._connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, stamp, body) VALUES (?, ?, ?)",
+                (key, stamp, json.dumps(value)),
+            )
+            conn.commit()
+            if self.expire_before is not None and time.time() - self._last_purge >= self.purge_interval:
+                self._purge_expired(conn)
+
+    def _remember(self, key: str, stamp: float, value: Any) -> None:
+        self._memory[key] = (stamp, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    async def lookup(self, key: str, accept: Callable[[float], bool]) -> tuple[bool, Any]:
+        """
+        ``(True, value)`` when an entry whose stamp ``accept`` takes is cached
+        in memory or, failing that, in the file; else ``(False, None)``.
+        """
+        entry = self._memory.get(key)
+        if (entry is None or not accept(entry[0])) and self.path:
+            try:
+                entry = await asyncio.to_thread(self._db_get, key)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.warning(f"{self.label} cache read failed: {e}")
+                entry = None
+            if entry is not None and accept(entry[0]):
+                self._remember(key, *entry)
+        if entry is None or not accept(entry[0]):
+            return False, None
+        self._memory.move_to_end(key)
+        return True, entry[1]
+
+    async def store(self, key: str, stamp: float, value: Any) -> None:
+        """Cache ``value`` under ``key``, replacing any entry with another stamp."""
+        self._remember(key, stamp, value)
+        if self.path:
+            try:
+                await asyncio.to_thread(self._db_set, key, stamp, value)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"{self.label} cache write failed: {e}")
+
+    def forget(self, match: Callable[[str], bool]) -> None:
+        """Drop this worker's in-memory entries whose key ``match`` takes."""
+        for key in [k for k in self._memory if match(k)]:
+            del self._memory[key]
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
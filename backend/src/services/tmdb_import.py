@@ -0,0 +1,202 @@
+"""
+Background jobs for bulk TMDB imports.
+
+POST /admin/tmdb/import/bulk takes a list of TMDB ids, or a TMDB list
+(``now_playing``, ``upcoming``, ``popular``, ``top_rated`` or a ``discover``
+query such as all Telugu-language films) and a page range, and returns a job
+id at once. The job:
+
+- reads the list pages concurrently and skips ids that are already imported;
+- fetches movie details ``tmdb_import_concurrency`` at a time through the
+  shared ``tmdb_client``, whose token bucket keeps the worker under its share
+  of the TMDB rate limit. The next batch is fetched while the current one is
+  written;
+- writes each batch with ``MovieBulkImporter``, which resolves every genre,
+  person and streaming platform of the batch in one pass and commits once.
+
+Status, the outcome per TMDB id and throughput go to ``background_jobs``
+through the same registry as the NDJSON imports (kind ``tmdb_import``), so
+GET /admin/tmdb/import/jobs/{id} can be answered by any worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..integrations.tmdb_client import TMDBError, TMDBNotFoundError, tmdb_client
+from ..models import Movie
+from ..schemas.movie_import import MovieImportIn
+from .import_jobs import ImportJob, ImportJobRegistry
+from .movie_import import IN_CHUNK, ImportResult, MovieBulkImporter, _chunks
+
+JOB_KIND = "tmdb_import"
+LIST_CATEGORIES = ("now_playing", "upcoming", "popular", "top_rated", "discover")
+# TMDB serves at most this many pages of any list
+MAX_LIST_PAGE = 500
+PEOPLE_FIELDS = ("directors", "writers", "producers", "cast")
+
+
+@dataclass
+class TMDBImportJob(ImportJob):
+    tmdb_ids: list[int] = field(default_factory=list)
+    category: str | None = None
+    start_page: int = 1
+    end_page: int = 1
+    # Extra query parameters for the list pages, e.g. with_original_language
+    list_params: dict[str, Any] = field(default_factory=dict)
+    total: int = 0
+    skipped: int = 0
+    not_found: int = 0
+    # imported | updated | skipped | not_found | failed
+    outcomes: dict[int, str] = field(default_factory=dict)
+
+    def report(self) -> dict[str, Any]:
+        report = super().report()
+        processed = report["processed"] + self.skipped + self.not_found
+        elapsed = report["elapsed_seconds"]
+        return {
+            **report,
+            "total": self.total,
+            "skipped": self.skipped,
+            "not_found": self.not_found,
+            "processed": processed,
+            "records_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+            # JSON object keys are strings; the response model turns them back into ints
+            "items": {str(tmdb_id): outcome for tmdb_id, outcome in self.outcomes.items()},
+        }
+
+
+def to_import_row(data: dict[str, Any]) -> MovieImportIn:
+    """A ``fetch_movie_by_id`` result as a bulk-import row."""
+    row = {name: value for name, value in data.items() if name in MovieImportIn.model_fields}
+    if row.get("release_date") is not None:
+        row["release_date"] = row["release_date"].isoformat()
+    for name in PEOPLE_FIELDS:
+        row[name] = [person for person in row.get(name) or [] if person.get("name")]
+    return MovieImportIn.model_validate(row)
+
+
+class TMDBImportJobRegistry(ImportJobRegistry):
+    kind = JOB_KIND
+
+    def __init__(self, *, concurrency: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.concurrency = max(1, concurrency)
+
+    async def submit(
+        self,
+        *,
+        tmdb_ids: Sequence[int] | None = None,
+        category: str | None = None,
+        start_page: int = 1,
+        end_page: int = 1,
+        list_params: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+    ) -> TMDBImportJob:
+        """Register a job for explicit ids or a list page range and start it."""
+        if tmdb_ids:
+            label = f"tmdb ids ({len(tmdb_ids)})"
+        else:
+            label = f"tmdb {category} pages {start_page}-{end_page}"
+        job = TMDBImportJob(
+            id=uuid.uuid4().hex,
+            path=None,
+            filename=label,
+            batch_size=batch_size,
+            result=ImportResult(max_errors=self.max_errors, outcomes={}),
+            tmdb_ids=list(tmdb_ids or []),
+            category=category,
+            start_page=start_page,
+            end_page=min(end_page, MAX_LIST_PAGE),
+            list_params=dict(list_params or {}),
+        )
+        await self._save(job)
+        return self._start(job)
+
+    async def _execute(self, job: TMDBImportJob, session: AsyncSession) -> None:
+        ids = list(dict.fromkeys(job.tmdb_ids or await self._list_ids(job)))
+        existing = await _imported(session, ids)
+        job.total, job.skipped = len(ids), len(existing)
+        job.outcomes.update((tmdb_id, "skipped") for tmdb_id in existing)
+        await self._save_quietly(job)
+
+        importer = MovieBulkImporter(session, batch_size=job.batch_size, result=job.result)
+        batches = list(_chunks([i for i in ids if i not in existing], importer.batch_size))
+        limit = asyncio.Semaphore(self.concurrency)
+        pending = asyncio.create_task(self._fetch(job, batches[0], limit)) if batches else None
+        try:
+            for n in range(len(batches)):
+                fetched = await pending
+                # Fetch the next batch from TMDB while this one is written
+                pending = asyncio.create_task(self._fetch(job, batches[n + 1], limit)) if n + 1 < len(batches) else None
+                if fetched:
+                    await importer.import_batch([row for _, row in fetched])
+                    await importer.fold_movie_ids()
+                for tmdb_id, row in fetched:
+                    job.outcomes[tmdb_id] = job.result.outcomes.pop(row.external_id, "failed")
+                await self._save_quietly(job)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+        await self._keep_alive(job, importer.refresh_genre_stats())
+
+    async def _list_ids(self, job: TMDBImportJob) -> list[int]:
+        """TMDB ids on pages ``start_page..end_page`` of the job's list, in list order."""
+        path = "/discover/movie" if job.category == "discover" else f"/movie/{job.category}"
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def page(n: int) -> dict[str, Any]:
+            async with limit:
+                return await tmdb_client.get_json(path, {"language": "en-US", **job.list_params, "page": n})
+
+        first = await page(job.start_page)
+        last = min(job.end_page, first.get("total_pages") or job.start_page, MAX_LIST_PAGE)
+        rest = await asyncio.gather(*(page(n) for n in range(job.start_page + 1, last + 1)))
+        return [movie["id"] for data in (first, *rest) for movie in data.get("results") or [] if movie.get("id")]
+
+    async def _fetch(
+        self, job: TMDBImportJob, ids: Sequence[int], limit: asyncio.Semaphore
+    ) -> list[tuple[int, MovieImportIn]]:
+        """Movie details for ``ids``, at most ``concurrency`` requests in flight."""
+
+        async def one(tmdb_id: int) -> tuple[int, MovieImportIn] | None:
+            try:
+                async with limit:
+                    data = await tmdb_client.fetch_movie_by_id(tmdb_id)
+                if data is None:
+                    raise TMDBError("TMDB API key not configured")
+                return tmdb_id, to_import_row(data)
+            except TMDBNotFoundError:
+                job.not_found += 1
+                job.outcomes[tmdb_id] = "not_found"
+            except (TMDBError, ValidationError) as e:
+                job.result.add_error(f"tmdb {tmdb_id}: {e}")
+                job.outcomes[tmdb_id] = "failed"
+            return None
+
+        return [found for found in await asyncio.gather(*(one(i) for i in ids)) if found is not None]
+
+
+async def _imported(session: AsyncSession, tmdb_ids: Sequence[int]) -> set[int]:
+    found: set[int] = set()
+    for chunk in _chunks(list(tmdb_ids), IN_CHUNK):
+        res = await session.execute(select(Movie.tmdb_id).where(Movie.tmdb_id.in_(chunk)))
+        found.update(res.scalars().all())
+    return found
+
+
+tmdb_import_jobs = TMDBImportJobRegistry(
+    concurrency=settings.tmdb_import_concurrency,
+    queue_batches=settings.import_stream_queue_batches,
+    max_errors=settings.import_job_max_errors,
+    history=settings.import_job_history,
+    stale_after=settings.import_job_stale_seconds,
+)
@@ -15,9 +15,13 @@ Date: 2025-01-30
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, Any
 import sys
 from pathlib import Path
@@ -47,6 +51,12 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 # DATABASE FIXTURES
 # ============================================================================
 
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    """Create JSONB columns as JSON on SQLite"""
+    return "JSON"
+
+
 @pytest_asyncio.fixture(scope="function")
 async def async_engine():
     """Create async engine for tests"""
@@ -97,6 +107,68 @@ async def async_db_session(async_engine):
         app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def make_sqlite_db(tmp_path):
+    """
+    Factory of SQLite databases holding only the given tables.
+
+    ``await make_sqlite_db(tables, seed=None, on_disk=False)`` creates the
+    tables, runs ``await seed(session)`` and commits, and returns a namespace
+    with the ``engine``, a session ``factory`` and the ``statements`` executed
+    since seeding. ``on_disk`` uses a file so that concurrent sessions get
+    separate connections. Every database is disposed after the test.
+    """
+    engines = []
+
+    async def _build(tables, seed=None, *, on_disk=False):
+        url = f"sqlite+aiosqlite:///{tmp_path / f'db{len(engines)}.sqlite'}" if on_disk else TEST_DATABASE_URL
+        engine = create_async_engine(url)
+        engines.append(engine)
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=tables))
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        if seed is not None:
+            async with factory() as session:
+                await seed(session)
+                await session.commit()
+        statements.clear()
+        return SimpleNamespace(engine=engine, factory=factory, statements=statements)
+
+    yield _build
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db(request, make_sqlite_db):
+    """
+    The test module's database: its ``TABLES``, seeded by its optional
+    ``seed(session)`` coroutine (on disk when ``SQLITE_ON_DISK`` is set), with
+    an open ``db.session``.
+    """
+    module = request.module
+    database = await make_sqlite_db(
+        module.TABLES, getattr(module, "seed", None), on_disk=getattr(module, "SQLITE_ON_DISK", False)
+    )
+    async with database.factory() as session:
+        database.session = session
+        yield database
+
+
+@pytest.fixture(scope="function")
+def session(db) -> AsyncSession:
+    """The open session of the module's database"""
+    return db.session
+
+
+@pytest.fixture(scope="function")
+def session_factory(db):
+    """Session factory of the module's database"""
+    return db.factory
+
+
 @pytest.fixture(scope="function")
 def client():
     """Create a test client for the FastAPI app"""
@@ -0,0 +1,88 @@
+"""
+Unit Tests for denormalized collection card fields
+
+This test module verifies that:
+1. add_movie/remove_movie keep movie_count and preview_posters current
+2. import_collection copies the movies in SQL and fills the copy's card fields
+3. refresh_cards rebuilds the fields after rows were written directly
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+
+from sqlalchemy import select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.models import Collection, Movie, User, UserStats, collection_movies
+from src.repositories.collections import CollectionRepository
+
+
+TABLES = [User.__table__, Movie.__table__, Collection.__table__, UserStats.__table__, collection_movies]
+
+
+async def seed(s):
+    s.add_all([
+        User(id=1, external_id="u1", email="u1@example.com", name="Owner", hashed_password="x"),
+        User(id=2, external_id="u2", email="u2@example.com", name="Fan", hashed_password="x"),
+    ])
+    s.add_all([
+        Movie(id=i, external_id=f"m{i}", title=f"Movie {i}", poster_url=None if i == 2 else f"/p/{i}.jpg")
+        for i in range(1, 8)
+    ])
+
+
+async def _card(session, external_id):
+    for card in await CollectionRepository(session).list(limit=50):
+        if card["id"] == external_id:
+            return card["movieCount"], card["posterImages"]
+    return None
+
+
+class TestMembershipChanges:
+    """Test that membership writes keep the card columns current"""
+
+    async def test_add_and_remove(self, session):
+        repo = CollectionRepository(session)
+        cid = (await repo.create(user_id=1, title="Picks"))["id"]
+        for i in (6, 1, 2, 3, 4, 5):
+            assert await repo.add_movie(cid, f"m{i}", 1)
+        assert await repo.add_movie(cid, "m1", 1)  # duplicate add is a no-op
+        assert await _card(session, cid) == (6, ["/p/1.jpg", "/p/3.jpg", "/p/4.jpg", "/p/5.jpg"])
+
+        assert await repo.remove_movie(cid, "m3", 1)
+        assert await repo.remove_movie(cid, "m3", 1)  # already gone
+        assert await _card(session, cid) == (5, ["/p/1.jpg", "/p/4.jpg", "/p/5.jpg", "/p/6.jpg"])
+
+        updated = await repo.update(cid, 1, title="Renamed")
+        assert (updated["movieCount"], updated["posterImages"][0]) == (5, "/p/1.jpg")
+
+    async def test_import_copies_card(self, session):
+        repo = CollectionRepository(session)
+        cid = (await repo.create(user_id=1, title="Picks"))["id"]
+        for i in range(1, 8):
+            await repo.add_movie(cid, f"m{i}", 1)
+        copy = await repo.import_collection(cid, 2)
+        assert copy["movieCount"] == 7
+        assert copy["posterImages"] == ["/p/1.jpg", "/p/3.jpg", "/p/4.jpg", "/p/5.jpg"]
+        assert await _card(session, copy["id"]) == (7, copy["posterImages"])
+
+
+class TestRefreshCards:
+    """Test rebuilding card columns from collection_movies"""
+
+    async def test_refresh_after_direct_inserts(self, session):
+        session.add(Collection(id=10, external_id="seeded", title="Seeded", user_id=1))
+        await session.flush()
+        await session.execute(collection_movies.insert(), [{"collection_id": 10, "movie_id": i} for i in (2, 7)])
+        assert await _card(session, "seeded") == (0, [])
+
+        assert await CollectionRepository(session).refresh_cards() == 1
+        session.expire_all()
+        assert await _card(session, "seeded") == (2, ["/p/7.jpg"])
+        count = (await session.execute(select(Collection.movie_count).where(Collection.id == 10))).scalar_one()
+        assert count == 2
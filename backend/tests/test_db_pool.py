@@ -0,0 +1,122 @@
+"""
+Unit Tests for database pool configuration and read routing
+
+This test module verifies that:
+1. Postgres engines take pool, statement-cache and application_name settings
+2. The pool records checkout waits, timeouts and connections in use
+3. get_read_session uses the replica when configured and the primary otherwise
+4. close_db disposes the engines
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src import db
+from src.config import settings
+
+
+class TestEngineSettings:
+    """Test engine construction from settings"""
+
+    async def test_postgres_pool_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_pool_size", 3)
+        monkeypatch.setattr(settings, "db_max_overflow", 2)
+        monkeypatch.setattr(settings, "db_pool_timeout_seconds", 4.0)
+        monkeypatch.setattr(settings, "db_pool_recycle_seconds", 600)
+        monkeypatch.setattr(settings, "db_statement_cache_size", 0)
+        monkeypatch.setattr(settings, "db_application_name", "iwm-test")
+        calls = []
+        create = db.create_async_engine
+
+        def capture(url, **kwargs):
+            calls.append(kwargs)
+            return create(url, **kwargs)
+
+        monkeypatch.setattr(db, "create_async_engine", capture)
+        engine = db._create_engine("postgresql+asyncpg://u:p@localhost:5432/iwm?sslmode=require")
+        try:
+            pool = engine.pool
+            assert isinstance(pool, db.TimedQueuePool)
+            assert (pool.size(), pool._max_overflow, pool._timeout, pool._recycle) == (3, 2, 4.0, 600)
+            connect_args = calls[0]["connect_args"]
+            assert connect_args["statement_cache_size"] == 0
+            assert connect_args["server_settings"] == {"application_name": "iwm-test"}
+            assert "ssl" in connect_args and "sslmode" not in str(engine.url)
+        finally:
+            await engine.dispose()
+
+    def test_read_url_is_made_async(self):
+        assert settings.__class__(
+            database_read_url="postgres://u:p@replica/iwm"
+        ).database_read_url == "postgresql+asyncpg://u:p@replica/iwm"
+
+
+class TestPoolMetrics:
+    """Test checkout timing and usage counters"""
+
+    async def test_waits_timeouts_and_in_use(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=db.TimedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05,
+        )
+        try:
+            async with engine.connect() as held:
+                await held.execute(text("SELECT 1"))
+                metrics = db._pool_metrics(engine)
+                assert (metrics["in_use"], metrics["size"], metrics["checkouts"]) == (1, 1, 1)
+                with pytest.raises(PoolTimeoutError):
+                    async with engine.connect() as conn:
+                        await conn.execute(text("SELECT 1"))
+            metrics = db._pool_metrics(engine)
+            assert (metrics["in_use"], metrics["timeouts"]) == (0, 1)
+            assert metrics["wait_seconds_max"] >= 0.05
+        finally:
+            await engine.dispose()
+
+
+class TestReadSession:
+    """Test read routing and shutdown"""
+
+    async def _sessions(self, primary):
+        gen = db.get_read_session(primary)
+        session = await gen.__anext__()
+        await gen.aclose()
+        return session
+
+    async def test_routing(self, tmp_path, monkeypatch):
+        primary = object()
+        monkeypatch.setattr(db, "ReadSessionLocal", None)
+        assert await self._sessions(primary) is primary
+
+        replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+        try:
+            monkeypatch.setattr(db, "ReadSessionLocal", async_sessionmaker(replica))
+            session = await self._sessions(primary)
+            assert session is not primary and session.bind is replica
+        finally:
+            await replica.dispose()
+
+    async def test_init_and_close(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'main.db'}")
+        monkeypatch.setattr(settings, "database_read_url", f"sqlite+aiosqlite:///{tmp_path / 'main.db'}")
+        await db.init_db()
+        try:
+            assert db.read_engine is not None and db.ReadSessionLocal is not None
+            async with db.ReadSessionLocal() as session:
+                assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+            assert set(db.pool_metrics()) == {"primary", "replica"}
+        finally:
+            await db.close_db()
+        assert (db.engine, db.SessionLocal, db.read_engine, db.ReadSessionLocal) == (None, None, None, None)
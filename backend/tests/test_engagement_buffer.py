@@ -0,0 +1,170 @@
+"""
+Unit Tests for the critic review engagement buffer
+
+This test module verifies that:
+1. Views, likes and shares are coalesced per review and written in one flush
+2. Flushed deltas roll into the critic's daily analytics row and total_views
+3. Failed flushes re-queue their deltas and stop() drains what is pending
+4. Review responses include this worker's unflushed increments
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.main import app
+from src.models import (
+    CriticAnalytics,
+    CriticProfile,
+    CriticReview,
+    CriticSocialLink,
+    Movie,
+    User,
+    UserRoleProfile,
+)
+from src.repositories.critics import CriticRepository
+from src.services.engagement_buffer import EngagementBuffer, engagement_buffer
+
+
+EDITED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+TABLES = [
+    User.__table__,
+    Movie.__table__,
+    UserRoleProfile.__table__,
+    CriticProfile.__table__,
+    CriticSocialLink.__table__,
+    CriticReview.__table__,
+    CriticAnalytics.__table__,
+]
+
+
+async def seed(s):
+    s.add(User(id=1, external_id="user-1", email="c@example.com", hashed_password="x", name="Critic"))
+    s.add(Movie(id=1, external_id="tt1", title="Movie 1"))
+    s.add(CriticProfile(id=1, external_id="critic-1", user_id=1, username="critic", display_name="Critic"))
+    s.add_all(
+        CriticReview(
+            id=rid,
+            external_id=f"review-{rid}",
+            critic_id=1,
+            movie_id=1,
+            content="...",
+            slug=f"review-{rid}",
+            updated_at=EDITED_AT,
+        )
+        for rid in (1, 2)
+    )
+
+
+async def _review(factory, review_id):
+    async with factory() as s:
+        return (await s.execute(select(CriticReview).where(CriticReview.id == review_id))).scalar_one()
+
+
+class TestFlush:
+    """Test coalescing and the batched write"""
+
+    async def test_coalesces_and_writes_once(self, session_factory):
+        buffer = EngagementBuffer(flush_interval=60, max_pending=100, session_factory=session_factory)
+        for _ in range(25):
+            buffer.record(1, views=1)
+        buffer.record(1, likes=1)
+        buffer.record(2, views=3, shares=2)
+        assert len(buffer) == 2
+        assert buffer.pending(1) == (25, 1, 0)
+
+        assert await buffer.flush() == 2
+        assert len(buffer) == 0
+
+        first = await _review(session_factory, 1)
+        assert (first.view_count, first.like_count, first.share_count) == (25, 1, 0)
+        assert first.updated_at == EDITED_AT
+        second = await _review(session_factory, 2)
+        assert (second.view_count, second.share_count) == (3, 2)
+
+    async def test_rolls_into_daily_analytics(self, session_factory):
+        buffer = EngagementBuffer(flush_interval=60, max_pending=100, session_factory=session_factory)
+        buffer.record(1, views=4, likes=1)
+        await buffer.flush()
+        buffer.record(2, views=6, shares=1)
+        await buffer.flush()
+
+        async with session_factory() as s:
+            rows = (await s.execute(select(CriticAnalytics))).scalars().all()
+            assert len(rows) == 1
+            assert (rows[0].total_views, rows[0].total_likes, rows[0].total_shares) == (10, 1, 1)
+            profile = await s.get(CriticProfile, 1)
+            assert profile.total_views == 10
+            month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            assert await CriticRepository(s).get_views_since(1, month_start) == 10
+            assert await CriticRepository(s).get_views_since(1, datetime.utcnow() + timedelta(days=1)) == 0
+
+
+class TestLifecycle:
+    """Test failure handling and shutdown"""
+
+    async def test_failed_flush_requeues(self, session_factory):
+        buffer = EngagementBuffer(flush_interval=60, max_pending=100, session_factory=session_factory)
+        buffer.record(1, views=2)
+
+        engine = session_factory.kw["bind"]
+
+        def fail(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("UPDATE"):
+                raise RuntimeError("database unavailable")
+
+        event.listen(engine.sync_engine, "before_cursor_execute", fail)
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        event.remove(engine.sync_engine, "before_cursor_execute", fail)
+
+        buffer.record(1, views=1)
+        assert buffer.pending(1) == (3, 0, 0)
+        await buffer.flush()
+        assert (await _review(session_factory, 1)).view_count == 3
+
+    async def test_stop_flushes_pending(self, session_factory):
+        buffer = EngagementBuffer(flush_interval=60, max_pending=100, session_factory=session_factory)
+        buffer.start()
+        buffer.record(2, views=5)
+        await buffer.stop()
+        assert len(buffer) == 0
+        assert (await _review(session_factory, 2)).view_count == 5
+
+
+class TestReadYourWrites:
+    """Test that responses add pending deltas to the stored counters"""
+
+    async def test_view_count_includes_pending(self, session_factory):
+        async def _override_session():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_session] = _override_session
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                first = (await client.get("/api/v1/critic-reviews/review-1")).json()
+                second = (await client.get("/api/v1/critic-reviews/review-1")).json()
+                # Shares need a signed-in user
+                anonymous_share = await client.post("/api/v1/critic-reviews/review-1/share")
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            pending = engagement_buffer.pending(1)
+            engagement_buffer._pending.clear()
+        # Each GET records its view before rendering, so it counts itself
+        assert (first["view_count"], second["view_count"]) == (1, 2)
+        assert anonymous_share.status_code == 401
+        assert pending == (2, 0, 0)
+        assert (await _review(session_factory, 1)).view_count == 0
@@ -0,0 +1,164 @@
+"""
+Unit Tests for FestivalsRepository
+
+This test module verifies that:
+1. Festival cards and headers read the current edition through
+   current_edition_id, in one query
+2. Edition writes move current_edition_id to the upcoming, else latest, edition
+3. Program and winners documents are cached per content_version and rebuilt
+   after an edit made by this or another worker
+4. The on-disk document store survives a new cache instance
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import update
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_read_session, get_session
+from src.dependencies.admin import require_admin
+from src.main import app
+from src.models import (
+    Festival, FestivalEdition, FestivalProgramEntry, FestivalProgramSection, FestivalWinner,
+    FestivalWinnerCategory, Movie,
+)
+from src.repositories.festivals import FestivalsRepository
+from src.services.festival_cache import FestivalDocumentCache, festival_cache
+
+
+TABLES = [
+    Movie.__table__, Festival.__table__, FestivalEdition.__table__,
+    FestivalProgramSection.__table__, FestivalProgramEntry.__table__,
+    FestivalWinnerCategory.__table__, FestivalWinner.__table__,
+]
+
+
+async def seed(s):
+    s.add_all([
+        Festival(id=1, external_id="cannes", name="Cannes", location="Cannes"),
+        Festival(id=2, external_id="venice", name="Venice"),
+        FestivalEdition(id=1, external_id="cannes-2023", year=2023, edition_label="76th", status="past", festival_id=1),
+        FestivalEdition(id=2, external_id="cannes-2024", year=2024, edition_label="77th", status="Upcoming",
+                        dates="May 14-25, 2024", festival_id=1),
+        FestivalEdition(id=3, external_id="venice-2022", year=2022, status="past", festival_id=2),
+        FestivalEdition(id=4, external_id="venice-2023", year=2023, status="past", festival_id=2),
+        FestivalProgramSection(id=1, name="competition", edition_id=2),
+        FestivalProgramEntry(id=1, section_id=1, title="Anatomy of a Fall", director="Justine Triet"),
+        FestivalWinnerCategory(id=1, external_id="palme-dor", name="Palme d'Or", edition_id=2),
+        FestivalWinner(id=1, category_id=1, movie_title="Anatomy of a Fall", rating=8.2),
+    ])
+    await s.flush()
+    await FestivalsRepository(s).touch()
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    festival_cache.clear()
+    yield
+    festival_cache.clear()
+
+
+@pytest.fixture
+async def client(db):
+    app.dependency_overrides[get_session] = lambda: db.session
+    app.dependency_overrides[get_read_session] = lambda: db.session
+    app.dependency_overrides[require_admin] = lambda: None
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+    finally:
+        for dep in (get_session, get_read_session, require_admin):
+            app.dependency_overrides.pop(dep, None)
+
+
+class TestCurrentEdition:
+    """Test the denormalized current edition pointer"""
+
+    async def test_list_and_header(self, db):
+        repo = FestivalsRepository(db.session)
+        items = await repo.list_festivals()
+        assert len(db.statements) == 1
+        assert [(f["id"], f["status"], f["dates"]) for f in items] == [
+            ("cannes", "Upcoming", "May 14-25, 2024"), ("venice", "past", None),
+        ]
+        header = await repo.get_festival_header("venice")
+        assert header["status"] == "past"
+        assert await repo.get_festival_header("nope") is None
+
+    async def test_edition_writes_move_pointer(self, client):
+        body = (await client.put(
+            "/api/v1/festivals/cannes/editions/2025", json={"edition_label": "78th", "status": "upcoming"}
+        )).json()
+        assert body["edition"] == "78th"
+
+        # With no upcoming edition left, the latest year is current
+        for year in (2024, 2025):
+            await client.put(f"/api/v1/festivals/cannes/editions/{year}", json={"status": "past"})
+        assert (await client.get("/api/v1/festivals/cannes")).json()["edition"] == "78th"
+        await client.put("/api/v1/festivals/cannes/editions/2023", json={"status": "upcoming"})
+        assert (await client.get("/api/v1/festivals/cannes")).json()["edition"] == "76th"
+
+        assert (await client.put("/api/v1/festivals/nope/editions/2024", json={})).status_code == 404
+
+
+class TestDocumentCache:
+    """Test cached program and winners documents"""
+
+    async def test_program_is_cached_per_version(self, db):
+        repo = FestivalsRepository(db.session)
+        first = await repo.get_program("cannes", 2024)
+        assert first["competition"] == [{
+            "title": "Anatomy of a Fall", "director": "Justine Triet", "country": None, "premiere": None, "image": None,
+        }]
+        assert first["outOfCompetition"] == []
+        db.statements.clear()
+        assert await repo.get_program("cannes", 2024) == first
+        # Only the content_version lookup
+        assert len(db.statements) == 1
+
+        # Another worker's edit: the version moves, so the document is rebuilt
+        await db.session.execute(update(Festival).where(Festival.id == 1).values(content_version=Festival.content_version + 1))
+        await db.session.execute(update(FestivalProgramEntry).values(title="Renamed"))
+        await db.session.commit()
+        assert (await repo.get_program("cannes", 2024))["competition"][0]["title"] == "Renamed"
+
+        assert await repo.get_program("cannes", 1999) is None
+        assert await repo.get_program("nope", 2024) is None
+
+    async def test_replace_program_and_winners(self, client):
+        assert (await client.get("/api/v1/festivals/cannes/2024/winners")).json()[0]["winners"][0]["rating"] == 8.2
+
+        program = {"competition": [{"title": "The Zone of Interest"}], "specialScreenings": []}
+        resp = await client.put("/api/v1/festivals/cannes/2024/program", json=program)
+        assert resp.json()["competition"][0]["title"] == "The Zone of Interest"
+        got = (await client.get("/api/v1/festivals/cannes/2024/program")).json()
+        assert [e["title"] for e in got["competition"]] == ["The Zone of Interest"]
+
+        winners = [{"id": "grand-prix", "categoryName": "Grand Prix", "winners": [{"movieTitle": "Zone"}]}]
+        await client.put("/api/v1/festivals/cannes/2024/winners", json=winners)
+        got = (await client.get("/api/v1/festivals/cannes/2024/winners")).json()
+        assert [(c["id"], c["winners"][0]["movieTitle"]) for c in got] == [("grand-prix", "Zone")]
+
+        assert (await client.put("/api/v1/festivals/cannes/1999/program", json=program)).status_code == 404
+
+    async def test_disk_store(self, tmp_path):
+        path = str(tmp_path / "festivals.sqlite")
+        cache = FestivalDocumentCache(path)
+        await cache.set("cannes", 2024, "program", 3, {"competition": []})
+        cache.close()
+
+        reopened = FestivalDocumentCache(path)
+        try:
+            assert await reopened.get("cannes", 2024, "program", 3) == (True, {"competition": []})
+            assert await reopened.get("cannes", 2024, "program", 4) == (False, None)
+            assert await reopened.get("cannes", 2024, "winners", 3) == (False, None)
+        finally:
+            reopened.close()
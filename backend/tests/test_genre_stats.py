@@ -0,0 +1,170 @@
+"""
+Unit Tests for genre statistics snapshots
+
+This test module verifies that:
+1. GenreStatsRepository.compute derives the statistics block from SQL aggregates
+2. GenreRepository.get_details serves the stored snapshot with a PK read
+3. refresh_for_movies rebuilds the genres a movie joined and left; basic-info
+   imports refresh on any aggregated field and expired snapshots rebuild on read
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import update
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.dependencies.admin import require_admin
+from src.main import app
+from src.models import Genre, GenreStatsSnapshot, Movie, Person, movie_genres, movie_people
+from src.repositories.genre_stats import GenreStatsRepository
+from src.repositories.genres import GenreRepository
+
+
+MOVIES = [
+    # id, year, siddu_score, country, language
+    (1, "1994", 9.1, "USA", "English"),
+    (2, "1999", 8.4, "USA", "English"),
+    (3, "2008", 7.2, "UK", "English"),
+    (4, "2021", 5.5, "India", "Telugu"),
+]
+
+TABLES = [
+    Genre.__table__,
+    Movie.__table__,
+    Person.__table__,
+    movie_genres,
+    movie_people,
+    GenreStatsSnapshot.__table__,
+]
+
+
+async def seed(s):
+    s.add_all([Genre(id=1, slug="drama", name="Drama"), Genre(id=2, slug="comedy", name="Comedy")])
+    s.add_all(
+        Movie(id=mid, external_id=f"tt{mid}", title=f"Movie {mid}", year=year, siddu_score=score, country=country, language=language)
+        for mid, year, score, country, language in MOVIES
+    )
+    s.add_all([
+        Person(id=1, external_id="nm1", name="Director A"),
+        Person(id=2, external_id="nm2", name="Director B"),
+        Person(id=3, external_id="nm3", name="Actor C"),
+    ])
+    await s.flush()
+    await s.execute(movie_genres.insert(), [{"movie_id": mid, "genre_id": 1} for mid, *_ in MOVIES])
+    await s.execute(movie_genres.insert(), [{"movie_id": 4, "genre_id": 2}])
+    await s.execute(
+        movie_people.insert(),
+        [
+            {"movie_id": 1, "person_id": 1, "role": "director"},
+            {"movie_id": 2, "person_id": 1, "role": "director"},
+            {"movie_id": 3, "person_id": 2, "role": "director"},
+            {"movie_id": 1, "person_id": 3, "role": "actor"},
+        ],
+    )
+
+
+class TestCompute:
+    """Test the aggregate statistics block"""
+
+    async def test_statistics_block(self, session):
+        stats = await GenreStatsRepository(session).compute(1)
+        assert stats["totalMovies"] == 4
+        assert stats["averageRating"] == pytest.approx(7.55)
+        assert [d["name"] for d in stats["topDirectors"]] == ["Director A", "Director B"]
+        assert stats["topDirectors"][0]["movieCount"] == 2
+        assert [a["name"] for a in stats["topActorsInGenre"]] == ["Actor C"]
+        assert stats["peakDecade"] == "1990s"
+        assert [m["id"] for m in stats["top3MoviesBySidduScoreInGenre"]] == ["tt1", "tt2", "tt3"]
+        assert stats["availableCountries"] == ["USA", "India", "UK"]
+        assert stats["availableLanguages"] == ["English", "Telugu"]
+        assert stats["releaseFrequencyByYear"][0] == {"year": 1994, "count": 1}
+        distribution = {b["range"]: b["count"] for b in stats["ratingDistribution"]}
+        assert distribution["9-10"] == 1
+        assert distribution["8-9"] == 1
+        assert distribution["5-6"] == 1
+        assert sum(distribution.values()) == 4
+
+    async def test_empty_genre(self, session):
+        session.add(Genre(id=3, slug="empty", name="Empty"))
+        await session.commit()
+        stats = await GenreStatsRepository(session).compute(3)
+        assert stats["totalMovies"] == 0
+        assert stats["topDirectors"] == []
+
+
+class TestSnapshots:
+    """Test snapshot reads and incremental refresh"""
+
+    async def test_details_served_from_snapshot(self, db):
+        repo = GenreRepository(db.session)
+        first = await repo.get_details("drama")
+        assert first["statistics"]["totalMovies"] == 4
+
+        db.statements.clear()
+        second = await repo.get_details("drama")
+        assert second["statistics"] == first["statistics"]
+        assert len(db.statements) == 2
+        assert not any("movie_people" in s or "movie_genres" in s for s in db.statements)
+
+    async def test_refresh_for_movies_covers_old_and_new_genres(self, session):
+        stats_repo = GenreStatsRepository(session)
+        await stats_repo.refresh([1, 2])
+        await session.commit()
+
+        # Move movie 3 from drama to comedy
+        previous = await stats_repo.genre_ids_for_movies([3])
+        await session.execute(movie_genres.delete().where(movie_genres.c.movie_id == 3))
+        await session.execute(movie_genres.insert().values(movie_id=3, genre_id=2))
+        refreshed = await stats_repo.refresh_for_movies([3], also_genre_ids=previous)
+        await session.commit()
+
+        assert refreshed == 2
+        assert (await stats_repo.get(1)).total_movies == 3
+        assert (await stats_repo.get(2)).total_movies == 2
+
+    async def test_expired_snapshot_is_rebuilt_on_read(self, session):
+        repo = GenreRepository(session)
+        assert (await repo.get_details("drama"))["statistics"]["peakDecade"] == "1990s"
+        await session.execute(update(Movie).where(Movie.id.in_([1, 2])).values(year="2015"))
+        await session.commit()
+
+        # Fresh snapshot: served as stored
+        assert (await repo.get_details("drama"))["statistics"]["peakDecade"] == "1990s"
+        await session.execute(
+            update(GenreStatsSnapshot).values(refreshed_at=datetime.utcnow() - timedelta(days=1))
+        )
+        await session.commit()
+        assert (await repo.get_details("drama"))["statistics"]["peakDecade"] == "2010s"
+
+    async def test_basic_info_import_refreshes_on_aggregated_fields(self, session):
+        stats_repo = GenreStatsRepository(session)
+        await stats_repo.refresh([1, 2])
+        await session.commit()
+
+        app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[require_admin] = lambda: None
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/admin/movies/tt4/import/basic-info",
+                    json={"category": "basic_info", "movie_id": "tt4", "data": {"country": "Japan", "siddu_score": 9.9}},
+                )
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            app.dependency_overrides.pop(require_admin, None)
+        assert response.status_code == 200, response.text
+
+        for genre_id in (1, 2):
+            stats = (await stats_repo.get(genre_id)).statistics
+            assert "Japan" in stats["availableCountries"]
+            assert stats["top3MoviesBySidduScoreInGenre"][0]["id"] == "tt4"
@@ -0,0 +1,233 @@
+"""
+Unit Tests for streaming NDJSON movie import jobs
+
+This test module verifies that:
+1. Plain and gzip NDJSON files import in batches, with invalid lines reported
+   by line number and counted as failures
+2. The reader stays at most a bounded number of batches ahead of the writer
+3. The admin endpoints accept an upload, return a job id and report progress
+   from the shared background_jobs table, readable by any worker
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import asyncio
+import gzip
+import json
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.dependencies.admin import require_admin
+from src.main import app
+from src.models import (
+    AwardCategory,
+    AwardCeremony,
+    AwardCeremonyYear,
+    AwardNomination,
+    BackgroundJob,
+    Genre,
+    GenreStatsSnapshot,
+    Movie,
+    MovieStreamingOption,
+    Person,
+    StreamingPlatform,
+    movie_genres,
+    movie_people,
+)
+from src.services import import_jobs as import_jobs_module
+from src.services.import_jobs import ImportJobRegistry, import_jobs
+from src.services.movie_import import MovieBulkImporter
+
+
+TABLES = [
+    Genre.__table__,
+    Movie.__table__,
+    Person.__table__,
+    movie_genres,
+    movie_people,
+    StreamingPlatform.__table__,
+    MovieStreamingOption.__table__,
+    AwardCeremony.__table__,
+    AwardCeremonyYear.__table__,
+    AwardCategory.__table__,
+    AwardNomination.__table__,
+    GenreStatsSnapshot.__table__,
+    BackgroundJob.__table__,
+]
+
+
+def _line(n: int) -> str:
+    return json.dumps({"external_id": f"nd-{n}", "title": f"Streamed {n}", "genres": ["Drama"]})
+
+
+def _ndjson(lines: list[str], compress: bool = False) -> bytes:
+    raw = ("\n".join(lines) + "\n").encode()
+    return gzip.compress(raw) if compress else raw
+
+
+def _spooled(data: bytes) -> Path:
+    with tempfile.NamedTemporaryFile(suffix=".ndjson", delete=False) as f:
+        f.write(data)
+    return Path(f.name)
+
+
+async def _count(session_factory, stmt):
+    async with session_factory() as s:
+        return (await s.execute(stmt)).scalar_one()
+
+
+async def _wait(job, timeout=5.0):
+    await asyncio.wait_for(asyncio.shield(job.task), timeout)
+    return job.report()
+
+
+class TestStreamingJob:
+    """Test parsing, batching and progress of a streaming import"""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    async def test_imports_file_and_reports_bad_lines(self, session_factory, compress):
+        lines = [_line(n) for n in range(7)]
+        lines[3] = '{"title": "no id"}'
+        lines.insert(5, "")
+        lines.insert(6, "{not json")
+        registry = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=300, session_factory=session_factory)
+        path = _spooled(_ndjson(lines, compress))
+
+        report = await _wait(await registry.submit(path, filename="catalog.ndjson", batch_size=2))
+
+        assert report["status"] == "completed", report["error"]
+        assert (report["imported"], report["failed"], report["processed"]) == (6, 2, 8)
+        assert report["errors"][0].startswith("line 4: external_id")
+        assert report["errors"][1].startswith("line 7:")
+        assert report["batches"] == 3
+        assert not path.exists()
+        assert await _count(session_factory, select(func.count()).select_from(Movie)) == 6
+        assert await _count(session_factory, select(GenreStatsSnapshot.total_movies)) == 6
+
+    async def test_truncated_gzip_fails_after_committed_batches(self, session_factory):
+        data = _ndjson([_line(n) for n in range(500)], compress=True)
+        registry = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=300, session_factory=session_factory)
+
+        report = await _wait(await registry.submit(_spooled(data[: len(data) // 2]), batch_size=50))
+
+        assert report["status"] == "failed"
+        assert "could not read import file" in report["error"]
+        assert report["imported"] == await _count(session_factory, select(func.count()).select_from(Movie))
+
+    async def test_reader_is_bounded_by_queue(self, session_factory, monkeypatch):
+        reads = 0
+        release = asyncio.Event()
+        read_batch = import_jobs_module._read_batch
+        import_batch = MovieBulkImporter.import_batch
+
+        def counting_read(*args):
+            nonlocal reads
+            reads += 1
+            return read_batch(*args)
+
+        async def gated_import(self, movies):
+            await release.wait()
+            await import_batch(self, movies)
+
+        monkeypatch.setattr(import_jobs_module, "_read_batch", counting_read)
+        monkeypatch.setattr(MovieBulkImporter, "import_batch", gated_import)
+        registry = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=300, session_factory=session_factory)
+        job = await registry.submit(_spooled(_ndjson([_line(n) for n in range(40)])), batch_size=2)
+
+        await asyncio.sleep(0.2)
+        # One batch held by the writer, two queued, one waiting to be queued
+        assert reads <= 4
+        release.set()
+        report = await _wait(job)
+        assert (report["status"], report["imported"], reads) == ("completed", 40, 21)
+
+
+class TestImportJobApi:
+    """Test the upload and status endpoints"""
+
+    async def test_upload_and_poll(self, session_factory, monkeypatch):
+        monkeypatch.setattr(import_jobs, "_session_factory", session_factory)
+        app.dependency_overrides[require_admin] = lambda: None
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                files = {"file": ("catalog.ndjson.gz", _ndjson([_line(n) for n in range(5)], True), "application/gzip")}
+                started = await client.post("/api/v1/admin/movies/import/stream", params={"batchSize": 2}, files=files)
+                assert started.status_code == 202
+                job_id = started.json()["id"]
+
+                await _wait(import_jobs.get(job_id))
+                status = await client.get(f"/api/v1/admin/movies/import/jobs/{job_id}")
+                body = status.json()
+                assert (body["status"], body["imported"], body["batches"]) == ("completed", 5, 3)
+                assert body["filename"] == "catalog.ndjson.gz"
+                assert body["finished_at"] is not None
+
+                empty = await client.post(
+                    "/api/v1/admin/movies/import/stream", files={"file": ("empty.ndjson", b"", "application/x-ndjson")}
+                )
+                assert empty.status_code == 400
+                assert (await client.get("/api/v1/admin/movies/import/jobs/nope")).status_code == 404
+        finally:
+            app.dependency_overrides.pop(require_admin, None)
+
+
+class TestSharedStatus:
+    """Test that job status lives in the shared table"""
+
+    async def test_other_worker_sees_progress(self, session_factory):
+        running_here = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=300, session_factory=session_factory)
+        elsewhere = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=300, session_factory=session_factory)
+        job = await running_here.submit(_spooled(_ndjson([_line(n) for n in range(5)])), filename="a.ndjson", batch_size=2)
+        assert (await elsewhere.status(job.id))["status"] in ("queued", "running")
+
+        await _wait(job)
+        assert elsewhere.get(job.id) is None
+        report = await elsewhere.status(job.id)
+        assert (report["status"], report["imported"], report["batches"]) == ("completed", 5, 3)
+        assert report["finished_at"] is not None
+        assert await elsewhere.status("missing") is None
+
+    async def test_abandoned_job_is_reported_failed(self, session_factory):
+        registry = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=60, session_factory=session_factory)
+        async with session_factory() as s:
+            s.add(BackgroundJob(
+                id="abandoned", kind="movie_import", status="running", report={"imported": 4},
+                updated_at=datetime.utcnow() - timedelta(minutes=5),
+            ))
+            await s.commit()
+        report = await registry.status("abandoned")
+        assert (report["status"], report["imported"]) == ("failed", 4)
+        assert "interrupted" in report["error"]
+
+    async def test_slow_finish_is_not_stale(self, session_factory, monkeypatch):
+        async def slow_refresh(importer):
+            await asyncio.sleep(0.8)
+
+        monkeypatch.setattr(MovieBulkImporter, "refresh_genre_stats", slow_refresh)
+        running_here = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=0.3, session_factory=session_factory)
+        elsewhere = ImportJobRegistry(queue_batches=2, max_errors=10, history=5, stale_after=0.3, session_factory=session_factory)
+        job = await running_here.submit(_spooled(_ndjson([_line(n) for n in range(3)])), batch_size=2)
+        try:
+            # Well past stale_after into the refresh, the status row is still fresh
+            await asyncio.sleep(0.6)
+            during = (await elsewhere.status(job.id))["status"]
+        finally:
+            await _wait(job)
+        assert during == "running"
+        assert (await elsewhere.status(job.id))["status"] == "completed"
+
+    async def test_history_is_pruned(self, session_factory):
+        registry = ImportJobRegistry(queue_batches=2, max_errors=10, history=2, stale_after=300, session_factory=session_factory)
+        for n in range(4):
+            await _wait(await registry.submit(_spooled(_ndjson([_line(n)])), batch_size=2))
+        assert await _count(session_factory, select(func.count()).select_from(BackgroundJob)) == 2
@@ -0,0 +1,228 @@
+"""
+Statement-count tests for repository loader profiles
+
+This test module verifies that:
+1. Core catalog relationships raise instead of lazy-loading implicitly
+2. Every registered loader profile resolves to loader options
+3. List endpoints issue a fixed number of SQL statements, independent of
+   how many rows they return
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.dependencies.auth import get_current_user
+from src.main import app
+from src.models import (
+    Collection,
+    Genre,
+    Movie,
+    Person,
+    Review,
+    User,
+    UserStats,
+    Watchlist,
+    collection_movies,
+    movie_genres,
+    movie_people,
+)
+from src.repositories.collections import CollectionRepository
+from src.repositories.loader_profiles import PROFILES, load_profile
+from src.repositories.watchlist import WatchlistRepository
+
+
+CATALOG_TABLES = [
+    Genre.__table__,
+    Movie.__table__,
+    Person.__table__,
+    User.__table__,
+    Review.__table__,
+    Collection.__table__,
+    Watchlist.__table__,
+    UserStats.__table__,
+    movie_genres,
+    movie_people,
+    collection_movies,
+]
+
+
+async def _seed(session: AsyncSession, n_movies: int) -> None:
+    users = [
+        User(
+            external_id=f"user-{i}",
+            email=f"user{i}@example.com",
+            hashed_password="x",
+            name=f"User {i}",
+        )
+        for i in range(3)
+    ]
+    genres = [Genre(slug=f"genre-{i}", name=f"Genre {i}") for i in range(3)]
+    session.add_all(users + genres)
+    await session.flush()
+
+    movies = [
+        Movie(external_id=f"tt{i:07d}", title=f"Movie {i}", year="2020", poster_url=f"/p/{i}.jpg")
+        for i in range(n_movies)
+    ]
+    session.add_all(movies)
+    await session.flush()
+
+    await session.execute(
+        movie_genres.insert(),
+        [{"movie_id": m.id, "genre_id": genres[i % 3].id} for i, m in enumerate(movies)],
+    )
+    for i, m in enumerate(movies):
+        session.add(
+            Review(
+                external_id=f"review-{i}",
+                title=f"Review {i}",
+                content="Solid.",
+                rating=8.0,
+                user_id=users[i % 3].id,
+                movie_id=m.id,
+            )
+        )
+    for i, u in enumerate(users):
+        session.add(Collection(external_id=f"collection-{i}", title=f"Collection {i}", user_id=u.id))
+    await session.flush()
+
+    collection_ids = (await session.execute(select(Collection.id))).scalars().all()
+    await session.execute(
+        collection_movies.insert(),
+        [
+            {"collection_id": cid, "movie_id": m.id}
+            for cid in collection_ids
+            for m in movies
+        ],
+    )
+    await CollectionRepository(session).refresh_cards()
+    await session.commit()
+
+
+@pytest.fixture
+async def catalog(make_sqlite_db):
+    """Seeded SQLite catalog: an HTTP client, its statement log and a session factory."""
+
+    async def _build(n_movies: int):
+        database = await make_sqlite_db(CATALOG_TABLES, lambda session: _seed(session, n_movies))
+
+        async def _override_session():
+            async with database.factory() as session:
+                yield session
+
+        app.dependency_overrides[get_session] = _override_session
+        return (
+            AsyncClient(transport=ASGITransport(app=app), base_url="http://test"),
+            database.statements,
+            database.factory,
+        )
+
+    yield _build
+    app.dependency_overrides.pop(get_session, None)
+
+
+class TestLoaderProfileRegistry:
+    """Test the named loader profile registry"""
+
+    def test_known_profiles_resolve(self):
+        """Every registered profile returns a non-empty tuple of options"""
+        for name in PROFILES:
+            assert load_profile(name)
+
+    def test_unknown_profile_raises(self):
+        """Unknown profile names fail loudly with the known names listed"""
+        with pytest.raises(KeyError, match="movie_card"):
+            load_profile("does_not_exist")
+
+
+class TestImplicitLoadsRaise:
+    """Test that relationships outside a profile are never lazy-loaded"""
+
+    async def test_relationship_without_profile_raises(self, catalog):
+        _, _, session_factory = await catalog(2)
+        async with session_factory() as session:
+            movie = (await session.execute(select(Movie).limit(1))).scalar_one()
+            with pytest.raises(InvalidRequestError):
+                _ = movie.genres
+
+    async def test_relationship_with_profile_is_loaded(self, catalog):
+        _, _, session_factory = await catalog(2)
+        async with session_factory() as session:
+            movie = (
+                await session.execute(select(Movie).options(*load_profile("movie_card")).limit(1))
+            ).scalar_one()
+            assert len(movie.genres) == 1
+            with pytest.raises(InvalidRequestError):
+                _ = movie.people
+
+
+class TestEndpointStatementCounts:
+    """Test that list endpoints issue a bounded number of statements"""
+
+    @pytest.mark.parametrize(
+        "path, budget",
+        [
+            ("/api/v1/movies?limit=50", 2),
+            ("/api/v1/movies/search?q=Movie&limit=50", 2),
+            ("/api/v1/search?q=Movie&limit=50", 4),
+            ("/api/v1/reviews?limit=50", 4),
+            ("/api/v1/collections?limit=50", 3),
+        ],
+    )
+    async def test_statement_budget(self, catalog, path, budget):
+        for n_movies in (3, 30):
+            client, statements, _ = await catalog(n_movies)
+            async with client:
+                statements.clear()
+                response = await client.get(path)
+            assert response.status_code == 200, response.text
+            assert len(statements) <= budget, (n_movies, statements)
+
+    async def test_collection_cards_count_in_sql(self, catalog):
+        client, statements, _ = await catalog(30)
+        async with client:
+            statements.clear()
+            cards = (await client.get("/api/v1/collections?limit=50")).json()
+        assert len(statements) <= 3
+        assert all(c["movieCount"] == 30 for c in cards)
+        assert all(c["posterImages"] == [f"/p/{i}.jpg" for i in range(4)] for c in cards)
+
+
+class TestWatchlistDuplicateAdd:
+    """Test the IntegrityError fallback of POST /watchlist"""
+
+    async def test_racing_add_returns_existing_entry(self, catalog, monkeypatch):
+        client, _, session_factory = await catalog(2)
+        async with session_factory() as session:
+            user = (await session.execute(select(User).limit(1))).scalar_one()
+        app.dependency_overrides[get_current_user] = lambda: user
+        try:
+            async with client:
+                body = {"movieId": "tt0000001", "userId": user.external_id, "status": "want-to-watch"}
+                first = await client.post("/api/v1/watchlist", json=body)
+
+                # A concurrent request inserted the row after our existence check
+                async def _lost_race(self, **kwargs):
+                    raise IntegrityError("INSERT INTO watchlist", {}, Exception("unique violation"))
+
+                monkeypatch.setattr(WatchlistRepository, "create", _lost_race)
+                again = await client.post("/api/v1/watchlist", json=body)
+        finally:
+            app.dependency_overrides.pop(get_current_user, None)
+        assert first.status_code == 200, first.text
+        assert again.status_code == 200, again.text
+        assert again.json()["id"] == first.json()["id"]
+        assert again.json()["movieId"] == "tt0000001"
@@ -0,0 +1,144 @@
+"""
+Unit Tests for the image upload pipeline
+
+This test module verifies that:
+1. Images are decoded, EXIF-rotated, stripped of metadata and resized into
+   WebP variants; non-images and oversized files are rejected
+2. Uploads go through the local storage backend and identical images are
+   deduplicated by content hash
+3. Concurrent uploads of different images each get their own variants
+4. "auto" storage falling back to local disk is flagged outside development/test
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import asyncio
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from PIL import Image
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.dependencies.auth import get_current_user
+from src.main import app
+from src.services.media import VARIANTS, InvalidImage, MediaPipeline, get_media_pipeline, process_image
+from src.config import settings
+from src.services.media_storage import LocalMediaStorage, local_fallback_unintended
+
+
+def _jpeg(color=(200, 30, 30), size=(300, 200), orientation=None) -> bytes:
+    img = Image.new("RGB", size, color)
+    # Mark the left edge so rotation is observable
+    img.paste((0, 0, 255), (0, 0, 20, size[1]))
+    exif = Image.Exif()
+    exif[0x010F] = "TestCam"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    out = io.BytesIO()
+    img.save(out, "JPEG", exif=exif.tobytes())
+    return out.getvalue()
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    pipeline = MediaPipeline(LocalMediaStorage(tmp_path, "/uploads"), workers=2, quality=80, max_pixels=10_000_000)
+    yield pipeline
+    pipeline.shutdown()
+
+
+class TestProcessImage:
+    """Test decoding, metadata stripping and resizing"""
+
+    def test_variants_are_stripped_webp(self):
+        # Orientation 6: stored landscape, displayed rotated 90 degrees clockwise
+        variants = process_image(io.BytesIO(_jpeg(orientation=6)), VARIANTS["banner"], 80, 10_000_000)
+        assert set(variants) == {"lg", "sm"}
+        for name, data in variants.items():
+            with Image.open(io.BytesIO(data)) as img:
+                assert img.format == "WEBP"
+                assert img.size == VARIANTS["banner"][name]
+                assert not img.getexif()
+                assert "icc_profile" not in img.info
+        with Image.open(io.BytesIO(variants["lg"])) as img:
+            # The blue edge was rotated to the top, so it is cropped away by the banner fit
+            assert img.convert("RGB").getpixel((5, 250))[2] < 100
+
+    def test_rejects_bad_input(self):
+        with pytest.raises(InvalidImage):
+            process_image(io.BytesIO(b"definitely not an image"), VARIANTS["avatar"], 80, 10_000_000)
+        with pytest.raises(InvalidImage, match="too large"):
+            process_image(io.BytesIO(_jpeg(size=(400, 400))), VARIANTS["avatar"], 80, 100_000)
+
+
+class TestUploadApi:
+    """Test the avatar/banner endpoints against local storage"""
+
+    @pytest.fixture
+    async def client(self, pipeline):
+        app.dependency_overrides[get_current_user] = lambda: None
+        app.dependency_overrides[get_media_pipeline] = lambda: pipeline
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                yield client
+        finally:
+            app.dependency_overrides.pop(get_current_user, None)
+            app.dependency_overrides.pop(get_media_pipeline, None)
+
+    async def _upload(self, client, kind, data, name="photo.jpg", content_type="image/jpeg"):
+        return await client.post(f"/api/v1/upload/{kind}", files={"file": (name, data, content_type)})
+
+    async def test_dedup_by_content_hash(self, client, tmp_path):
+        data = _jpeg()
+        first = (await self._upload(client, "avatar", data)).json()
+        assert not first["deduplicated"]
+        assert first["url"].startswith("/uploads/avatars/") and first["url"].endswith("/lg.webp")
+        assert first["size"] == len(data)
+        assert set(first["variants"]) == {"lg", "sm"}
+        stored = tmp_path / first["filename"]
+        mtime = stored.stat().st_mtime_ns
+
+        again = (await self._upload(client, "avatar", data, name="renamed.jpg")).json()
+        assert again["deduplicated"]
+        assert again["variants"] == first["variants"]
+        assert stored.stat().st_mtime_ns == mtime
+
+    async def test_concurrent_uploads(self, client, tmp_path):
+        responses = await asyncio.gather(
+            *(self._upload(client, "banner", _jpeg(color=(10 * i, 100, 100))) for i in range(4))
+        )
+        bodies = [r.json() for r in responses]
+        assert len({b["content_hash"] for b in bodies}) == 4
+        assert len(list(tmp_path.glob("banners/*/*.webp"))) == 8
+
+    async def test_rejections(self, client):
+        bad = await self._upload(client, "avatar", b"GIF89a not really", name="x.gif", content_type="image/gif")
+        assert bad.status_code == 400
+        assert (await self._upload(client, "avatar", b"", name="x.png", content_type="image/png")).status_code == 400
+        wrong_type = await self._upload(client, "avatar", _jpeg(), name="x.txt", content_type="text/plain")
+        assert wrong_type.status_code == 400
+
+
+class TestBackendSelection:
+    """Test when the local fallback of "auto" storage is flagged"""
+
+    @pytest.mark.parametrize(
+        "storage,cloud,env,flagged",
+        [
+            ("auto", None, "development", False),
+            ("auto", None, "test", False),
+            ("auto", None, "production", True),
+            ("auto", "demo", "production", False),
+            ("local", None, "production", False),
+        ],
+    )
+    def test_local_fallback(self, monkeypatch, storage, cloud, env, flagged):
+        monkeypatch.setattr(settings, "media_storage", storage)
+        monkeypatch.setattr(settings, "cloudinary_cloud_name", cloud)
+        monkeypatch.setattr(settings, "env", env)
+        assert local_fallback_unintended() is flagged
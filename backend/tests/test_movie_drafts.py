@@ -0,0 +1,133 @@
+"""
+Unit Tests for bulk movie draft publish/discard
+
+This test module verifies that:
+1. Publishing copies every selected movie's draft to its live column with
+   one UPDATE per category, and reports movies without a draft
+2. Discarding clears drafts of the listed movies and reports unknown IDs
+3. Every change, single or bulk, is written to movie_draft_audit
+4. Requests without a selection or with unknown categories are rejected
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.dependencies.admin import require_admin
+from src.main import app
+from src.models import Movie, MovieDraftAudit
+
+
+TABLES = [Movie.__table__, MovieDraftAudit.__table__]
+
+
+async def seed(s):
+    s.add_all([
+        Movie(id=1, external_id="m1", title="One", curation_status="approved",
+              trivia_draft=[{"question": "Q1"}], timeline_draft=[{"title": "Shot"}]),
+        Movie(id=2, external_id="m2", title="Two", curation_status="approved",
+              trivia=[{"question": "old"}], trivia_draft=[{"question": "Q2"}], timeline_draft=[]),
+        Movie(id=3, external_id="m3", title="Three", curation_status="draft", trivia_draft=[{"question": "Q3"}]),
+    ])
+
+
+@pytest.fixture
+async def client(db):
+    app.dependency_overrides[get_session] = lambda: db.session
+    app.dependency_overrides[require_admin] = lambda: SimpleNamespace(id=7)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        app.dependency_overrides.pop(require_admin, None)
+
+
+async def _movie(db, movie_id):
+    return (await db.session.execute(
+        select(Movie).where(Movie.id == movie_id).execution_options(populate_existing=True)
+    )).scalar_one()
+
+
+class TestBulkPublish:
+    """Test set-based publishing"""
+
+    async def test_publish_by_filter(self, client, db):
+        resp = await client.post(
+            "/api/v1/admin/movies/drafts/publish",
+            json={"curation_status": "approved", "categories": ["trivia", "timeline"]},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["outcomes"] == {
+            "m1": {"trivia": "published", "timeline": "published"},
+            # An empty draft is no draft
+            "m2": {"trivia": "published", "timeline": "no_draft"},
+        }
+        assert body["updated"] == 3
+        assert sorted((a["movie_id"], a["category"]) for a in body["audit"]) == [
+            ("m1", "timeline"), ("m1", "trivia"), ("m2", "trivia"),
+        ]
+        assert {a["user_id"] for a in body["audit"]} == {7}
+        assert len([s for s in db.statements if s.startswith("UPDATE movies")]) == 2
+
+        two = await _movie(db, 2)
+        assert two.trivia == [{"question": "Q2"}] and two.trivia_status == "published"
+        assert two.curated_by_id == 7
+        assert (await _movie(db, 3)).trivia is None
+
+    async def test_status_only_categories(self, client, db):
+        db.session.add(Movie(id=4, external_id="m4", title="Four", media_draft=[{"poster_url": "p"}]))
+        await db.session.commit()
+        resp = await client.post(
+            "/api/v1/admin/movies/drafts/publish", json={"movie_ids": ["m4"], "categories": ["media"]}
+        )
+        assert resp.json()["outcomes"] == {"m4": {"media": "published"}}
+        assert (await _movie(db, 4)).media_status == "published"
+
+
+class TestBulkDiscard:
+    """Test set-based discarding"""
+
+    async def test_discard_by_ids(self, client, db):
+        resp = await client.post(
+            "/api/v1/admin/movies/drafts/discard",
+            json={"movie_ids": ["m3", "missing"], "categories": ["trivia"]},
+        )
+        body = resp.json()
+        assert body["outcomes"] == {"m3": {"trivia": "discarded"}}
+        assert body["not_found"] == ["missing"]
+        three = await _movie(db, 3)
+        assert three.trivia_draft is None and three.trivia_status == "draft"
+        # The other movies keep their drafts
+        assert (await _movie(db, 1)).trivia_draft == [{"question": "Q1"}]
+
+
+class TestAuditAndValidation:
+    """Test single-movie audit rows and request validation"""
+
+    async def test_single_publish_is_audited(self, client, db):
+        resp = await client.post("/api/v1/admin/movies/m1/publish/trivia")
+        assert resp.status_code == 200
+        audit = (await db.session.execute(select(MovieDraftAudit))).scalars().all()
+        assert [(a.movie_id, a.category, a.action, a.user_id) for a in audit] == [(1, "trivia", "publish", 7)]
+
+    async def test_rejects_bad_requests(self, client):
+        url = "/api/v1/admin/movies/drafts/publish"
+        assert (await client.post(url, json={"categories": ["trivia"]})).status_code == 400
+        assert (await client.post(url, json={"movie_ids": ["m1"], "categories": ["posters"]})).status_code == 400
+        assert (await client.post(url, json={"movie_ids": ["m1"], "categories": []})).status_code == 422
+        assert (await client.post(
+            "/api/v1/admin/movies/drafts/archive", json={"movie_ids": ["m1"], "categories": ["trivia"]}
+        )).status_code == 404
@@ -0,0 +1,178 @@
+"""
+Unit Tests for the admin movie category export
+
+This test module verifies that:
+1. A movie's genres, people, awards and streaming options load in one query
+   per table, however many categories are exported
+2. Award exports carry the ceremony, year and category names
+3. /export/all streams a ZIP whose files match the single-category exports
+4. POST /admin/movies/export streams every selected movie, batch by batch,
+   as a ZIP or as NDJSON
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import io
+import json
+import sys
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config import settings
+from src.db import get_read_session, get_session
+from src.dependencies.admin import require_admin, require_admin_user
+from src.main import app
+from src.models import (
+    AwardCategory, AwardCeremony, AwardCeremonyYear, AwardNomination, Genre, Movie,
+    MovieStreamingOption, Person, StreamingPlatform, movie_genres, movie_people,
+)
+from src.services.movie_export import CATEGORIES, load_snapshots, stream_zip
+
+
+TABLES = [
+    Movie.__table__, Genre.__table__, movie_genres, Person.__table__, movie_people,
+    AwardCeremony.__table__, AwardCeremonyYear.__table__, AwardCategory.__table__,
+    AwardNomination.__table__, StreamingPlatform.__table__, MovieStreamingOption.__table__,
+]
+
+
+async def seed(s):
+    s.add_all([
+        Movie(id=1, external_id="m1", title="Baahubali", year="2015", language="te",
+              curation_status="approved", trivia=[{"question": "Q", "answer": "A"}]),
+        Movie(id=2, external_id="m2", title="Eega", year="2012", language="te", curation_status="approved"),
+        Movie(id=3, external_id="m3", title="Draft", language="hi", curation_status="draft"),
+        Genre(id=1, slug="action", name="Action"),
+        Person(id=1, external_id="p1", name="S. S. Rajamouli"),
+        Person(id=2, external_id="p2", name="Prabhas"),
+        AwardCeremony(id=1, external_id="nfa", name="National Film Awards"),
+        AwardCeremonyYear(id=1, external_id="nfa-2016", year=2016, ceremony_id=1),
+        AwardCategory(id=1, external_id="nfa-2016-film", name="Best Feature Film", ceremony_year_id=1),
+        AwardNomination(id=1, external_id="n1", nominee_type="movie", nominee_name="Baahubali",
+                        is_winner=True, category_id=1, movie_id=1),
+        StreamingPlatform(id=1, external_id="netflix", name="Netflix"),
+        MovieStreamingOption(id=1, external_id="s1", movie_id=1, platform_id=1, region="IN",
+                             type="subscription", quality="4K"),
+    ])
+    await s.flush()
+    await s.execute(movie_genres.insert(), [{"movie_id": 1, "genre_id": 1}, {"movie_id": 2, "genre_id": 1}])
+    await s.execute(movie_people.insert(), [
+        {"movie_id": 1, "person_id": 1, "role": "director", "character_name": None},
+        {"movie_id": 1, "person_id": 2, "role": "actor", "character_name": "Amarendra"},
+    ])
+
+
+@pytest.fixture
+async def client(db):
+    app.dependency_overrides[get_session] = lambda: db.session
+    app.dependency_overrides[get_read_session] = lambda: db.session
+    app.dependency_overrides[require_admin] = lambda: None
+    app.dependency_overrides[require_admin_user] = lambda: SimpleNamespace(email="admin@iwm.test")
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+    finally:
+        for dep in (get_session, get_read_session, require_admin, require_admin_user):
+            app.dependency_overrides.pop(dep, None)
+
+
+class TestSnapshots:
+    """Test the batched snapshot loader"""
+
+    async def test_one_query_per_table(self, db):
+        movies = [await db.session.get(Movie, 1), await db.session.get(Movie, 2)]
+        db.statements.clear()
+        first, second = await load_snapshots(db.session, movies)
+        assert len(db.statements) == 4
+        assert first.genres == ["Action"] and second.genres == ["Action"]
+        assert first.people == [
+            ("director", {"id": "p1", "name": "S. S. Rajamouli", "image": None}),
+            ("actor", {"id": "p2", "name": "Prabhas", "image": None, "character": "Amarendra"}),
+        ]
+        assert first.streaming[0]["platform"] == "Netflix"
+        assert second.people == [] and second.awards == []
+
+    async def test_only_needed_rows(self, db):
+        movie = await db.session.get(Movie, 1)
+        db.statements.clear()
+        [snapshot] = await load_snapshots(db.session, [movie], categories=["timeline", "trivia"])
+        assert db.statements == []
+        assert snapshot.genres == []
+
+
+class TestSingleMovieExport:
+    """Test the per-movie export endpoints"""
+
+    async def test_awards_have_names(self, client):
+        body = (await client.get("/api/v1/admin/movies/m1/export/awards")).json()
+        assert body["data"]["awards"] == [{
+            "id": "n1", "ceremony": "National Film Awards", "year": 2016, "category": "Best Feature Film",
+            "nominee": "Baahubali", "result": "Winner", "notes": None,
+        }]
+        assert body["metadata"]["updated_by"] == "admin@iwm.test"
+
+    async def test_all_matches_categories(self, client, db):
+        db.statements.clear()
+        resp = await client.get("/api/v1/admin/movies/m1/export/all")
+        assert resp.status_code == 200
+        # The movie and one query per related table
+        assert len(db.statements) == 5
+        archive = zipfile.ZipFile(io.BytesIO(resp.content))
+        assert archive.namelist() == [f"m1/{category}.json" for category in CATEGORIES]
+        for category in ("basic-info", "cast-crew", "trivia", "streaming"):
+            single = (await client.get(f"/api/v1/admin/movies/m1/export/{category}")).json()
+            assert json.loads(archive.read(f"m1/{category}.json"))["data"] == single["data"]
+
+        assert (await client.get("/api/v1/admin/movies/nope/export/all")).status_code == 404
+
+
+class TestBulkExport:
+    """Test the streaming multi-movie export"""
+
+    async def test_zip_by_filter(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "movie_export_batch_size", 1)
+        resp = await client.post("/api/v1/admin/movies/export", json={"curation_status": "approved"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/zip"
+        names = zipfile.ZipFile(io.BytesIO(resp.content)).namelist()
+        assert sorted({name.split("/")[0] for name in names}) == ["m1", "m2"]
+        assert len(names) == 2 * len(CATEGORIES)
+
+    async def test_ndjson_by_ids(self, client):
+        resp = await client.post(
+            "/api/v1/admin/movies/export", json={"movie_ids": ["m3", "m1"], "format": "ndjson"}
+        )
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["movie_id"] for line in lines] == ["m1", "m3"]
+        assert lines[0]["categories"]["basic-info"]["data"]["genres"] == ["Action"]
+        assert lines[1]["categories"]["cast-crew"]["data"]["cast"] == []
+
+    async def test_genre_filter_and_id_limit(self, client, monkeypatch):
+        resp = await client.post(
+            "/api/v1/admin/movies/export", json={"genre": "action", "language": "te", "format": "ndjson"}
+        )
+        assert [json.loads(line)["movie_id"] for line in resp.text.splitlines()] == ["m1", "m2"]
+
+        monkeypatch.setattr(settings, "movie_export_max_ids", 1)
+        resp = await client.post("/api/v1/admin/movies/export", json={"movie_ids": ["m1", "m2"]})
+        assert resp.status_code == 400
+
+    async def test_zip_streams_per_movie(self, db):
+        movies = [await db.session.get(Movie, 1), await db.session.get(Movie, 2)]
+
+        async def snapshots():
+            for snapshot in await load_snapshots(db.session, movies):
+                yield snapshot
+
+        chunks = [chunk async for chunk in stream_zip(snapshots(), updated_by=None)]
+        # One chunk per movie, then the central directory
+        assert len(chunks) == 3
+        assert len(zipfile.ZipFile(io.BytesIO(b"".join(chunks))).namelist()) == 2 * len(CATEGORIES)
@@ -0,0 +1,137 @@
+"""
+Unit Tests for keyset (cursor) pagination
+
+This test module verifies that:
+1. Walking a listing by cursor visits every row exactly once, in the same order
+   as offset paging, across ties and NULL sort values
+2. Cursors are opaque, bound to their sort order, and rejected with 400 when invalid
+3. Offset paging keeps returning bare lists
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.main import app
+from src.models import Genre, Movie, Pulse, User, movie_genres
+from src.repositories.movies import MOVIE_KEYSETS, MovieRepository
+from src.repositories.pagination import InvalidCursor
+from src.repositories.pulse import PulseRepository
+
+
+# Repeated scores and NULLs exercise the tie-break and NULLS LAST branches.
+SCORES = [8.0, None, 7.5, 8.0, 9.1, None, 7.5, 8.0, 6.0, 9.1, None]
+
+TABLES = [Genre.__table__, Movie.__table__, movie_genres, User.__table__, Pulse.__table__]
+
+
+async def seed(s):
+    s.add_all(
+        Movie(id=i, external_id=f"tt{i}", title=f"Movie {i % 4}", year=str(2000 + i % 3), siddu_score=score)
+        for i, score in enumerate(SCORES, start=1)
+    )
+    s.add(User(id=1, external_id="user-1", email="u1@example.com", hashed_password="x", name="U1"))
+    base = datetime.utcnow() - timedelta(hours=1)
+    s.add_all(
+        Pulse(
+            id=i,
+            external_id=f"pulse-{i}",
+            user_id=1,
+            content_text=f"pulse {i}",
+            created_at=base + timedelta(minutes=i // 2),
+            reactions_total=i % 3,
+        )
+        for i in range(1, 10)
+    )
+
+
+async def _walk(fetch, limit):
+    seen, cursor, pages = [], "", 0
+    while True:
+        page = await fetch(cursor, limit)
+        seen.extend(item["id"] for item in page["items"])
+        pages += 1
+        if page["next_cursor"] is None:
+            return seen, pages
+        cursor = page["next_cursor"]
+
+
+class TestKeysetWalk:
+    """Test that cursor pages cover the listing exactly once"""
+
+    @pytest.mark.parametrize("sort_by", sorted(MOVIE_KEYSETS))
+    async def test_movies_match_offset_order(self, session_factory, sort_by):
+        async with session_factory() as s:
+            repo = MovieRepository(s)
+            by_offset = [m["id"] for m in await repo.list(limit=100, sort_by=sort_by or None)]
+            walked, pages = await _walk(
+                lambda cursor, limit: repo.list(limit=limit, sort_by=sort_by or None, cursor=cursor), 3
+            )
+        assert walked == by_offset
+        assert len(walked) == len(SCORES)
+        assert pages == 4
+
+    async def test_nulls_sort_last(self, session_factory):
+        async with session_factory() as s:
+            items = await MovieRepository(s).list(limit=100, sort_by="score")
+        assert [m["sidduScore"] for m in items][-3:] == [None, None, None]
+
+    @pytest.mark.parametrize("filter_type", ["latest", "popular", "trending"])
+    async def test_pulse_feed(self, session_factory, filter_type):
+        async with session_factory() as s:
+            repo = PulseRepository(s)
+            by_offset = [p["id"] for p in await repo.list_feed(filter_type=filter_type, window="30d", limit=100)]
+            walked, _ = await _walk(
+                lambda cursor, limit: repo.list_feed(filter_type=filter_type, window="30d", limit=limit, cursor=cursor), 2
+            )
+        assert walked == by_offset
+        assert sorted(walked) == sorted(f"pulse-{i}" for i in range(1, 10))
+
+
+class TestCursorTokens:
+    """Test cursor validation"""
+
+    async def test_cursor_bound_to_sort(self, session_factory):
+        async with session_factory() as s:
+            repo = MovieRepository(s)
+            page = await repo.list(limit=2, sort_by="score", cursor="")
+            with pytest.raises(InvalidCursor):
+                await repo.list(limit=2, sort_by="alphabetical", cursor=page["next_cursor"])
+            with pytest.raises(InvalidCursor):
+                await repo.list(limit=2, cursor="not-a-cursor")
+
+    async def test_api_envelope_and_bad_cursor(self, session_factory):
+        async def override():
+            async with session_factory() as s:
+                yield s
+
+        app.dependency_overrides[get_session] = override
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                legacy = await client.get("/api/v1/movies", params={"limit": 2})
+                assert isinstance(legacy.json(), list)
+
+                first = await client.get("/api/v1/movies", params={"limit": 2, "cursor": "", "sortBy": "latest"})
+                body = first.json()
+                assert len(body["items"]) == 2 and body["next_cursor"]
+
+                second = await client.get(
+                    "/api/v1/movies", params={"limit": 2, "cursor": body["next_cursor"], "sortBy": "latest"}
+                )
+                assert {m["id"] for m in second.json()["items"]}.isdisjoint(m["id"] for m in body["items"])
+
+                bad = await client.get("/api/v1/movies", params={"cursor": "garbage!!"})
+                assert bad.status_code == 400
+                assert bad.json() == {"detail": "invalid_cursor"}
+        finally:
+            app.dependency_overrides.pop(get_session, None)
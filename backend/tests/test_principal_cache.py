@@ -0,0 +1,278 @@
+"""
+Unit Tests for authenticated principal loading and caching
+
+This test module verifies that:
+1. PrincipalCache honours TTL, LRU bound and per-user invalidation
+2. get_current_principal answers repeated requests from the cache
+3. Role changes become visible after invalidate_principal, and on other
+   workers once their roles_changed_at watermark copy expires
+4. Admin routes authorize from current token role claims without loading the
+   user, and fall back to the database for tokens older than a role change
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, update
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.main import app
+from src.models import User, UserRoleProfile
+from src.security.jwt import create_access_token, create_refresh_token, decode_token
+from src.security.principal import (
+    Principal,
+    PrincipalCache,
+    invalidate_principal,
+    principal_cache,
+    principal_from_claims,
+    role_watermarks,
+    roles_changed,
+    token_claims,
+)
+
+
+TABLES = [User.__table__, UserRoleProfile.__table__]
+
+
+async def seed(s):
+    s.add(User(id=1, external_id="user-1", email="user1@example.com", hashed_password="x", name="User 1"))
+    await s.flush()
+    s.add(UserRoleProfile(user_id=1, role_type="lover", enabled=True, is_default=True))
+    s.add(UserRoleProfile(user_id=1, role_type="admin", enabled=False))
+
+
+def _principal(user_id: int, roles=("lover",)) -> Principal:
+    return Principal(id=user_id, external_id=f"user-{user_id}", active_role="lover", enabled_roles=frozenset(roles))
+
+
+class TestPrincipalCache:
+    """Test the bounded TTL/LRU cache"""
+
+    def test_hit_requires_matching_iat(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        cache.put(100, _principal(1))
+        assert cache.get(1, 100) == _principal(1)
+        assert cache.get(1, 101) is None
+
+    def test_entries_expire(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        with patch("src.security.principal.time.monotonic", return_value=1000.0):
+            cache.put(100, _principal(1))
+        with patch("src.security.principal.time.monotonic", return_value=1059.0):
+            assert cache.get(1, 100) is not None
+        with patch("src.security.principal.time.monotonic", return_value=1061.0):
+            assert cache.get(1, 100) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+        cache.put(1, _principal(1))
+        cache.put(2, _principal(2))
+        cache.get(1, 1)
+        cache.put(3, _principal(3))
+        assert cache.get(1, 1) is not None
+        assert cache.get(2, 2) is None
+        assert cache.get(3, 3) is not None
+
+    def test_invalidate_drops_every_token_of_user(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        cache.put(100, _principal(1))
+        cache.put(200, _principal(1))
+        cache.put(100, _principal(2))
+        cache.invalidate(1)
+        assert cache.get(1, 100) is None
+        assert cache.get(1, 200) is None
+        assert cache.get(2, 100) is not None
+
+    def test_role_flags(self):
+        principal = _principal(1, roles=("lover", "admin"))
+        assert principal.is_admin
+        assert not principal.is_critic
+        assert principal.has_role("lover")
+
+
+@pytest.fixture
+async def auth_app(db):
+    """SQLite-backed app with one user and a statement log."""
+
+    async def _override_session():
+        async with db.factory() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_session
+    principal_cache.clear()
+    role_watermarks.clear()
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client, db.statements, db.factory, 1
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        principal_cache.clear()
+        role_watermarks.clear()
+
+
+class TestCurrentPrincipal:
+    """Test principal resolution through the auth dependencies"""
+
+    async def test_repeated_requests_hit_cache(self, auth_app):
+        client, statements, _, user_id = auth_app
+        headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+
+        statements.clear()
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        first = len(statements)
+
+        statements.clear()
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert len(statements) == first - 2
+        assert all("user_role_profiles" not in s for s in statements)
+
+    async def test_role_change_visible_after_invalidation(self, auth_app):
+        client, _, session_factory, user_id = auth_app
+        headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.json()["is_admin"] is False
+
+        async with session_factory() as session:
+            await session.execute(
+                update(UserRoleProfile)
+                .where(UserRoleProfile.user_id == user_id, UserRoleProfile.role_type == "admin")
+                .values(enabled=True)
+            )
+            await session.commit()
+
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.json()["is_admin"] is False
+
+        invalidate_principal(user_id)
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.json()["is_admin"] is True
+
+    async def test_unknown_user_is_rejected(self, auth_app):
+        client, _, _, _ = auth_app
+        headers = {"Authorization": f"Bearer {create_access_token('999')}"}
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 401
+
+    async def test_roles_changed_bumps_watermark(self, auth_app):
+        client, _, session_factory, user_id = auth_app
+        headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+        assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_admin"] is False
+
+        async with session_factory() as session:
+            await session.execute(
+                update(UserRoleProfile)
+                .where(UserRoleProfile.user_id == user_id, UserRoleProfile.role_type == "admin")
+                .values(enabled=True)
+            )
+            await session.commit()
+            await roles_changed(session, user_id)
+            assert (await session.get(User, user_id)).roles_changed_at is not None
+
+        assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_admin"] is True
+
+    async def test_revocation_on_another_worker(self, auth_app):
+        """A role change written by another worker is seen once the watermark copy expires"""
+        client, statements, session_factory, user_id = auth_app
+        async with session_factory() as session:
+            await session.execute(
+                update(UserRoleProfile)
+                .where(UserRoleProfile.user_id == user_id, UserRoleProfile.role_type == "admin")
+                .values(enabled=True)
+            )
+            await session.commit()
+        headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+        assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_admin"] is True
+
+        # Another worker revokes admin; this worker's caches are untouched
+        async with session_factory() as session:
+            await session.execute(
+                update(UserRoleProfile)
+                .where(UserRoleProfile.user_id == user_id, UserRoleProfile.role_type == "admin")
+                .values(enabled=False)
+            )
+            await session.execute(
+                update(User).where(User.id == user_id).values(roles_changed_at=datetime.utcnow() + timedelta(seconds=1))
+            )
+            await session.commit()
+
+        # Within the watermark TTL the cached principal is still served
+        assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_admin"] is True
+
+        role_watermarks.clear()  # the watermark TTL elapses
+        statements.clear()
+        assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_admin"] is False
+        assert any("roles_changed_at" in s for s in statements)
+
+
+class TestTokenClaims:
+    """Test the claims-based fast path"""
+
+    def _admin_token(self, user_id: int) -> str:
+        return create_access_token(
+            str(user_id),
+            role_profiles=[{"role_type": "lover", "enabled": True}, {"role_type": "admin", "enabled": True}],
+            external_id="user-1",
+            active_role="lover",
+        )
+
+    def test_claims_round_trip(self):
+        principal = _principal(7, roles=("critic", "lover"))
+        payload = decode_token(create_access_token("7", **token_claims(principal)))
+        assert principal_from_claims(payload) == principal
+        assert principal_from_claims(decode_token(create_access_token("7"))) is None
+
+    async def test_admin_route_needs_no_user_load(self, auth_app):
+        client, statements, _, user_id = auth_app
+        headers = {"Authorization": f"Bearer {self._admin_token(user_id)}"}
+
+        statements.clear()
+        assert (await client.get("/api/v1/health/metrics", headers=headers)).status_code == 200
+        # Only the roles_changed_at watermark is read, and then cached
+        assert len(statements) == 1 and "roles_changed_at" in statements[0]
+
+        statements.clear()
+        assert (await client.get("/api/v1/health/metrics", headers=headers)).status_code == 200
+        assert statements == []
+
+    async def test_claims_older_than_role_change_are_not_trusted(self, auth_app):
+        client, _, session_factory, user_id = auth_app
+        # The token claims admin, but was issued before the last role change,
+        # and the database has admin disabled
+        with patch("src.security.jwt._now", return_value=datetime.now().astimezone() - timedelta(seconds=30)):
+            headers = {"Authorization": f"Bearer {self._admin_token(user_id)}"}
+        async with session_factory() as session:
+            await roles_changed(session, user_id)
+
+        assert (await client.get("/api/v1/health/metrics", headers=headers)).status_code == 403
+
+    async def test_deleted_user_is_rejected(self, auth_app):
+        client, _, session_factory, user_id = auth_app
+        headers = {"Authorization": f"Bearer {self._admin_token(user_id)}"}
+        async with session_factory() as session:
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        assert (await client.get("/api/v1/health/metrics", headers=headers)).status_code == 401
+
+    async def test_refresh_issues_claims(self, auth_app):
+        client, _, _, user_id = auth_app
+        response = await client.post("/api/v1/auth/refresh", json={"refresh_token": create_refresh_token(str(user_id))})
+        assert response.status_code == 200
+        principal = principal_from_claims(decode_token(response.json()["access_token"]))
+        assert principal == Principal(id=user_id, external_id="user-1", active_role="lover", enabled_roles=frozenset({"lover"}))
+
+        missing = await client.post("/api/v1/auth/refresh", json={"refresh_token": create_refresh_token("999")})
+        assert missing.status_code == 401
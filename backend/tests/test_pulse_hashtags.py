@@ -0,0 +1,125 @@
+"""
+Unit Tests for incremental trending hashtags
+
+This test module verifies that:
+1. Creating a pulse normalizes its hashtags into pulse_hashtags and counts
+   them in hourly buckets; deleting it uncounts them
+2. Trending hashtags are summed from buckets inside the window, optionally
+   with exponential time decay, without reading pulses
+3. Rankings are cached per window and rebuild() restores both tables
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.models import (
+    Movie, Pulse, PulseHashtag, PulseHashtagBucket, PulseTimelineEntry, User, UserFollow, UserStats,
+)
+from src.repositories.pulse import PulseRepository
+from src.repositories.pulse_hashtags import PulseHashtagRepository, hour_bucket, normalize_hashtags, trending_cache
+
+
+TABLES = [
+    User.__table__, Movie.__table__, Pulse.__table__, UserFollow.__table__, UserStats.__table__,
+    PulseTimelineEntry.__table__, PulseHashtag.__table__, PulseHashtagBucket.__table__,
+]
+
+
+async def seed(s):
+    s.add(User(id=1, external_id="user-1", email="u1@example.com", hashed_password="x", name="U1"))
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    trending_cache.clear()
+    yield
+    trending_cache.clear()
+
+
+async def _buckets(session):
+    rows = await session.execute(select(PulseHashtagBucket.tag, PulseHashtagBucket.count).order_by(PulseHashtagBucket.tag))
+    return dict(rows.all())
+
+
+async def _add_old_bucket(session, tag, hours_ago, count):
+    session.add(PulseHashtagBucket(tag=tag, hour=hour_bucket(datetime.utcnow() - timedelta(hours=hours_ago)), count=count))
+    await session.commit()
+
+
+class TestWritePath:
+    """Test hashtag rows and bucket counters on create/delete"""
+
+    def test_normalize(self):
+        assert normalize_hashtags([" #Dune ", "#dune", "", 3, "#Oscars", "x" * 200]) == ["#Dune", "#Oscars", "x" * 120]
+
+    async def test_create_and_delete(self, session):
+        repo = PulseRepository(session)
+        first = await repo.create(user_id=1, content_text="a", hashtags=["#Dune", " #dune", "#IPL"])
+        await repo.create(user_id=1, content_text="b", hashtags=["#Dune"])
+        await session.commit()
+        assert first["content"]["hashtags"] == ["#Dune", "#IPL"]
+        assert await _buckets(session) == {"#Dune": 2, "#IPL": 1}
+
+        assert await repo.delete(first["id"], 1)
+        await session.commit()
+        assert await _buckets(session) == {"#Dune": 1, "#IPL": 0}
+        tags = (await session.execute(select(PulseHashtag.tag))).scalars().all()
+        assert tags == ["#Dune"]
+
+
+class TestTrending:
+    """Test ranking from buckets"""
+
+    async def test_window_and_decay(self, session):
+        await PulseRepository(session).create(user_id=1, content_text="now", hashtags=["#Fresh"])
+        await session.commit()
+        await _add_old_bucket(session, "#Fresh", 2, 1)
+        await _add_old_bucket(session, "#Stale", 100, 5)
+        await _add_old_bucket(session, "#Ancient", 24 * 40, 50)
+
+        repo = PulseRepository(session)
+        assert await repo.trending_topics(window="24h") == [{"id": 1, "tag": "#Fresh", "count": 2, "category": "movie"}]
+        assert [t["tag"] for t in await repo.trending_topics(window="7d")] == ["#Stale", "#Fresh"]
+
+        trending_cache.clear()
+        decayed = await repo.trending_topics(window="7d", decay=True)
+        # 5 posts four days ago weigh less than 2 within the last hours at a 24h half-life
+        assert [t["tag"] for t in decayed] == ["#Fresh", "#Stale"]
+        assert decayed[1]["count"] == 5
+
+    async def test_reads_only_buckets_and_caches(self, db, session):
+        await PulseRepository(session).create(user_id=1, content_text="x", hashtags=["#Cannes", "#IPL2025"])
+        await session.commit()
+
+        db.statements.clear()
+        repo = PulseRepository(session)
+        first = await repo.trending_topics(window="7d", limit=1)
+        second = await repo.trending_topics(window="7d", limit=5)
+        assert len(db.statements) == 1
+        assert "pulses" not in db.statements[0].replace("pulse_hashtag_buckets", "")
+        assert first == [{"id": 1, "tag": "#Cannes", "count": 1, "category": "event"}]
+        assert [t["category"] for t in second] == ["event", "cricket"]
+
+
+class TestRebuild:
+    """Test rebuilding from pulses.hashtags"""
+
+    async def test_rebuild(self, session):
+        session.add_all([
+            Pulse(external_id="p1", user_id=1, content_text="a", hashtags=["#A", "#a", "#B"]),
+            Pulse(external_id="p2", user_id=1, content_text="b", hashtags=["#A"]),
+            Pulse(external_id="p3", user_id=1, content_text="c", hashtags={"not": "a list"}),
+        ])
+        await session.commit()
+        assert await PulseHashtagRepository(session).rebuild() == 3
+        assert await _buckets(session) == {"#A": 2, "#B": 1}
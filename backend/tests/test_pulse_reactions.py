@@ -0,0 +1,113 @@
+"""
+Unit Tests for atomic Pulse reactions
+
+This test module verifies that:
+1. Reaction counts change with a single UPDATE and concurrent taps from
+   separate sessions are all counted
+2. Decrements stop at zero and keep reactions_total consistent
+3. Feed DTOs read media, hashtags and reactions as stored JSON values
+4. The reaction endpoints validate the reaction type and the pulse
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.dependencies.auth import get_current_user
+from src.main import app
+from src.models import (
+    Movie, Pulse, PulseHashtag, PulseHashtagBucket, PulseTimelineEntry, User, UserFollow, UserStats,
+)
+from src.repositories.pulse import PulseRepository
+
+
+# A file database, so concurrent sessions use separate connections
+SQLITE_ON_DISK = True
+
+TABLES = [
+    User.__table__, Movie.__table__, Pulse.__table__, UserFollow.__table__, UserStats.__table__,
+    PulseTimelineEntry.__table__, PulseHashtag.__table__, PulseHashtagBucket.__table__,
+]
+
+
+async def seed(s):
+    s.add(User(id=1, external_id="user-1", email="u1@example.com", hashed_password="x", name="U1"))
+    s.add(Pulse(
+        id=1, external_id="pulse-1", user_id=1, content_text="hot take",
+        content_media=[{"type": "image", "url": "/a.png"}], hashtags=["#Hot"],
+        reactions_json={"love": 2}, reactions_total=2,
+    ))
+
+
+class TestReact:
+    """Test atomic increments and decrements"""
+
+    async def test_concurrent_taps_are_counted(self, session_factory):
+        async def tap(reaction):
+            async with session_factory() as s:
+                await PulseRepository(s).react("pulse-1", reaction, 1)
+                await s.commit()
+
+        await asyncio.gather(*(tap("fire" if i % 2 else "love") for i in range(20)))
+        async with session_factory() as s:
+            counts = await PulseRepository(s).react("pulse-1", "laugh", 0)
+        assert (counts["love"], counts["fire"], counts["total"]) == (12, 10, 22)
+
+    async def test_single_update_and_floor(self, db, session):
+        counts = await PulseRepository(session).react("pulse-1", "sad", -1)
+        assert len(db.statements) == 1 and db.statements[0].startswith("UPDATE pulses")
+        assert (counts["sad"], counts["total"]) == (0, 2)
+
+        await PulseRepository(session).react("pulse-1", "love", -1)
+        counts = await PulseRepository(session).react("pulse-1", "love", -5)
+        assert (counts["love"], counts["total"]) == (0, 0)
+        assert await PulseRepository(session).react("missing", "love", 1) is None
+        with pytest.raises(ValueError):
+            await PulseRepository(session).react("pulse-1", "meh", 1)
+
+    async def test_dto_uses_stored_json(self, session_factory):
+        async with session_factory() as s:
+            await PulseRepository(s).react("pulse-1", "fire", 1)
+            await s.commit()
+            [item] = await PulseRepository(s).list_feed()
+        assert item["content"]["media"] == [{"type": "image", "url": "/a.png"}]
+        assert item["content"]["hashtags"] == ["#Hot"]
+        assert item["engagement"]["reactions"] == {
+            "love": 2, "fire": 1, "mindblown": 0, "laugh": 0, "sad": 0, "angry": 0, "total": 3,
+        }
+
+
+class TestReactionApi:
+    """Test the reaction endpoints"""
+
+    async def test_endpoints(self, session_factory):
+        async def override():
+            async with session_factory() as s:
+                yield s
+
+        async with session_factory() as s:
+            user = await s.get(User, 1)
+        app.dependency_overrides[get_session] = override
+        app.dependency_overrides[get_current_user] = lambda: user
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                added = await client.post("/api/v1/pulse/pulse-1/reactions/mindblown")
+                assert added.status_code == 200
+                assert added.json()["reactions"]["mindblown"] == 1
+                removed = await client.delete("/api/v1/pulse/pulse-1/reactions/love")
+                assert removed.json()["reactions"]["total"] == 2
+                assert (await client.post("/api/v1/pulse/pulse-1/reactions/meh")).status_code == 400
+                assert (await client.post("/api/v1/pulse/nope/reactions/love")).status_code == 404
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            app.dependency_overrides.pop(get_current_user, None)
@@ -0,0 +1,150 @@
+"""
+Unit Tests for the Pulse "following" timeline
+
+This test module verifies that:
+1. Creating a pulse copies it into each follower's inbox, and deleting it
+   removes the copies
+2. Authors at or above the fan-out threshold are not copied; their pulses
+   are merged into followers' feeds at read time without duplicates
+3. Keyset and offset reads walk the merged feed in order
+4. backfill rebuilds inboxes from user_follows
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config import settings
+from src.models import (
+    Collection, Favorite, Movie, Pulse, PulseHashtag, PulseHashtagBucket, PulseTimelineEntry, Review, User,
+    UserFollow, UserStats, Watchlist,
+)
+from src.repositories.pulse import PulseRepository
+from src.repositories.pulse_timeline import PulseTimelineRepository
+from src.repositories.user_stats import UserStatsRepository
+
+
+TABLES = [
+    User.__table__, Movie.__table__, Pulse.__table__, UserFollow.__table__,
+    UserStats.__table__, PulseTimelineEntry.__table__, PulseHashtag.__table__, PulseHashtagBucket.__table__,
+    # Counted by UserStatsRepository.reconcile
+    Review.__table__, Watchlist.__table__, Favorite.__table__, Collection.__table__,
+]
+
+
+async def seed(s):
+    s.add_all([
+        User(id=i, external_id=f"user-{i}", email=f"u{i}@example.com", hashed_password="x", name=f"U{i}")
+        for i in range(1, 6)
+    ])
+    # user-1 and user-2 follow user-3 and user-4; user-5 follows user-4.
+    # user-4 has three followers, which reaches the threshold of three.
+    s.add_all([
+        UserFollow(follower_id=f, following_id=t)
+        for f, t in ((1, 3), (1, 4), (2, 3), (2, 4), (5, 4))
+    ])
+    await s.flush()
+    await UserStatsRepository(s).reconcile()
+
+
+@pytest.fixture(autouse=True)
+def _fanout_threshold(monkeypatch):
+    monkeypatch.setattr(settings, "pulse_fanout_max_followers", 3)
+
+
+async def _post(session, user_id, text, minutes_ago):
+    dto = await PulseRepository(session).create(user_id=user_id, content_text=text)
+    pulse = (await session.execute(select(Pulse).where(Pulse.external_id == dto["id"]))).scalar_one()
+    pulse.created_at = datetime.utcnow() - timedelta(minutes=minutes_ago)
+    await session.execute(
+        PulseTimelineEntry.__table__.update()
+        .where(PulseTimelineEntry.pulse_id == pulse.id)
+        .values(created_at=pulse.created_at)
+    )
+    await session.commit()
+    return pulse
+
+
+async def _inbox(session, owner_id):
+    return (
+        await session.execute(select(func.count()).where(PulseTimelineEntry.owner_id == owner_id))
+    ).scalar_one()
+
+
+def _texts(items):
+    return [p["content"]["text"] for p in items]
+
+
+class TestFanOut:
+    """Test fan-out on create and cleanup on delete"""
+
+    async def test_copies_to_followers_only(self, session):
+        pulse = await _post(session, 3, "regular", 5)
+        assert await _inbox(session, 1) == 1
+        assert await _inbox(session, 2) == 1
+        assert await _inbox(session, 5) == 0
+
+        assert await PulseRepository(session).delete(pulse.external_id, 3)
+        await session.commit()
+        assert await _inbox(session, 1) == 0
+
+    async def test_high_follower_author_is_skipped(self, session):
+        await _post(session, 4, "celebrity", 5)
+        assert await _inbox(session, 1) == 0
+        assert await _inbox(session, 5) == 0
+
+
+class TestFeedReads:
+    """Test merged keyset and offset reads"""
+
+    async def test_merged_feed_in_order(self, session):
+        for minutes, (author, text) in enumerate([(3, "a"), (4, "b"), (3, "c"), (4, "d"), (5, "e")]):
+            await _post(session, author, text, 10 - minutes)
+        repo = PulseRepository(session)
+
+        walked, cursor = [], ""
+        while cursor is not None:
+            page = await repo.list_feed(filter_type="following", viewer_external_id="user-1", cursor=cursor, limit=2)
+            walked += _texts(page["items"])
+            cursor = page["next_cursor"]
+        assert walked == ["d", "c", "b", "a"]
+
+        assert _texts(await repo.list_feed(filter_type="following", viewer_external_id="user-1", page=2, limit=2)) == ["b", "a"]
+        assert _texts(await repo.list_feed(filter_type="following", viewer_external_id="user-5")) == ["d", "b"]
+        assert await repo.list_feed(filter_type="following", viewer_external_id="user-3") == []
+        assert await repo.list_feed(filter_type="following", viewer_external_id="nobody") == []
+
+    async def test_no_duplicates_after_author_crosses_threshold(self, session):
+        await _post(session, 3, "before", 5)
+        # user-3 gains followers after posting; the pulse is both in the inbox and pulled
+        await session.execute(UserStats.__table__.update().where(UserStats.user_id == 3).values(followers=50))
+        await session.commit()
+        feed = await PulseRepository(session).list_feed(filter_type="following", viewer_external_id="user-1")
+        assert _texts(feed) == ["before"]
+
+
+class TestBackfill:
+    """Test rebuilding inboxes"""
+
+    async def test_backfill_from_follows(self, session):
+        await _post(session, 3, "old", 60)
+        session.add(UserFollow(follower_id=5, following_id=3))
+        await session.commit()
+        assert await _inbox(session, 5) == 0
+
+        written = await PulseTimelineRepository(session).backfill([5])
+        assert written == 1
+        assert await _inbox(session, 5) == 1
+        assert await _inbox(session, 1) == 1  # other inboxes untouched
+
+        await PulseTimelineRepository(session).backfill(days=0)
+        assert await _inbox(session, 1) == 0
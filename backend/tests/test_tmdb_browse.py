@@ -0,0 +1,131 @@
+"""
+Unit Tests for TMDB admin browse pages
+
+This test module verifies that:
+1. "Already imported" flags for a page come from one column-only query
+2. Browse and search pages are cached per (category, page) / search key
+3. The cache is bypassed once cleared, picking up newly imported movies
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config import settings
+from src.db import get_session
+from src.dependencies.admin import require_admin
+from src.main import app
+from src.models import Movie
+from src.routers import tmdb_admin
+from src.routers.tmdb_admin import browse_cache, imported_movie_ids
+
+
+TABLES = [Movie.__table__]
+
+
+async def seed(s):
+    s.add_all([
+        Movie(id=10, external_id="m10", title="Arrival", tmdb_id=329865),
+        Movie(id=11, external_id="m11", title="Dune", tmdb_id=438631),
+        Movie(id=12, external_id="m12", title="Manual entry"),
+    ])
+
+
+@pytest.fixture
+def tmdb(monkeypatch):
+    """Stub TMDB: one page of three results per call, calls recorded."""
+    calls = []
+
+    async def get_json(path, params=None):
+        calls.append((path, dict(params or {})))
+        page = (params or {}).get("page", 1)
+        return {
+            "results": [
+                {"id": 329865, "title": "Arrival", "poster_path": "/a.jpg"},
+                {"id": 438631, "title": "Dune"},
+                {"id": 1000 + page, "title": f"New {page}"},
+            ],
+            "total_results": 60,
+            "total_pages": 3,
+        }
+
+    monkeypatch.setattr(tmdb_admin.tmdb_client, "get_json", get_json)
+    monkeypatch.setattr(settings, "tmdb_api_key", "test-key")
+    monkeypatch.setattr(browse_cache, "ttl_seconds", 60.0)
+    browse_cache.clear()
+    yield calls
+    browse_cache.clear()
+
+
+class TestImportedLookup:
+    """Test the batched tmdb_id lookup"""
+
+    async def test_single_query(self, db, session):
+        got = await imported_movie_ids(session, [329865, 438631, 5, None, 329865])
+        assert got == {329865: 10, 438631: 11}
+        assert len(db.statements) == 1
+        assert "movies.title" not in db.statements[0]
+        assert await imported_movie_ids(session, []) == {}
+
+
+class TestBrowseCache:
+    """Test cached browse and search pages"""
+
+    async def _get(self, client, url, **params):
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    async def test_pages_are_cached_per_key(self, session, tmdb):
+        app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[require_admin] = lambda: None
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                url = "/api/v1/admin/tmdb/new-releases"
+                first = await self._get(client, url, category="popular", page=1)
+                assert [(m["tmdb_id"], m["already_imported"], m["our_movie_id"]) for m in first["movies"]] == [
+                    (329865, True, 10), (438631, True, 11), (1001, False, None),
+                ]
+                assert first["movies"][0]["poster_url"] == "https://image.tmdb.org/t/p/w500/a.jpg"
+
+                assert await self._get(client, url, category="popular", page=1) == first
+                await self._get(client, url, category="popular", page=2)
+                await self._get(client, url, category="upcoming", page=1)
+                assert len(tmdb) == 3
+
+                search = "/api/v1/admin/tmdb/search"
+                await self._get(client, search, query="Dune", page=1)
+                await self._get(client, search, query="dune ", page=1)
+                await self._get(client, search, query="dune", year=2021, page=1)
+                assert len(tmdb) == 5
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            app.dependency_overrides.pop(require_admin, None)
+
+    async def test_clear_picks_up_imports(self, session, tmdb):
+        app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[require_admin] = lambda: None
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                url = "/api/v1/admin/tmdb/new-releases"
+                await self._get(client, url, category="popular", page=1)
+                session.add(Movie(id=13, external_id="m13", title="New 1", tmdb_id=1001))
+                await session.commit()
+                stale = await self._get(client, url, category="popular", page=1)
+                assert stale["movies"][2]["already_imported"] is False
+
+                browse_cache.clear()
+                fresh = await self._get(client, url, category="popular", page=1)
+                assert fresh["movies"][2]["our_movie_id"] == 13
+                assert len(tmdb) == 2
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            app.dependency_overrides.pop(require_admin, None)
@@ -0,0 +1,198 @@
+"""
+Unit Tests for the pooled TMDB client
+
+This test module verifies that:
+1. Movie details are cached by TMDB id, survive a new client via the SQLite
+   file, are refetched once the TTL expires, and expired rows are purged
+2. 429 and 5xx responses are retried with backoff; 404 and exhausted retries
+   raise the matching TMDB errors
+3. The token bucket allows a burst, then spaces requests at the configured
+   rate, which is split across worker processes
+
+All HTTP calls go to an in-process stub of the TMDB API.
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.integrations import tmdb_client as tmdb_module
+from src.integrations.tmdb_client import (
+    TMDBClient,
+    TMDBError,
+    TMDBNotFoundError,
+    TMDBRateLimitError,
+    TMDBResponseCache,
+    TokenBucket,
+)
+
+
+class StubTMDB:
+    """A tiny TMDB API double; ``failures`` queues status codes to return before succeeding."""
+
+    def __init__(self):
+        self.hits = Counter()
+        self.failures: list[int] = []
+        self.app = Starlette(routes=[
+            Route("/3/movie/{movie_id:int}", self.movie),
+            Route("/3/search/movie", self.search),
+        ])
+
+    def _fail(self):
+        if self.failures:
+            code = self.failures.pop(0)
+            return JSONResponse({"status_code": code}, status_code=code, headers={"Retry-After": "0"})
+        return None
+
+    async def movie(self, request):
+        movie_id = request.path_params["movie_id"]
+        self.hits[f"movie:{movie_id}"] += 1
+        assert request.query_params["api_key"] == "test-key"
+        if movie_id == 404:
+            return JSONResponse({"status_message": "not found"}, status_code=404)
+        return self._fail() or JSONResponse({
+            "id": movie_id,
+            "title": f"Stub {movie_id}",
+            "release_date": "2010-07-16",
+            "genres": [{"id": 1, "name": "Drama"}],
+            "credits": {"crew": [{"job": "Director", "name": "Stub Director"}], "cast": []},
+        })
+
+    async def search(self, request):
+        self.hits["search"] += 1
+        return self._fail() or JSONResponse({"results": [{"id": 27205}]})
+
+
+@pytest.fixture
+def stub():
+    return StubTMDB()
+
+
+def _client(stub, cache=None, **kwargs):
+    kwargs.setdefault("max_retries", 2)
+    return TMDBClient(
+        "test-key",
+        base_url="http://tmdb.test/3",
+        backoff_seconds=0,
+        cache=cache,
+        transport=httpx.ASGITransport(app=stub.app),
+        **kwargs,
+    )
+
+
+class TestCache:
+    """Test the TTL response cache"""
+
+    async def test_details_cached_across_clients(self, stub, tmp_path):
+        path = str(tmp_path / "tmdb.sqlite")
+        client = _client(stub, TMDBResponseCache(path, ttl_seconds=60))
+        try:
+            movie = await client.search_movie("Inception")
+            assert (movie["tmdb_id"], movie["title"], movie["directors"][0]["name"]) == (27205, "Stub 27205", "Stub Director")
+            await client.fetch_movie_by_id(27205)
+        finally:
+            await client.aclose()
+        assert stub.hits == Counter({"search": 1, "movie:27205": 1})
+
+        # A new process starts warm from the SQLite file
+        restarted = _client(stub, TMDBResponseCache(path, ttl_seconds=60))
+        try:
+            assert (await restarted.fetch_movie_by_id(27205))["title"] == "Stub 27205"
+        finally:
+            await restarted.aclose()
+        assert stub.hits["movie:27205"] == 1
+
+    async def test_expired_entries_refetched(self, stub, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(tmdb_module.time, "time", lambda: now[0])
+        client = _client(stub, TMDBResponseCache(None, ttl_seconds=60))
+        try:
+            await client.fetch_movie_by_id(1)
+            now[0] += 59
+            await client.fetch_movie_by_id(1)
+            assert stub.hits["movie:1"] == 1
+            now[0] += 2
+            await client.fetch_movie_by_id(1)
+            assert stub.hits["movie:1"] == 2
+        finally:
+            await client.aclose()
+
+
+    async def test_expired_rows_are_purged(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(tmdb_module.time, "time", lambda: now[0])
+        path = str(tmp_path / "tmdb.sqlite")
+        cache = TMDBResponseCache(path, ttl_seconds=60)
+        try:
+            await cache.set("movie:1", {"id": 1})
+            now[0] += tmdb_module.CACHE_PURGE_INTERVAL_SECONDS
+            await cache.set("movie:2", {"id": 2})
+        finally:
+            cache.close()
+        with sqlite3.connect(path) as conn:
+            assert [k for (k,) in conn.execute("SELECT key FROM tmdb_responses")] == ["movie:2"]
+
+
+class TestRetries:
+    """Test retry and error mapping"""
+
+    async def test_transient_errors_retried(self, stub):
+        stub.failures = [429, 503]
+        client = _client(stub)
+        try:
+            assert (await client.fetch_movie_by_id(7))["tmdb_id"] == 7
+        finally:
+            await client.aclose()
+        assert stub.hits["movie:7"] == 3
+
+    @pytest.mark.parametrize("code, error", [(429, TMDBRateLimitError), (502, TMDBError)])
+    async def test_exhausted_retries_raise(self, stub, code, error):
+        stub.failures = [code] * 5
+        client = _client(stub)
+        try:
+            with pytest.raises(error):
+                await client.fetch_movie_by_id(7)
+        finally:
+            await client.aclose()
+        assert stub.hits["movie:7"] == 3
+
+    async def test_not_found_is_not_retried(self, stub):
+        client = _client(stub)
+        try:
+            with pytest.raises(TMDBNotFoundError):
+                await client.fetch_movie_by_id(404)
+        finally:
+            await client.aclose()
+        assert stub.hits["movie:404"] == 1
+
+
+class TestTokenBucket:
+    """Test request pacing"""
+
+    def test_burst_then_rate(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=10, capacity=3, clock=lambda: now[0])
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert [round(bucket.reserve(), 3) for _ in range(2)] == [0.1, 0.2]
+        now[0] = 1.0
+        # The debt is repaid and the bucket refills up to its capacity only
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() > 0
+
+    def test_budget_split_across_workers(self):
+        bucket = tmdb_module.tmdb_client.rate_limit
+        workers = tmdb_module.settings.worker_processes
+        assert bucket.rate * workers == pytest.approx(tmdb_module.settings.tmdb_rate_limit_per_second)
@@ -0,0 +1,190 @@
+"""
+Unit Tests for bulk TMDB import jobs
+
+This test module verifies that:
+1. A job for explicit ids fetches details with bounded concurrency, shares
+   genres and people across the batch and reports the outcome per id
+2. Movies already imported are skipped, and TMDB ids are stored on new rows
+3. List jobs read the requested page range, clamped to TMDB's total pages
+4. The admin endpoints start a job and report it from background_jobs
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config import settings
+from src.dependencies.admin import require_admin
+from src.integrations.tmdb_client import TMDBNotFoundError, _transform_tmdb_response
+from src.main import app
+from src.models import (
+    AwardCategory,
+    AwardCeremony,
+    AwardCeremonyYear,
+    AwardNomination,
+    BackgroundJob,
+    Genre,
+    GenreStatsSnapshot,
+    Movie,
+    MovieStreamingOption,
+    Person,
+    StreamingPlatform,
+    movie_genres,
+    movie_people,
+)
+from src.services import tmdb_import as tmdb_import_module
+from src.services.tmdb_import import TMDBImportJobRegistry, tmdb_import_jobs
+
+
+TABLES = [
+    Genre.__table__,
+    Movie.__table__,
+    Person.__table__,
+    movie_genres,
+    movie_people,
+    StreamingPlatform.__table__,
+    MovieStreamingOption.__table__,
+    AwardCeremony.__table__,
+    AwardCeremonyYear.__table__,
+    AwardCategory.__table__,
+    AwardNomination.__table__,
+    GenreStatsSnapshot.__table__,
+    BackgroundJob.__table__,
+]
+
+
+def _details(tmdb_id: int) -> dict:
+    return {
+        "id": tmdb_id,
+        "title": f"Film {tmdb_id}",
+        "release_date": "2023-05-01",
+        "original_language": "te",
+        "genres": [{"id": 18, "name": "Drama"}, {"id": 28, "name": "Action"}],
+        "credits": {
+            "crew": [{"name": "Shared Director", "job": "Director"}],
+            "cast": [{"name": "Shared Star", "character": f"Hero {tmdb_id}"}, {"name": None}],
+        },
+    }
+
+
+@pytest.fixture
+def tmdb(monkeypatch):
+    """Stub TMDB: details for any id except 404s, three-page lists; in-flight requests tracked."""
+    state = {"in_flight": 0, "peak": 0, "details": [], "pages": []}
+
+    async def fetch_movie_by_id(tmdb_id):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            state["details"].append(tmdb_id)
+            if tmdb_id == 404:
+                raise TMDBNotFoundError("gone")
+            return _transform_tmdb_response(_details(tmdb_id))
+        finally:
+            state["in_flight"] -= 1
+
+    async def get_json(path, params=None):
+        state["pages"].append((path, dict(params or {})))
+        page = params["page"]
+        return {"results": [{"id": page * 10 + i} for i in range(2)], "total_pages": 3}
+
+    monkeypatch.setattr(tmdb_import_module.tmdb_client, "fetch_movie_by_id", fetch_movie_by_id)
+    monkeypatch.setattr(tmdb_import_module.tmdb_client, "get_json", get_json)
+    return state
+
+
+def _registry(session_factory, concurrency=3):
+    return TMDBImportJobRegistry(
+        concurrency=concurrency, queue_batches=2, max_errors=10, history=5, stale_after=300, session_factory=session_factory
+    )
+
+
+async def _wait(job, timeout=5.0):
+    await asyncio.wait_for(asyncio.shield(job.task), timeout)
+    return job.report()
+
+
+async def _scalar(session_factory, stmt):
+    async with session_factory() as s:
+        return (await s.execute(stmt)).scalar_one()
+
+
+class TestIdJob:
+    """Test a job for explicit TMDB ids"""
+
+    async def test_imports_with_bounded_concurrency(self, session_factory, tmdb):
+        async with session_factory() as s:
+            s.add(Movie(external_id="local-7", title="Already here", tmdb_id=7))
+            await s.commit()
+
+        job = await _registry(session_factory).submit(tmdb_ids=[1, 2, 3, 7, 404, 4, 5, 2], batch_size=2)
+        report = await _wait(job)
+
+        assert report["status"] == "completed", report["error"]
+        assert (report["total"], report["imported"], report["skipped"], report["not_found"]) == (7, 5, 1, 1)
+        assert report["processed"] == 7
+        assert report["items"] == {
+            "1": "imported", "2": "imported", "3": "imported", "4": "imported", "5": "imported",
+            "7": "skipped", "404": "not_found",
+        }
+        assert 7 not in tmdb["details"] and tmdb["peak"] <= 3
+        assert await _scalar(session_factory, select(Movie.id).where(Movie.tmdb_id == 5)) is not None
+        assert await _scalar(session_factory, select(func.count()).select_from(Person)) == 2
+        assert await _scalar(session_factory, select(func.count()).select_from(Genre)) == 2
+        assert await _scalar(session_factory, select(func.count()).select_from(movie_people)) == 10
+
+        again = await _wait(await _registry(session_factory).submit(tmdb_ids=[1, 2]))
+        assert (again["imported"], again["skipped"]) == (0, 2)
+
+
+class TestListJob:
+    """Test a job for a TMDB list page range"""
+
+    async def test_page_range_is_clamped(self, session_factory, tmdb):
+        job = await _registry(session_factory).submit(
+            category="discover", start_page=2, end_page=9, list_params={"with_original_language": "te"}
+        )
+        report = await _wait(job)
+
+        assert report["status"] == "completed", report["error"]
+        assert sorted(p["page"] for _, p in tmdb["pages"]) == [2, 3]
+        assert all(path == "/discover/movie" and p["with_original_language"] == "te" for path, p in tmdb["pages"])
+        assert sorted(int(i) for i in report["items"]) == [20, 21, 30, 31]
+        assert report["filename"] == "tmdb discover pages 2-9"
+
+
+class TestBulkImportApi:
+    """Test the start and status endpoints"""
+
+    async def test_start_and_poll(self, session_factory, tmdb, monkeypatch):
+        monkeypatch.setattr(tmdb_import_jobs, "_session_factory", session_factory)
+        monkeypatch.setattr(settings, "tmdb_api_key", "test-key")
+        app.dependency_overrides[require_admin] = lambda: None
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                started = await client.post("/api/v1/admin/tmdb/import/bulk", json={"tmdb_ids": [1, 404]})
+                assert started.status_code == 202
+                job_id = started.json()["id"]
+
+                await _wait(tmdb_import_jobs.get(job_id))
+                body = (await client.get(f"/api/v1/admin/tmdb/import/jobs/{job_id}")).json()
+                assert (body["status"], body["imported"], body["not_found"]) == ("completed", 1, 1)
+                assert body["items"] == {"1": "imported", "404": "not_found"}
+
+                assert (await client.post("/api/v1/admin/tmdb/import/bulk", json={})).status_code == 400
+                bad_range = {"category": "popular", "start_page": 3, "end_page": 2}
+                assert (await client.post("/api/v1/admin/tmdb/import/bulk", json=bad_range)).status_code == 400
+                assert (await client.get("/api/v1/admin/tmdb/import/jobs/nope")).status_code == 404
+        finally:
+            app.dependency_overrides.pop(require_admin, None)
@@ -0,0 +1,152 @@
+"""
+Unit Tests for the user_stats counters table
+
+This test module verifies that:
+1. Review, watchlist, favorite and collection write paths keep the counters
+   in step with the rows they add and remove
+2. GET /users/{username}/stats answers from a single statement, including
+   follower/following counts
+3. reconcile rebuilds the counters from the source tables
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import update
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.main import app
+from src.models import (
+    Collection,
+    Favorite,
+    Movie,
+    Person,
+    Review,
+    User,
+    UserFollow,
+    UserReviewStats,
+    MovieReviewStats,
+    UserStats,
+    Watchlist,
+    collection_movies,
+)
+from src.repositories.collections import CollectionRepository
+from src.repositories.favorites import FavoriteRepository
+from src.repositories.reviews import ReviewRepository
+from src.repositories.user_stats import UserStatsRepository
+from src.repositories.watchlist import WatchlistRepository
+
+
+TABLES = [
+    User.__table__, Movie.__table__, Person.__table__, Review.__table__, UserReviewStats.__table__,
+    MovieReviewStats.__table__, Watchlist.__table__, Favorite.__table__, Collection.__table__,
+    collection_movies, UserFollow.__table__, UserStats.__table__,
+]
+
+
+async def seed(s):
+    s.add_all([
+        User(id=1, external_id="user-1", email="ana@example.com", hashed_password="x", name="Ana"),
+        User(id=2, external_id="user-2", email="ben@example.com", hashed_password="x", name="Ben"),
+        User(id=3, external_id="user-3", email="cy@example.com", hashed_password="x", name="Cy"),
+    ])
+    s.add_all([Movie(id=i, external_id=f"m{i}", title=f"Movie {i}") for i in (1, 2)])
+    s.add(Person(id=1, external_id="p1", name="Someone"))
+
+
+class TestWritePaths:
+    """Test that each write path moves its counter"""
+
+    async def test_counters_follow_writes(self, session):
+        stats = UserStatsRepository(session)
+        review = await ReviewRepository(session).create("m1", "user-1", 8.0, "Great")
+        await ReviewRepository(session).create("m2", "user-1", 6.0, "Fine")
+        item = await WatchlistRepository(session).create("m1", "user-1")
+        await WatchlistRepository(session).create("m1", "user-1")  # idempotent re-add
+        fav = await FavoriteRepository(session).create(1, "movie", movie_id="m2")
+        await FavoriteRepository(session).create(1, "person", person_id="p1")
+        coll = await CollectionRepository(session).create(1, "Mine")
+        await CollectionRepository(session).import_collection(coll["id"], 2)
+        await session.commit()
+
+        assert await stats.get(1) == {
+            "reviews": 2, "watchlist": 1, "favorites": 1, "collections": 1, "followers": 0, "following": 0,
+        }
+        assert (await stats.get(2))["collections"] == 1
+
+        await ReviewRepository(session).delete(review["id"], 1)
+        await WatchlistRepository(session).delete(item["id"])
+        await FavoriteRepository(session).delete(fav["id"], 1)
+        await CollectionRepository(session).delete_collection(coll["id"], 1)
+        await session.commit()
+        assert await stats.get(1) == {
+            "reviews": 1, "watchlist": 0, "favorites": 0, "collections": 0, "followers": 0, "following": 0,
+        }
+
+    async def test_rollback_discards_counters(self, session):
+        await WatchlistRepository(session).create("m1", "user-1")
+        await session.rollback()
+        assert (await UserStatsRepository(session).get(1))["watchlist"] == 0
+
+    async def test_unknown_counter(self, session):
+        with pytest.raises(ValueError):
+            await UserStatsRepository(session).apply(1, likes=1)
+
+
+class TestStatsEndpoint:
+    """Test the profile stats endpoint"""
+
+    async def test_single_statement_with_follows(self, db, session):
+        session.add_all([
+            UserFollow(follower_id=1, following_id=2),
+            UserFollow(follower_id=3, following_id=2),
+            UserFollow(follower_id=2, following_id=1),
+        ])
+        await session.commit()
+        await UserStatsRepository(session).reconcile()
+
+        async def override():
+            async with db.factory() as s:
+                yield s
+
+        app.dependency_overrides[get_session] = override
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                db.statements.clear()
+                ben = await client.get("/api/v1/users/ben/stats")
+                cy = await client.get("/api/v1/users/cy/stats")
+                missing = await client.get("/api/v1/users/nobody/stats")
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+        assert ben.json() == {
+            "reviews": 0, "watchlist": 0, "favorites": 0, "collections": 0, "following": 1, "followers": 2,
+        }
+        assert cy.json()["following"] == 1
+        assert missing.status_code == 404
+        assert len(db.statements) == 3
+
+
+class TestReconcile:
+    """Test rebuilding counters from the source tables"""
+
+    async def test_repairs_drift(self, session):
+        await ReviewRepository(session).create("m1", "user-1", 7.0, "Good")
+        await CollectionRepository(session).create(1, "Mine")
+        session.add(UserFollow(follower_id=2, following_id=1))
+        await session.execute(update(UserStats).values(reviews=40, collections=0))
+        await session.commit()
+
+        assert await UserStatsRepository(session).reconcile() == 3
+        assert await UserStatsRepository(session).get(1) == {
+            "reviews": 1, "watchlist": 0, "favorites": 0, "collections": 1, "followers": 1, "following": 0,
+        }
+        assert (await UserStatsRepository(session).get(2))["following"] == 1
@@ -0,0 +1,124 @@
+"""
+Unit Tests for VisualTreatsRepository
+
+This test module verifies that:
+1. Search and decade filters run in SQL, so LIMIT/OFFSET pages are full
+2. Tag filters match several tags without duplicating a treat
+3. Facet counts per category, tag, director, cinematographer and decade
+   follow the active filters, and the API returns them only on request
+
+Author: IWM Development Team
+Date: 2026-10-18
+"""
+
+import sys
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.db import get_session
+from src.main import app
+from src.models import Movie, Scene, VisualTreat, VisualTreatTagLookup, visual_treat_tags
+from src.repositories.visual_treats import VisualTreatsRepository
+
+
+TABLES = [
+    Movie.__table__, Scene.__table__, VisualTreatTagLookup.__table__,
+    VisualTreat.__table__, visual_treat_tags,
+]
+
+
+async def seed(s):
+    s.add_all([
+        Movie(id=1, external_id="m1", title="Blade Runner", year="1982"),
+        Movie(id=2, external_id="m2", title="Dune", year="2021"),
+        Movie(id=3, external_id="m3", title="Chungking Express", year="1994"),
+    ])
+    neon, rain, desert = (
+        VisualTreatTagLookup(id=1, name="neon"),
+        VisualTreatTagLookup(id=2, name="rain"),
+        VisualTreatTagLookup(id=3, name="desert"),
+    )
+    s.add_all([
+        VisualTreat(id=1, external_id="v1", title="Tyrell pyramid", category="Lighting", director="Ridley Scott",
+                    cinematographer="Jordan Cronenweth", likes=90, views=10, movie_id=1, tags=[neon, rain]),
+        VisualTreat(id=2, external_id="v2", title="Spinner flight", category="Composition", director="Ridley Scott",
+                    cinematographer="Jordan Cronenweth", likes=80, views=20, movie_id=1, tags=[neon]),
+        VisualTreat(id=3, external_id="v3", title="Arrakis dunes", category="Composition",
+                    description="Endless sand", director="Denis Villeneuve", cinematographer="Greig Fraser",
+                    likes=70, views=30, movie_id=2, tags=[desert]),
+        VisualTreat(id=4, external_id="v4", title="Midnight Express", category="Lighting", director="Wong Kar-wai",
+                    cinematographer="Christopher Doyle", likes=60, views=40, movie_id=3, tags=[neon, rain]),
+        VisualTreat(id=5, external_id="v5", title="Unlinked still", category="Color", likes=50, views=50),
+    ])
+
+
+class TestFilters:
+    """Test that filters run before pagination"""
+
+    async def test_search_pages_are_full(self, session):
+        repo = VisualTreatsRepository(session)
+        # "neon" only appears in tags, so every match comes from the EXISTS clause
+        first = await repo.list_treats(search="neon", page=1, page_size=2)
+        second = await repo.list_treats(search="neon", page=2, page_size=2)
+        assert [t["id"] for t in first] == ["v1", "v2"]
+        assert [t["id"] for t in second] == ["v4"]
+        assert [t["id"] for t in await repo.list_treats(search="SAND")] == ["v3"]
+        assert [t["id"] for t in await repo.list_treats(search="runner")] == ["v1", "v2"]
+
+    async def test_decades(self, session):
+        repo = VisualTreatsRepository(session)
+        assert [t["id"] for t in await repo.list_treats(decades=["1980s"], page=1, page_size=1)] == ["v1"]
+        got = await repo.list_treats(decades=["1990s", "2020s"], sort_by="oldest")
+        assert [t["id"] for t in got] == ["v4", "v3"]
+        assert await repo.list_treats(decades=["eighties"]) == []
+
+    async def test_treats_without_movie_sort_last(self, session):
+        repo = VisualTreatsRepository(session)
+        assert [t["id"] for t in await repo.list_treats(sort_by="recent")] == ["v3", "v4", "v2", "v1", "v5"]
+        assert [t["id"] for t in await repo.list_treats(sort_by="oldest")][-1] == "v5"
+
+    async def test_tags_do_not_duplicate(self, session):
+        repo = VisualTreatsRepository(session)
+        got = await repo.list_treats(tags=["neon", "rain"], page=1, page_size=3)
+        assert [t["id"] for t in got] == ["v1", "v2", "v4"]
+        assert sorted(got[0]["tags"]) == ["neon", "rain"]
+
+
+class TestFacets:
+    """Test aggregate facet counts"""
+
+    async def test_counts_follow_filters(self, session):
+        repo = VisualTreatsRepository(session)
+        facets = await repo.facets()
+        assert facets["categories"] == [
+            {"value": "Composition", "count": 2}, {"value": "Lighting", "count": 2}, {"value": "Color", "count": 1},
+        ]
+        assert facets["tags"][0] == {"value": "neon", "count": 3}
+        assert facets["decades"] == [
+            {"value": "1980s", "count": 2}, {"value": "1990s", "count": 1}, {"value": "2020s", "count": 1},
+        ]
+        assert {"value": "Ridley Scott", "count": 2} in facets["directors"]
+
+        lit = await repo.facets(categories=["Lighting"])
+        assert lit["cinematographers"] == [
+            {"value": "Christopher Doyle", "count": 1}, {"value": "Jordan Cronenweth", "count": 1},
+        ]
+        assert lit["tags"] == [{"value": "neon", "count": 2}, {"value": "rain", "count": 2}]
+
+    async def test_api_envelope(self, session):
+        app.dependency_overrides[get_session] = lambda: session
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                plain = await client.get("/api/v1/visual-treats", params={"decades": "1980s"})
+                assert [t["id"] for t in plain.json()] == ["v1", "v2"]
+                body = (await client.get(
+                    "/api/v1/visual-treats", params={"decades": "1980s", "facets": "true"}
+                )).json()
+                assert [t["id"] for t in body["items"]] == ["v1", "v2"]
+                assert body["facets"]["decades"] == [{"value": "1980s", "count": 2}]
+        finally:
+            app.dependency_overrides.pop(get_session, None)
@@ -0,0 +1,57 @@
+"""restore_critic_analytics_unique
+
+Revision ID: 47846c80c7b2
+Revises: 51f5e40e54ae
+Create Date: 2026-10-18 11:00:00.000000
+
+The engagement buffer upserts one critic_analytics row per critic per day on
+(critic_id, date). That constraint was dropped by 1131c429e4be; collapse any
+duplicate days onto the lowest id and put it back.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '47846c80c7b2'
+down_revision: Union[str, Sequence[str], None] = '51f5e40e54ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        UPDATE critic_analytics keep
+        SET total_views = agg.total_views,
+            total_likes = agg.total_likes,
+            total_comments = agg.total_comments,
+            total_shares = agg.total_shares,
+            new_followers = agg.new_followers
+        FROM (
+            SELECT critic_id, date, MIN(id) AS id,
+                   SUM(total_views) AS total_views, SUM(total_likes) AS total_likes,
+                   SUM(total_comments) AS total_comments, SUM(total_shares) AS total_shares,
+                   SUM(new_followers) AS new_followers
+            FROM critic_analytics
+            GROUP BY critic_id, date
+            HAVING COUNT(*) > 1
+        ) agg
+        WHERE keep.id = agg.id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM critic_analytics a
+        USING critic_analytics b
+        WHERE a.critic_id = b.critic_id AND a.date = b.date AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint('uq_critic_analytics_date', 'critic_analytics', ['critic_id', 'date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_critic_analytics_date', 'critic_analytics', type_='unique')
@@ -0,0 +1,42 @@
+"""add_genre_stats_snapshots
+
+Revision ID: 51f5e40e54ae
+Revises: ff7cfc4ddf55
+Create Date: 2026-10-18 10:00:00.000000
+
+Precomputed genre-page statistics, one JSONB document per genre, plus an index
+on movie_genres.genre_id for the per-genre aggregates that build them.
+Snapshots are filled lazily on first view or by scripts/refresh_genre_stats.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '51f5e40e54ae'
+down_revision: Union[str, Sequence[str], None] = 'ff7cfc4ddf55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'genre_stats_snapshots',
+        sa.Column('genre_id', sa.Integer(), nullable=False),
+        sa.Column('total_movies', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('statistics', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['genre_id'], ['genres.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('genre_id')
+    )
+    op.create_index(op.f('ix_movie_genres_genre_id'), 'movie_genres', ['genre_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_movie_genres_genre_id'), table_name='movie_genres')
+    op.drop_table('genre_stats_snapshots')
@@ -0,0 +1,70 @@
+"""add_search_indexes
+
+Revision ID: 8d3f0b6c2a41
+Revises: 47846c80c7b2
+Create Date: 2026-10-18 12:00:00.000000
+
+Full-text and trigram search support for SearchRepository:
+generated, weighted tsvector columns on movies and people with GIN indexes,
+and pg_trgm GIN indexes for typo-tolerant / substring title and name matches.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f0b6c2a41'
+down_revision: Union[str, Sequence[str], None] = '47846c80c7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MOVIE_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(tagline, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(overview, '')), 'C')"
+)
+PERSON_VECTOR = "to_tsvector('simple', coalesce(name, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        'movies',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(MOVIE_VECTOR, persisted=True), nullable=True),
+    )
+    op.add_column(
+        'people',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(PERSON_VECTOR, persisted=True), nullable=True),
+    )
+
+    op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_people_search_vector', 'people', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_movies_title_trgm', 'movies', ['title'], unique=False,
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_people_name_trgm', 'people', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_genres_name_trgm', 'genres', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_genres_name_trgm', table_name='genres')
+    op.drop_index('ix_people_name_trgm', table_name='people')
+    op.drop_index('ix_movies_title_trgm', table_name='movies')
+    op.drop_index('ix_people_search_vector', table_name='people')
+    op.drop_index('ix_movies_search_vector', table_name='movies')
+    op.drop_column('people', 'search_vector')
+    op.drop_column('movies', 'search_vector')
@@ -0,0 +1,57 @@
+"""add_user_stats
+
+Revision ID: a7d2e5f9c184
+Revises: f3c9a1e7d426
+Create Date: 2026-10-18 20:00:00.000000
+
+Per-user profile counters (reviews, watchlist, movie favorites, collections,
+followers, following) so the profile stats endpoint is a primary-key read.
+Existing users are backfilled from the source tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2e5f9c184'
+down_revision: Union[str, Sequence[str], None] = 'f3c9a1e7d426'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('reviews', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('watchlist', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('favorites', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('collections', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('followers', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('following', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.execute(
+        """
+        INSERT INTO user_stats (user_id, reviews, watchlist, favorites, collections, followers, following, updated_at)
+        SELECT u.id,
+            (SELECT count(*) FROM reviews r WHERE r.user_id = u.id),
+            (SELECT count(*) FROM watchlist w WHERE w.user_id = u.id),
+            (SELECT count(*) FROM favorites f WHERE f.user_id = u.id AND f.type = 'movie'),
+            (SELECT count(*) FROM collections c WHERE c.user_id = u.id),
+            (SELECT count(*) FROM user_follows uf WHERE uf.following_id = u.id),
+            (SELECT count(*) FROM user_follows uf WHERE uf.follower_id = u.id),
+            now() AT TIME ZONE 'utc'
+        FROM users u
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_stats')
@@ -0,0 +1,56 @@
+"""use_english_config_for_movie_titles
+
+Revision ID: a7e2d5c8b913
+Revises: f1c8d3e6a274
+Create Date: 2026-10-19 12:00:00.000000
+
+movies.search_vector indexed titles with the 'simple' config while
+movie_search queries it with websearch_to_tsquery('english'), so stemmed
+query lexemes ("running" -> "run") never matched a title. Rebuild the
+generated column with 'english' for the title as well, so all three
+weights and the query use one config.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e2d5c8b913'
+down_revision: Union[str, Sequence[str], None] = 'f1c8d3e6a274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _movie_vector(title_config: str) -> str:
+    return (
+        f"setweight(to_tsvector('{title_config}', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(tagline, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(overview, '')), 'C')"
+    )
+
+
+def _rebuild(title_config: str) -> None:
+    # A generated column's expression can't be altered in place before
+    # Postgres 17; dropping the column also drops its GIN index.
+    op.drop_column('movies', 'search_vector')
+    op.add_column(
+        'movies',
+        sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(_movie_vector(title_config), persisted=True), nullable=True,
+        ),
+    )
+    op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild('english')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild('simple')
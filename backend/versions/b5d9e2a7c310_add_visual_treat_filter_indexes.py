@@ -0,0 +1,61 @@
+"""add_visual_treat_filter_indexes
+
+Revision ID: b5d9e2a7c310
+Revises: e7b2f4c81d09
+Create Date: 2026-10-18 15:00:00.000000
+
+Indexes for the SQL-side visual treats filters (VisualTreatsRepository):
+btree indexes for the equality filters, sort columns and tag EXISTS lookups,
+pg_trgm GIN indexes so ``ILIKE '%q%'`` search can use an index, and an index
+on movies.year for the decade range filter.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d9e2a7c310'
+down_revision: Union[str, Sequence[str], None] = 'e7b2f4c81d09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BTREE = [
+    ('visual_treats', 'category'),
+    ('visual_treats', 'director'),
+    ('visual_treats', 'cinematographer'),
+    ('visual_treats', 'likes'),
+    ('visual_treats', 'views'),
+    ('visual_treats', 'movie_id'),
+    ('visual_treats', 'scene_id'),
+    ('visual_treat_tags', 'tag_id'),
+    ('movies', 'year'),
+]
+TRIGRAM = [
+    ('visual_treats', 'title'),
+    ('visual_treats', 'description'),
+    ('visual_treats', 'director'),
+    ('visual_treat_tag_lookup', 'name'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in BTREE:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False, if_not_exists=True)
+    for table, column in TRIGRAM:
+        op.create_index(
+            f'ix_{table}_{column}_trgm', table, [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(TRIGRAM):
+        op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
+    for table, column in reversed(BTREE):
+        op.drop_index(f'ix_{table}_{column}', table_name=table, if_exists=True)
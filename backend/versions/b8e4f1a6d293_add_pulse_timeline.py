@@ -0,0 +1,52 @@
+"""add_pulse_timeline
+
+Revision ID: b8e4f1a6d293
+Revises: a7d2e5f9c184
+Create Date: 2026-10-18 21:00:00.000000
+
+Fan-out-on-write inbox for the Pulse "following" feed, plus the indexes its
+reads and writes seek on: user_follows by follower and by followed user, and
+user_stats by follower count (to find high-follower authors). Inboxes are
+filled with `python scripts/backfill_pulse_timeline.py` after upgrading.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f1a6d293'
+down_revision: Union[str, Sequence[str], None] = 'a7d2e5f9c184'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'pulse_timeline',
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('pulse_id', sa.Integer(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['pulse_id'], ['pulses.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('owner_id', 'pulse_id')
+    )
+    op.create_index(
+        'ix_pulse_timeline_owner_keyset', 'pulse_timeline', ['owner_id', 'created_at', 'pulse_id'], unique=False
+    )
+    op.create_index(op.f('ix_user_follows_follower_id'), 'user_follows', ['follower_id'], unique=False)
+    op.create_index(op.f('ix_user_follows_following_id'), 'user_follows', ['following_id'], unique=False)
+    op.create_index(op.f('ix_user_stats_followers'), 'user_stats', ['followers'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_stats_followers'), table_name='user_stats')
+    op.drop_index(op.f('ix_user_follows_following_id'), table_name='user_follows')
+    op.drop_index(op.f('ix_user_follows_follower_id'), table_name='user_follows')
+    op.drop_index('ix_pulse_timeline_owner_keyset', table_name='pulse_timeline')
+    op.drop_table('pulse_timeline')
@@ -0,0 +1,45 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: c4e1a9d27b35
+Revises: 8d3f0b6c2a41
+Create Date: 2026-10-18 13:00:00.000000
+
+Composite indexes matching the keyset (cursor) sort orders in
+repositories/pagination.py users, so ?cursor= pages are an index seek
+instead of an OFFSET scan. Column order and direction mirror each Keyset.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a9d27b35'
+down_revision: Union[str, Sequence[str], None] = '8d3f0b6c2a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_movies_score_keyset', 'movies', ['siddu_score DESC NULLS LAST', 'id DESC']),
+    ('ix_movies_year_keyset', 'movies', ['year DESC NULLS LAST', 'id DESC']),
+    ('ix_movies_title_keyset', 'movies', ['title', 'id']),
+    ('ix_pulses_created_keyset', 'pulses', ['created_at DESC', 'id DESC']),
+    ('ix_moderation_items_created_keyset', 'moderation_items', ['created_at DESC', 'id DESC']),
+    ('ix_quiz_attempts_user_started_keyset', 'quiz_attempts', ['user_id', 'started_at DESC', 'id DESC']),
+    ('ix_critic_reviews_critic_published_keyset', 'critic_reviews', ['critic_id', 'published_at DESC', 'id DESC']),
+    ('ix_critic_reviews_movie_published_keyset', 'critic_reviews', ['movie_id', 'published_at DESC', 'id DESC']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, [sa.text(c) for c in columns], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,67 @@
+"""add_pulse_hashtag_buckets
+
+Revision ID: c6f2a9d4e517
+Revises: b8e4f1a6d293
+Create Date: 2026-10-18 22:00:00.000000
+
+Normalized pulse hashtags and hourly per-hashtag counters, so trending
+hashtags are summed from buckets instead of parsing every pulse in the
+window. Both tables are backfilled from pulses.hashtags (a JSON array).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f2a9d4e517'
+down_revision: Union[str, Sequence[str], None] = 'b8e4f1a6d293'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'pulse_hashtags',
+        sa.Column('pulse_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(length=120), nullable=False),
+        sa.ForeignKeyConstraint(['pulse_id'], ['pulses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('pulse_id', 'tag')
+    )
+    op.create_index(op.f('ix_pulse_hashtags_tag'), 'pulse_hashtags', ['tag'], unique=False)
+    op.create_table(
+        'pulse_hashtag_buckets',
+        sa.Column('tag', sa.String(length=120), nullable=False),
+        sa.Column('hour', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('tag', 'hour')
+    )
+    op.create_index(op.f('ix_pulse_hashtag_buckets_hour'), 'pulse_hashtag_buckets', ['hour'], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO pulse_hashtags (pulse_id, tag)
+        SELECT DISTINCT ON (p.id, lower(left(btrim(t.tag), 120))) p.id, left(btrim(t.tag), 120)
+        FROM pulses p
+        CROSS JOIN LATERAL json_array_elements_text(p.hashtags::json) AS t(tag)
+        WHERE p.hashtags IS NOT NULL AND p.hashtags LIKE '[%' AND btrim(t.tag) <> ''
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO pulse_hashtag_buckets (tag, hour, count)
+        SELECT ph.tag, floor(extract(epoch FROM p.created_at) / 3600)::int, count(*)
+        FROM pulse_hashtags ph JOIN pulses p ON p.id = ph.pulse_id
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_pulse_hashtag_buckets_hour'), table_name='pulse_hashtag_buckets')
+    op.drop_table('pulse_hashtag_buckets')
+    op.drop_index(op.f('ix_pulse_hashtags_tag'), table_name='pulse_hashtags')
+    op.drop_table('pulse_hashtags')
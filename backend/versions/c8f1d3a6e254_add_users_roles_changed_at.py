@@ -0,0 +1,31 @@
+"""add_users_roles_changed_at
+
+Revision ID: c8f1d3a6e254
+Revises: b5d9e2a7c310
+Create Date: 2026-10-18 16:00:00.000000
+
+Per-user role-change watermark. Every worker compares it with the load time
+of its cached principals, so a role change made through one worker reaches
+the others without waiting for the principal cache TTL.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f1d3a6e254'
+down_revision: Union[str, Sequence[str], None] = 'b5d9e2a7c310'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('roles_changed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'roles_changed_at')
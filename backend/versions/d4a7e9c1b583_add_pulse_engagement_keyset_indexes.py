@@ -0,0 +1,42 @@
+"""add_pulse_engagement_keyset_indexes
+
+Revision ID: d4a7e9c1b583
+Revises: c8f1d3a6e254
+Create Date: 2026-10-18 17:00:00.000000
+
+Expression indexes for the popular and trending Pulse feeds. Both sort on
+reactions_total + comments_count + shares_count (repositories/pulse.py
+_ENGAGEMENT); the index expression, direction and NULLS LAST placement
+mirror FEED_POPULAR and FEED_TRENDING so keyset pages are an index seek.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e9c1b583'
+down_revision: Union[str, Sequence[str], None] = 'c8f1d3a6e254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENGAGEMENT = '(reactions_total + comments_count + shares_count) DESC NULLS LAST'
+
+INDEXES = [
+    ('ix_pulses_popular_keyset', 'pulses', [ENGAGEMENT, 'created_at DESC', 'id DESC']),
+    ('ix_pulses_trending_keyset', 'pulses', [ENGAGEMENT, 'id DESC']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, [sa.text(c) for c in columns], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
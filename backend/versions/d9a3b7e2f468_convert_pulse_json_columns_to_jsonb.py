@@ -0,0 +1,66 @@
+"""convert_pulse_json_columns_to_jsonb
+
+Revision ID: d9a3b7e2f468
+Revises: c6f2a9d4e517
+Create Date: 2026-10-18 23:00:00.000000
+
+pulses.content_media, hashtags and reactions_json change from JSON text to
+JSONB, so feed rows are not re-parsed in Python and reaction counts can be
+changed with one UPDATE (jsonb_set). Text that is not valid JSON of the
+expected shape becomes NULL (media, hashtags) or {} (reactions).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a3b7e2f468'
+down_revision: Union[str, Sequence[str], None] = 'c6f2a9d4e517'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.try_jsonb(value text, expected text) RETURNS jsonb AS $$
+        DECLARE parsed jsonb;
+        BEGIN
+            parsed := value::jsonb;
+            IF jsonb_typeof(parsed) = expected THEN
+                RETURN parsed;
+            END IF;
+            RETURN NULL;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+        """
+    )
+    op.alter_column(
+        'pulses', 'content_media',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using="pg_temp.try_jsonb(content_media, 'array')",
+    )
+    op.alter_column(
+        'pulses', 'hashtags',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using="pg_temp.try_jsonb(hashtags, 'array')",
+    )
+    op.alter_column(
+        'pulses', 'reactions_json',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using="COALESCE(pg_temp.try_jsonb(reactions_json, 'object'), '{}'::jsonb)",
+    )
+    op.alter_column('pulses', 'reactions_json', nullable=False, server_default=sa.text("'{}'::jsonb"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('pulses', 'reactions_json', nullable=True, server_default=None)
+    for column in ('reactions_json', 'hashtags', 'content_media'):
+        op.alter_column('pulses', column, type_=sa.Text(), postgresql_using=f"{column}::text")
@@ -0,0 +1,46 @@
+"""add_background_jobs
+
+Revision ID: e2b6c8d4f715
+Revises: d4a7e9c1b583
+Create Date: 2026-10-18 18:00:00.000000
+
+Shared status rows for background admin jobs (streaming movie imports), so a
+progress poll answered by any worker sees the job and a restart keeps the
+history of finished jobs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6c8d4f715'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e9c1b583'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'background_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('kind', sa.String(length=40), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=True),
+        sa.Column('report', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_background_jobs_kind'), 'background_jobs', ['kind'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_background_jobs_kind'), table_name='background_jobs')
+    op.drop_table('background_jobs')
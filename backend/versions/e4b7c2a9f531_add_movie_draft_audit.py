@@ -0,0 +1,47 @@
+"""add_movie_draft_audit
+
+Revision ID: e4b7c2a9f531
+Revises: d9a3b7e2f468
+Create Date: 2026-10-18 23:30:00.000000
+
+One row per published or discarded movie category draft, written by the
+single and the bulk publish/discard endpoints.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c2a9f531'
+down_revision: Union[str, Sequence[str], None] = 'd9a3b7e2f468'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'movie_draft_audit',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('category', sa.String(length=20), nullable=False),
+        sa.Column('action', sa.String(length=20), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_movie_draft_audit_movie_id'), 'movie_draft_audit', ['movie_id'], unique=False)
+    op.create_index(op.f('ix_movie_draft_audit_user_id'), 'movie_draft_audit', ['user_id'], unique=False)
+    op.create_index(op.f('ix_movie_draft_audit_created_at'), 'movie_draft_audit', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_movie_draft_audit_created_at'), table_name='movie_draft_audit')
+    op.drop_index(op.f('ix_movie_draft_audit_user_id'), table_name='movie_draft_audit')
+    op.drop_index(op.f('ix_movie_draft_audit_movie_id'), table_name='movie_draft_audit')
+    op.drop_table('movie_draft_audit')
@@ -0,0 +1,35 @@
+"""add_lower_name_indexes
+
+Revision ID: e7b2f4c81d09
+Revises: c4e1a9d27b35
+Create Date: 2026-10-18 14:00:00.000000
+
+Expression indexes on lower(name) for the tables the bulk movie importer
+resolves by case-insensitive name (``lower(name) IN (...)``).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2f4c81d09'
+down_revision: Union[str, Sequence[str], None] = 'c4e1a9d27b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ['people', 'genres', 'streaming_platforms', 'award_ceremonies']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(f'ix_{table}_lower_name', table, [sa.text('lower(name)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_lower_name', table_name=table)
@@ -0,0 +1,49 @@
+"""add_festival_current_edition
+
+Revision ID: f1c8d3e6a274
+Revises: e4b7c2a9f531
+Create Date: 2026-10-19 00:00:00.000000
+
+festivals.current_edition_id points at the edition festival cards and
+headers show (the upcoming one, else the latest year), so those pages no
+longer load and sort every edition. festivals.content_version is bumped on
+every festival edit and versions the cached program/winners documents.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c8d3e6a274'
+down_revision: Union[str, Sequence[str], None] = 'e4b7c2a9f531'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('festivals', sa.Column('current_edition_id', sa.Integer(), nullable=True))
+    op.add_column('festivals', sa.Column('content_version', sa.Integer(), server_default='1', nullable=False))
+    op.create_foreign_key(
+        'fk_festivals_current_edition_id', 'festivals', 'festival_editions',
+        ['current_edition_id'], ['id'], ondelete='SET NULL'
+    )
+    op.execute(
+        """
+        UPDATE festivals f SET current_edition_id = (
+            SELECT e.id FROM festival_editions e
+            WHERE e.festival_id = f.id
+            ORDER BY CASE WHEN lower(e.status) = 'upcoming' THEN 0 ELSE 1 END, e.year DESC, e.id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_festivals_current_edition_id', 'festivals', type_='foreignkey')
+    op.drop_column('festivals', 'content_version')
+    op.drop_column('festivals', 'current_edition_id')
@@ -0,0 +1,55 @@
+"""add_collection_card_columns
+
+Revision ID: f3c9a1e7d426
+Revises: e2b6c8d4f715
+Create Date: 2026-10-18 19:00:00.000000
+
+Denormalized movie_count and preview_posters on collections, so the
+collection list renders cards without loading any collection's movies.
+Existing rows are backfilled from collection_movies.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a1e7d426'
+down_revision: Union[str, Sequence[str], None] = 'e2b6c8d4f715'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('collections', sa.Column('movie_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column(
+        'collections',
+        sa.Column('preview_posters', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'),
+    )
+    op.execute(
+        """
+        UPDATE collections c SET
+            movie_count = (
+                SELECT count(*) FROM collection_movies cm WHERE cm.collection_id = c.id
+            ),
+            preview_posters = COALESCE((
+                SELECT jsonb_agg(p.poster_url ORDER BY p.movie_id)
+                FROM (
+                    SELECT cm.movie_id, m.poster_url
+                    FROM collection_movies cm JOIN movies m ON m.id = cm.movie_id
+                    WHERE cm.collection_id = c.id AND m.poster_url IS NOT NULL
+                    ORDER BY cm.movie_id
+                    LIMIT 4
+                ) p
+            ), '[]'::jsonb)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('collections', 'preview_posters')
+    op.drop_column('collections', 'movie_count')
@@ -0,0 +1,66 @@
+"""add_review_stats_tables
+
+Revision ID: ff7cfc4ddf55
+Revises: 25598acb4f30
+Create Date: 2026-10-18 09:00:00.000000
+
+Per-user and per-movie review aggregates (count, rating sum, helpful votes),
+maintained incrementally by ReviewRepository and backfilled here from reviews.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ff7cfc4ddf55'
+down_revision: Union[str, Sequence[str], None] = '25598acb4f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_review_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('helpful_votes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table(
+        'movie_review_stats',
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('helpful_votes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_id')
+    )
+
+    # Backfill from existing reviews
+    op.execute(
+        """
+        INSERT INTO user_review_stats (user_id, review_count, rating_sum, helpful_votes, updated_at)
+        SELECT user_id, COUNT(*), COALESCE(SUM(rating), 0), COALESCE(SUM(helpful_votes), 0), NOW()
+        FROM reviews GROUP BY user_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO movie_review_stats (movie_id, review_count, rating_sum, helpful_votes, updated_at)
+        SELECT movie_id, COUNT(*), COALESCE(SUM(rating), 0), COALESCE(SUM(helpful_votes), 0), NOW()
+        FROM reviews GROUP BY movie_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('movie_review_stats')
+    op.drop_table('user_review_stats')